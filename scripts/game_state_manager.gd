@@ -94,6 +94,10 @@ func initialize_new_campaign(campaign_name: String) -> void:
 		}
 	})
 
+	# The bundled data already contains every journaled fix up to this version;
+	# tools/data_journal.py apply starts from here
+	data_manager.save_json("data_version.json", {"journal_version": _bundled_journal_version()})
+
 	save_game_state()
 	state_changed.emit()
 
@@ -281,3 +285,18 @@ func _derive_state_from_data() -> void:
 	if evt_location != "":
 		if evt_location != current_location:
 			current_location = evt_location
+
+
+## Version of the last entry in the bundled data journal (0 if none).
+## Each line of journal.jsonl is one entry; only the last one is parsed.
+func _bundled_journal_version() -> int:
+	var path := "res://resources/data/journal.jsonl"
+	if not FileAccess.file_exists(path):
+		return 0
+	var lines := FileAccess.get_file_as_string(path).strip_edges().split("\n")
+	if lines.is_empty() or lines[-1].is_empty():
+		return 0
+	var entry = JSON.parse_string(lines[-1])
+	if entry == null:
+		return 0
+	return int(entry.get("version", 0))
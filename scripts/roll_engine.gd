@@ -8,6 +8,11 @@ signal roll_invalid(reason: String)
 @export var data_manager: DataManager
 @export var game_state: GameStateManager
 
+## Compiled roll tables (sorted breakpoints), generated by tools/roll_intervals.py export.
+const INTERVALS_PATH := "res://resources/data/roll_intervals.json"
+
+var _intervals: Dictionary = {}
+
 
 ## Validates and submits a d100 roll value.
 func submit_roll(input: String) -> void:
@@ -45,3 +50,27 @@ func get_last_roll() -> Variant:
 	if history.is_empty():
 		return null
 	return history[-1]
+
+
+## Returns {"range": String, "label": String} for a rolled value in a compiled
+## roll table, falling back to the standard bands when table_id is unknown.
+## Returns an empty dictionary if the value is not covered.
+func outcome_for(table_id: String, rolled: int) -> Dictionary:
+	if _intervals.is_empty() and data_manager != null:
+		var data = data_manager.load_bundled_json(INTERVALS_PATH)
+		if data is Dictionary:
+			_intervals = data
+	var table: Dictionary = _intervals.get("tables", {}).get(table_id, _intervals.get("standard", {}))
+	var lows: Array = table.get("lows", [])
+	var highs: Array = table.get("highs", [])
+	var i := lows.bsearch(rolled, false) - 1
+	# Overlapping (nested) ranges: step back to the latest-starting band
+	# that actually contains the value
+	while i >= 0 and rolled > int(highs[i]):
+		i -= 1
+	if i < 0:
+		return {}
+	return {
+		"range": "%02d-%02d" % [int(lows[i]), int(highs[i])],
+		"label": table.get("labels", [])[i],
+	}
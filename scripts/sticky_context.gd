@@ -7,7 +7,8 @@ extends Node
 signal context_overflow
 signal context_cleared
 
-## Token budget: 3000 tokens, estimated at 4 chars = 1 token.
+## Token budget: 3000 tokens, estimated by TokenEstimator once a calibration
+## fitted against real API usage exists, and at 4 chars = 1 token until then.
 const TOKEN_BUDGET := 3000
 const CHARS_PER_TOKEN := 4
 
@@ -101,16 +102,16 @@ func add_laws(laws: Array) -> bool:
 
 ## Estimates the total token usage of all sticky content.
 func estimate_total_tokens() -> int:
-	var total_chars := 0
+	var parts: PackedStringArray = []
 	for c in _characters.values():
-		total_chars += _dict_char_count(c)
+		parts.append(_dict_text(c))
 	for evt in _events.values():
-		total_chars += _dict_char_count(evt.get("record", {}))
+		parts.append(_dict_text(evt.get("record", {})))
 		for conv in evt.get("conversations", []):
-			total_chars += _dict_char_count(conv)
+			parts.append(_dict_text(conv))
 	for law in _laws.values():
-		total_chars += _dict_char_count(law)
-	return ceili(float(total_chars) / CHARS_PER_TOKEN)
+		parts.append(_dict_text(law))
+	return _count_tokens("\n".join(parts))
 
 
 ## Checks if token budget is exceeded. Emits context_overflow if so.
@@ -221,21 +222,30 @@ func format_for_prompt() -> String:
 
 ## Estimates token count for a single item.
 func _estimate_tokens(data: Variant) -> int:
-	return ceili(float(_dict_char_count(data)) / CHARS_PER_TOKEN)
+	return _count_tokens(_dict_text(data))
+
+
+## Calibrated estimate when available; the uncalibrated defaults would let
+## more text into the budget than anything has measured, so fall back to len/4.
+func _count_tokens(text: String) -> int:
+	if TokenEstimator.is_calibrated():
+		return TokenEstimator.count_tokens(text)
+	return ceili(float(text.length()) / CHARS_PER_TOKEN)
 
 
-## Counts total characters in a dictionary's string values (recursive).
-func _dict_char_count(data: Variant) -> int:
+## Flattens a dictionary's keys and values into one string (recursive).
+func _dict_text(data: Variant) -> String:
 	if data is String:
-		return data.length()
+		return data
 	if data is Dictionary:
-		var count := 0
+		var parts: PackedStringArray = []
 		for key in data:
-			count += str(key).length() + _dict_char_count(data[key])
-		return count
+			parts.append(str(key))
+			parts.append(_dict_text(data[key]))
+		return " ".join(parts)
 	if data is Array:
-		var count := 0
+		var parts: PackedStringArray = []
 		for item in data:
-			count += _dict_char_count(item)
-		return count
-	return str(data).length()
+			parts.append(_dict_text(item))
+		return " ".join(parts)
+	return str(data)
@@ -0,0 +1,95 @@
+## Calibrated token estimator — GDScript twin of tools/token_estimator.py.
+## Estimates tokens as a weighted sum of character-class counts (ASCII letters,
+## word starts, digits, spaces, newlines, punctuation, non-ASCII) plus a bias.
+## Weights come from res://resources/data/token_calibration.json, fitted by
+## `python3 tools/token_estimator.py calibrate` against real API usage; the
+## defaults below are used until a calibration exists.
+class_name TokenEstimator
+extends RefCounted
+
+const CALIBRATION_PATH := "res://resources/data/token_calibration.json"
+
+## Must match DEFAULT_WEIGHTS in tools/token_estimator.py.
+const DEFAULT_WEIGHTS := {
+	"letters": 0.18, "words": 0.25, "digits": 0.5, "spaces": 0.0,
+	"newlines": 0.5, "punct": 0.6, "non_ascii": 1.0, "bias": 4.0,
+}
+
+static var _weights: Dictionary = {}
+static var _error_bound: float = -1.0
+static var _calibrated := false
+
+
+## Estimated token count of text.
+static func count_tokens(text: String) -> int:
+	if text.is_empty():
+		return 0
+	_ensure_loaded()
+	var f := features(text)
+	var total := 0.0
+	for key in f:
+		total += _weights.get(key, 0.0) * f[key]
+	return maxi(1, roundi(total))
+
+
+## True once weights have been loaded from a fitted calibration file.
+## Until then the defaults are unmeasured guesses, and budget-critical callers
+## (StickyContext) should keep their conservative fallback.
+static func is_calibrated() -> bool:
+	_ensure_loaded()
+	return _calibrated
+
+
+## Relative error of count_tokens() at the 95th percentile, or -1.0 while it is
+## unknown (no calibration has measured it).
+static func error_bound() -> float:
+	_ensure_loaded()
+	return _error_bound
+
+
+## Character-class counts for text (same classes as the Python estimator).
+static func features(text: String) -> Dictionary:
+	var f := {
+		"letters": 0, "words": 0, "digits": 0, "spaces": 0,
+		"newlines": 0, "punct": 0, "non_ascii": 0, "bias": 1,
+	}
+	var in_word := false
+	for i in text.length():
+		var c := text.unicode_at(i)
+		var is_letter := (c >= 65 and c <= 90) or (c >= 97 and c <= 122)
+		if is_letter:
+			f["letters"] += 1
+			if not in_word:
+				f["words"] += 1
+		elif c >= 48 and c <= 57:
+			f["digits"] += 1
+		elif c == 32 or c == 9:
+			f["spaces"] += 1
+		elif c == 10:
+			f["newlines"] += 1
+		elif c > 127:
+			f["non_ascii"] += 1
+		else:
+			f["punct"] += 1
+		in_word = is_letter
+	return f
+
+
+static func _ensure_loaded() -> void:
+	if not _weights.is_empty():
+		return
+	_weights = DEFAULT_WEIGHTS.duplicate()
+	if not FileAccess.file_exists(CALIBRATION_PATH):
+		return
+	var file := FileAccess.open(CALIBRATION_PATH, FileAccess.READ)
+	if file == null:
+		return
+	var json := JSON.new()
+	if json.parse(file.get_as_text()) != OK or not json.data is Dictionary:
+		push_warning("TokenEstimator: Invalid calibration file, using defaults")
+		return
+	var data: Dictionary = json.data
+	for key in data.get("weights", {}):
+		_weights[key] = float(data["weights"][key])
+	_error_bound = float(data.get("error_bound", -1.0))
+	_calibrated = true
@@ -3,8 +3,13 @@
 
 import json
 import sys
+from pathlib import Path
 
-CHARACTERS_FILE = "resources/data/characters.json"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CHARACTERS_FILE = PROJECT_ROOT / "resources" / "data" / "characters.json"
+
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from data_journal import journaled_save
 
 NEW_CHARACTERS = [
     {
@@ -303,6 +308,11 @@ NEW_CHARACTERS = [
 ]
 
 
+def save_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 def main():
     with open(CHARACTERS_FILE, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -321,8 +331,7 @@ def main():
     # Update meta count
     data["meta"]["total_characters"] = len(data["characters"])
 
-    with open(CHARACTERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    journaled_save(CHARACTERS_FILE, data, "add_missing_characters.py", save_json)
 
     print(f"Added {len(added)} characters:")
     for cid in added:
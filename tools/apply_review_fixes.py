@@ -11,34 +11,27 @@ Changes:
   3. Add 15 new character entries to characters.json with the exact schema
      used by existing characters.
 
+The fixes are registered fixers (fix_registry.py) and can also run as part
+of a combined fix_registry.py pass.
+
 Usage:
     python3 tools/apply_review_fixes.py
 """
 
-import json
-import os
-import re
 import sys
 from pathlib import Path
 
 # Paths
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-EVENTS_DIR = PROJECT_ROOT / "resources" / "data" / "events"
-CHARACTERS_FILE = PROJECT_ROOT / "resources" / "data" / "characters.json"
-CHAPTER_134 = EVENTS_DIR / "chapter_1.34.json"
-
-# ─── Helpers ────────────────────────────────────────────────────────────────
-
-def load_json(path: Path) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+# Data files, relative to resources/data (fix_registry.DataStore names)
+CHARACTERS_FILE = "characters.json"
+CHAPTER_134 = "events/chapter_1.34.json"
 
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from fix_registry import DataStore, fixer
+from corpus_scan import PatternSet, from_categories, scan_data
 
-def save_json(path: Path, data: dict) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-
+# ─── Helpers ────────────────────────────────────────────────────────────────
 
 def report(section: str, msg: str) -> None:
     print(f"  [{section}] {msg}")
@@ -46,11 +39,12 @@ def report(section: str, msg: str) -> None:
 
 # ─── Fix 1: Replace luis_de_guzman → luis_de_guzman_niebla in ch 1.34 ──────
 
-def fix_luis_de_guzman_in_chapter_134() -> int:
+@fixer(group="apply_review_fixes")
+def fix_luis_de_guzman_in_chapter_134(store: DataStore) -> int:
     """Replace all 'luis_de_guzman' in characters arrays with
     'luis_de_guzman_niebla' in chapter_1.34.json.  Returns count of
     replacements made."""
-    data = load_json(CHAPTER_134)
+    data = store.load(CHAPTER_134)
     count = 0
     already_correct = 0
 
@@ -69,47 +63,35 @@ def fix_luis_de_guzman_in_chapter_134() -> int:
         report("FIX-1", f"  Already correct: {already_correct} "
                f"luis_de_guzman_niebla reference(s) found")
 
-    if count:
-        save_json(CHAPTER_134, data)
-
     return count
 
 
 # ─── Fix 2: Scan for wrong-age Juan references ─────────────────────────────
 
-def scan_age_references() -> list[str]:
+# corpus_scan.py pattern set "age": {category: [(regex, description)]}
+AGE_PATTERNS = {
+    "Wrong age for Juan": [
+        (r"(?i)twenty[\-\s]eight", "twenty-eight"),
+        (r"(?i)28\s+years?\s+old", "28 years old"),
+    ],
+}
+
+
+@fixer(group="apply_review_fixes")
+def scan_age_references(store: DataStore) -> list[str]:
     """Search all chapter files for 'twenty-eight' or '28 years old' in
     exchange text or summaries.  Returns list of findings (report only)."""
     findings: list[str] = []
-    patterns = [
-        re.compile(r"twenty[\-\s]eight", re.IGNORECASE),
-        re.compile(r"28\s+years?\s+old", re.IGNORECASE),
-    ]
-
-    for chapter_file in sorted(EVENTS_DIR.glob("chapter_*.json")):
-        data = load_json(chapter_file)
-        for event in data.get("events", []):
-            eid = event.get("event_id", "?")
-
-            # Check summary
-            summary = event.get("summary", "")
-            for pat in patterns:
-                for m in pat.finditer(summary):
-                    findings.append(
-                        f"{chapter_file.name} / {eid} / summary: "
-                        f"'{m.group()}' at pos {m.start()}"
-                    )
-
-            # Check exchanges
-            for ex in event.get("exchanges", []):
-                text = ex.get("text", "")
-                for pat in patterns:
-                    for m in pat.finditer(text):
-                        findings.append(
-                            f"{chapter_file.name} / {eid} / "
-                            f"{ex.get('role','?')} exchange: "
-                            f"'{m.group()}' at pos {m.start()}"
-                        )
+    pattern_set = PatternSet(from_categories(AGE_PATTERNS))
+
+    for name in store.chapter_names():
+        file_name = Path(name).name
+        for hit in scan_data(store.load(name), pattern_set, file_name,
+                             roles=None, summaries=True):
+            where = ("summary" if hit["exchange"] is None
+                     else f"{hit['role'] or '?'} exchange")
+            findings.append(f"{file_name} / {hit['event_id']} / {where}: "
+                            f"'{hit['match']}' at pos {hit['offset']}")
 
     return findings
 
@@ -480,9 +462,10 @@ NEW_CHARACTERS = [
 ]
 
 
-def add_new_characters() -> list[str]:
+@fixer(group="apply_review_fixes")
+def add_new_characters(store: DataStore) -> list[str]:
     """Add new characters to characters.json.  Returns list of IDs added."""
-    data = load_json(CHARACTERS_FILE)
+    data = store.load(CHARACTERS_FILE)
     existing_ids = {c["id"] for c in data["characters"]}
     added: list[str] = []
 
@@ -497,9 +480,6 @@ def add_new_characters() -> list[str]:
     # Update total_characters count in meta
     data["meta"]["total_characters"] = len(data["characters"])
 
-    if added:
-        save_json(CHARACTERS_FILE, data)
-
     return added
 
 
@@ -510,16 +490,19 @@ def main() -> None:
     print("apply_review_fixes.py — Applying review fixes")
     print("=" * 70)
 
+    # One shared copy of the data; saved once after all fixes
+    store = DataStore()
+
     # ── Fix 1 ───────────────────────────────────────────────────────────
     print("\n[FIX-1] Replacing luis_de_guzman → luis_de_guzman_niebla "
           "in chapter_1.34.json ...")
-    fix1_count = fix_luis_de_guzman_in_chapter_134()
+    fix1_count = fix_luis_de_guzman_in_chapter_134(store)
     print(f"  → {fix1_count} replacement(s) made.\n")
 
     # ── Fix 2 ───────────────────────────────────────────────────────────
     print("[FIX-2] Scanning ALL chapter files for wrong-age Juan references "
           "(twenty-eight / 28 years old) ...")
-    findings = scan_age_references()
+    findings = scan_age_references(store)
     if findings:
         for f in findings:
             report("FIX-2", f"  FOUND: {f}")
@@ -530,9 +513,12 @@ def main() -> None:
 
     # ── Fix 3 ───────────────────────────────────────────────────────────
     print("[FIX-3] Adding new characters to characters.json ...")
-    added = add_new_characters()
+    added = add_new_characters(store)
     print(f"  → {len(added)} character(s) added.\n")
 
+    for name in store.commit("apply_review_fixes.py"):
+        print(f"  Saved {name}")
+
     # ── Summary ─────────────────────────────────────────────────────────
     print("=" * 70)
     print("SUMMARY")
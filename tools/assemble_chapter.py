@@ -9,6 +9,7 @@ Usage:
   python3 tools/assemble_chapter.py 1.33 --defs tools/event_defs/chapter_1.33_defs.json
   python3 tools/assemble_chapter.py 1.33 --defs-stdin < defs.json
   python3 tools/assemble_chapter.py 1.33 --preview   # Show message index/preview for planning
+  python3 tools/message_search.py malaga ambush     # Find messages across all chapters
 
 Event definition format (JSON):
 {
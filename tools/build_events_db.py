@@ -10,6 +10,7 @@ Commands:
   merge   — Merge all chapter files back into events.json
   verify  — Check that a merge would produce identical output to current events.json
   status  — Show chapter file inventory and event counts
+  assign-ids — Replace PLACEHOLDER event IDs (sequence blocks from event_sequence.py)
 
 Usage:
   python3 tools/build_events_db.py split              # One-time: split events.json into chapters
@@ -17,6 +18,7 @@ Usage:
   python3 tools/build_events_db.py merge --dry-run    # Preview without writing
   python3 tools/build_events_db.py verify             # Verify round-trip integrity
   python3 tools/build_events_db.py status             # Show chapter inventory
+  python3 tools/build_events_db.py assign-ids 2.31    # Replace PLACEHOLDER IDs (one chapter)
 """
 
 import json
@@ -34,6 +36,9 @@ DATA_DIR = PROJECT_ROOT / "resources" / "data"
 EVENTS_FILE = DATA_DIR / "events.json"
 CHAPTERS_DIR = DATA_DIR / "events"
 
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from event_sequence import EVENT_COUNTER, peek, reserve, event_year, make_event_id
+
 
 def load_json(path: Path) -> dict:
     """Load a JSON file."""
@@ -262,77 +267,66 @@ def cmd_status(args):
 # Assign IDs: replace PLACEHOLDER IDs with proper sequential ones
 # ---------------------------------------------------------------------------
 
-BUILD_STATE_FILE = PROJECT_ROOT / "tools" / "build_state.json"
-
-
 def cmd_assign_ids(args):
     """Assign proper sequential event IDs to chapter files with PLACEHOLDERs.
 
-    Reads build_state.json for the current next_event_seq, walks chapter
-    files in order, replaces any evt_PLACEHOLDER_* IDs with proper
-    evt_{year}_{seq} IDs, and writes the updated chapter files back.
+    Walks chapter files in order (or just the chapters given), reserves a
+    block of sequence numbers per chapter from event_sequence (locked, so
+    several chapters can be assigned concurrently), replaces any
+    evt_PLACEHOLDER_* IDs with proper evt_{year}_{seq} IDs, and writes the
+    updated chapter files back.
     """
     chapter_files = sorted(CHAPTERS_DIR.glob("chapter_*.json"))
+    if args.chapters:
+        wanted = {f"chapter_{c}.json" for c in args.chapters}
+        chapter_files = [cf for cf in chapter_files if cf.name in wanted]
     if not chapter_files:
         print(f"ERROR: No chapter files found in {CHAPTERS_DIR}/")
         sys.exit(1)
 
-    # Load build state for sequence counter
-    if BUILD_STATE_FILE.exists():
-        with open(BUILD_STATE_FILE, "r", encoding="utf-8") as f:
-            build_state = json.load(f)
-    else:
-        build_state = {}
-
-    seq = build_state.get("next_event_seq", 1)
+    seq = peek(EVENT_COUNTER)
     total_assigned = 0
     total_skipped = 0
 
-    print(f"Assigning event IDs starting from sequence {seq}...\n")
+    print(f"Assigning event IDs (next sequence {seq})...\n")
 
     for cf in chapter_files:
         chapter_data = load_json(cf)
         events = chapter_data.get("events", [])
         chapter_id = chapter_data.get("chapter", cf.stem)
-        changed = False
-
-        for evt in events:
-            eid = evt.get("event_id", "")
-            if "PLACEHOLDER" in eid:
-                # Extract year from event date
-                date_str = evt.get("date", "")
-                try:
-                    year = int(date_str[:4]) if date_str and len(date_str) >= 4 else 1430
-                except ValueError:
-                    year = 1430
-
-                new_id = f"evt_{year}_{seq:05d}"
-                evt["event_id"] = new_id
-                seq += 1
-                changed = True
-                total_assigned += 1
-            else:
-                total_skipped += 1
-
-        if changed:
-            count = sum(1 for e in events
-                        if not e.get("event_id", "").startswith("evt_PLACEHOLDER"))
-            if not args.dry_run:
-                save_json(cf, chapter_data)
-            else:
-                print(f"  {chapter_id}: would assign {len(events)} event IDs")
-        else:
+        pending = [evt for evt in events if "PLACEHOLDER" in evt.get("event_id", "")]
+        total_skipped += len(events) - len(pending)
+
+        if not pending:
             print(f"  {chapter_id}: already has proper IDs (skipped)")
+            continue
 
-    # Update build state
-    if not args.dry_run:
-        build_state["next_event_seq"] = seq
-        with open(BUILD_STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(build_state, f, indent=2, ensure_ascii=False)
+        if args.dry_run:
+            block = range(seq, seq + len(pending))
+            seq += len(pending)
+        else:
+            # A fully-placeholder chapter keeps its block across re-assembly;
+            # a partially-assigned one gets a fresh block so IDs never repeat
+            key = f"assign:{chapter_id}" if len(pending) == len(events) else None
+            try:
+                block = reserve(len(pending), key=key)
+            except TimeoutError as e:
+                print(f"ERROR: {e}")
+                sys.exit(1)
+
+        for evt, n in zip(pending, block):
+            evt["event_id"] = make_event_id(event_year(evt.get("date", "")), n)
+        total_assigned += len(pending)
+
+        if not args.dry_run:
+            save_json(cf, chapter_data)
+        else:
+            print(f"  {chapter_id}: would assign {len(pending)} event IDs "
+                  f"({block.start}-{block.stop - 1})")
 
     mode = "[DRY RUN] " if args.dry_run else ""
     print(f"\n{mode}Assigned {total_assigned} IDs, skipped {total_skipped} existing IDs.")
-    print(f"Next event sequence: {seq}")
+    print(f"Next event sequence: {seq if args.dry_run else peek(EVENT_COUNTER)}")
     if not args.dry_run:
         print(f"\nRun 'python3 tools/build_events_db.py merge' to rebuild events.json.")
 
@@ -376,6 +370,7 @@ def main():
     # assign-ids
     sp_assign = subparsers.add_parser("assign-ids",
         help="Assign proper sequential IDs to chapter files with PLACEHOLDERs")
+    sp_assign.add_argument("chapters", nargs="*", help="Chapters to assign (default: all)")
     sp_assign.add_argument("--dry-run", action="store_true", help="Preview without writing")
 
     args = parser.parse_args()
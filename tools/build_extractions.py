@@ -43,6 +43,9 @@ LOCATIONS_FILE = DATA_DIR / "locations.json"
 LAWS_FILE = DATA_DIR / "laws.json"
 ALIASES_FILE = TOOLS_DIR / "known_aliases.json"
 
+sys.path.insert(0, str(TOOLS_DIR))
+from extract_engine import is_curated
+
 
 # ---------------------------------------------------------------------------
 # Character name/category inference
@@ -555,6 +558,10 @@ def main():
         if extraction_path.exists() and not args.force:
             print(f"  {ch}: SKIP (extraction exists, use --force to overwrite)")
             continue
+        defs_path = DEFS_DIR / f"chapter_{ch}_defs.json"
+        if defs_path.exists() and is_curated(json.load(open(defs_path, encoding="utf-8"))):
+            print(f"  {ch}: SKIP (curated defs, built by extract_engine.py)")
+            continue
 
         try:
             extraction = build_extraction(ch, cumulative_chars, cumulative_factions,
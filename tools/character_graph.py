@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Character Graph — Co-occurrence matrices and relationship analytics.
+
+Characters, factions and events are interned to dense integer ids, and the
+links between them are kept as two sparse incidence matrices in coordinate
+form (row ids, column ids):
+
+  A  character × event   (characters.json event_refs ∪ event "characters")
+  F  faction × event     (event "factions_affected")
+  M  character × faction (known membership: faction_ids ∪ faction member_ids)
+
+Everything else is a handful of matrix products over all characters at once:
+
+  C = A Aᵀ             shared-event counts (diagonal = events per character)
+  S = C / √(nᵢ nⱼ)     relationship strength (Ochiai / cosine, 0..1)
+  D = (A W) Fᵀ         faction exposure, each event weighted by 1/|characters|
+                       so a faction named in a two-person scene counts for more
+                       than one named in a crowded council
+  affinity = ½ (row-normalized D R_F) + ½ (row-normalized S R · M)
+                       direct exposure plus how strongly one's associates
+                       belong to the faction, each associate j weighted by
+                       Rⱼ = log(events / nⱼ) so that ubiquitous characters
+                       (the king) do not pull everyone into their faction;
+                       R_F does the same for factions named in most events
+  centrality           eigenvector centrality of C (power iteration)
+
+Membership suggestions are (character, faction) pairs not yet in M whose
+affinity clears SUGGEST_MIN_AFFINITY with at least SUGGEST_MIN_EVENTS shared
+events — a replacement for the one-event heuristic in
+enrich_characters.derive_factions.
+
+The result is exported to resources/data/character_relations.json, keyed by
+character id and faction id, for the game's panels.
+
+Usage:
+  python3 tools/character_graph.py                      # Summary: central characters, suggestions
+  python3 tools/character_graph.py --id alvaro_de_luna  # Associates and affinities of one character
+  python3 tools/character_graph.py --suggest            # All membership suggestions
+  python3 tools/character_graph.py --export             # Write character_relations.json
+  python3 tools/character_graph.py --json               # Full analytics as JSON on stdout
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+CHARACTERS_FILE = DATA_DIR / "characters.json"
+FACTIONS_FILE = DATA_DIR / "factions.json"
+EVENTS_FILE = DATA_DIR / "events.json"
+EVENTS_DIR = DATA_DIR / "events"
+EXPORT_FILE = DATA_DIR / "character_relations.json"
+
+ASSOCIATES = 8                # closest associates kept per character
+FACTIONS_PER_CHARACTER = 5    # top faction affinities kept per character
+SUGGEST_MIN_AFFINITY = 0.4
+SUGGEST_MIN_EVENTS = 3
+CENTRALITY_ITERATIONS = 200
+CENTRALITY_TOLERANCE = 1e-9
+
+
+# ---------------------------------------------------------------------------
+# Interning and incidence
+# ---------------------------------------------------------------------------
+
+class Interner:
+    """String id ↔ dense integer id."""
+
+    def __init__(self, ids=()):
+        self.ids = []
+        self.index = {}
+        for i in ids:
+            self.add(i)
+
+    def add(self, key: str) -> int:
+        n = self.index.get(key)
+        if n is None:
+            n = self.index[key] = len(self.ids)
+            self.ids.append(key)
+        return n
+
+    def get(self, key: str, default=None):
+        return self.index.get(key, default)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class Incidence:
+    """Sparse 0/1 matrix in coordinate form; duplicates are dropped."""
+
+    def __init__(self, rows: list, cols: list, shape: tuple):
+        pairs = np.unique(np.array([rows, cols], dtype=np.int64).reshape(2, -1), axis=1)
+        self.rows, self.cols = pairs[0], pairs[1]
+        self.shape = shape
+
+    @property
+    def nnz(self) -> int:
+        return len(self.rows)
+
+    def dense(self, weights: np.ndarray | None = None) -> np.ndarray:
+        """Dense float matrix; weights scales each column (event)."""
+        out = np.zeros(self.shape)
+        out[self.rows, self.cols] = 1.0 if weights is None else weights[self.cols]
+        return out
+
+    def row_counts(self) -> np.ndarray:
+        return np.bincount(self.rows, minlength=self.shape[0])
+
+    def col_counts(self) -> np.ndarray:
+        return np.bincount(self.cols, minlength=self.shape[1])
+
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_events() -> list:
+    """All events: events.json if it has been built, else the chapter files."""
+    if EVENTS_FILE.exists():
+        return load_json(EVENTS_FILE).get("events", [])
+    return [e for path in sorted(EVENTS_DIR.glob("chapter_*.json"))
+            for e in load_json(path).get("events", [])]
+
+
+def build_graph(characters: list, factions: list, events: list) -> dict:
+    """Intern ids and build the A, F and M incidence matrices.
+
+    Character and faction axes come from characters.json / factions.json;
+    ids that appear only in events are counted but not interned.
+    """
+    chars = Interner(c["id"] for c in characters)
+    facs = Interner(f["faction_id"] for f in factions)
+    evts = Interner(e["event_id"] for e in events)
+
+    a_rows, a_cols, f_rows, f_cols = [], [], [], []
+    unknown = {"characters": set(), "factions": set(), "event_refs": set()}
+    for e in events:
+        col = evts.get(e["event_id"])
+        for cid in e.get("characters", []):
+            row = chars.get(cid)
+            if row is None:
+                unknown["characters"].add(cid)
+                continue
+            a_rows.append(row)
+            a_cols.append(col)
+        for fid in e.get("factions_affected", []):
+            row = facs.get(fid)
+            if row is None:
+                unknown["factions"].add(fid)
+                continue
+            f_rows.append(row)
+            f_cols.append(col)
+    for c in characters:
+        row = chars.get(c["id"])
+        for ref in c.get("event_refs", []):
+            col = evts.get(ref)
+            if col is None:
+                unknown["event_refs"].add(ref)
+                continue
+            a_rows.append(row)
+            a_cols.append(col)
+
+    m_rows, m_cols = [], []
+    for c in characters:
+        for fid in c.get("faction_ids", []):
+            if fid in facs.index:
+                m_rows.append(chars.get(c["id"]))
+                m_cols.append(facs.get(fid))
+    for f in factions:
+        for cid in f.get("member_ids", []) + [f.get("leader_id")]:
+            if cid in chars.index:
+                m_rows.append(chars.get(cid))
+                m_cols.append(facs.get(f["faction_id"]))
+
+    return {
+        "characters": chars,
+        "factions": facs,
+        "events": evts,
+        "A": Incidence(a_rows, a_cols, (len(chars), len(evts))),
+        "F": Incidence(f_rows, f_cols, (len(facs), len(evts))),
+        "M": Incidence(m_rows, m_cols, (len(chars), len(facs))),
+        "unknown": {k: sorted(v) for k, v in unknown.items()},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Analytics
+# ---------------------------------------------------------------------------
+
+def row_normalize(m: np.ndarray) -> np.ndarray:
+    totals = m.sum(axis=1, keepdims=True)
+    return np.divide(m, totals, out=np.zeros_like(m), where=totals > 0)
+
+
+def eigenvector_centrality(adjacency: np.ndarray) -> np.ndarray:
+    """Principal eigenvector of a symmetric non-negative matrix, max-scaled to 1."""
+    n = adjacency.shape[0]
+    if not n or not adjacency.any():
+        return np.zeros(n)
+    # Adding the identity keeps power iteration from oscillating on
+    # bipartite-like components without changing the eigenvectors
+    shifted = adjacency + np.eye(n) * adjacency.max()
+    x = np.full(n, 1.0 / n)
+    for _ in range(CENTRALITY_ITERATIONS):
+        nxt = shifted @ x
+        nxt /= np.abs(nxt).max()
+        if np.abs(nxt - x).max() < CENTRALITY_TOLERANCE:
+            return nxt
+        x = nxt
+    return x
+
+
+def analyze(graph: dict) -> dict:
+    """All pairwise and per-character measures as arrays over the interned axes."""
+    A, F, M = graph["A"], graph["F"], graph["M"]
+
+    # Each event weighted by 1 / its number of (known) characters
+    per_event = A.col_counts().astype(float)
+    weights = np.divide(1.0, per_event, out=np.zeros_like(per_event), where=per_event > 0)
+
+    a = A.dense()
+    f = F.dense()
+    m = M.dense()
+
+    cooc = a @ a.T
+    n = np.diag(cooc).copy()
+    norm = np.sqrt(np.outer(n, n))
+    strength = np.divide(cooc, norm, out=np.zeros_like(cooc), where=norm > 0)
+    np.fill_diagonal(strength, 0.0)
+    shared = cooc.copy()
+    np.fill_diagonal(shared, 0.0)
+
+    exposure = (a * weights) @ f.T
+    faction_events = a @ f.T
+    # Associates are weighted by how rare they are (log N / nⱼ): someone
+    # present in nearly every event says nothing about anyone's allegiance
+    # The same rarity weight applies to factions named in most events
+    rarity = np.log(np.divide(len(weights), n, out=np.ones_like(n), where=n > 0))
+    f_n = f.sum(axis=1)
+    f_rarity = np.log(np.divide(len(weights), f_n, out=np.ones_like(f_n), where=f_n > 0))
+    affinity = (0.5 * row_normalize(exposure * f_rarity)
+                + 0.5 * row_normalize(strength * rarity) @ m)
+
+    return {
+        "events": n.astype(int),
+        "shared": shared.astype(int),
+        "strength": strength,
+        "degree": (shared > 0).sum(axis=1),
+        "weighted_degree": strength.sum(axis=1),
+        "centrality": eigenvector_centrality(shared),
+        "exposure": exposure,
+        "faction_events": faction_events.astype(int),
+        "affinity": affinity,
+        "membership": m.astype(bool),
+    }
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the k highest scores per row, best first."""
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.zeros((scores.shape[0], 0), dtype=np.int64)
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(-scores, part, axis=1).argsort(axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+def suggestions(graph: dict, result: dict,
+                min_affinity: float = SUGGEST_MIN_AFFINITY,
+                min_events: int = SUGGEST_MIN_EVENTS) -> list:
+    """(character, faction) pairs outside the known membership, strongest first."""
+    mask = ((result["affinity"] >= min_affinity)
+            & (result["faction_events"] >= min_events)
+            & ~result["membership"])
+    rows, cols = np.nonzero(mask)
+    order = np.argsort(-result["affinity"][rows, cols], kind="stable")
+    chars, facs = graph["characters"].ids, graph["factions"].ids
+    return [{
+        "character": chars[r],
+        "faction": facs[c],
+        "affinity": round(float(result["affinity"][r, c]), 3),
+        "events": int(result["faction_events"][r, c]),
+    } for r, c in zip(rows[order], cols[order])]
+
+
+def relations(graph: dict, result: dict) -> dict:
+    """Per-character and per-faction summaries (the export payload)."""
+    chars, facs = graph["characters"].ids, graph["factions"].ids
+    strength, shared, affinity = result["strength"], result["shared"], result["affinity"]
+    associates = top_k(strength, ASSOCIATES)
+    closest_factions = top_k(affinity, FACTIONS_PER_CHARACTER)
+
+    suggested = {}
+    for s in suggestions(graph, result):
+        suggested.setdefault(s["character"], []).append(s["faction"])
+
+    characters = {}
+    for i, cid in enumerate(chars):
+        characters[cid] = {
+            "events": int(result["events"][i]),
+            "degree": int(result["degree"][i]),
+            "centrality": round(float(result["centrality"][i]), 4),
+            "associates": [{"id": chars[j], "shared": int(shared[i, j]),
+                            "strength": round(float(strength[i, j]), 3)}
+                           for j in associates[i] if shared[i, j] > 0],
+            "factions": [{"id": facs[j], "affinity": round(float(affinity[i, j]), 3),
+                          "events": int(result["faction_events"][i, j]),
+                          "member": bool(result["membership"][i, j])}
+                         for j in closest_factions[i] if affinity[i, j] > 0],
+            "suggested_factions": suggested.get(cid, []),
+        }
+
+    # Faction view: strongest affiliated characters by the same affinity
+    by_faction = top_k(affinity.T, ASSOCIATES)
+    factions = {}
+    for j, fid in enumerate(facs):
+        factions[fid] = {
+            "events": int(graph["F"].row_counts()[j]),
+            "members": int(result["membership"][:, j].sum()),
+            "affiliated": [{"id": chars[i], "affinity": round(float(affinity[i, j]), 3),
+                            "member": bool(result["membership"][i, j])}
+                           for i in by_faction[j] if affinity[i, j] > 0],
+        }
+    return {"characters": characters, "factions": factions}
+
+
+def export_for_game(graph: dict, result: dict) -> dict:
+    return {
+        "meta": {
+            "description": "Character co-occurrence, closest associates and faction affinity. "
+                           "Generated by tools/character_graph.py --export — do not edit.",
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "events": len(graph["events"]),
+            "strength": "shared events / sqrt(events_a * events_b)",
+        },
+        **relations(graph, result),
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def load_all() -> tuple:
+    characters = load_json(CHARACTERS_FILE).get("characters", [])
+    factions = load_json(FACTIONS_FILE).get("factions", [])
+    graph = build_graph(characters, factions, load_events())
+    return graph, analyze(graph)
+
+
+def print_summary(graph: dict, result: dict, limit: int) -> None:
+    chars = graph["characters"].ids
+    A, F = graph["A"], graph["F"]
+    print(f"\n{len(chars)} characters × {len(graph['events'])} events "
+          f"({A.nnz} links), {len(graph['factions'])} factions ({F.nnz} links), "
+          f"{graph['M'].nnz} known memberships")
+    for kind, ids in graph["unknown"].items():
+        if ids:
+            print(f"  unknown {kind}: {len(ids)} ({', '.join(ids[:5])}{', ...' if len(ids) > 5 else ''})")
+
+    print(f"\nMost central characters:")
+    for i in np.argsort(-result["centrality"], kind="stable")[:limit]:
+        print(f"  {result['centrality'][i]:.3f}  {chars[i]:<32} "
+              f"{result['events'][i]:>4} events, {result['degree'][i]:>3} associates")
+
+    pairs = suggestions(graph, result)
+    print(f"\nMembership suggestions: {len(pairs)}")
+    for s in pairs[:limit]:
+        print(f"  {s['affinity']:.3f}  {s['character']:<32} → {s['faction']} ({s['events']} events)")
+    if len(pairs) > limit:
+        print(f"  ... and {len(pairs) - limit} more (--suggest)")
+
+
+def print_character(graph: dict, result: dict, cid: str) -> None:
+    info = relations(graph, result)["characters"].get(cid)
+    if info is None:
+        print(f"ERROR: {cid} not in characters.json")
+        sys.exit(1)
+    print(f"\n{cid}: {info['events']} events, {info['degree']} associates, "
+          f"centrality {info['centrality']:.3f}")
+    print("\n  Closest associates:")
+    for a in info["associates"]:
+        print(f"    {a['strength']:.3f}  {a['id']:<32} {a['shared']:>3} shared events")
+    print("\n  Faction affinity:")
+    for f in info["factions"]:
+        mark = "member" if f["member"] else ("suggested" if f["id"] in info["suggested_factions"] else "")
+        print(f"    {f['affinity']:.3f}  {f['id']:<32} {f['events']:>3} events  {mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Character co-occurrence and relationship analytics")
+    parser.add_argument("--id", type=str, help="Show one character's associates and affinities")
+    parser.add_argument("--suggest", action="store_true", help="List all membership suggestions")
+    parser.add_argument("--min-affinity", type=float, default=SUGGEST_MIN_AFFINITY,
+                        help=f"Suggestion threshold (default {SUGGEST_MIN_AFFINITY})")
+    parser.add_argument("--min-events", type=int, default=SUGGEST_MIN_EVENTS,
+                        help=f"Shared events needed for a suggestion (default {SUGGEST_MIN_EVENTS})")
+    parser.add_argument("--export", action="store_true", help="Write character_relations.json for the game")
+    parser.add_argument("--json", action="store_true", help="Print the export payload as JSON")
+    parser.add_argument("--limit", type=int, default=15, help="Rows per summary section")
+    args = parser.parse_args()
+
+    graph, result = load_all()
+
+    if args.json:
+        print(json.dumps(export_for_game(graph, result), indent=2, ensure_ascii=False))
+    elif args.id:
+        print_character(graph, result, args.id)
+    elif args.suggest:
+        for s in suggestions(graph, result, args.min_affinity, args.min_events):
+            print(f"  {s['affinity']:.3f}  {s['character']:<32} → {s['faction']} ({s['events']} events)")
+    else:
+        print_summary(graph, result, args.limit)
+
+    if args.export:
+        data = export_for_game(graph, result)
+        tmp = EXPORT_FILE.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp.replace(EXPORT_FILE)
+        print(f"\nExported {len(data['characters'])} characters, {len(data['factions'])} factions "
+              f"→ {EXPORT_FILE.relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
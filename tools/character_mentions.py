@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Character Mentions — Alias-aware multi-pattern scanner for exchange text.
+
+Builds one word trie of every surface form a character can appear under
+(display name with and without titles, characters.json aliases,
+tools/known_aliases.json aliases) and finds all of them in a single pass over
+accent-folded, lowercased text, longest form first ("lucia d este" over
+"lucia"). A form shared by several characters (e.g. a bare "maria") counts as
+a hit for each of them.
+
+Used by extract_from_exchanges_v2.py to prune the known-character roster
+sent to Haiku down to characters plausibly relevant to the chapter.
+
+The mention index (tools/preprocessed/character_mentions.json) stores, per
+event, each character's mention count, the count of mentions through a form
+no other character shares, and the first mention (exchange index, offset in
+the exchange text), next to the event's `characters` list. update_index()
+rescans only chapter files whose mtime or size changed, and everything when
+the surface forms change (characters.json names/aliases, known_aliases.json).
+From it:
+
+  unlisted     characters named in an event's exchanges but not in its list
+               (counting unshared forms only, so a bare "maria" flags no one)
+  unmentioned  characters in an event's list never named in its exchanges
+
+Usage:
+  python3 tools/character_mentions.py --chapter 2.25     # Mention counts per character
+  python3 tools/character_mentions.py --build            # Update the mention index
+  python3 tools/character_mentions.py --unlisted --min 3
+  python3 tools/character_mentions.py --unmentioned --chapter 2.25 --json
+"""
+
+import re
+import json
+import hashlib
+import argparse
+import unicodedata
+from bisect import bisect_right
+from pathlib import Path
+from collections import Counter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+TOOLS_DIR = PROJECT_ROOT / "tools"
+EVENTS_DIR = DATA_DIR / "events"
+ALIASES_FILE = TOOLS_DIR / "known_aliases.json"
+INDEX_FILE = TOOLS_DIR / "preprocessed" / "character_mentions.json"
+INDEX_FORMAT = 1
+
+# Leading honorifics stripped from display names to get a bare-name form
+TITLE_WORDS = {
+    "king", "queen", "prince", "princess", "infante", "infanta", "don", "dona",
+    "fray", "brother", "father", "cardinal", "bishop", "archbishop", "pope",
+    "patriarch", "emperor", "empress", "sultan", "lord", "lady", "sir", "ser",
+    "count", "countess", "duke", "duchess", "marquis", "baron", "admiral",
+    "captain", "commander", "master", "doctor", "rabbi", "sheikh", "imam",
+}
+
+# Surface forms shorter than this are too ambiguous to scan for
+MIN_FORM_LENGTH = 4
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+NON_ASCII_RE = re.compile(r"[^\x00-\x7f]+")
+
+
+def fold_text(text: str) -> str:
+    """Lowercase, strip accents, collapse every non-alphanumeric run to a space."""
+    nfkd = unicodedata.normalize("NFKD", text)
+    ascii_only = nfkd.encode("ASCII", "ignore").decode("ASCII")
+    return re.sub(r"[^a-z0-9]+", " ", ascii_only.lower())
+
+
+def surface_forms(name: str, aliases: list) -> set:
+    """All folded forms a character may be written as."""
+    forms = set()
+    if name:
+        folded = fold_text(name).strip()
+        forms.add(folded)
+        words = folded.split()
+        while words and words[0] in TITLE_WORDS:
+            words = words[1:]
+        # "Juan II of Castile" → "juan ii"
+        if "of" in words[1:]:
+            forms.add(" ".join(words[:words.index("of", 1)]))
+        forms.add(" ".join(words))
+    for alias in aliases:
+        forms.add(fold_text(alias.replace("_", " ")).strip())
+    return {f for f in forms if len(f) >= MIN_FORM_LENGTH}
+
+
+class MentionScanner:
+    """Single compiled automaton over every character surface form."""
+
+    def __init__(self, characters_db: list, aliases: dict):
+        form_to_ids = {}
+        for c in characters_db:
+            for form in surface_forms(c.get("name", ""), c.get("aliases", []) + [c["id"]]):
+                form_to_ids.setdefault(form, set()).add(c["id"])
+        for canonical_id, info in aliases.items():
+            for form in surface_forms(info.get("name", ""),
+                                      info.get("aliases", []) + [canonical_id]):
+                form_to_ids.setdefault(form, set()).add(canonical_id)
+
+        self.form_to_ids = form_to_ids
+        # Word trie over the forms: folded text is single-space-separated
+        # words, so a form can only match whole words starting at a word
+        self.trie = {}
+        for form in form_to_ids:
+            node = self.trie
+            for word in form.split():
+                node = node.setdefault(word, {})
+            node[None] = form
+
+    def matches(self, folded: str):
+        """(word index, form) of each mention, leftmost-longest, non-overlapping."""
+        words = folded.split()
+        trie = self.trie
+        i, n = 0, len(words)
+        while i < n:
+            node = trie.get(words[i])
+            if node is None:
+                i += 1
+                continue
+            form, end, j = node.get(None), i + 1, i + 1
+            while j < n and (node := node.get(words[j])) is not None:
+                j += 1
+                if None in node:
+                    form, end = node[None], j
+            if form is None:
+                i += 1
+                continue
+            yield i, form
+            i = end
+
+    def scan(self, text: str) -> Counter:
+        """Count mentions per character ID in *text*."""
+        counts = Counter()
+        if not text:
+            return counts
+        for _, form in self.matches(fold_text(text)):
+            for cid in self.form_to_ids[form]:
+                counts[cid] += 1
+        return counts
+
+    def key(self) -> str:
+        """Hash of the surface forms (an index built with another key is stale)."""
+        forms = json.dumps(sorted((f, sorted(ids)) for f, ids in self.form_to_ids.items()))
+        return hashlib.sha256(forms.encode("utf-8")).hexdigest()[:16]
+
+    def first_mentions(self, text: str) -> dict:
+        """{character ID: [count, unshared count, first offset in text]}."""
+        found = {}
+        if not text:
+            return found
+        folded = fold_text(text)
+        for word, form in self.matches(folded):
+            ids = self.form_to_ids[form]
+            for cid in ids:
+                entry = found.get(cid)
+                if entry is None:
+                    entry = found[cid] = [0, 0, word]
+                entry[0] += 1
+                entry[1] += len(ids) == 1
+        if found:
+            offsets = word_offsets(text)
+            for entry in found.values():
+                entry[2] = offsets[entry[2]]
+        return found
+
+    def scan_events(self, events: list) -> Counter:
+        """Mention counts over all exchange text of a list of events."""
+        counts = Counter()
+        for evt in events:
+            for ex in evt.get("exchanges", []):
+                counts.update(self.scan(ex.get("text", "")))
+        return counts
+
+
+def word_offsets(text: str) -> list:
+    """Offset in text of each word of fold_text(text).
+
+    ASCII runs fold one character to one; each non-ASCII run is folded on
+    its own (NFKD is local to it) and its output maps back to its start.
+    """
+    if text.isascii():
+        return [m.start() for m in WORD_RE.finditer(text.lower())]
+    pieces, segments = [], []          # segments: (folded start, text start, 1:1?)
+    pos = folded_len = 0
+    for m in NON_ASCII_RE.finditer(text):
+        for start, chunk, one_to_one in ((pos, text[pos:m.start()], True),
+                                         (m.start(), m.group(), False)):
+            if not one_to_one:
+                chunk = unicodedata.normalize("NFKD", chunk).encode("ASCII", "ignore").decode("ASCII")
+            segments.append((folded_len, start, one_to_one))
+            pieces.append(chunk.lower())
+            folded_len += len(chunk)
+        pos = m.end()
+    segments.append((folded_len, pos, True))
+    pieces.append(text[pos:].lower())
+
+    seg_starts = [seg[0] for seg in segments]
+    offsets = []
+    for m in WORD_RE.finditer("".join(pieces)):
+        seg_start, text_start, one_to_one = segments[bisect_right(seg_starts, m.start()) - 1]
+        offsets.append(text_start + (m.start() - seg_start if one_to_one else 0))
+    return offsets
+
+
+def load_aliases() -> dict:
+    if not ALIASES_FILE.exists():
+        return {}
+    with open(ALIASES_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_scanner() -> MentionScanner:
+    with open(DATA_DIR / "characters.json", "r", encoding="utf-8") as f:
+        characters_db = json.load(f).get("characters", [])
+    return MentionScanner(characters_db, load_aliases())
+
+
+# ---------------------------------------------------------------------------
+# Mention index
+# ---------------------------------------------------------------------------
+
+def chapter_files() -> list:
+    return sorted(EVENTS_DIR.glob("chapter_*.json"))
+
+
+def index_chapter(scanner: MentionScanner, events: list) -> dict:
+    """{event_id: {"listed": [...], "mentions": {cid: [count, unshared, exchange, offset]}}}."""
+    indexed = {}
+    for evt in events:
+        mentions = {}
+        for idx, ex in enumerate(evt.get("exchanges", [])):
+            for cid, (count, unshared, offset) in scanner.first_mentions(ex.get("text", "")).items():
+                entry = mentions.get(cid)
+                if entry is None:
+                    mentions[cid] = [count, unshared, idx, offset]
+                else:
+                    entry[0] += count
+                    entry[1] += unshared
+        indexed[evt.get("event_id", "unknown")] = {
+            "listed": evt.get("characters", []),
+            "mentions": mentions,
+        }
+    return indexed
+
+
+def update_index(scanner: MentionScanner | None = None, force: bool = False) -> tuple:
+    """Bring the mention index up to date; returns (index, rescanned chapter files)."""
+    scanner = scanner or load_scanner()
+    index = None
+    if INDEX_FILE.exists() and not force:
+        with open(INDEX_FILE, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("format") != INDEX_FORMAT or index.get("scanner") != scanner.key():
+            index = None
+    if index is None:
+        index = {"format": INDEX_FORMAT, "scanner": scanner.key(), "chapters": {}}
+
+    present = {p.name: p for p in chapter_files()}
+    rescanned = []
+    for name in list(index["chapters"]):
+        if name not in present:
+            del index["chapters"][name]
+            rescanned.append(name)
+    for name, path in present.items():
+        st = path.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        if index["chapters"].get(name, {}).get("stamp") == stamp:
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            events = json.load(f).get("events", [])
+        index["chapters"][name] = {"stamp": stamp, "events": index_chapter(scanner, events)}
+        rescanned.append(name)
+
+    if rescanned:
+        INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = INDEX_FILE.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(INDEX_FILE)
+    return index, rescanned
+
+
+def canonical_ids(characters_db: list, aliases: dict) -> dict:
+    """Alias or ID → every ID it may stand for (itself included)."""
+    resolve = {}
+    for c in characters_db:
+        for alias in c.get("aliases", []) + [c["id"]]:
+            resolve.setdefault(alias, {alias}).add(c["id"])
+    for canonical_id, info in aliases.items():
+        for alias in info.get("aliases", []) + [canonical_id]:
+            resolve.setdefault(alias, {alias}).add(canonical_id)
+    return resolve
+
+
+def iter_events(index: dict, chapter: str | None = None):
+    """(chapter file, event_id, entry) in file order, optionally one chapter."""
+    for name in sorted(index["chapters"]):
+        if chapter and name != f"chapter_{chapter}.json":
+            continue
+        for event_id, entry in index["chapters"][name]["events"].items():
+            yield name, event_id, entry
+
+
+def unlisted_report(index: dict, characters_db: list, aliases: dict,
+                    min_count: int = 2, chapter: str | None = None) -> list:
+    """Characters (characters.json) named at least min_count times by an unshared
+    form in an event's exchanges but missing from its characters list."""
+    resolve = canonical_ids(characters_db, aliases)
+    db_ids = {c["id"] for c in characters_db}
+    rows = []
+    for name, event_id, entry in iter_events(index, chapter):
+        listed = set()
+        for cid in entry["listed"]:
+            listed |= resolve.get(cid, {cid})
+        for cid, (count, unshared, exchange, offset) in entry["mentions"].items():
+            if cid in db_ids and unshared >= min_count and not (resolve.get(cid, {cid}) & listed):
+                rows.append({"file": name, "event_id": event_id, "character": cid,
+                             "mentions": count, "exchange": exchange, "offset": offset})
+    return rows
+
+
+def unmentioned_report(index: dict, characters_db: list, aliases: dict,
+                       chapter: str | None = None) -> list:
+    """Characters in an event's characters list never named in its exchanges."""
+    resolve = canonical_ids(characters_db, aliases)
+    rows = []
+    for name, event_id, entry in iter_events(index, chapter):
+        mentioned = set(entry["mentions"])
+        for cid in entry["listed"]:
+            if not (resolve.get(cid, {cid}) & mentioned):
+                rows.append({"file": name, "event_id": event_id, "character": cid})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Character mentions in exchange text")
+    parser.add_argument("--chapter", help="Chapter ID (e.g., 2.25)")
+    parser.add_argument("--build", action="store_true", help="Update the mention index")
+    parser.add_argument("--force", action="store_true", help="With --build: rescan every chapter")
+    parser.add_argument("--unlisted", action="store_true",
+                        help="Characters mentioned in an event but not in its list")
+    parser.add_argument("--unmentioned", action="store_true",
+                        help="Characters listed for an event but never mentioned")
+    parser.add_argument("--min", type=int, default=2,
+                        help="--unlisted: minimum unshared mentions (default: 2)")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    if args.build or args.unlisted or args.unmentioned:
+        scanner = load_scanner()
+        index, rescanned = update_index(scanner, force=args.force)
+        if args.build:
+            print(f"Mention index: {len(index['chapters'])} chapter files, "
+                  f"{len(rescanned)} rescanned ({len(scanner.form_to_ids)} surface forms)")
+        with open(DATA_DIR / "characters.json", "r", encoding="utf-8") as f:
+            characters_db = json.load(f).get("characters", [])
+        aliases = load_aliases()
+        reports = []
+        if args.unlisted:
+            reports.append(("Mentioned but not listed",
+                            unlisted_report(index, characters_db, aliases, args.min, args.chapter)))
+        if args.unmentioned:
+            reports.append(("Listed but never mentioned",
+                            unmentioned_report(index, characters_db, aliases, args.chapter)))
+        if args.json:
+            print(json.dumps({title: rows for title, rows in reports}, indent=2, ensure_ascii=False))
+            return
+        for title, rows in reports:
+            print(f"\n{title}: {len(rows)}")
+            for r in rows:
+                where = f"  {r['mentions']:>3}x, first in [{r['exchange']}] @{r['offset']}" \
+                    if "mentions" in r else ""
+                print(f"  {r['event_id']:<18} {r['character']:<32}{where}")
+        return
+
+    if not args.chapter:
+        parser.error("give --chapter, --build, --unlisted or --unmentioned")
+    with open(EVENTS_DIR / f"chapter_{args.chapter}.json", "r", encoding="utf-8") as f:
+        events = json.load(f).get("events", [])
+    scanner = load_scanner()
+    counts = scanner.scan_events(events)
+    listed = {cid for evt in events for cid in evt.get("characters", [])}
+
+    print(f"Chapter {args.chapter}: {len(counts)} characters mentioned, "
+          f"{len(listed)} listed in events ({len(scanner.form_to_ids)} surface forms)")
+    for cid, n in counts.most_common():
+        print(f"  {n:>5}  {cid}{'' if cid in listed else '  (not listed)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,13 @@ across the entire dataset that per-chapter validation would miss.
 Checks:
   1. Character timeline: dead characters appearing in later events
   2. Character location jumps: impossibly fast location changes
+     (travel_check.py, locations.json coordinates)
   3. Faction membership conflicts: character in opposing factions
   4. Date ordering: events out of chronological order within a book
   5. Duplicate events: same summary appearing twice
   6. Orphan references: IDs that exist in one DB but not another
+  7. Event character lists: characters named in an event's exchanges but not
+     listed, or listed but never named (character_mentions.py index)
 
 Usage:
   python3 tools/check_consistency.py              # Full check
@@ -26,6 +29,14 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "resources" / "data"
 TOOLS_DIR = PROJECT_ROOT / "tools"
 
+sys.path.insert(0, str(TOOLS_DIR))
+from character_mentions import (update_index, load_aliases, unlisted_report,
+                                unmentioned_report)
+from travel_check import check_travel
+
+# Unshared-form mentions before an unlisted character is reported
+UNLISTED_MIN_MENTIONS = 3
+
 
 def load_json(path: Path) -> dict:
     if not path.exists():
@@ -82,6 +93,12 @@ def check_character_timelines(events: list, characters: list) -> list[dict]:
     return issues
 
 
+def check_location_jumps(events: list, locations: list) -> list[dict]:
+    """Find consecutive appearances too far apart for the days between them."""
+    return [{"type": "impossible_travel", **j}
+            for j in check_travel(events, locations)["journeys"]]
+
+
 def check_date_ordering(events: list) -> list[dict]:
     """Check for date regressions within each book."""
     issues = []
@@ -202,6 +219,18 @@ def check_orphan_references(events: list, characters: list, locations: list,
     return issues
 
 
+def check_event_character_lists(characters: list) -> list[dict]:
+    """Compare each event's characters list with who its exchanges name."""
+    index, _ = update_index()
+    aliases = load_aliases()
+    issues = []
+    for row in unlisted_report(index, characters, aliases, UNLISTED_MIN_MENTIONS):
+        issues.append({"type": "unlisted_character", **row})
+    for row in unmentioned_report(index, characters, aliases):
+        issues.append({"type": "unmentioned_character", **row})
+    return issues
+
+
 def check_character_field_gaps(characters: list) -> list[dict]:
     """Find characters with critical missing data."""
     issues = []
@@ -269,12 +298,21 @@ def print_report(all_issues: dict, json_output: bool = False):
             elif itype == "date_regression":
                 print(f"  {issue['from_chapter']} ({issue['from_date']}) → "
                       f"{issue['to_chapter']} ({issue['to_date']})")
+            elif itype == "impossible_travel":
+                print(f"  {issue['character']}: {issue['from']} → {issue['to']} "
+                      f"{issue['distance_km']:.0f} km in {issue['days']} d ({issue['mode']}), "
+                      f"{issue['from_event']} → {issue['to_event']}")
             elif itype == "possible_duplicate":
                 print(f"  {', '.join(issue['event_ids'])}: \"{issue['summary_prefix'][:60]}...\"")
             elif itype in ("missing_character", "missing_faction_leader",
                           "missing_faction_member", "orphan_roll", "orphan_law_origin"):
                 detail = {k: v for k, v in issue.items() if k != "type"}
                 print(f"  {detail}")
+            elif itype == "unlisted_character":
+                print(f"  {issue['event_id']}: {issue['character']} named {issue['mentions']}x "
+                      f"but not listed")
+            elif itype == "unmentioned_character":
+                print(f"  {issue['event_id']}: {issue['character']} listed but never named")
             elif itype == "character_data_gap":
                 print(f"  {issue['character_id']} ({issue['event_count']} events): "
                       f"missing {', '.join(issue['gaps'])}")
@@ -307,11 +345,13 @@ def main():
 
     all_issues = {
         "Character timelines": check_character_timelines(events, characters),
+        "Character location jumps": check_location_jumps(events, locations),
         "Date ordering": check_date_ordering(events),
         "Duplicate events": check_duplicate_events(events),
         "Orphan references": check_orphan_references(events, characters, locations,
                                                      factions, rolls, laws),
         "Character data gaps": check_character_field_gaps(characters),
+        "Event character lists": check_event_character_lists(characters),
     }
 
     print_report(all_issues, json_output=args.json)
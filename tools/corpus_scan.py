@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Corpus Scan — Multi-pattern audit scanner over the chapter event files.
+
+Finds every match of a set of audit regexes (GM thinking left in the text,
+wrong-age references, …) in the exchanges (and optionally summaries) of
+resources/data/events/chapter_*.json, and reports each hit as
+(chapter, event_id, exchange index, pattern, offset, context).
+
+Each text is scanned once per pattern set, not once per pattern: every
+pattern is reduced to a literal it cannot match without (taken from the
+parsed regex: "(?i)(?:^|\\n)\\s*Let me think" needs "let me think", a
+branch contributes all its alternatives), the text is lowercased once, and
+only the patterns whose literals occur in it are run. A Python re
+alternation of all patterns would be one compiled regex but is several
+times slower than the separate regexes (re tries every branch at every
+position); the literal checks are C substring searches, so adding patterns
+adds almost nothing to the scan. Hits are exactly those of running each
+pattern's finditer on each text.
+
+By default the texts come from the exchange blob (exchange_blob.py,
+rebuilt when a chapter file changed): roles and chapters are filtered on
+its offset table and only the selected texts are decoded, with no JSON
+parsing. With --no-blob the chapter files are parsed instead, spread over
+a process pool. Hits are written as JSONL, in chapter order.
+
+Pattern sets: gm_thinking (scan_gm_thinking.PATTERNS), age
+(apply_review_fixes.AGE_PATTERNS), or ad hoc --regex patterns.
+
+Usage:
+  python3 tools/corpus_scan.py --set gm_thinking > hits.jsonl
+  python3 tools/corpus_scan.py --set age --summaries --role any
+  python3 tools/corpus_scan.py --regex '(?i)\\bducats?\\b' --regex 'Hamza' --chapters 2.20-2.30
+  python3 tools/corpus_scan.py --set gm_thinking --stats    # Counts per pattern only
+  python3 tools/corpus_scan.py --set gm_thinking --no-blob  # Scan the JSON files
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import importlib
+from pathlib import Path
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import re._parser as sre_parse
+    from re._constants import LITERAL, SUBPATTERN, BRANCH, MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT
+except ImportError:  # Python < 3.11
+    import sre_parse
+    from sre_constants import LITERAL, SUBPATTERN, BRANCH, MAX_REPEAT, MIN_REPEAT
+    POSSESSIVE_REPEAT = MAX_REPEAT
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EVENTS_DIR = PROJECT_ROOT / "resources" / "data" / "events"
+TOOLS_DIR = PROJECT_ROOT / "tools"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from exchange_blob import open_blob, SUMMARY_ROLE
+
+# name → (module, attribute); the attribute is {category: [(regex, description), ...]}
+PATTERN_SETS = {
+    "gm_thinking": ("scan_gm_thinking", "PATTERNS"),
+    "age": ("apply_review_fixes", "AGE_PATTERNS"),
+}
+
+CONTEXT_BEFORE = 20
+CONTEXT_AFTER = 100
+
+
+# ---------------------------------------------------------------------------
+# Required literals
+# ---------------------------------------------------------------------------
+
+def _required(items) -> set | None:
+    """Best set of literals one of which every match must contain (None: none found)."""
+    candidates = []
+    run = []
+    for op, av in list(items) + [(None, None)]:
+        if op is LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            candidates.append({"".join(run)})
+            run = []
+        if op is SUBPATTERN:
+            sub = _required(av[-1])
+        elif op is BRANCH:
+            alts = [_required(branch) for branch in av[1]]
+            sub = set().union(*alts) if all(alts) else None
+        elif op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT) and av[0] >= 1:
+            sub = _required(av[2])
+        else:
+            sub = None
+        if sub:
+            candidates.append(sub)
+    if not candidates:
+        return None
+    return max(candidates, key=lambda c: min(len(s) for s in c))
+
+
+def required_literals(regex: str) -> set | None:
+    """Lowercased literals, one of which occurs in any text the regex matches."""
+    found = _required(sre_parse.parse(regex))
+    return {s.lower() for s in found} if found else None
+
+
+# ---------------------------------------------------------------------------
+# Pattern sets
+# ---------------------------------------------------------------------------
+
+def from_categories(patterns: dict) -> list:
+    """{category: [(regex, description)]} → [(description, regex, category)]."""
+    return [(desc, regex, category)
+            for category, items in patterns.items() for regex, desc in items]
+
+
+def load_pattern_set(name: str) -> list:
+    module, attr = PATTERN_SETS[name]
+    return from_categories(getattr(importlib.import_module(module), attr))
+
+
+class PatternSet:
+    """Compiled patterns plus the literal prefilter that picks which to run."""
+
+    def __init__(self, patterns: list):
+        """patterns: [(name, regex, category), ...]."""
+        self.patterns = []
+        self.by_literal = {}
+        self.always = []
+        for i, (name, regex, category) in enumerate(patterns):
+            self.patterns.append((name, re.compile(regex), category))
+            literals = required_literals(regex)
+            if literals is None:
+                self.always.append(i)
+            else:
+                for lit in literals:
+                    self.by_literal.setdefault(lit, []).append(i)
+
+    def scan(self, text: str):
+        """Yield (name, category, match) in pattern order, then offset order."""
+        low = text.lower()
+        selected = set(self.always)
+        for lit, indexes in self.by_literal.items():
+            if lit in low:
+                selected.update(indexes)
+        for i in sorted(selected):
+            name, regex, category = self.patterns[i]
+            for m in regex.finditer(text):
+                yield name, category, m
+
+
+def get_context(text: str, start: int) -> str:
+    """One-line snippet around an offset (scan_gm_thinking.py format)."""
+    lo = max(0, start - CONTEXT_BEFORE)
+    hi = min(len(text), start + CONTEXT_AFTER)
+    snippet = text[lo:hi].replace("\n", "\\n")
+    return ("..." if lo > 0 else "") + snippet + ("..." if hi < len(text) else "")
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def iter_texts(data: dict, roles: tuple | None = ("gm",), summaries: bool = False):
+    """(event_id, exchange index or None, role, text) for one chapter file."""
+    events = data if isinstance(data, list) else data.get("events", [])
+    for event in events:
+        event_id = event.get("event_id", "unknown")
+        if summaries and event.get("summary"):
+            yield event_id, None, "summary", event["summary"]
+        for idx, exchange in enumerate(event.get("exchanges", [])):
+            role = exchange.get("role")
+            if roles is not None and role not in roles:
+                continue
+            if exchange.get("text"):
+                yield event_id, idx, role, exchange["text"]
+
+
+def scan_data(data: dict, pattern_set: PatternSet, file_name: str = "",
+              roles: tuple | None = ("gm",), summaries: bool = False) -> list:
+    """Hits for one parsed chapter file."""
+    chapter = data.get("chapter", "unknown") if isinstance(data, dict) else "unknown"
+    hits = []
+    for event_id, idx, role, text in iter_texts(data, roles, summaries):
+        for name, category, m in pattern_set.scan(text):
+            hits.append({
+                "file": file_name,
+                "chapter": chapter,
+                "event_id": event_id,
+                "exchange": idx,
+                "role": role,
+                "category": category,
+                "pattern": name,
+                "offset": m.start(),
+                "match": m.group(0),
+                "context": get_context(text, m.start()),
+            })
+    return hits
+
+
+_worker = {}
+
+
+def _init_worker(patterns: list, roles, summaries: bool) -> None:
+    _worker["set"] = PatternSet(patterns)
+    _worker["roles"] = roles
+    _worker["summaries"] = summaries
+
+
+def _scan_path(path: str) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return scan_data(data, _worker["set"], os.path.basename(path),
+                     _worker["roles"], _worker["summaries"])
+
+
+def scan_blob(blob, pattern_set: PatternSet, files: list | None = None,
+              roles: tuple | None = ("gm",), summaries: bool = False):
+    """Yield hits from an open ExchangeBlob, in blob (chapter) order.
+
+    Entries are filtered on the offset table (role, file) before anything
+    is decoded, so only the texts that would be scanned are ever read.
+    """
+    summary_role = blob.roles.index(SUMMARY_ROLE)
+    wanted_roles = blob.role_ids(roles)
+    wanted_files = None
+    if files is not None:
+        names = {os.path.basename(str(p)) for p in files}
+        wanted_files = {i for i, name in enumerate(blob.files) if name in names}
+    event_col, role_col = blob.col["event"], blob.col["role"]
+
+    for i in range(len(blob)):
+        role = role_col[i]
+        if role == summary_role:
+            if not summaries:
+                continue
+        elif wanted_roles is not None and role not in wanted_roles:
+            continue
+        if wanted_files is not None and blob.events[event_col[i]][1] not in wanted_files:
+            continue
+        text = blob.text(i)
+        hits = [(name, category, m) for name, category, m in pattern_set.scan(text)]
+        if not hits:
+            continue
+        entry = blob.entry(i)
+        for name, category, m in hits:
+            yield {
+                "file": entry["file"],
+                "chapter": entry["chapter"],
+                "event_id": entry["event_id"],
+                "exchange": entry["exchange"],
+                "role": entry["role"] or None,
+                "category": category,
+                "pattern": name,
+                "offset": m.start(),
+                "match": m.group(0),
+                "context": get_context(text, m.start()),
+            }
+
+
+def chapter_files(chapters: str | None = None) -> list:
+    """Chapter event files in chapter order, optionally within a range ("1.20-1.30", "2")."""
+    def key(path: Path):
+        book, _, num = path.stem[len("chapter_"):].partition(".")
+        return int(book) * 1000 + int(num or 0)
+
+    files = sorted(EVENTS_DIR.glob("chapter_*.json"), key=key)
+    if chapters:
+        lo, _, hi = chapters.partition("-")
+        hi = hi or lo
+
+        def bound(c: str, upper: bool) -> int:
+            book, _, num = c.partition(".")
+            return int(book) * 1000 + (int(num) if num else (999 if upper else 0))
+
+        files = [p for p in files if bound(lo, False) <= key(p) <= bound(hi, True)]
+    return files
+
+
+def scan_corpus(patterns: list, files: list | None = None, roles: tuple | None = ("gm",),
+                summaries: bool = False, workers: int | None = None, use_blob: bool = True):
+    """Yield hits for every file (file order).
+
+    Reads the exchange blob (rebuilt first if stale) when use_blob, else
+    scans the JSON files in a process pool.
+    """
+    if use_blob:
+        with open_blob() as blob:
+            yield from scan_blob(blob, PatternSet(patterns), files, roles, summaries)
+        return
+    files = [str(p) for p in (files if files is not None else chapter_files())]
+    workers = workers or min(len(files), os.cpu_count() or 1) or 1
+    if workers == 1:
+        _init_worker(patterns, roles, summaries)
+        for path in files:
+            yield from _scan_path(path)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(patterns, roles, summaries)) as pool:
+        for hits in pool.map(_scan_path, files, chunksize=4):
+            yield from hits
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-pattern scan of chapter event files")
+    parser.add_argument("--set", action="append", choices=list(PATTERN_SETS),
+                        help="Named pattern set (repeatable)")
+    parser.add_argument("--regex", action="append", default=[], help="Ad hoc pattern (repeatable)")
+    parser.add_argument("--role", default="gm", choices=["gm", "player", "any"],
+                        help="Exchanges to scan (default: gm)")
+    parser.add_argument("--summaries", action="store_true", help="Also scan event summaries")
+    parser.add_argument("--chapters", help="Chapter or range: 1.23, 1.20-1.30, 2")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-blob", action="store_true",
+                        help="Parse the JSON files instead of the exchange blob")
+    parser.add_argument("--stats", action="store_true", help="Print hit counts per pattern, not hits")
+    args = parser.parse_args()
+
+    patterns = [p for name in (args.set or []) for p in load_pattern_set(name)]
+    patterns += [(regex, regex, "ad hoc") for regex in args.regex]
+    if not patterns:
+        parser.error("give --set and/or --regex")
+    for _, regex, _ in patterns:
+        try:
+            re.compile(regex)
+        except re.error as e:
+            print(f"ERROR: bad pattern {regex!r}: {e}")
+            sys.exit(1)
+
+    roles = None if args.role == "any" else (args.role,)
+    files = chapter_files(args.chapters)
+    t0 = time.time()
+    counts = Counter()
+    for hit in scan_corpus(patterns, files, roles, args.summaries, args.workers,
+                           not args.no_blob):
+        counts[(hit["category"], hit["pattern"])] += 1
+        if not args.stats:
+            sys.stdout.write(json.dumps(hit, ensure_ascii=False) + "\n")
+
+    if args.stats:
+        for (category, name), n in sorted(counts.items(), key=lambda kv: -kv[1]):
+            print(f"  {n:>6}  {name:<50} {category}")
+    print(f"{sum(counts.values())} hit(s), {len(patterns)} pattern(s), {len(files)} file(s) "
+          f"in {time.time() - t0:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
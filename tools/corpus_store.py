@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Corpus Store — Transparent per-file compression for source and archive corpora.
+
+resources/source_material/ (raw chat exports) and archive/ (v1 data, old
+chapter text) are read-only corpora. Each file may be stored as-is or packed
+next to its logical name with a codec suffix:
+
+  Claude-Chapter 1.json        plain
+  Claude-Chapter 1.json.zst    zstd (needs the zstandard package)
+  Claude-Chapter 1.json.gz     gzip
+
+Readers never see the difference: open_corpus(path) takes the logical path
+and returns a streaming file object over the decompressed bytes, and
+corpus_exists() / corpus_glob() find files under their logical names.
+
+Packed files are written as a series of independent frames (gzip members or
+zstd frames) of FRAME_SIZE uncompressed bytes. Both codecs read concatenated
+frames as one stream, so a plain decompress of the file still works; the
+frame table in the directory's .corpus_frames.json (uncompressed offset →
+stored offset per frame, plus size and sha256) additionally lets
+read_range() decompress only the frames covering a byte range.
+
+Usage:
+  python3 tools/corpus_store.py status resources/source_material archive
+  python3 tools/corpus_store.py pack resources/source_material archive/v1_data
+  python3 tools/corpus_store.py pack archive/all_chapters.json --codec gzip --level 9
+  python3 tools/corpus_store.py unpack archive/chapters
+  python3 tools/corpus_store.py cat "resources/source_material/book1/Claude-Chapter 1.json" --range 0 400
+"""
+
+import io
+import os
+import sys
+import gzip
+import json
+import bisect
+import hashlib
+import argparse
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Logical file → stored file suffix, in lookup order
+CODEC_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+DEFAULT_LEVELS = {"zstd": 19, "gzip": 9}
+INDEX_NAME = ".corpus_frames.json"
+
+FRAME_SIZE = 1 << 20
+READ_CHUNK = 1 << 20
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def _require_zstd() -> None:
+    if zstandard is None:
+        raise RuntimeError("zstd-packed corpus file needs the zstandard package "
+                           "(pip install zstandard)")
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+def stored_path(path) -> tuple:
+    """(stored file, codec) for a logical path; codec is None for plain files.
+
+    Raises FileNotFoundError if no form exists.
+    """
+    path = Path(path)
+    if path.exists():
+        return path, None
+    for codec, suffix in CODEC_SUFFIXES.items():
+        packed = path.with_name(path.name + suffix)
+        if packed.exists():
+            return packed, codec
+    raise FileNotFoundError(f"corpus file not found: {path}")
+
+
+def corpus_exists(path) -> bool:
+    try:
+        stored_path(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def corpus_glob(directory, pattern: str) -> list:
+    """Logical paths matching pattern in directory, whichever form is stored."""
+    directory = Path(directory)
+    found = set(directory.glob(pattern))
+    for suffix in CODEC_SUFFIXES.values():
+        found.update(p.with_name(p.name[:-len(suffix)]) for p in directory.glob(pattern + suffix))
+    return sorted(p for p in found if p.name != INDEX_NAME)
+
+
+def open_corpus(path, mode: str = "r", encoding: str = "utf-8"):
+    """Open a corpus file by logical path; mode "r" (text) or "rb" (bytes).
+
+    Packed files are decompressed as they are read.
+    """
+    if mode not in ("r", "rt", "rb"):
+        raise ValueError(f"corpus files are read-only (mode {mode!r})")
+    stored, codec = stored_path(path)
+    if codec is None:
+        return open(stored, mode, encoding=None if mode == "rb" else encoding)
+    if codec == "gzip":
+        raw = gzip.open(stored, "rb")
+    else:
+        _require_zstd()
+        raw = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(
+            open(stored, "rb"), read_across_frames=True, closefd=True))
+    return raw if mode == "rb" else io.TextIOWrapper(raw, encoding=encoding)
+
+
+def load_corpus_json(path):
+    with open_corpus(path) as f:
+        return json.load(f)
+
+
+# ---------------------------------------------------------------------------
+# Frame index
+# ---------------------------------------------------------------------------
+
+def load_index(directory) -> dict:
+    """{file name: {"codec", "size", "sha256", "frames": [[raw, stored], ...]}}."""
+    path = Path(directory) / INDEX_NAME
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_index(directory, index: dict) -> None:
+    path = Path(directory) / INDEX_NAME
+    if not index:
+        path.unlink(missing_ok=True)
+        return
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(index.items())), f, indent=1, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _decompress_frames(codec: str, data: bytes) -> bytes:
+    if codec == "gzip":
+        return gzip.decompress(data)
+    _require_zstd()
+    with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data), read_across_frames=True) as r:
+        return r.read()
+
+
+def read_range(path, start: int, length: int) -> bytes:
+    """length decompressed bytes from offset start.
+
+    With a frame table only the frames overlapping the range are read and
+    decompressed; otherwise the stream is decompressed up to the range.
+    """
+    path = Path(path)
+    stored, codec = stored_path(path)
+    entry = load_index(path.parent).get(path.name) if codec else None
+    if entry is None or entry.get("codec") != codec:
+        with open_corpus(path, "rb") as f:
+            remaining = start
+            while remaining > 0:
+                skipped = len(f.read(min(remaining, READ_CHUNK)))
+                if not skipped:
+                    return b""
+                remaining -= skipped
+            return f.read(length)
+
+    frames = entry["frames"]
+    raw_starts = [raw for raw, _ in frames]
+    first = max(bisect.bisect_right(raw_starts, start) - 1, 0)
+    last = max(bisect.bisect_left(raw_starts, start + length) - 1, first)
+    with open(stored, "rb") as f:
+        f.seek(frames[first][1])
+        end = frames[last + 1][1] if last + 1 < len(frames) else None
+        data = f.read() if end is None else f.read(end - frames[first][1])
+    chunk = _decompress_frames(codec, data)
+    offset = start - frames[first][0]
+    return chunk[offset:offset + length]
+
+
+# ---------------------------------------------------------------------------
+# Packing
+# ---------------------------------------------------------------------------
+
+def _compress_frame(codec: str, data: bytes, level: int) -> bytes:
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    _require_zstd()
+    return zstandard.ZstdCompressor(level=level, write_checksum=True).compress(data)
+
+
+def pack_file(path, codec: str | None = None, level: int | None = None,
+              frame_size: int = FRAME_SIZE, keep: bool = False) -> dict:
+    """Compress a plain corpus file in frames, verify it, and drop the original.
+
+    Returns the file's frame-table entry plus its stored size.
+    """
+    path = Path(path)
+    codec = codec or default_codec()
+    level = level if level is not None else DEFAULT_LEVELS[codec]
+    packed = path.with_name(path.name + CODEC_SUFFIXES[codec])
+
+    digest = hashlib.sha256()
+    frames, size = [], 0
+    tmp = packed.with_name(packed.name + ".tmp")
+    try:
+        with open(path, "rb") as src, open(tmp, "wb") as dst:
+            while True:
+                data = src.read(frame_size)
+                if not data and frames:
+                    break
+                frames.append([size, dst.tell()])
+                dst.write(_compress_frame(codec, data, level))
+                digest.update(data)
+                size += len(data)
+                if not data:
+                    break
+        with open(tmp, "rb") as f:
+            if hashlib.sha256(_decompress_frames(codec, f.read())).hexdigest() != digest.hexdigest():
+                raise RuntimeError(f"round-trip check failed for {path}")
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, packed)
+
+    entry = {"codec": codec, "size": size, "sha256": digest.hexdigest(), "frames": frames}
+    index = load_index(path.parent)
+    index[path.name] = entry
+    save_index(path.parent, index)
+    for other in CODEC_SUFFIXES.values():
+        stale = path.with_name(path.name + other)
+        if stale != packed:
+            stale.unlink(missing_ok=True)
+    if not keep:
+        path.unlink()
+    return {**entry, "stored": packed.stat().st_size}
+
+
+def unpack_file(path) -> int:
+    """Restore the plain file for a packed logical path; returns its size."""
+    path = Path(path)
+    stored, codec = stored_path(path)
+    if codec is None:
+        return path.stat().st_size
+    tmp = path.with_name(path.name + ".tmp")
+    with open_corpus(path, "rb") as src, open(tmp, "wb") as dst:
+        while data := src.read(READ_CHUNK):
+            dst.write(data)
+    os.replace(tmp, path)
+    stored.unlink()
+    index = load_index(path.parent)
+    index.pop(path.name, None)
+    save_index(path.parent, index)
+    return path.stat().st_size
+
+
+def iter_corpus_files(targets: list):
+    """Logical paths of every corpus file under the given files/directories."""
+    suffixes = tuple(CODEC_SUFFIXES.values())
+    for target in targets:
+        target = Path(target)
+        if not target.is_dir():
+            yield target
+            continue
+        seen = set()
+        for p in sorted(target.rglob("*")):
+            if not p.is_file() or p.name == INDEX_NAME or p.name.endswith(".tmp"):
+                continue
+            logical = p.with_name(p.name[:-len(p.suffix)]) if p.name.endswith(suffixes) else p
+            if logical not in seen:
+                seen.add(logical)
+                yield logical
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _rel(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(PROJECT_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def cmd_status(args) -> None:
+    total_raw = total_stored = 0
+    for path in iter_corpus_files(args.paths):
+        stored, codec = stored_path(path)
+        stored_size = stored.stat().st_size
+        if codec:
+            entry = load_index(path.parent).get(path.name, {})
+            raw_size = entry.get("size")
+            frames = len(entry.get("frames", []))
+        else:
+            raw_size, frames = stored_size, 0
+        if raw_size is None:
+            with open_corpus(path, "rb") as f:
+                raw_size = sum(len(b) for b in iter(lambda: f.read(READ_CHUNK), b""))
+        total_raw += raw_size
+        total_stored += stored_size
+        if args.verbose:
+            kind = f"{codec}, {frames} frame(s)" if codec else "plain"
+            print(f"  {raw_size:>10,} → {stored_size:>10,}  {_rel(path)} ({kind})")
+    ratio = total_raw / total_stored if total_stored else 0
+    print(f"{total_raw:,} bytes stored as {total_stored:,} ({ratio:.1f}x)")
+
+
+def cmd_pack(args) -> None:
+    total_raw = total_stored = 0
+    for path in iter_corpus_files(args.paths):
+        stored, codec = stored_path(path)
+        if codec is not None:
+            continue
+        result = pack_file(path, args.codec, args.level, args.frame_size)
+        total_raw += result["size"]
+        total_stored += result["stored"]
+        print(f"  {result['size']:>10,} → {result['stored']:>10,}  {_rel(path)}")
+    ratio = total_raw / total_stored if total_stored else 0
+    print(f"\nPacked {total_raw:,} bytes into {total_stored:,} ({ratio:.1f}x)")
+
+
+def cmd_unpack(args) -> None:
+    count = 0
+    for path in iter_corpus_files(args.paths):
+        if stored_path(path)[1] is not None:
+            unpack_file(path)
+            count += 1
+    print(f"Unpacked {count} file(s)")
+
+
+def cmd_cat(args) -> None:
+    if args.range:
+        data = read_range(args.path, *args.range)
+    else:
+        with open_corpus(args.path, "rb") as f:
+            data = f.read()
+    sys.stdout.buffer.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed storage for read-only corpora")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("status", help="Stored vs uncompressed sizes")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("-v", "--verbose", action="store_true", help="One line per file")
+    p = sub.add_parser("pack", help="Compress plain files in place")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("--codec", choices=sorted(CODEC_SUFFIXES), default=None,
+                   help=f"Default: {default_codec()}")
+    p.add_argument("--level", type=int, default=None, help="Compression level")
+    p.add_argument("--frame-size", type=int, default=FRAME_SIZE,
+                   help=f"Uncompressed bytes per frame (default {FRAME_SIZE})")
+    p = sub.add_parser("unpack", help="Restore plain files")
+    p.add_argument("paths", nargs="+")
+    p = sub.add_parser("cat", help="Write a corpus file (or a byte range of it) to stdout")
+    p.add_argument("path")
+    p.add_argument("--range", type=int, nargs=2, metavar=("START", "LENGTH"))
+
+    args = parser.parse_args()
+    if args.command == "pack" and args.codec == "zstd" and zstandard is None:
+        print("ERROR: zstd needs the zstandard package (pip install zstandard)")
+        sys.exit(1)
+    {"status": cmd_status, "pack": cmd_pack, "unpack": cmd_unpack, "cat": cmd_cat}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
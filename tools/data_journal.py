@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Data Journal — Versioned operations log for the bundled databases, and delta
+updates of campaign saves.
+
+game_state_manager.gd seeds each campaign in user://save_data/{campaign}/
+with copies of the bundled characters.json and laws.json, and the campaign
+then diverges. To carry a later data fix into an existing campaign without
+recopying (and losing campaign-local changes), every Python write path
+records what it changed in resources/data/journal.jsonl:
+
+  {"version": 12, "time": "...", "source": "merge_chapter.py 1.07",
+   "ops": [{"op": "upsert", "db": "characters", "key": "juan_ii", "record": {...}},
+           {"op": "set", "db": "laws", "key": "law_1430_001", "field": "status",
+            "old": "proposed", "value": "enacted"},
+           {"op": "list_add", "db": "characters", "key": "juan_ii",
+            "field": "event_refs", "values": ["evt_1430_00613"]}, ...]}
+
+Ops are the db_diff.py ops (add is written as upsert). Only the databases a
+campaign copies from the bundle (CAMPAIGN_FILES) are journaled: a campaign's
+events.json, factions.json and roll_history.json hold its own play, not the
+bundled history, and must never receive it.
+
+merge_chapter.py and merge_extractions.py save through journaled_save_all(),
+which diffs each file on disk against the data being written and records the
+whole merge as one entry; enrich_characters.py and add_missing_characters.py
+use journaled_save(); the fix scripts commit through fix_registry.DataStore,
+which journals all of a run's changes as one entry.
+
+Campaigns remember the last version they contain in data_version.json
+(written at campaign creation; campaigns without it start from 0). apply
+folds every newer entry into a minimal delta (later sets win, an add and a
+remove of the same list value cancel, field ops on an upserted record are
+folded into the record) and applies it:
+
+  upsert       new record appended; an existing one only gains missing fields
+  set          applied when the campaign still has the old value (or already
+               the new one); a campaign-local value is kept and reported
+               unless --force
+  list_add/remove, remove   applied as is
+
+Usage:
+  python3 tools/data_journal.py log                       # Journal versions
+  python3 tools/data_journal.py delta "My Campaign"        # Minimal delta, no writes
+  python3 tools/data_journal.py apply "My Campaign"        # Apply to the campaign
+  python3 tools/data_journal.py apply path/to/save_data/x --dry-run
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+TOOLS_DIR = PROJECT_ROOT / "tools"
+JOURNAL_FILE = DATA_DIR / "journal.jsonl"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from db_diff import DATABASES, database_of, diff_records
+from event_sequence import state_lock
+
+# Godot project name (project.godot config/name) → user:// location
+GODOT_PROJECT_NAME = "Castile 1430"
+CAMPAIGN_VERSION_FILE = "data_version.json"
+
+# Campaign file per database, for the databases initialize_new_campaign()
+# (game_state_manager.gd) copies from the bundle. The rest start empty or
+# from other seed files and are never patched.
+CAMPAIGN_FILES = {
+    "characters": "characters.json",
+    "laws": "laws.json",
+}
+
+
+def godot_user_dir() -> Path:
+    """user:// for this project on the current platform."""
+    if os.name == "nt":
+        base = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming")) / "Godot"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support" / "Godot"
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "godot"
+    return base / "app_userdata" / GODOT_PROJECT_NAME
+
+
+def campaign_dir(name_or_path: str) -> Path:
+    path = Path(name_or_path)
+    if path.is_dir():
+        return path
+    return godot_user_dir() / "save_data" / name_or_path
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+def last_version() -> int:
+    """Version of the last journal entry (0 when empty), read from the tail."""
+    if not JOURNAL_FILE.exists():
+        return 0
+    with open(JOURNAL_FILE, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        tail = b""
+        pos = end
+        while pos > 0:
+            step = min(1 << 16, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            lines = tail.rstrip(b"\n").split(b"\n")
+            if len(lines) > 1 or pos == 0:
+                return json.loads(lines[-1])["version"] if lines[-1] else 0
+    return 0
+
+
+def journal_ops(db: str, old_data, new_data) -> list:
+    """Ops turning one in-memory database file into another."""
+    list_key = DATABASES[db][1]
+
+    def records(data):
+        if isinstance(data, list):
+            return data
+        return (data or {}).get(list_key, [])
+
+    ops = diff_records(db, records(old_data), records(new_data))["ops"]
+    for op in ops:
+        if op["op"] == "add":
+            op["op"] = "upsert"
+        elif op["op"] == "remove":
+            op.pop("record", None)
+    return ops
+
+
+def append_entry(source: str, ops: list) -> int | None:
+    """Append one versioned entry of the ops on campaign databases; returns
+    its version (None when there are none)."""
+    ops = [op for op in ops if op["db"] in CAMPAIGN_FILES]
+    if not ops:
+        return None
+    with state_lock():
+        version = last_version() + 1
+        entry = {"version": version, "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 "source": source, "ops": ops}
+        with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return version
+
+
+def journaled_save_all(files: list, source: str, save) -> int | None:
+    """save(path, data) for each (path, data), journaling all the record
+    changes of the campaign database files among them as one entry.
+
+    The previous content of each file is read from disk before its write.
+    Returns the journal version, or None when nothing changed.
+    """
+    ops = []
+    for path, data in files:
+        db = database_of(Path(path))
+        if db not in CAMPAIGN_FILES:
+            db = None
+        old = None
+        if db is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                old = json.load(f)
+        save(path, data)
+        if db is not None:
+            ops.extend(journal_ops(db, old, data))
+    return append_entry(source, ops)
+
+
+def journaled_save(path, data, source: str, save) -> int | None:
+    """save(path, data), journaling the record changes if path is a database."""
+    return journaled_save_all([(path, data)], source, save)
+
+
+def read_journal(since: int = 0) -> list:
+    """Entries with version > since, in version order."""
+    if not JOURNAL_FILE.exists():
+        return []
+    entries = []
+    with open(JOURNAL_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                if entry["version"] > since:
+                    entries.append(entry)
+    return sorted(entries, key=lambda e: e["version"])
+
+
+# ---------------------------------------------------------------------------
+# Delta
+# ---------------------------------------------------------------------------
+
+def _get(record: dict, field: str):
+    for part in field.split("."):
+        if not isinstance(record, dict) or part not in record:
+            return None
+        record = record[part]
+    return record
+
+
+def _set(record: dict, field: str, value, delete: bool = False) -> None:
+    *parents, last = field.split(".")
+    for part in parents:
+        record = record.setdefault(part, {})
+    if delete:
+        record.pop(last, None)
+    else:
+        record[last] = value
+
+
+def _apply_list(record: dict, op: dict) -> None:
+    current = _get(record, op["field"])
+    current = list(current) if isinstance(current, list) else []
+    if op["op"] == "list_add":
+        current += [v for v in op["values"] if v not in current]
+    else:
+        current = [v for v in current if v not in op["values"]]
+    _set(record, op["field"], current)
+
+
+def _noop_set(op: dict) -> bool:
+    """A folded set that ends where it started: x: 1→1, or added then deleted."""
+    if op.get("deleted"):
+        return "old" not in op
+    return "old" in op and op["old"] == op.get("value")
+
+
+class _KeyDelta:
+    """Folded ops for one record."""
+
+    def __init__(self):
+        self.record = None      # upsert: full record
+        self.removed = False
+        self.sets = {}          # field → set op
+        self.adds = {}          # field → {value: None} (ordered)
+        self.removes = {}       # field → {value: None}
+
+    def _clear_field(self, field: str) -> None:
+        for table in (self.sets, self.adds, self.removes):
+            for f in [f for f in table if f == field or f.startswith(field + ".")]:
+                del table[f]
+
+    def fold(self, op: dict) -> None:
+        kind = op["op"]
+        if kind == "upsert":
+            self.__init__()
+            self.record = json.loads(json.dumps(op["record"]))
+        elif kind == "remove":
+            self.__init__()
+            self.removed = True
+        elif self.record is not None:
+            if kind == "set":
+                _set(self.record, op["field"], op.get("value"), op.get("deleted", False))
+            else:
+                _apply_list(self.record, op)
+        elif kind == "set":
+            # Keep the first op's old value — or its absence, for a field the
+            # record did not have — so ops() can tell a net no-op
+            first = self.sets.get(op["field"])
+            self._clear_field(op["field"])
+            folded = {k: v for k, v in op.items() if k != "old" or first is None}
+            if first is not None and "old" in first:
+                folded["old"] = first["old"]
+            self.sets[op["field"]] = folded
+        else:
+            field = op["field"]
+            if field in self.sets:
+                holder = {}
+                _set(holder, "v", list(self.sets[field].get("value") or []))
+                _apply_list(holder, {**op, "field": "v"})
+                self.sets[field]["value"] = holder["v"]
+                return
+            mine, other = ((self.adds, self.removes) if kind == "list_add"
+                           else (self.removes, self.adds))
+            for v in op["values"]:
+                key = json.dumps(v)
+                other.get(field, {}).pop(key, None)
+                mine.setdefault(field, {})[key] = None
+
+    def ops(self, db: str, key) -> list:
+        base = {"db": db, "key": key}
+        if self.removed:
+            return [{"op": "remove", **base}]
+        if self.record is not None:
+            return [{"op": "upsert", **base, "record": self.record}]
+        out = [{"op": "set", **base, **{k: v for k, v in op.items() if k not in ("op", "db", "key")}}
+               for op in self.sets.values() if not _noop_set(op)]
+        for kind, table in (("list_remove", self.removes), ("list_add", self.adds)):
+            for field, values in table.items():
+                if values:
+                    out.append({"op": kind, **base, "field": field,
+                                "values": [json.loads(v) for v in values]})
+        return out
+
+
+def minimal_delta(entries: list) -> list:
+    """Fold journal entries into the smallest equivalent op list."""
+    deltas = {}
+    for entry in entries:
+        for op in entry["ops"]:
+            deltas.setdefault((op["db"], op["key"]), _KeyDelta()).fold(op)
+    ops = []
+    for (db, key), delta in deltas.items():
+        ops.extend(delta.ops(db, key))
+    return ops
+
+
+# ---------------------------------------------------------------------------
+# Apply
+# ---------------------------------------------------------------------------
+
+def read_campaign_version(directory: Path) -> int:
+    path = directory / CAMPAIGN_VERSION_FILE
+    if not path.exists():
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        return int(json.load(f).get("journal_version", 0))
+
+
+def _save_campaign_json(path: Path, data) -> None:
+    """Atomic write in data_manager.gd's format (tab indent)."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent="\t", ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def apply_delta(directory: Path, ops: list, force: bool = False, dry_run: bool = False) -> dict:
+    """Apply ops to the campaign files in directory.
+
+    Returns {"applied": n, "skipped": n, "conflicts": [...], "files": [...]}.
+    Ops on databases outside CAMPAIGN_FILES, or whose file the campaign
+    lacks, are skipped.
+    """
+    result = {"applied": 0, "skipped": 0, "conflicts": [], "files": []}
+    by_db = {}
+    for op in ops:
+        by_db.setdefault(op["db"], []).append(op)
+
+    for db, db_ops in by_db.items():
+        path = directory / CAMPAIGN_FILES[db] if db in CAMPAIGN_FILES else None
+        if path is None or not path.exists():
+            result["skipped"] += len(db_ops)
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        _, list_key, pk = DATABASES[db]
+        records = data.setdefault(list_key, [])
+        index = {r.get(pk): i for i, r in enumerate(records) if isinstance(r, dict)}
+        removed = set()
+        changed = False
+
+        for op in db_ops:
+            key = op["key"]
+            i = index.get(key)
+            record = records[i] if i is not None and i not in removed else None
+            kind = op["op"]
+            if kind == "upsert":
+                if record is None:
+                    index[key] = len(records)
+                    records.append(op["record"])
+                else:
+                    # Campaign-local values win; only missing fields are added
+                    for field, value in op["record"].items():
+                        record.setdefault(field, value)
+            elif kind == "remove":
+                if record is None:
+                    result["skipped"] += 1
+                    continue
+                removed.add(i)
+            elif record is None:
+                result["skipped"] += 1
+                continue
+            elif kind == "set":
+                current = _get(record, op["field"])
+                if not force and current not in (op.get("old"), op.get("value")):
+                    result["conflicts"].append({"db": db, "key": key, "field": op["field"],
+                                                "campaign": current, "value": op.get("value")})
+                    continue
+                _set(record, op["field"], op.get("value"), op.get("deleted", False))
+            else:
+                _apply_list(record, op)
+            result["applied"] += 1
+            changed = True
+
+        if changed:
+            data[list_key] = [r for i, r in enumerate(records) if i not in removed]
+            result["files"].append(path.name)
+            if not dry_run:
+                _save_campaign_json(path, data)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_log(args):
+    entries = read_journal(args.since)
+    for e in entries[-args.top:]:
+        dbs = sorted({op["db"] for op in e["ops"]})
+        print(f"  v{e['version']:<5} {e['time']}  {len(e['ops']):>6} ops  "
+              f"{', '.join(dbs):<30} {e['source']}")
+    print(f"\n  {len(entries)} entr{'y' if len(entries) == 1 else 'ies'}, "
+          f"latest version {last_version()}")
+
+
+def cmd_delta(args):
+    directory = campaign_dir(args.campaign)
+    since = args.since if args.since is not None else read_campaign_version(directory)
+    entries = read_journal(since)
+    ops = minimal_delta(entries)
+    if args.json:
+        print(json.dumps(ops, indent=2, ensure_ascii=False))
+        return
+    raw = sum(len(e["ops"]) for e in entries)
+    print(f"  {directory}: v{since} → v{last_version()}, "
+          f"{len(entries)} entries, {raw} ops → {len(ops)} in delta")
+    return ops
+
+
+def cmd_apply(args):
+    directory = campaign_dir(args.campaign)
+    if not directory.is_dir():
+        print(f"ERROR: campaign directory not found: {directory}")
+        sys.exit(1)
+    t0 = time.time()
+    since = args.since if args.since is not None else read_campaign_version(directory)
+    target = last_version()
+    entries = read_journal(since)
+    ops = minimal_delta(entries)
+    result = apply_delta(directory, ops, force=args.force, dry_run=args.dry_run)
+    if not args.dry_run and target > since:
+        _save_campaign_json(directory / CAMPAIGN_VERSION_FILE, {"journal_version": target})
+
+    prefix = "[DRY RUN] " if args.dry_run else ""
+    print(f"  {prefix}{directory.name}: v{since} → v{target}, {len(ops)} ops "
+          f"({result['applied']} applied, {result['skipped']} skipped, "
+          f"{len(result['conflicts'])} kept local) in {(time.time() - t0) * 1000:.0f} ms")
+    if result["files"]:
+        print(f"  Files: {', '.join(result['files'])}")
+    for c in result["conflicts"][:args.top]:
+        print(f"    kept {c['db']}/{c['key']}.{c['field']}: "
+              f"{json.dumps(c['campaign'], ensure_ascii=False)[:50]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Data journal and campaign delta updates")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    sp_log = subparsers.add_parser("log", help="List journal entries")
+    sp_log.add_argument("--since", type=int, default=0)
+    sp_log.add_argument("--top", type=int, default=20, help="Most recent entries to show")
+
+    for name, help_text in (("delta", "Show the minimal delta for a campaign"),
+                            ("apply", "Apply the minimal delta to a campaign")):
+        sp = subparsers.add_parser(name, help=help_text)
+        sp.add_argument("campaign", help="Campaign name (under user://save_data) or directory")
+        sp.add_argument("--since", type=int, help="Override the campaign's journal version")
+        sp.add_argument("--top", type=int, default=20, help="Conflicts to list")
+        if name == "delta":
+            sp.add_argument("--json", action="store_true", help="Print the delta ops")
+        else:
+            sp.add_argument("--force", action="store_true", help="Overwrite campaign-local values")
+            sp.add_argument("--dry-run", action="store_true", help="Report without writing")
+
+    args = parser.parse_args()
+    if args.command == "log":
+        cmd_log(args)
+    elif args.command == "delta":
+        cmd_delta(args)
+    elif args.command == "apply":
+        cmd_apply(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+DB Diff — Keyed structural diff between two versions of the game databases.
+
+Aligns records by primary key (event_id, id, location_id, faction_id,
+roll_id, law_id, …) instead of by line, and reports field-level changes:
+
+  add          record only in the new version
+  remove       record only in the old version
+  set          field changed (nested dicts give dotted paths: appearance.hair)
+  list_add     values appended to a list of scalars (event_refs, member_ids, …)
+  list_remove  values dropped from a list of scalars
+
+Records are streamed: each side is read incrementally with
+json.JSONDecoder.raw_decode, the old side is kept as a key → record table
+and the new side is compared record by record as it is read, so the cost is
+one pass over each file. Events are read from events.json, the per-chapter
+files in events/ or v1's starter_events.json, whichever the side has;
+directory sides are read through corpus_store, so packed archives work.
+
+The patch (--json) is the list of ops plus per-database counts; the same op
+format is used by the mutation journal.
+
+Usage:
+  python3 tools/db_diff.py archive/v1_data resources/data          # Directories
+  python3 tools/db_diff.py old/characters.json resources/data/characters.json
+  python3 tools/db_diff.py --rev HEAD~1                             # Git revision vs working tree
+  python3 tools/db_diff.py --rev HEAD~1 --db characters --db laws --json > patch.json
+"""
+
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from collections import Counter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from corpus_store import open_corpus, corpus_glob
+
+# database name → (file name, list key, primary key)
+DATABASES = {
+    "characters": ("characters.json", "characters", "id"),
+    "locations": ("locations.json", "locations", "location_id"),
+    "factions": ("factions.json", "factions", "faction_id"),
+    "roll_history": ("roll_history.json", "rolls", "roll_id"),
+    "roll_tables": ("roll_tables.json", "tables", "id"),
+    "laws": ("laws.json", "laws", "law_id"),
+    "events": ("events.json", "events", "event_id"),
+}
+EVENT_SOURCES = ("events.json", "events/chapter_*.json", "starter_events.json")
+
+READ_CHUNK = 1 << 20
+
+
+# ---------------------------------------------------------------------------
+# Streaming reader
+# ---------------------------------------------------------------------------
+
+class JsonStream:
+    """Incremental reader for one top-level JSON object from a text stream."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(max(READ_CHUNK, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _skip_ws(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        if self._skip_ws() != ch:
+            raise ValueError(f"expected {ch!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more as needed."""
+        self._skip_ws()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buf) or self.eof or not isinstance(obj, (int, float)):
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                obj, self.pos = self.decoder.raw_decode(self.buf, self.pos)
+                return obj
+
+    def members(self):
+        """Yield (key, stream) for each member of the top-level object; the
+        caller must consume the value (value() or items())."""
+        self.expect("{")
+        if self._skip_ws() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key, self
+            ch = self._skip_ws()
+            self.pos += 1
+            if ch == "}":
+                return
+            if ch != ",":
+                raise ValueError(f"expected ',' or '}}' at offset {self.pos}")
+
+    def items(self):
+        """Yield the elements of the array at the current position."""
+        self.expect("[")
+        if self._skip_ws() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            ch = self._skip_ws()
+            self.pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                raise ValueError(f"expected ',' or ']' at offset {self.pos}")
+
+
+def iter_records(f, list_key: str):
+    """Records of a {list_key: [...]} file (or a bare top-level array)."""
+    stream = JsonStream(f)
+    if stream._skip_ws() == "[":
+        yield from stream.items()
+        return
+    for key, s in stream.members():
+        if key == list_key:
+            yield from s.items()
+        else:
+            s.value()
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+class Source:
+    """One side of the diff: a data directory, a single file, or a git revision."""
+
+    def __init__(self, path: Path | None = None, rev: str | None = None):
+        self.path = path
+        self.rev = rev
+
+    def __str__(self):
+        return f"{self.rev}:{DATA_DIR.relative_to(PROJECT_ROOT)}" if self.rev else str(self.path)
+
+    def _git_ls(self, pattern: str) -> list:
+        rel = (DATA_DIR / pattern).relative_to(PROJECT_ROOT)
+        out = subprocess.run(["git", "ls-tree", "--name-only", self.rev, f"{rel.parent}/"],
+                             cwd=PROJECT_ROOT, capture_output=True, text=True).stdout.split()
+        return sorted(p for p in out if Path(p).match(str(rel)))
+
+    def files(self, db: str) -> list:
+        """Paths (relative to the data dir or repo) holding this database."""
+        if self.path is not None and self.path.is_file():
+            # A single file (e.g. events/chapter_1.01.json) holds whatever
+            # database_of() says it does
+            return [self.path] if database_of(self.path) == db else []
+        names = EVENT_SOURCES if db == "events" else (DATABASES[db][0],)
+        for name in names:
+            if self.rev:
+                found = self._git_ls(name)
+            else:
+                found = corpus_glob(self.path, name)
+            found = [p for p in found if not Path(p).name.startswith("_")]
+            if found:
+                return found
+        return []
+
+    def records(self, db: str):
+        list_key = DATABASES[db][1]
+        for name in self.files(db):
+            if self.rev:
+                proc = subprocess.Popen(["git", "show", f"{self.rev}:{name}"], cwd=PROJECT_ROOT,
+                                        stdout=subprocess.PIPE, text=True, encoding="utf-8")
+                yield from iter_records(proc.stdout, list_key)
+                proc.wait()
+            else:
+                with open_corpus(name) as f:
+                    yield from iter_records(f, list_key)
+
+
+def database_of(path: Path) -> str | None:
+    for db, (file_name, _, _) in DATABASES.items():
+        if path.name == file_name:
+            return db
+    if path.name == "starter_events.json" or (path.parent.name == "events"
+                                              and path.name.startswith("chapter_")):
+        return "events"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Diff
+# ---------------------------------------------------------------------------
+
+def _scalar_list(value) -> bool:
+    return isinstance(value, list) and all(
+        isinstance(v, (str, int, float, bool)) or v is None for v in value)
+
+
+def diff_values(old, new, path: str, out: list) -> None:
+    """Append field-level ops turning old into new (path = dotted field)."""
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for k in list(old) + [k for k in new if k not in old]:
+            sub = f"{path}.{k}" if path else k
+            if k not in new:
+                out.append({"op": "set", "field": sub, "old": old[k], "value": None, "deleted": True})
+            elif k not in old:
+                out.append({"op": "set", "field": sub, "value": new[k]})
+            else:
+                diff_values(old[k], new[k], sub, out)
+        return
+    if _scalar_list(old) and _scalar_list(new):
+        old_set, new_set = set(old), set(new)
+        added = [v for v in new if v not in old_set]
+        removed = [v for v in old if v not in new_set]
+        if added:
+            out.append({"op": "list_add", "field": path, "values": added})
+        if removed:
+            out.append({"op": "list_remove", "field": path, "values": removed})
+        # Same members, different order or multiplicity: replace the list
+        if not added and not removed:
+            out.append({"op": "set", "field": path, "old": old, "value": new})
+        return
+    out.append({"op": "set", "field": path, "old": old, "value": new})
+
+
+def diff_records(db: str, old_records, new_records, keep_records: bool = True) -> dict:
+    """Ops and counts between two record iterables (old side hashed, new side streamed)."""
+    pk = DATABASES[db][2]
+    old = {}
+    duplicates = 0
+    for rec in old_records:
+        key = rec.get(pk) if isinstance(rec, dict) else None
+        if key is None:
+            continue
+        duplicates += key in old
+        old[key] = rec
+
+    ops = []
+    counts = Counter()
+    field_counts = Counter()
+    seen = set()
+    for rec in new_records:
+        key = rec.get(pk) if isinstance(rec, dict) else None
+        if key is None or key in seen:
+            duplicates += key in seen
+            continue
+        seen.add(key)
+        before = old.pop(key, None)
+        if before is None:
+            counts["added"] += 1
+            ops.append({"op": "add", "db": db, "key": key,
+                        **({"record": rec} if keep_records else {})})
+            continue
+        changes = []
+        diff_values(before, rec, "", changes)
+        if changes:
+            counts["changed"] += 1
+            for c in changes:
+                field_counts[c["field"].split(".")[0]] += 1
+                ops.append({"db": db, "key": key, **c})
+        else:
+            counts["unchanged"] += 1
+
+    for key, rec in old.items():
+        counts["removed"] += 1
+        ops.append({"op": "remove", "db": db, "key": key,
+                    **({"record": rec} if keep_records else {})})
+
+    return {"counts": dict(counts), "fields": dict(field_counts.most_common()),
+            "duplicate_keys": duplicates, "ops": ops}
+
+
+def diff_database(db: str, old_src: Source, new_src: Source, keep_records: bool = True) -> dict:
+    """Ops and counts for one database."""
+    return diff_records(db, old_src.records(db), new_src.records(db), keep_records)
+
+
+def diff_sources(old_src: Source, new_src: Source, databases: list) -> dict:
+    result = {"from": str(old_src), "to": str(new_src), "databases": {}, "ops": []}
+    for db in databases:
+        if not old_src.files(db) or not new_src.files(db):
+            continue
+        d = diff_database(db, old_src, new_src)
+        result["databases"][db] = {k: d[k] for k in ("counts", "fields", "duplicate_keys")}
+        result["ops"].extend(d["ops"])
+    return result
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _short(value, width: int = 70) -> str:
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def print_summary(result: dict, limit: int) -> None:
+    print(f"Diff {result['from']} → {result['to']}\n")
+    if not result["databases"]:
+        print("  No common databases to compare.")
+        return
+    for db, info in result["databases"].items():
+        c = info["counts"]
+        print(f"  {db:<13} +{c.get('added', 0):<5} -{c.get('removed', 0):<5} "
+              f"~{c.get('changed', 0):<5} ={c.get('unchanged', 0)}"
+              + (f"  ({info['duplicate_keys']} duplicate keys)" if info["duplicate_keys"] else ""))
+        if info["fields"]:
+            top = ", ".join(f"{f} ×{n}" for f, n in list(info["fields"].items())[:8])
+            print(f"  {'':<13} fields: {top}")
+
+    if limit:
+        print(f"\n  First {min(limit, len(result['ops']))} of {len(result['ops'])} ops:")
+        for op in result["ops"][:limit]:
+            where = f"{op['db']}/{op['key']}"
+            if op["op"] in ("add", "upsert", "remove"):
+                print(f"    {op['op']:<11} {where}")
+            elif op["op"] == "set":
+                print(f"    {'set':<11} {where}.{op['field']}: "
+                      f"{_short(op.get('old'), 30)} → {_short(op['value'], 40)}")
+            else:
+                print(f"    {op['op']:<11} {where}.{op['field']}: {_short(op['values'])}")
+
+
+def counterpart(path: Path, db: str) -> Path:
+    """Where the file matching path sits in another data directory."""
+    if db != "events":
+        return Path(DATABASES[db][0])
+    if path.parent.name == "events" and path.name.startswith("chapter_"):
+        return Path("events") / path.name
+    return Path(path.name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyed structural diff of game databases")
+    parser.add_argument("old", nargs="?", help="Old data directory or database file")
+    parser.add_argument("new", nargs="?", help="New data directory or file (default: resources/data)")
+    parser.add_argument("--rev", help="Use this git revision of resources/data as the old side")
+    parser.add_argument("--db", action="append", choices=list(DATABASES),
+                        help="Only these databases (repeatable)")
+    parser.add_argument("--limit", type=int, default=25, help="Ops to list in the summary")
+    parser.add_argument("--json", action="store_true", help="Print the patch as JSON")
+    args = parser.parse_args()
+
+    if args.rev:
+        old_src = Source(rev=args.rev)
+        new_src = Source(Path(args.old) if args.old else DATA_DIR)
+    elif args.old:
+        old_src = Source(Path(args.old))
+        new_src = Source(Path(args.new) if args.new else DATA_DIR)
+    else:
+        parser.print_help()
+        return
+
+    databases = args.db or list(DATABASES)
+    if old_src.path and old_src.path.is_file():
+        db = database_of(old_src.path)
+        if db is None:
+            print(f"ERROR: unknown database file {old_src.path.name}")
+            sys.exit(1)
+        databases = [db]
+        if new_src.path.is_dir():
+            new_src = Source(new_src.path / counterpart(old_src.path, db))
+
+    result = diff_sources(old_src, new_src, databases)
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print_summary(result, args.limit)
+
+
+if __name__ == "__main__":
+    main()
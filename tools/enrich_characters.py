@@ -30,6 +30,14 @@ EVENTS_FILE = DATA_DIR / "events.json"
 ROLLS_FILE = DATA_DIR / "roll_history.json"
 ALIASES_FILE = PROJECT_ROOT / "tools" / "known_aliases.json"
 
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from data_journal import journaled_save
+
+
+def save_json(path: Path, data: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 # ---------------------------------------------------------------------------
 # Trait inference rules
@@ -440,8 +448,7 @@ def main():
 
     # Save
     if not args.dry_run and not args.id:
-        with open(CHARACTERS_FILE, "w", encoding="utf-8") as f:
-            json.dump(chars_db, f, indent=2, ensure_ascii=False)
+        journaled_save(CHARACTERS_FILE, chars_db, "enrich_characters.py", save_json)
         print(f"\nSaved {CHARACTERS_FILE.name}")
     elif not args.dry_run and args.id:
         # Save the whole file even for single character update
@@ -450,8 +457,8 @@ def main():
             if c["id"] == characters[0]["id"]:
                 all_chars["characters"][i] = characters[0]
                 break
-        with open(CHARACTERS_FILE, "w", encoding="utf-8") as f:
-            json.dump(all_chars, f, indent=2, ensure_ascii=False)
+        journaled_save(CHARACTERS_FILE, all_chars,
+                       f"enrich_characters.py --id {args.id}", save_json)
         print(f"\nSaved {CHARACTERS_FILE.name}")
 
 
@@ -461,7 +468,8 @@ def main():
 
 def run_enrichment(characters_data: dict = None, events_data: dict = None,
                    rolls_data: dict = None, save: bool = True,
-                   verbose: bool = False) -> dict:
+                   verbose: bool = False,
+                   source: str = "enrich_characters.py") -> dict:
     """Run character enrichment programmatically.
 
     Can be called from other scripts (e.g., merge_chapter.py) to
@@ -473,6 +481,7 @@ def run_enrichment(characters_data: dict = None, events_data: dict = None,
         rolls_data: Pre-loaded roll_history.json dict (loads from file if None)
         save: Whether to write results to characters.json
         verbose: Print per-character details
+        source: Journal entry source for the save
 
     Returns:
         Dict with update counts per field.
@@ -510,8 +519,7 @@ def run_enrichment(characters_data: dict = None, events_data: dict = None,
                 total_updates[field] += 1
 
     if save:
-        with open(CHARACTERS_FILE, "w", encoding="utf-8") as f:
-            json.dump(characters_data, f, indent=2, ensure_ascii=False)
+        journaled_save(CHARACTERS_FILE, characters_data, source, save_json)
 
     return total_updates
 
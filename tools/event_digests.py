@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""
+Event Digests — Cached chapter and year summaries of the event database.
+
+The context agent sees history only through build_event_index(): the last
+100 events, each summary cut to 80 characters. Everything older falls out of
+the window. This tool condenses the event summaries in resources/data/events/
+into two levels of digest that together fit a whole campaign in a fixed
+token budget:
+
+  chapter   the chapter's events       → ≤ CHAPTER_BUDGET tokens
+  year      the year's chapter digests → ≤ YEAR_BUDGET tokens
+
+Digests are written to resources/data/chapter_summaries/ (chapter_{id}.json,
+year_{YYYY}.json). They digest the bundled history, so they live with the
+bundled data; this is not the campaign directory's chapter_summaries/
+(user://save_data/{campaign}/chapter_summaries/chapter_{NN}.json, see
+PROMPT_ENGINE_DESIGN.md §11 and CONVENTIONS.md), which holds summaries of a
+campaign's own play. Each records its token count (token_estimator.count_tokens), the
+summarizer that wrote it and an input_hash over everything it was built from:
+
+  chapter   summarizer id, budget, the digest-relevant fields of its events
+  year      summarizer id, budget, the digest_hash of each chapter digest
+
+so a build only re-summarizes digests whose inputs changed, and a year is
+rebuilt only when one of its chapter digests actually came out different.
+
+Summarizers are pluggable (SUMMARIZERS):
+
+  extractive  ranks events by type, factions and cast size and keeps the
+              leading sentences of the best ones that fit — local, free,
+              deterministic
+  llm         asks Haiku for a prose digest (responses cached by request
+              hash in tools/progress/responses/, so re-running never pays twice)
+
+campaign_history() assembles the game-facing recap: chapter digests while
+they fit the budget, the oldest finished years collapsed into their year
+digests until they do, and only then the oldest sections dropped.
+
+Usage:
+  python3 tools/event_digests.py                          # Digest status (fresh/stale/missing)
+  python3 tools/event_digests.py --build                  # Rebuild stale digests
+  python3 tools/event_digests.py --build --force          # Rebuild everything
+  python3 tools/event_digests.py --build --summarizer llm # Haiku digests
+  python3 tools/event_digests.py --history --budget 3000  # Campaign recap within a budget
+  python3 tools/event_digests.py --history --upto 1.30    # ...as of a chapter
+  python3 tools/event_digests.py --json
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import inspect
+import hashlib
+import argparse
+import functools
+from pathlib import Path
+from datetime import datetime
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+TOOLS_DIR = PROJECT_ROOT / "tools"
+EVENTS_FILE = DATA_DIR / "events.json"
+EVENTS_DIR = DATA_DIR / "events"
+DIGEST_DIR = DATA_DIR / "chapter_summaries"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from token_estimator import count_tokens
+
+CHAPTER_BUDGET = 200
+YEAR_BUDGET = 500
+DEFAULT_HISTORY_BUDGET = 4000
+
+# Fields a digest is built from — edits to anything else (exchanges, rolls)
+# leave digests fresh
+DIGEST_FIELDS = ("event_id", "date", "end_date", "type", "summary", "characters",
+                 "factions_affected", "location")
+
+TOOL_NAME = "event_digests"
+
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_events() -> list:
+    """All events: events.json if it has been built, else the chapter files."""
+    if EVENTS_FILE.exists():
+        return load_json(EVENTS_FILE).get("events", [])
+    return [e for path in sorted(EVENTS_DIR.glob("chapter_*.json"))
+            for e in load_json(path).get("events", [])]
+
+
+def chapter_key(chapter: str) -> tuple:
+    """'1.05' → (1, 5), so chapters sort numerically across books."""
+    try:
+        book, num = str(chapter).split(".", 1)
+        return int(book), int(num)
+    except ValueError:
+        return (math.inf, str(chapter))
+
+
+def year_of(evt: dict) -> str | None:
+    year = str(evt.get("date", ""))[:4]
+    return year if year.isdigit() else None
+
+
+def stable_hash(*parts) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(part, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def group_events(events: list) -> dict:
+    """chapter → its events in date order."""
+    chapters = {}
+    for evt in events:
+        chapters.setdefault(str(evt.get("chapter", "")), []).append(evt)
+    for evts in chapters.values():
+        evts.sort(key=lambda e: str(e.get("date", "")))
+    return dict(sorted(chapters.items(), key=lambda kv: chapter_key(kv[0])))
+
+
+def chapter_years(events: list) -> list:
+    return sorted({y for y in map(year_of, events) if y})
+
+
+# ---------------------------------------------------------------------------
+# Summarizers
+# ---------------------------------------------------------------------------
+
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z\"“¿¡(])")
+MIN_LEAD_CHARS = 60
+MAX_LEAD_CHARS = 220
+
+
+def lead(summary: str) -> str:
+    """First sentence of a summary (two if the first is very short), capped in length."""
+    sentences = SENTENCE_RE.split(" ".join(str(summary).split()))
+    text = sentences[0]
+    if len(text) < MIN_LEAD_CHARS and len(sentences) > 1:
+        text += " " + sentences[1]
+    if len(text) > MAX_LEAD_CHARS:
+        text = text[:MAX_LEAD_CHARS].rsplit(" ", 1)[0].rstrip(",;:—-") + "…"
+    return text
+
+
+def pack(items: list, budget: int, omitted_note: bool = True) -> tuple:
+    """Highest-scoring items whose lines fit the budget, in date order.
+
+    Always keeps the best item, so a digest is never empty. Returns
+    (kept items, rendered text).
+    """
+    kept, used = [], 0
+    for item in sorted(items, key=lambda it: -it["score"]):
+        cost = count_tokens(item["line"]) + 1
+        if kept and used + cost > budget:
+            continue
+        kept.append(item)
+        used += cost
+    kept.sort(key=lambda it: (it["date"], it["event_id"]))
+    lines = [it["line"] for it in kept]
+    if omitted_note and len(kept) < len(items):
+        lines.append(f"(+{len(items) - len(kept)} lesser events)")
+    return kept, "\n".join(lines)
+
+
+class ExtractiveSummarizer:
+    """Ranks events and keeps the leading sentences of the best that fit."""
+
+    name = "extractive"
+    version = 1
+
+    TYPE_WEIGHTS = {
+        "crisis": 3.0, "military_action": 2.5, "decision": 2.5,
+        "legal": 2.0, "diplomacy": 2.0,
+        "ceremony": 1.5, "religious": 1.5, "economic": 1.5,
+        "council": 1.0, "travel": 0.5, "personal": 0.5,
+    }
+
+    @property
+    def id(self) -> str:
+        """name/version/code-hash — the hash covers this class, lead(), pack()
+        and the lead settings, so editing any of them makes every digest stale
+        without a hand-bumped version."""
+        return f"{self.name}/{self.version}/{self.code_hash()}"
+
+    @classmethod
+    @functools.cache
+    def code_hash(cls) -> str:
+        return stable_hash(inspect.getsource(cls), inspect.getsource(lead),
+                           inspect.getsource(pack), SENTENCE_RE.pattern,
+                           MIN_LEAD_CHARS, MAX_LEAD_CHARS)
+
+    def score(self, evt: dict) -> float:
+        factions = len(evt.get("factions_affected") or [])
+        cast = len(evt.get("characters") or [])
+        return round(self.TYPE_WEIGHTS.get(evt.get("type"), 1.0)
+                     + 0.5 * min(factions, 4)
+                     + 0.4 * math.log2(1 + cast), 3)
+
+    def item(self, evt: dict) -> dict:
+        place = str(evt.get("location") or "").split(",")[0].strip()
+        where = f" {place}" if place else ""
+        return {
+            "event_id": evt.get("event_id", ""),
+            "date": str(evt.get("date", "")),
+            "score": self.score(evt),
+            "line": f"{evt.get('date', '')}{where} — {lead(evt.get('summary', ''))}",
+        }
+
+    def chapter(self, chapter: str, events: list, budget: int) -> dict:
+        kept, text = pack([self.item(e) for e in events], budget)
+        return {"summary": text, "items": kept}
+
+    def year(self, year: str, chapters: list, budget: int) -> dict:
+        items = [it for digest in chapters for it in digest.get("items", [])
+                 if it["date"][:4] == year]
+        kept, text = pack(items, budget, omitted_note=False)
+        return {"summary": text, "items": kept}
+
+
+class LLMSummarizer:
+    """Prose digests from Haiku, with responses cached by request hash."""
+
+    name = "llm"
+    version = 1
+
+    SYSTEM_PROMPT = (
+        "You condense the chronicle of a historical role-playing campaign set in "
+        "15th-century Castile, whose protagonist is King Juan II. Write a compact "
+        "recap in plain prose for the game master: who did what, where, and with "
+        "what consequence for the realm, factions and key characters. Keep names, "
+        "titles and dates exact; never invent anything. No headings, no lists, no "
+        "preamble — only the recap."
+    )
+
+    @property
+    def id(self) -> str:
+        from llm_client import API_MODEL
+        return f"{self.name}/{self.version}/{API_MODEL}/{stable_hash(self.SYSTEM_PROMPT)}"
+
+    def complete(self, label: str, prompt: str, budget: int) -> str:
+        from llm_client import API_MODEL, call_haiku
+        from run_manifest import request_hash, cache_response, cached_response
+
+        req_hash = request_hash(API_MODEL, self.SYSTEM_PROMPT, prompt)
+        cached = cached_response(req_hash)
+        if cached is not None:
+            return cached.strip()
+        result = call_haiku(get_api_key(), self.SYSTEM_PROMPT, prompt, tool=TOOL_NAME,
+                            chapter=label, max_tokens=budget * 2)
+        if result["error"]:
+            raise RuntimeError(f"{label}: {result['error']}")
+        cache_response(req_hash, result["text"])
+        return result["text"].strip()
+
+    def chapter(self, chapter: str, events: list, budget: int) -> dict:
+        lines = [f"{e.get('date', '')} | {e.get('type', '')} | {e.get('location', '')} | "
+                 f"{' '.join(str(e.get('summary', '')).split())}" for e in events]
+        prompt = (f"Chapter {chapter} events (date | type | location | summary):\n\n"
+                  + "\n".join(lines)
+                  + f"\n\nRecap this chapter in at most {budget} tokens.")
+        return {"summary": self.complete(chapter, prompt, budget), "items": []}
+
+    def year(self, year: str, chapters: list, budget: int) -> dict:
+        parts = [f"Chapter {d['chapter']} ({d['date_range']}):\n{d['summary']}" for d in chapters]
+        prompt = (f"Chapter recaps covering the year {year}:\n\n" + "\n\n".join(parts)
+                  + f"\n\nRecap what happened in {year} only, in at most {budget} tokens.")
+        return {"summary": self.complete(year, prompt, budget), "items": []}
+
+
+SUMMARIZERS = {
+    "extractive": ExtractiveSummarizer,
+    "llm": LLMSummarizer,
+}
+
+
+@functools.cache
+def get_api_key() -> str:
+    key = os.environ.get("ANTHROPIC_API_KEY", "")
+    if not key:
+        config_path = PROJECT_ROOT / ".api_key"
+        if config_path.exists():
+            key = config_path.read_text().strip()
+    if not key:
+        print("ERROR: No API key in ANTHROPIC_API_KEY or .api_key (needed for --summarizer llm).")
+        sys.exit(1)
+    return key
+
+
+# ---------------------------------------------------------------------------
+# Digest store
+# ---------------------------------------------------------------------------
+
+def chapter_path(chapter: str) -> Path:
+    return DIGEST_DIR / f"chapter_{chapter}.json"
+
+
+def year_path(year: str) -> Path:
+    return DIGEST_DIR / f"year_{year}.json"
+
+
+def read_digest(path: Path) -> dict | None:
+    try:
+        return load_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+def write_digest(path: Path, digest: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(digest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def digest_meta(level: str) -> dict:
+    return {
+        "description": f"{level.capitalize()} digest of the event summaries. "
+                       f"Generated by tools/event_digests.py --build — do not edit.",
+        "generated": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def chapter_input_hash(summarizer, chapter: str, events: list) -> str:
+    fields = [{k: e.get(k) for k in DIGEST_FIELDS} for e in events]
+    return stable_hash(summarizer.id, CHAPTER_BUDGET, chapter, fields)
+
+
+def year_input_hash(summarizer, year: str, chapters: list) -> str:
+    return stable_hash(summarizer.id, YEAR_BUDGET, year,
+                       [(d["chapter"], d["digest_hash"]) for d in chapters])
+
+
+def date_range(events: list) -> str:
+    dates = sorted(str(e.get("date", "")) for e in events if e.get("date"))
+    return f"{dates[0]} / {dates[-1]}" if dates else ""
+
+
+class DigestPlan:
+    """Which digests exist, which are fresh and which must be (re)built."""
+
+    def __init__(self, events: list, summarizer):
+        self.summarizer = summarizer
+        self.chapters = group_events(events)
+        self.years = {}
+        for chapter, evts in self.chapters.items():
+            for year in chapter_years(evts):
+                self.years.setdefault(year, []).append(chapter)
+        self.years = dict(sorted(self.years.items()))
+        self.stored = {c: read_digest(chapter_path(c)) for c in self.chapters}
+        self.stored_years = {y: read_digest(year_path(y)) for y in self.years}
+        self.hashes = {c: chapter_input_hash(summarizer, c, evts)
+                       for c, evts in self.chapters.items()}
+
+    def chapter_state(self, chapter: str) -> str:
+        stored = self.stored.get(chapter)
+        if stored is None:
+            return "missing"
+        return "fresh" if stored.get("input_hash") == self.hashes[chapter] else "stale"
+
+    def year_state(self, year: str) -> str:
+        stored = self.stored_years.get(year)
+        if stored is None:
+            return "missing"
+        if any(self.chapter_state(c) != "fresh" for c in self.years[year]):
+            return "stale"
+        children = [self.stored[c] for c in self.years[year]]
+        return "fresh" if stored.get("input_hash") == year_input_hash(
+            self.summarizer, year, children) else "stale"
+
+    def orphans(self) -> list:
+        wanted = {chapter_path(c) for c in self.chapters} | {year_path(y) for y in self.years}
+        return sorted(p for p in DIGEST_DIR.glob("*.json") if p not in wanted)
+
+
+def build(plan: DigestPlan, force: bool = False, dry_run: bool = False) -> dict:
+    """Rebuild stale or missing digests (all with force); returns what was done."""
+    summarizer = plan.summarizer
+    done = {"chapters": [], "years": [], "removed": []}
+
+    for chapter, evts in plan.chapters.items():
+        if not force and plan.chapter_state(chapter) == "fresh":
+            continue
+        done["chapters"].append(chapter)
+        if dry_run:
+            continue
+        result = summarizer.chapter(chapter, evts, CHAPTER_BUDGET)
+        plan.stored[chapter] = digest = {
+            "meta": digest_meta("chapter"),
+            "chapter": chapter,
+            "book": evts[0].get("book"),
+            "years": chapter_years(evts),
+            "date_range": date_range(evts),
+            "event_count": len(evts),
+            "summarizer": summarizer.id,
+            "input_hash": plan.hashes[chapter],
+            "digest_hash": stable_hash(result["summary"], result["items"]),
+            "tokens": count_tokens(result["summary"]),
+            "summary": result["summary"],
+            "items": result["items"],
+        }
+        write_digest(chapter_path(chapter), digest)
+
+    for year, chapters in plan.years.items():
+        if dry_run:
+            if force or plan.year_state(year) != "fresh":
+                done["years"].append(year)
+            continue
+        children = [plan.stored[c] for c in chapters]
+        input_hash = year_input_hash(summarizer, year, children)
+        stored = plan.stored_years.get(year)
+        if not force and stored is not None and stored.get("input_hash") == input_hash:
+            continue
+        done["years"].append(year)
+        result = summarizer.year(year, children, YEAR_BUDGET)
+        year_events = [e for c in chapters for e in plan.chapters[c] if year_of(e) == year]
+        plan.stored_years[year] = digest = {
+            "meta": digest_meta("year"),
+            "year": year,
+            "chapters": chapters,
+            "date_range": date_range(year_events),
+            "event_count": len(year_events),
+            "summarizer": summarizer.id,
+            "input_hash": input_hash,
+            "tokens": count_tokens(result["summary"]),
+            "summary": result["summary"],
+            "items": result["items"],
+        }
+        write_digest(year_path(year), digest)
+
+    for path in plan.orphans():
+        done["removed"].append(path.name)
+        if not dry_run:
+            path.unlink()
+    return done
+
+
+# ---------------------------------------------------------------------------
+# Campaign history
+# ---------------------------------------------------------------------------
+
+def chapter_section(digest: dict) -> str:
+    return f"Chapter {digest['chapter']} ({digest['date_range']}):\n{digest['summary']}"
+
+
+def year_section(digest: dict) -> str:
+    return f"Year {digest['year']} (chapters {digest['chapters'][0]}–{digest['chapters'][-1]}):\n" \
+           f"{digest['summary']}"
+
+
+def campaign_history(plan: DigestPlan, budget: int = DEFAULT_HISTORY_BUDGET,
+                     upto: str | None = None) -> dict:
+    """The campaign so far as digests that fit the token budget.
+
+    Starts from every chapter digest (up to and including upto), then
+    collapses the oldest finished years into their year digests until the
+    sections fit; if even that is too long, the current year's oldest chapters
+    and then the oldest years are dropped, each run replaced by a note where
+    it stood.
+    The current year is never collapsed, since its year digest may cover
+    chapters after upto.
+    """
+    chapters = [c for c in plan.chapters
+                if upto is None or chapter_key(c) <= chapter_key(upto)]
+    if not chapters:
+        return {"text": "", "tokens": 0, "sections": [], "omitted": []}
+    current_year = max(plan.stored[chapters[-1]]["years"] or ["0"])
+
+    # Ordered (kind, id, text, tokens) sections; a chapter stays until every
+    # year it touches has been collapsed
+    def section(kind: str, key: str) -> tuple:
+        text = chapter_section(plan.stored[key]) if kind == "chapter" \
+            else year_section(plan.stored_years[key])
+        return kind, key, text, count_tokens(text) + 1
+
+    sections = [section("chapter", c) for c in chapters]
+    collapsible = [y for y in plan.years if y < current_year
+                   and all(c in chapters for c in plan.years[y])]
+    omitted = []
+
+    def total() -> int:
+        return sum(s[3] for s in sections)
+
+    for year in collapsible:
+        if total() <= budget:
+            break
+        keep = [s for s in sections
+                if not (s[0] == "chapter" and max(plan.stored[s[1]]["years"]) <= year)]
+        insert_at = next((n for n, s in enumerate(keep) if s[0] == "chapter"), len(keep))
+        keep.insert(insert_at, section("year", year))
+        sections = keep
+
+    def gap(names: list) -> tuple:
+        text = f"(Omitted here for length: {', '.join(names)})"
+        return "gap", names, text, count_tokens(text) + 1
+
+    # Still too long: the current year's oldest chapters go first, then the
+    # oldest years — the most recent chapter is always kept. Each dropped run
+    # leaves a note in its place, so the recap never claims that what is
+    # missing precedes everything shown.
+    for kind in ("chapter", "year"):
+        while total() > budget:
+            n = next((n for n, s in enumerate(sections) if s[0] == kind), None)
+            if n is None or (kind == "chapter" and sum(s[0] == "chapter" for s in sections) == 1):
+                break
+            name = f"{kind} {sections.pop(n)[1]}"
+            omitted.append(name)
+            if n > 0 and sections[n - 1][0] == "gap":
+                sections[n - 1] = gap(sections[n - 1][1] + [name])
+            else:
+                sections.insert(n, gap([name]))
+
+    text = "\n\n".join(s[2] for s in sections)
+    return {
+        "text": text,
+        "tokens": count_tokens(text),
+        "sections": [f"{s[0]} {s[1]}" for s in sections if s[0] != "gap"],
+        "omitted": omitted,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def status_rows(plan: DigestPlan) -> list:
+    rows = []
+    for chapter in plan.chapters:
+        stored = plan.stored.get(chapter) or {}
+        rows.append({"digest": f"chapter {chapter}", "state": plan.chapter_state(chapter),
+                     "events": len(plan.chapters[chapter]), "tokens": stored.get("tokens"),
+                     "summarizer": stored.get("summarizer")})
+    for year in plan.years:
+        stored = plan.stored_years.get(year) or {}
+        rows.append({"digest": f"year {year}", "state": plan.year_state(year),
+                     "events": stored.get("event_count"), "tokens": stored.get("tokens"),
+                     "summarizer": stored.get("summarizer")})
+    return rows
+
+
+def print_status(plan: DigestPlan, rows: list) -> None:
+    for row in rows:
+        if row["state"] != "fresh" or row["digest"].startswith("year"):
+            tokens = row["tokens"] if row["tokens"] is not None else "-"
+            print(f"  {row['digest']:<14} {row['state']:<8} {tokens:>5} tokens  "
+                  f"{row['summarizer'] or ''}")
+    states = {}
+    for row in rows:
+        states[row["state"]] = states.get(row["state"], 0) + 1
+    chapter_tokens = sum(d["tokens"] for d in plan.stored.values() if d)
+    year_tokens = sum(d["tokens"] for d in plan.stored_years.values() if d)
+    source_tokens = sum(count_tokens(str(e.get("summary", "")))
+                        for evts in plan.chapters.values() for e in evts)
+    print(f"\n{len(plan.chapters)} chapter + {len(plan.years)} year digests "
+          f"({', '.join(f'{n} {s}' for s, n in sorted(states.items()))}) "
+          f"for summarizer {plan.summarizer.id}")
+    print(f"Event summaries: ~{source_tokens:,} tokens → chapter digests ~{chapter_tokens:,} "
+          f"→ year digests ~{year_tokens:,}")
+    for path in plan.orphans():
+        print(f"Orphaned digest (removed on --build): {path.relative_to(PROJECT_ROOT)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cached chapter and year digests of the event database")
+    parser.add_argument("--build", action="store_true", help="Rebuild stale and missing digests")
+    parser.add_argument("--force", action="store_true", help="With --build, rebuild every digest")
+    parser.add_argument("--dry-run", action="store_true", help="With --build, only list what would be rebuilt")
+    parser.add_argument("--summarizer", choices=sorted(SUMMARIZERS), default="extractive",
+                        help="Summarizer (default: extractive)")
+    parser.add_argument("--history", action="store_true", help="Print the campaign history recap")
+    parser.add_argument("--budget", type=int, default=DEFAULT_HISTORY_BUDGET,
+                        help=f"Token budget for --history (default: {DEFAULT_HISTORY_BUDGET})")
+    parser.add_argument("--upto", type=str, help="With --history, the last chapter to include")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    plan = DigestPlan(load_events(), SUMMARIZERS[args.summarizer]())
+
+    if args.build:
+        done = build(plan, force=args.force, dry_run=args.dry_run)
+        if args.json:
+            print(json.dumps(done, indent=2))
+            return
+        verb = "Would rebuild" if args.dry_run else "Rebuilt"
+        print(f"{verb} {len(done['chapters'])} chapter and {len(done['years'])} year digests "
+              f"→ {DIGEST_DIR.relative_to(PROJECT_ROOT)}")
+        for kind in ("chapters", "years"):
+            if done[kind]:
+                print(f"  {kind}: {', '.join(done[kind])}")
+        if done["removed"]:
+            print(f"  {'would remove' if args.dry_run else 'removed'}: {', '.join(done['removed'])}")
+        return
+
+    if args.history:
+        missing = [c for c in plan.chapters if plan.chapter_state(c) != "fresh"] \
+            + [y for y in plan.years if plan.year_state(y) != "fresh"]
+        if missing:
+            print(f"ERROR: {len(missing)} digests are stale or missing — run with --build first.")
+            sys.exit(1)
+        if args.upto and args.upto not in plan.chapters:
+            print(f"ERROR: Unknown chapter {args.upto!r}")
+            sys.exit(1)
+        history = campaign_history(plan, args.budget, args.upto)
+        if args.json:
+            print(json.dumps(history, indent=2, ensure_ascii=False))
+            return
+        print(history["text"])
+        print(f"\n--- ~{history['tokens']:,} tokens (budget {args.budget:,}), "
+              f"{len(history['sections'])} sections"
+              + (f", {len(history['omitted'])} omitted" if history["omitted"] else ""))
+        return
+
+    rows = status_rows(plan)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print_status(plan, rows)
+
+
+if __name__ == "__main__":
+    main()
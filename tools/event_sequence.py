@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Event Sequence — Process-safe allocator for event (and roll) ID sequences.
+
+Event IDs are evt_{year}_{seq:05d}, where seq comes from the global counter
+next_event_seq in tools/build_state.json. Every writer of that counter goes
+through this module, which holds an exclusive advisory lock on
+tools/build_state.lock while it reads, bumps and rewrites the state file,
+so chapters can be assembled and ID-assigned in parallel without handing
+out the same sequence twice.
+
+Callers reserve a contiguous block per chapter:
+
+  block = reserve(len(events), key="assign:1.07")   # range(613, 621)
+
+Blocks reserved with a key are recorded under sequence_blocks in
+build_state.json; reserving again with the same key (a re-run after a crash
+or a re-assembly of the chapter) returns the same block when it is large
+enough, so IDs are stable across retries. Keys are prefixed by the tool that
+reserves them (assign:{chapter}, merge:{chapter}): a chapter that is
+ID-assigned and later merged must get two distinct blocks. Merge order does not depend on
+which chapter reserved first: build_events_db.py merge walks the chapter
+files in chapter order, whatever their sequence numbers.
+
+save_build_state() is the locked counterpart of a plain json.dump for
+scripts that hold build_state in memory for a whole run (merge_chapter.py):
+it re-reads the file under the lock and never moves a counter backwards.
+
+Used by build_events_db.py (assign-ids) and merge_chapter.py.
+
+Usage:
+  python3 tools/event_sequence.py status              # Counters, blocks, lock holder
+  python3 tools/event_sequence.py reserve 12 --key 2.31
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from contextlib import contextmanager
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+BUILD_STATE_FILE = TOOLS_DIR / "build_state.json"
+LOCK_FILE = TOOLS_DIR / "build_state.lock"
+
+EVENT_COUNTER = "next_event_seq"
+ROLL_COUNTER = "next_roll_seq"
+COUNTERS = (EVENT_COUNTER, ROLL_COUNTER)
+
+# How long to wait for another process to release the lock
+LOCK_TIMEOUT = 30.0
+LOCK_POLL = 0.05
+
+DEFAULT_YEAR = 1430
+
+
+# ---------------------------------------------------------------------------
+# Locking
+# ---------------------------------------------------------------------------
+
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def lock_holder() -> str:
+    """PID and time recorded by the current (or last) lock holder."""
+    try:
+        return LOCK_FILE.read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+
+
+@contextmanager
+def state_lock(timeout: float = LOCK_TIMEOUT):
+    """Exclusive advisory lock on build_state.json (blocks up to timeout)."""
+    LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(fd):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"build_state.json is locked ({lock_holder() or 'unknown holder'})")
+            time.sleep(LOCK_POLL)
+        try:
+            os.ftruncate(fd, 0)
+            os.write(fd, f"pid {os.getpid()} since {time.strftime('%H:%M:%S')}".encode())
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+# ---------------------------------------------------------------------------
+# State file
+# ---------------------------------------------------------------------------
+
+def _read_state() -> dict:
+    if not BUILD_STATE_FILE.exists():
+        return {}
+    with open(BUILD_STATE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_state(state: dict) -> None:
+    """Write build_state.json atomically (temp file + rename)."""
+    tmp = BUILD_STATE_FILE.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, BUILD_STATE_FILE)
+
+
+@contextmanager
+def locked_state():
+    """Read-modify-write build_state.json under the lock.
+
+    Yields the parsed state; it is written back when the block exits
+    without an exception.
+    """
+    with state_lock():
+        state = _read_state()
+        yield state
+        _write_state(state)
+
+
+def save_build_state(state: dict) -> dict:
+    """Merge an in-memory build_state into the file under the lock.
+
+    Counters keep the larger of the two values, chapters_processed and
+    sequence_blocks are merged key by key, every other key takes the
+    in-memory value. Returns the state as written.
+    """
+    with locked_state() as current:
+        for key, value in state.items():
+            if key in COUNTERS:
+                current[key] = max(current.get(key, 1), value)
+            elif key == "chapters_processed":
+                current.setdefault(key, {}).update(value)
+            elif key == "sequence_blocks":
+                for counter, blocks in value.items():
+                    current.setdefault(key, {}).setdefault(counter, {}).update(blocks)
+            else:
+                current[key] = value
+        merged = dict(current)
+    state.update(merged)
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Allocation
+# ---------------------------------------------------------------------------
+
+def peek(counter: str = EVENT_COUNTER) -> int:
+    """Next unreserved value of a counter (no reservation; for dry runs)."""
+    return _read_state().get(counter, 1)
+
+
+def reserve(count: int, key: str | None = None, counter: str = EVENT_COUNTER) -> range:
+    """Reserve count consecutive sequence numbers.
+
+    With a key (the reserving tool and chapter ID) the block is recorded, and a later
+    reserve() with the same key gets the same block back if it is at least
+    count long; a larger request gets a fresh block.
+    """
+    if count <= 0:
+        return range(0)
+    with locked_state() as state:
+        blocks = state.setdefault("sequence_blocks", {}).setdefault(counter, {})
+        if key is not None and key in blocks:
+            start, size = blocks[key]
+            if size >= count:
+                return range(start, start + count)
+        start = state.get(counter, 1)
+        state[counter] = start + count
+        if key is not None:
+            blocks[key] = [start, count]
+    return range(start, start + count)
+
+
+def event_year(date_str: str) -> int:
+    """Year part of an event ID, from the event's YYYY-MM-DD date."""
+    try:
+        return int(date_str[:4]) if date_str and len(date_str) >= 4 else DEFAULT_YEAR
+    except ValueError:
+        return DEFAULT_YEAR
+
+
+def make_event_id(year: int, seq: int) -> str:
+    """Generate event ID: evt_{year}_{5digit}."""
+    return f"evt_{year}_{seq:05d}"
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_status(args):
+    state = _read_state()
+    for counter in COUNTERS:
+        print(f"  {counter}: {state.get(counter, 1)}")
+    blocks = state.get("sequence_blocks", {})
+    for counter, by_key in blocks.items():
+        print(f"\n  {counter} blocks ({len(by_key)}):")
+        for key, (start, size) in sorted(by_key.items(), key=lambda kv: kv[1][0])[-args.top:]:
+            print(f"    {key:<10} {start:>6}-{start + size - 1:<6} ({size})")
+    holder = lock_holder()
+    if holder:
+        print(f"\n  Last lock holder: {holder}")
+
+
+def cmd_reserve(args):
+    try:
+        block = reserve(args.count, key=args.key, counter=args.counter)
+    except TimeoutError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    print(f"  Reserved {args.counter} {block.start}-{block.stop - 1}"
+          + (f" for {args.key}" if args.key else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event/roll sequence allocator")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    sp_status = subparsers.add_parser("status", help="Show counters and reserved blocks")
+    sp_status.add_argument("--top", type=int, default=10, help="Most recent blocks to show")
+
+    sp_reserve = subparsers.add_parser("reserve", help="Reserve a block of sequence numbers")
+    sp_reserve.add_argument("count", type=int)
+    sp_reserve.add_argument("--key", help="Record the block under this key (e.g. assign:1.07)")
+    sp_reserve.add_argument("--counter", choices=COUNTERS, default=EVENT_COUNTER)
+
+    args = parser.parse_args()
+    if args.command == "status":
+        cmd_status(args)
+    elif args.command == "reserve":
+        cmd_reserve(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Exchange Blob — All event texts in one memory-mapped UTF-8 file plus an offset table.
+
+The exchange texts (and event summaries) sit inside ~14 MB of pretty-printed
+JSON in resources/data/events/chapter_*.json, so every full-corpus scan
+starts by parsing all of it. build writes them once into
+
+  tools/preprocessed/exchanges.bin    texts, each preceded by one "\\n"
+  tools/preprocessed/exchanges.idx    offset table, one row per text:
+                                      start (u64), length (u32), event (u32),
+                                      exchange index (u16), role (u8),
+                                      stored column by column
+  tools/preprocessed/exchanges.json   event IDs, chapter files and numbers, role names and
+                                      the mtime/size of every source file
+
+ExchangeBlob mmaps both files: raw(i) is a memoryview slice of the blob,
+text(i) decodes one entry, and finditer() runs a bytes regex over the whole
+map and reports (entry, match), never letting a match run past the end of
+its entry. The "\\n" before each text keeps line-anchored patterns ((?m)^,
+(?:^|\\n)) working at entry starts.
+Offsets into raw() are bytes; char_offset() converts.
+
+Summaries are entries with role "summary" and no exchange index. open_blob()
+rebuilds when any chapter file changed since the build.
+
+Usage:
+  python3 tools/exchange_blob.py build             # (Re)build
+  python3 tools/exchange_blob.py status            # Size, entries, freshness
+  python3 tools/exchange_blob.py grep 'Hamza Bey' --role gm --limit 20
+"""
+
+import os
+import re
+import sys
+import json
+import mmap
+import time
+import struct
+import argparse
+from bisect import bisect_right
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EVENTS_DIR = PROJECT_ROOT / "resources" / "data" / "events"
+PREPROCESSED_DIR = PROJECT_ROOT / "tools" / "preprocessed"
+BLOB_FILE = PREPROCESSED_DIR / "exchanges.bin"
+INDEX_FILE = PREPROCESSED_DIR / "exchanges.idx"
+META_FILE = PREPROCESSED_DIR / "exchanges.json"
+
+MAGIC = b"EXB1"
+FORMAT = 1                              # bump when the metadata layout changes
+HEADER = struct.Struct("<4sI")          # magic, entry count
+# Column typecodes, in file order (8-byte column first keeps every column aligned)
+COLUMNS = (("start", "Q"), ("length", "I"), ("event", "I"), ("exchange", "H"), ("role", "B"))
+NO_EXCHANGE = 0xFFFF
+SUMMARY_ROLE = "summary"
+SEPARATOR = b"\n"
+
+
+def chapter_sort_key(path: Path) -> int:
+    book, _, num = path.stem[len("chapter_"):].partition(".")
+    return int(book) * 1000 + int(num or 0)
+
+
+def source_files() -> list:
+    return sorted(EVENTS_DIR.glob("chapter_*.json"), key=chapter_sort_key)
+
+
+def source_stamps() -> dict:
+    return {p.name: [p.stat().st_mtime_ns, p.stat().st_size] for p in source_files()}
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def build() -> dict:
+    """Write blob, offset table and metadata; returns the metadata."""
+    PREPROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    roles = [SUMMARY_ROLE]
+    role_ids = {SUMMARY_ROLE: 0}
+    files, chapters, events = [], [], []
+    columns = {name: [] for name, _ in COLUMNS}
+    stamps = source_stamps()
+
+    tmp_blob = BLOB_FILE.with_suffix(".bin.tmp")
+    with open(tmp_blob, "wb") as out:
+        pos = 0
+
+        def add(text: str, event: int, exchange: int, role: str) -> None:
+            nonlocal pos
+            data = SEPARATOR + text.encode("utf-8")
+            out.write(data)
+            if role not in role_ids:
+                role_ids[role] = len(roles)
+                roles.append(role)
+            columns["start"].append(pos + len(SEPARATOR))
+            columns["length"].append(len(data) - len(SEPARATOR))
+            columns["event"].append(event)
+            columns["exchange"].append(exchange)
+            columns["role"].append(role_ids[role])
+            pos += len(data)
+
+        for path in source_files():
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            file_index = len(files)
+            files.append(path.name)
+            chapters.append(data.get("chapter", "unknown") if isinstance(data, dict) else "unknown")
+            chapter_events = data if isinstance(data, list) else data.get("events", [])
+            for event in chapter_events:
+                event_index = len(events)
+                events.append([event.get("event_id", "unknown"), file_index])
+                if event.get("summary"):
+                    add(event["summary"], event_index, NO_EXCHANGE, SUMMARY_ROLE)
+                for idx, exchange in enumerate(event.get("exchanges", [])):
+                    if exchange.get("text"):
+                        add(exchange["text"], event_index, idx, exchange.get("role") or "")
+
+    count = len(columns["start"])
+    tmp_idx = INDEX_FILE.with_suffix(".idx.tmp")
+    with open(tmp_idx, "wb") as out:
+        out.write(HEADER.pack(MAGIC, count))
+        for name, code in COLUMNS:
+            out.write(struct.pack(f"<{count}{code}", *columns[name]))
+
+    meta = {"format": FORMAT, "entries": count, "roles": roles, "files": files, "chapters": chapters,
+            "events": events,
+            "sources": stamps, "built": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    tmp_meta = META_FILE.with_suffix(".json.tmp")
+    with open(tmp_meta, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    os.replace(tmp_blob, BLOB_FILE)
+    os.replace(tmp_idx, INDEX_FILE)
+    os.replace(tmp_meta, META_FILE)
+    return meta
+
+
+def is_stale() -> bool:
+    if not (BLOB_FILE.exists() and INDEX_FILE.exists() and META_FILE.exists()):
+        return True
+    with open(META_FILE, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    return meta.get("format") != FORMAT or meta.get("sources") != source_stamps()
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class ExchangeBlob:
+    """Read-only view of a built blob (use as a context manager or close())."""
+
+    def __init__(self):
+        with open(META_FILE, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.roles = meta["roles"]
+        self.files = meta["files"]
+        self.chapters = meta["chapters"]
+        self.events = meta["events"]
+
+        with open(BLOB_FILE, "rb") as f:
+            # mmap cannot map an empty file
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+        with open(INDEX_FILE, "rb") as f:
+            self.idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(self.idx, 0)
+        if magic != MAGIC or count != meta["entries"]:
+            raise ValueError(f"{INDEX_FILE.name} does not match {META_FILE.name}; rebuild")
+        self.count = count
+
+        # Offset-table columns as typed memoryviews over the map (no copy)
+        view = memoryview(self.idx)
+        offset = HEADER.size
+        self.col = {}
+        for name, code in COLUMNS:
+            size = struct.calcsize(code) * count
+            self.col[name] = view[offset:offset + size].cast(code)
+            offset += size
+        view.release()
+        self.starts = self.col["start"]
+        self.lengths = self.col["length"]
+        self.blob = memoryview(self.mm)
+
+    def close(self) -> None:
+        self.starts = self.lengths = None
+        for column in self.col.values():
+            column.release()
+        self.blob.release()
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        self.idx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    # -----------------------------------------------------------------------
+
+    def entry(self, i: int) -> dict:
+        event_id, file_index = self.events[self.col["event"][i]]
+        exchange = self.col["exchange"][i]
+        return {"event_id": event_id, "file": self.files[file_index],
+                "chapter": self.chapters[file_index],
+                "exchange": None if exchange == NO_EXCHANGE else exchange,
+                "role": self.role(i), "start": self.starts[i], "length": self.lengths[i]}
+
+    def role(self, i: int) -> str:
+        return self.roles[self.col["role"][i]]
+
+    def role_ids(self, roles: tuple | None) -> set | None:
+        return None if roles is None else {self.roles.index(r) for r in roles if r in self.roles}
+
+    def raw(self, i: int) -> memoryview:
+        start = self.starts[i]
+        return self.blob[start:start + self.lengths[i]]
+
+    def text(self, i: int) -> str:
+        return str(self.raw(i), "utf-8")
+
+    def char_offset(self, i: int, byte_offset: int) -> int:
+        return len(str(self.raw(i)[:byte_offset], "utf-8", "replace"))
+
+    def locate(self, offset: int) -> int:
+        """Entry containing blob offset (a separator belongs to the entry after it)."""
+        return max(0, bisect_right(self.starts, offset + len(SEPARATOR)) - 1)
+
+    def entries(self, roles: tuple | None = None):
+        """Entry numbers, optionally only these roles."""
+        wanted = self.role_ids(roles)
+        if wanted is None:
+            return range(self.count)
+        role_col = self.col["role"]
+        return (i for i in range(self.count) if role_col[i] in wanted)
+
+    def finditer(self, pattern, roles: tuple | None = None):
+        """Yield (entry, match) for a bytes regex over the whole blob.
+
+        match offsets are blob offsets; entry-relative = m.start() - starts[entry]
+        (clamped at 0 for matches that begin on the separator). A match that
+        would cross into the next entry is searched again with the entry's
+        end as endpos, so every match lies within one entry's bounds.
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern.encode("utf-8"))
+        wanted = self.role_ids(roles)
+        pos, size = 0, len(self.mm)
+        while pos <= size:
+            m = pattern.search(self.mm, pos)
+            if m is None:
+                return
+            i = self.locate(m.start())
+            end = self.starts[i] + self.lengths[i]
+            if m.end() > end:
+                m = pattern.search(self.mm, m.start(), end)
+                if m is None:
+                    pos = end
+                    continue
+            if wanted is None or self.col["role"][i] in wanted:
+                yield i, m
+            pos = m.end() if m.end() > m.start() else m.end() + 1
+
+
+def open_blob(refresh: bool = True) -> ExchangeBlob:
+    """Open the blob, rebuilding it first if missing or stale (refresh=True)."""
+    if refresh and is_stale():
+        build()
+    return ExchangeBlob()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory-mapped exchange-text blob")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    subparsers.add_parser("build", help="(Re)build the blob from the chapter files")
+    subparsers.add_parser("status", help="Show blob size, entries and freshness")
+    sp_grep = subparsers.add_parser("grep", help="Regex search over the blob")
+    sp_grep.add_argument("pattern", help="Regex (bytes; (?i) folds ASCII only)")
+    sp_grep.add_argument("--role", action="append", help="Only these roles (gm, player, summary)")
+    sp_grep.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        t0 = time.time()
+        meta = build()
+        print(f"  {meta['entries']:,} texts from {len(meta['files'])} files "
+              f"({BLOB_FILE.stat().st_size / 1e6:.1f} MB) in {time.time() - t0:.2f}s")
+    elif args.command == "status":
+        if not META_FILE.exists():
+            print("  Not built. Run: python3 tools/exchange_blob.py build")
+            return
+        with ExchangeBlob() as blob:
+            print(f"  {BLOB_FILE.relative_to(PROJECT_ROOT)}: {len(blob.mm) / 1e6:.1f} MB, "
+                  f"{len(blob):,} texts, {len(blob.events):,} events, {len(blob.files)} files")
+            print(f"  Roles: {', '.join(blob.roles)}")
+        print(f"  {'STALE (a chapter file changed)' if is_stale() else 'Up to date'}")
+    elif args.command == "grep":
+        t0 = time.time()
+        n = 0
+        with open_blob() as blob:
+            for i, m in blob.finditer(args.pattern, tuple(args.role) if args.role else None):
+                e = blob.entry(i)
+                rel = max(0, m.start() - e["start"])
+                line = str(blob.raw(i)[max(0, rel - 40):rel + 80], "utf-8", "replace")
+                ex = "summary" if e["exchange"] is None else f"[{e['exchange']}]"
+                print(f"  {e['event_id']:<16} {ex:>8} {e['role']:<7} {' '.join(line.split())}")
+                n += 1
+                if n >= args.limit:
+                    break
+        print(f"\n{n} hit(s) in {(time.time() - t0) * 1000:.0f} ms")
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
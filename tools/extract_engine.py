@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Extract Engine — Builds curated chapter extractions from event_defs files.
+
+Replaces the one-shot extract_chapter_1_01.py … extract_chapter_1_22.py
+scripts. Each of those hardcoded EVENT_DEFS plus the curated extraction
+sections and ran the same main(); the data now lives in
+tools/event_defs/chapter_{id}_defs.json next to the assemble_chapter.py defs,
+with the curated sections as extra top-level keys:
+
+  {
+    "events": [{"msgs": [1, 14], "date": ..., "type": ..., ...}, ...],
+    "new_characters": [...], "character_updates": [...],
+    "new_locations": [...], "new_factions": [...],
+    "faction_updates": [...], "rolls": [...], "law_references": [...]
+  }
+
+Only defs files carrying those sections are curated extractions; the others
+(plain assemble_chapter.py defs) are left to build_extractions.py.
+
+Each event's exchanges are copied verbatim from the preprocessed messages in
+its msgs range, and the output is written exactly as the old scripts wrote
+it (same key order, end_date only when the def has one, indent 2, no
+trailing newline), so --check can compare bytes against tools/extractions/.
+
+Usage:
+  python3 tools/extract_engine.py                 # All curated chapters
+  python3 tools/extract_engine.py 1.05 1.07       # Specific chapters
+  python3 tools/extract_engine.py --book 1        # One book
+  python3 tools/extract_engine.py --check         # Byte-compare with tools/extractions/, no writes
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+DEFS_DIR = TOOLS_DIR / "event_defs"
+PREPROCESSED_DIR = TOOLS_DIR / "preprocessed"
+EXTRACTIONS_DIR = TOOLS_DIR / "extractions"
+
+# Curated sections, in output order
+EXTRACTION_SECTIONS = ("new_characters", "character_updates", "new_locations",
+                       "new_factions", "faction_updates", "rolls", "law_references")
+
+# Event fields copied from the def, in output order (status/exchanges follow)
+EVENT_FIELDS = ("date", "type", "summary", "characters", "factions_affected",
+                "location", "tags")
+
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def is_curated(defs: dict) -> bool:
+    """True for defs files that carry curated extraction sections."""
+    return any(section in defs for section in EXTRACTION_SECTIONS)
+
+
+def curated_chapters(book: int | None = None) -> list:
+    """Chapter IDs with curated defs, in chapter order."""
+    chapters = []
+    for path in DEFS_DIR.glob("chapter_*_defs.json"):
+        chapter_id = re.search(r"chapter_(.+?)_defs\.json", path.name).group(1)
+        if book is not None and int(chapter_id.split(".")[0]) != book:
+            continue
+        if is_curated(load_json(path)):
+            chapters.append(chapter_id)
+    return sorted(chapters, key=lambda c: tuple(int(p) for p in c.split(".")))
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def build_events(event_defs: list, messages: list) -> list:
+    msg_by_index = {m["index"]: m for m in messages}
+    events = []
+    for edef in event_defs:
+        start, end = edef["msgs"]
+        exchanges = [{"role": msg_by_index[idx]["role"], "text": msg_by_index[idx]["text"]}
+                     for idx in range(start, end + 1) if idx in msg_by_index]
+        event = {field: edef[field] for field in EVENT_FIELDS}
+        event["status"] = edef.get("status", "resolved")
+        event["exchanges"] = exchanges
+        if "end_date" in edef:
+            event["end_date"] = edef["end_date"]
+        events.append(event)
+    return events
+
+
+def build_extraction(chapter_id: str, defs: dict, messages: list) -> dict:
+    extraction = {
+        "chapter": chapter_id,
+        "book": int(chapter_id.split(".")[0]),
+        "events": build_events(defs["events"], messages),
+    }
+    for section in EXTRACTION_SECTIONS:
+        extraction[section] = defs.get(section, [])
+    return extraction
+
+
+def render(extraction: dict) -> bytes:
+    """Serialized exactly as the legacy scripts' json.dump wrote it."""
+    return json.dumps(extraction, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def first_difference(a: bytes, b: bytes) -> int:
+    n = min(len(a), len(b))
+    return next((i for i in range(n) if a[i] != b[i]), n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build curated extractions from event_defs")
+    parser.add_argument("chapters", nargs="*", help="Chapter IDs (default: all curated)")
+    parser.add_argument("--book", type=int, help="Only chapters of this book")
+    parser.add_argument("--check", action="store_true",
+                        help="Compare with tools/extractions/ byte for byte; write nothing")
+    args = parser.parse_args()
+
+    chapter_ids = args.chapters or curated_chapters(args.book)
+    if not chapter_ids:
+        print("No curated defs found.")
+        return
+
+    t0 = time.time()
+    mismatched = []
+    for chapter_id in chapter_ids:
+        defs_path = DEFS_DIR / f"chapter_{chapter_id}_defs.json"
+        pre_path = PREPROCESSED_DIR / f"chapter_{chapter_id}_preprocessed.json"
+        if not defs_path.exists() or not pre_path.exists():
+            print(f"  {chapter_id}: ERROR missing {'defs' if not defs_path.exists() else 'preprocessed'} file")
+            mismatched.append(chapter_id)
+            continue
+        defs = load_json(defs_path)
+        if not is_curated(defs):
+            print(f"  {chapter_id}: SKIP (assemble-only defs; see build_extractions.py)")
+            continue
+
+        extraction = build_extraction(chapter_id, defs, load_json(pre_path).get("messages", []))
+        data = render(extraction)
+        out_path = EXTRACTIONS_DIR / f"chapter_{chapter_id}_extracted.json"
+        n_ex = sum(len(e["exchanges"]) for e in extraction["events"])
+        summary = (f"{len(extraction['events'])} events, {n_ex} exchanges, "
+                   f"{len(extraction['new_characters'])} new chars, {len(extraction['rolls'])} rolls")
+
+        if args.check:
+            current = out_path.read_bytes() if out_path.exists() else b""
+            if current == data:
+                print(f"  {chapter_id}: identical ({len(data):,} bytes; {summary})")
+            else:
+                at = first_difference(current, data)
+                print(f"  {chapter_id}: DIFFERS at byte {at:,} "
+                      f"(current {len(current):,}, built {len(data):,})")
+                mismatched.append(chapter_id)
+        else:
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_bytes(data)
+            print(f"  {chapter_id}: {summary} → {out_path.name}")
+
+    print(f"\n{len(chapter_ids)} chapter(s) in {time.time() - t0:.2f}s")
+    if mismatched:
+        print(f"{len(mismatched)} not identical: {', '.join(mismatched)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -34,22 +34,22 @@ import json
 import os
 import re
 import sys
-import time
 import argparse
 from pathlib import Path
 
-import requests
-
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "resources" / "data"
 TOOLS_DIR = PROJECT_ROOT / "tools"
 EXTRACTIONS_DIR = TOOLS_DIR / "extractions"
 EVENTS_DIR = DATA_DIR / "events"
 
-API_URL = "https://api.anthropic.com/v1/messages"
-API_MODEL = "claude-haiku-4-5-20251001"
-API_VERSION = "2023-06-01"
-MAX_TOKENS = 16384
+# Shared API client (retries, cost, usage ledger)
+sys.path.insert(0, str(TOOLS_DIR))
+from llm_client import call_haiku
+from json_repair import tolerant_loads
+from token_estimator import count_tokens_bounded, margin_text
+
+TOOL_NAME = "extract_from_exchanges"
 
 # ---------------------------------------------------------------------------
 # API
@@ -68,55 +68,6 @@ def get_api_key() -> str:
     return key
 
 
-def call_haiku(api_key: str, system_prompt: str, user_message: str,
-               max_retries: int = 3) -> dict:
-    """Call Claude Haiku with retry logic."""
-    headers = {
-        "x-api-key": api_key,
-        "anthropic-version": API_VERSION,
-        "content-type": "application/json",
-    }
-    payload = {
-        "model": API_MODEL,
-        "max_tokens": MAX_TOKENS,
-        "system": system_prompt,
-        "messages": [{"role": "user", "content": user_message}],
-    }
-
-    for attempt in range(max_retries):
-        try:
-            resp = requests.post(API_URL, headers=headers, json=payload, timeout=180)
-
-            if resp.status_code == 200:
-                data = resp.json()
-                text = data.get("content", [{}])[0].get("text", "")
-                usage = data.get("usage", {})
-                return {"text": text, "usage": usage, "error": None}
-
-            if resp.status_code == 429:
-                wait = 2 ** (attempt + 1)
-                print(f"    Rate limited, waiting {wait}s...")
-                time.sleep(wait)
-                continue
-
-            if resp.status_code >= 500:
-                wait = 2 ** (attempt + 1)
-                print(f"    Server error {resp.status_code}, waiting {wait}s...")
-                time.sleep(wait)
-                continue
-
-            return {"text": "", "usage": {}, "error": f"HTTP {resp.status_code}: {resp.text[:200]}"}
-
-        except requests.exceptions.Timeout:
-            wait = 2 ** (attempt + 1)
-            print(f"    Timeout, waiting {wait}s...")
-            time.sleep(wait)
-        except requests.exceptions.RequestException as e:
-            return {"text": "", "usage": {}, "error": str(e)}
-
-    return {"text": "", "usage": {}, "error": "Max retries exceeded"}
-
-
 # ---------------------------------------------------------------------------
 # Prompts
 # ---------------------------------------------------------------------------
@@ -303,7 +254,12 @@ def get_known_characters(events: list, characters_db: list) -> dict:
 
 
 def parse_api_response(text: str) -> dict:
-    """Parse JSON from API response, handling markdown fences."""
+    """Parse JSON from API response, handling markdown fences.
+
+    Malformed output (truncated, trailing commas, stray prose) is repaired
+    with json_repair.tolerant_loads; the notes on what was dropped are
+    returned under "_repairs".
+    """
     text = text.strip()
     # Remove markdown code fences
     if text.startswith("```"):
@@ -314,13 +270,11 @@ def parse_api_response(text: str) -> dict:
     try:
         return json.loads(text)
     except json.JSONDecodeError as e:
-        # Try to find JSON in the text
-        match = re.search(r"\{[\s\S]*\}", text)
-        if match:
-            try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
-                pass
+        # Recover what we can instead of paying for another call
+        data, dropped = tolerant_loads(text)
+        if isinstance(data, dict) and data:
+            data["_repairs"] = dropped
+            return data
         return {"error": f"Failed to parse JSON: {e}", "raw": text[:500]}
 
 
@@ -413,19 +367,20 @@ def process_chapter(chapter_id: str, api_key: str, dry_run: bool = False,
 
     # Build prompt
     prompt = build_extraction_prompt(chapter_id, events, known_chars)
-    prompt_tokens = len(prompt) // 4  # Rough estimate
+    prompt_tokens, margin = count_tokens_bounded(SYSTEM_PROMPT + "\n\n" + prompt)
 
     if dry_run:
         stats["status"] = "dry_run"
         stats["input_tokens"] = prompt_tokens
         print(f"  {chapter_id}: DRY RUN — {len(events)} events, "
-              f"~{prompt_tokens:,} input tokens")
+              f"~{prompt_tokens:,}{margin_text(margin)} input tokens")
         return stats
 
     print(f"  {chapter_id}: Processing {len(events)} events (~{prompt_tokens:,} tokens)...", end="", flush=True)
 
     # Call API
-    result = call_haiku(api_key, SYSTEM_PROMPT, prompt)
+    result = call_haiku(api_key, SYSTEM_PROMPT, prompt, tool=TOOL_NAME,
+                        chapter=chapter_id, timeout=180)
 
     if result["error"]:
         stats["status"] = "error"
@@ -435,8 +390,7 @@ def process_chapter(chapter_id: str, api_key: str, dry_run: bool = False,
     usage = result.get("usage", {})
     stats["input_tokens"] = usage.get("input_tokens", 0)
     stats["output_tokens"] = usage.get("output_tokens", 0)
-    stats["cost"] = (stats["input_tokens"] * 0.80 / 1_000_000 +
-                     stats["output_tokens"] * 4.00 / 1_000_000)
+    stats["cost"] = result["cost"]
 
     # Parse response
     api_data = parse_api_response(result["text"])
@@ -449,6 +403,10 @@ def process_chapter(chapter_id: str, api_key: str, dry_run: bool = False,
         print(f"    Raw response saved to {debug_path}")
         return stats
 
+    repairs = api_data.pop("_repairs", [])
+    if repairs:
+        print(f" [repaired JSON: {len(repairs)} note(s)]", end="")
+
     # Load or create extraction file
     if extraction_path.exists():
         existing = load_json(extraction_path)
@@ -10,6 +10,9 @@ Improvements over v1:
   - Post-processing validation: fixes outcome_range format, removes
     hallucinated rolls, validates character IDs against aliases
   - Richer known-character context: DOB, faction, aliases sent to Haiku
+  - Relevance-pruned roster: the characters listed in the chapter's events
+    plus a handful named unambiguously in its exchange text, and only the
+    core factions, theirs and the ones the events affect
 
 Usage:
   python3 tools/extract_from_exchanges_v2.py --chapter 2.25
@@ -17,24 +20,27 @@ Usage:
   python3 tools/extract_from_exchanges_v2.py --all
   python3 tools/extract_from_exchanges_v2.py --chapter 2.25 --dry-run
   python3 tools/extract_from_exchanges_v2.py --review-only
+  python3 tools/extract_from_exchanges_v2.py --resume extract_from_exchanges_v2_20260301_120000
 
 Options:
   --force         Overwrite existing extraction even if non-stub
+  --resume ID     Continue an interrupted run from its manifest (tools/progress/)
   --review-only   Write review_needed.json without calling API
   --dry-run       Show what would be processed, don't call API
+
+Every API call is recorded in tools/logs/llm_usage.jsonl (see llm_client.py);
+run tools/llm_usage_report.py for cost and latency analytics.
 """
 
 import json
 import os
 import re
 import sys
-import time
 import argparse
 import unicodedata
 from pathlib import Path
 from datetime import datetime
-
-import requests
+from collections import Counter
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "resources" / "data"
@@ -43,10 +49,17 @@ EXTRACTIONS_DIR = TOOLS_DIR / "extractions"
 EVENTS_DIR = DATA_DIR / "events"
 ALIASES_FILE = TOOLS_DIR / "known_aliases.json"
 
-API_URL = "https://api.anthropic.com/v1/messages"
-API_MODEL = "claude-haiku-4-5-20251001"
-API_VERSION = "2023-06-01"
-MAX_TOKENS = 16384
+# Shared API client (retries, cost, usage ledger)
+sys.path.insert(0, str(TOOLS_DIR))
+from llm_client import API_MODEL, call_haiku
+from json_repair import tolerant_loads
+from character_mentions import MentionScanner, fold_text
+from token_estimator import count_tokens, count_tokens_bounded, margin_text
+from roll_intervals import infer_range_from_rolled
+from run_manifest import (request_hash, cache_response, cached_response, discard_response,
+                          file_hash, new_run, load_run, mark, remaining_chapters, print_resume_hint)
+
+TOOL_NAME = "extract_from_exchanges_v2"
 
 # Known facts for age validation (born year → used to flag wrong ages)
 KNOWN_BIRTH_YEARS = {
@@ -92,59 +105,6 @@ def get_api_key() -> str:
     return key
 
 
-def call_haiku(api_key: str, system_prompt: str, user_message: str,
-               max_retries: int = 3) -> dict:
-    """Call Claude Haiku with retry logic.
-
-    Timeout is 120s per request (large chapters need more time).
-    Backoff is capped at 16s.
-    """
-    headers = {
-        "x-api-key": api_key,
-        "anthropic-version": API_VERSION,
-        "content-type": "application/json",
-    }
-    payload = {
-        "model": API_MODEL,
-        "max_tokens": MAX_TOKENS,
-        "system": system_prompt,
-        "messages": [{"role": "user", "content": user_message}],
-    }
-
-    for attempt in range(max_retries):
-        try:
-            resp = requests.post(API_URL, headers=headers, json=payload, timeout=120)
-
-            if resp.status_code == 200:
-                data = resp.json()
-                text = data.get("content", [{}])[0].get("text", "")
-                usage = data.get("usage", {})
-                return {"text": text, "usage": usage, "error": None}
-
-            if resp.status_code == 429:
-                wait = min(2 ** (attempt + 1), 16)
-                print(f"    Rate limited (attempt {attempt+1}/{max_retries}), waiting {wait}s...")
-                time.sleep(wait)
-                continue
-
-            if resp.status_code >= 500:
-                wait = min(2 ** (attempt + 1), 16)
-                print(f"    Server error {resp.status_code} (attempt {attempt+1}/{max_retries}), waiting {wait}s...")
-                time.sleep(wait)
-                continue
-
-            return {"text": "", "usage": {}, "error": f"HTTP {resp.status_code}: {resp.text[:200]}"}
-
-        except requests.exceptions.Timeout:
-            wait = min(2 ** (attempt + 1), 16)
-            print(f"    Timeout (attempt {attempt+1}/{max_retries}), waiting {wait}s...")
-            time.sleep(wait)
-        except requests.exceptions.RequestException as e:
-            return {"text": "", "usage": {}, "error": str(e)}
-
-    return {"text": "", "usage": {}, "error": "Max retries exceeded"}
-
-
 # ---------------------------------------------------------------------------
 # GM thinking / meta text stripping (pre-processing)
 # ---------------------------------------------------------------------------
@@ -453,6 +413,41 @@ CRITICAL RULES:
 10. ANACHRONISMS: Flag any reference to events/terms that are anachronistic for the 1430s (e.g., "Pragmatic Sanction" before 1438, institutions that don't exist yet)."""
 
 
+# Faction IDs shown per roster line
+ROSTER_FACTIONS_SHOWN = 3
+
+
+def format_roster_block(known_characters: dict) -> list:
+    """Prompt lines for the KNOWN CHARACTERS block."""
+    if not known_characters:
+        return []
+    lines = ["\n\n## KNOWN CHARACTERS (already in database — use these exact IDs)"]
+    for cid, cdata in known_characters.items():
+        aliases_str = ""
+        if cdata.get("aliases"):
+            aliases_str = f" (aliases: {', '.join(cdata['aliases'][:5])})"
+        faction_str = ""
+        if cdata.get("faction_ids"):
+            faction_str = f" [factions: {', '.join(cdata['faction_ids'][:ROSTER_FACTIONS_SHOWN])}]"
+        born_str = ""
+        if cdata.get("born") and cdata["born"] != "0000-00-00":
+            born_str = f" born={cdata['born'][:4]}"
+        lines.append(f"- {cid}: {cdata.get('name', '?')} — "
+                     f"{cdata.get('title', '(no title)')}"
+                     f"{born_str}{aliases_str}{faction_str}")
+    return lines
+
+
+def format_factions_block(known_factions: list) -> list:
+    """Prompt lines for the KNOWN FACTIONS block."""
+    if not known_factions:
+        return []
+    lines = ["\n\n## KNOWN FACTIONS (use these IDs for faction assignments)"]
+    for f in known_factions:
+        lines.append(f"- {f['faction_id']}: {f.get('name', '?')} ({f.get('type', '?')})")
+    return lines
+
+
 def build_extraction_prompt(chapter_id: str, events: list,
                             known_characters: dict, known_factions: list,
                             alias_index: dict) -> str:
@@ -490,27 +485,10 @@ def build_extraction_prompt(chapter_id: str, events: list,
         parts.append("\n".join(exchange_text))
 
     # Known characters context (enriched)
-    if known_characters:
-        parts.append("\n\n## KNOWN CHARACTERS (already in database — use these exact IDs)")
-        for cid, cdata in known_characters.items():
-            aliases_str = ""
-            if cdata.get("aliases"):
-                aliases_str = f" (aliases: {', '.join(cdata['aliases'][:5])})"
-            faction_str = ""
-            if cdata.get("faction_ids"):
-                faction_str = f" [factions: {', '.join(cdata['faction_ids'][:3])}]"
-            born_str = ""
-            if cdata.get("born") and cdata["born"] != "0000-00-00":
-                born_str = f" born={cdata['born'][:4]}"
-            parts.append(f"- {cid}: {cdata.get('name', '?')} — "
-                         f"{cdata.get('title', '(no title)')}"
-                         f"{born_str}{aliases_str}{faction_str}")
+    parts.extend(format_roster_block(known_characters))
 
     # Known factions
-    if known_factions:
-        parts.append("\n\n## KNOWN FACTIONS (use these IDs for faction assignments)")
-        for f in known_factions:
-            parts.append(f"- {f['faction_id']}: {f.get('name', '?')} ({f.get('type', '?')})")
+    parts.extend(format_factions_block(known_factions))
 
     parts.append("""
 
@@ -651,24 +629,6 @@ LABEL_TO_RANGE = {
 }
 
 
-def infer_range_from_rolled(rolled: int) -> str:
-    """Given a rolled value, return the standard numeric range."""
-    if rolled <= 10:
-        return "01-10"
-    elif rolled <= 25:
-        return "11-25"
-    elif rolled <= 40:
-        return "26-40"
-    elif rolled <= 60:
-        return "41-60"
-    elif rolled <= 80:
-        return "61-80"
-    elif rolled <= 93:
-        return "81-93"
-    else:
-        return "94-100"
-
-
 def validate_and_fix_rolls(rolls: list, chapter_id: str) -> tuple:
     """Validate and fix roll data. Returns (fixed_rolls, warnings)."""
     fixed = []
@@ -789,6 +749,184 @@ def validate_faction_references(api_data: dict, known_faction_ids: set,
     return warnings
 
 
+# ---------------------------------------------------------------------------
+# Roster selection (prompt pruning)
+# ---------------------------------------------------------------------------
+
+# Extra roster entries allowed beyond the characters listed in the events
+ROSTER_EXTRAS = 3
+
+# Unambiguous mentions (a surface form only that character has) before an
+# unlisted character is offered
+MENTION_MIN = 3
+
+# Factions named in SYSTEM_PROMPT rule 7 — always offered
+CORE_FACTION_IDS = {
+    "royal_court", "castile", "castilian_church", "military_orders",
+    "papacy", "council_of_basel", "granada", "independent",
+}
+
+
+def roster_entry(char: dict) -> dict:
+    """The character fields sent to Haiku in the KNOWN CHARACTERS block."""
+    return {
+        "name": char.get("name", ""),
+        "title": char.get("title", ""),
+        "born": char.get("born", ""),
+        "aliases": char.get("aliases", []),
+        "faction_ids": char.get("faction_ids", []),
+        "category": char.get("category", []),
+    }
+
+
+def faction_entry(faction: dict) -> dict:
+    return {"faction_id": faction["faction_id"],
+            "name": faction.get("name", ""),
+            "type": faction.get("type", "")}
+
+
+def roster_tokens(known_characters: dict, known_factions: list) -> int:
+    """Estimated tokens of the KNOWN CHARACTERS and KNOWN FACTIONS blocks."""
+    lines = format_roster_block(known_characters) + format_factions_block(known_factions)
+    return count_tokens("\n".join(lines))
+
+
+def build_cooccurrence(characters_db: list) -> dict:
+    """Map character ID → Counter of characters sharing events with it."""
+    by_event = {}
+    for c in characters_db:
+        for eid in c.get("event_refs", []):
+            by_event.setdefault(eid, []).append(c["id"])
+
+    cooccurrence = {}
+    for members in by_event.values():
+        for a in members:
+            counts = cooccurrence.setdefault(a, Counter())
+            for b in members:
+                if a != b:
+                    counts[b] += 1
+    return cooccurrence
+
+
+class RosterSelector:
+    """Picks the known characters and factions relevant to one chapter.
+
+    Built once per run: holds the character/faction databases, the alias
+    mention scanner and the character co-occurrence counts.
+    """
+
+    def __init__(self, characters_db: list, factions_db: list,
+                 aliases: dict, alias_index: dict):
+        self.characters_db = characters_db
+        self.factions_db = factions_db
+        self.alias_index = alias_index
+        self.char_lookup = {c["id"]: c for c in characters_db}
+        self.alias_to_char = {}
+        for c in characters_db:
+            for alias in c.get("aliases", []):
+                self.alias_to_char.setdefault(alias, c)
+        self.scanner = MentionScanner(characters_db, aliases)
+        self.cooccurrence = build_cooccurrence(characters_db)
+
+    def canonical(self, raw_id: str) -> str | None:
+        """Resolve an event/alias character ID to a characters.json ID."""
+        if raw_id in self.char_lookup:
+            return raw_id
+        resolved = resolve_id(raw_id, self.alias_index)
+        if resolved in self.char_lookup:
+            return resolved
+        char = self.alias_to_char.get(raw_id)
+        return char["id"] if char else None
+
+    def listed(self, events: list) -> set:
+        """Characters.json IDs of the characters listed in the events."""
+        listed = set()
+        for evt in events:
+            for raw in evt.get("characters", []):
+                cid = self.canonical(raw)
+                if cid:
+                    listed.add(cid)
+        return listed
+
+    def confident_mentions(self, events: list) -> Counter:
+        """Mentions in the exchange text through forms only one character has."""
+        counts = Counter()
+        for evt in events:
+            for ex in evt.get("exchanges", []):
+                for _, form in self.scanner.matches(fold_text(ex.get("text", ""))):
+                    ids = self.scanner.form_to_ids[form]
+                    if len(ids) == 1:
+                        cid = self.canonical(next(iter(ids)))
+                        if cid:
+                            counts[cid] += 1
+        return counts
+
+    def factions_for(self, known_characters: dict, events: list) -> list:
+        """Core factions, those shown on the roster lines and those the events affect."""
+        faction_ids = set(CORE_FACTION_IDS)
+        for entry in known_characters.values():
+            faction_ids.update(entry["faction_ids"][:ROSTER_FACTIONS_SHOWN])
+        for evt in events:
+            faction_ids.update(evt.get("factions_affected") or [])
+        return [faction_entry(f) for f in self.factions_db
+                if f["faction_id"] in faction_ids]
+
+    def select(self, events: list) -> tuple:
+        """Return (known_characters, known_factions, info) for a chapter.
+
+        Characters listed in the events are always included. Up to
+        ROSTER_EXTRAS unlisted characters named unambiguously at least
+        MENTION_MIN times in the exchange text are added, ranked by mentions
+        plus co-occurrence with the listed ones — but only while the roster
+        and factions blocks stay within the unpruned prompt (every listed
+        character and the full faction list), so pruning never grows a prompt.
+        """
+        listed = self.listed(events)
+        unpruned = {cid: roster_entry(self.char_lookup[cid]) for cid in sorted(listed)}
+        unpruned_tokens = roster_tokens(unpruned, [faction_entry(f) for f in self.factions_db])
+
+        mentions = self.confident_mentions(events)
+        co_weight = Counter()
+        for cid in listed:
+            co_weight.update(self.cooccurrence.get(cid, {}))
+        candidates = sorted(((mentions[cid] + co_weight[cid], cid) for cid in mentions
+                             if cid not in listed and mentions[cid] >= MENTION_MIN),
+                            key=lambda c: (-c[0], c[1]))
+
+        known_characters = unpruned
+        known_factions = self.factions_for(known_characters, events)
+        tokens = roster_tokens(known_characters, known_factions)
+        extras = 0
+        for _, cid in candidates[:ROSTER_EXTRAS]:
+            chars = dict(sorted({**known_characters,
+                                 cid: roster_entry(self.char_lookup[cid])}.items()))
+            factions = self.factions_for(chars, events)
+            cost = roster_tokens(chars, factions)
+            if cost > unpruned_tokens:
+                continue
+            known_characters, known_factions, tokens = chars, factions, cost
+            extras += 1
+
+        info = {
+            "listed": len(listed),
+            "mentioned": extras,
+            "characters": len(known_characters),
+            "characters_total": len(self.characters_db),
+            "factions": len(known_factions),
+            "factions_total": len(self.factions_db),
+            "unpruned_tokens": unpruned_tokens,
+            "tokens": tokens,
+        }
+        return known_characters, known_factions, info
+
+
+def load_roster_selector(alias_index: dict) -> RosterSelector:
+    aliases = load_json(ALIASES_FILE) if ALIASES_FILE.exists() else {}
+    characters_db = load_json(DATA_DIR / "characters.json").get("characters", [])
+    factions_db = load_json(DATA_DIR / "factions.json").get("factions", [])
+    return RosterSelector(characters_db, factions_db, aliases, alias_index)
+
+
 # ---------------------------------------------------------------------------
 # Chapter processing
 # ---------------------------------------------------------------------------
@@ -802,37 +940,13 @@ def is_stub_extraction(extraction_path: Path) -> bool:
     return len(updates) == 0
 
 
-def get_known_characters(events: list, characters_db: list) -> dict:
-    """Get enriched known character data for characters appearing in events."""
-    char_ids = set()
-    for evt in events:
-        for cid in evt.get("characters", []):
-            char_ids.add(cid)
-
-    char_lookup = {c["id"]: c for c in characters_db}
-    # Also build alias → character lookup
-    alias_to_char = {}
-    for c in characters_db:
-        for alias in c.get("aliases", []):
-            alias_to_char[alias] = c
-
-    result = {}
-    for cid in sorted(char_ids):
-        char = char_lookup.get(cid) or alias_to_char.get(cid)
-        if char:
-            result[char["id"]] = {
-                "name": char.get("name", ""),
-                "title": char.get("title", ""),
-                "born": char.get("born", ""),
-                "aliases": char.get("aliases", []),
-                "faction_ids": char.get("faction_ids", []),
-                "category": char.get("category", []),
-            }
-    return result
-
-
 def parse_api_response(text: str) -> dict:
-    """Parse JSON from API response, handling markdown fences."""
+    """Parse JSON from API response, handling markdown fences.
+
+    Malformed output (truncated, trailing commas, stray prose) is repaired
+    with json_repair.tolerant_loads; the notes on what was dropped are
+    returned under "_repairs".
+    """
     text = text.strip()
     # Remove markdown code fences
     if text.startswith("```"):
@@ -843,13 +957,11 @@ def parse_api_response(text: str) -> dict:
     try:
         return json.loads(text)
     except json.JSONDecodeError as e:
-        # Try to find JSON in the text
-        match = re.search(r"\{[\s\S]*\}", text)
-        if match:
-            try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
-                pass
+        # Recover what we can instead of paying for another call
+        data, dropped = tolerant_loads(text)
+        if isinstance(data, dict) and data:
+            data["_repairs"] = dropped
+            return data
         return {"error": f"Failed to parse JSON: {e}", "raw": text[:500]}
 
 
@@ -939,11 +1051,18 @@ def merge_extraction_data(existing: dict, api_data: dict) -> dict:
 
 def process_chapter(chapter_id: str, api_key: str, alias_index: dict,
                     known_faction_ids: set, dry_run: bool = False,
-                    force: bool = False) -> dict:
-    """Process a single chapter. Returns stats dict."""
+                    force: bool = False, run: dict | None = None,
+                    roster: RosterSelector | None = None) -> dict:
+    """Process a single chapter. Returns stats dict.
+
+    With a run manifest, the chapter is checkpointed as in_flight before the
+    API call and the raw response is cached by request hash, so a resumed run
+    re-uses it instead of paying for the call again.
+    """
     stats = {"chapter": chapter_id, "status": "skipped", "input_tokens": 0,
              "output_tokens": 0, "cost": 0.0, "review_flags": 0,
-             "validation_warnings": 0}
+             "validation_warnings": 0, "request_hash": None,
+             "output_path": None, "roster_tokens_saved": 0}
 
     chapter_path = EVENTS_DIR / f"chapter_{chapter_id}.json"
     if not chapter_path.exists():
@@ -969,35 +1088,46 @@ def process_chapter(chapter_id: str, api_key: str, alias_index: dict,
         if detect_role_swap(evt.get("exchanges", [])):
             print(f"  {chapter_id}: WARNING — possible role swap detected in event")
 
-    # Load known characters (enriched)
-    characters_db = load_json(DATA_DIR / "characters.json").get("characters", [])
-    known_chars = get_known_characters(events, characters_db)
-
-    # Load known factions
-    factions_db = load_json(DATA_DIR / "factions.json").get("factions", [])
-    known_factions_list = [{"faction_id": f["faction_id"],
-                            "name": f.get("name", ""),
-                            "type": f.get("type", "")} for f in factions_db]
+    # Relevant known characters and factions (pruned roster)
+    if roster is None:
+        roster = load_roster_selector(alias_index)
+    known_chars, known_factions_list, roster_info = roster.select(events)
+    stats["roster_tokens_saved"] = roster_info["unpruned_tokens"] - roster_info["tokens"]
+    print(f"  {chapter_id}: roster {roster_info['characters']}/{roster_info['characters_total']} "
+          f"characters ({roster_info['listed']} listed, {roster_info['mentioned']} mentioned), "
+          f"{roster_info['factions']}/{roster_info['factions_total']} factions — "
+          f"~{roster_info['unpruned_tokens']:,} → ~{roster_info['tokens']:,} tokens")
 
     # Build prompt
     prompt = build_extraction_prompt(chapter_id, events, known_chars,
                                      known_factions_list, alias_index)
-    prompt_tokens = len(prompt) // 4  # Rough estimate
+    prompt_tokens, margin = count_tokens_bounded(SYSTEM_PROMPT + "\n\n" + prompt)
 
     if dry_run:
         stats["status"] = "dry_run"
         stats["input_tokens"] = prompt_tokens
         print(f"  {chapter_id}: DRY RUN — {len(events)} events, "
-              f"~{prompt_tokens:,} input tokens")
+              f"~{prompt_tokens:,}{margin_text(margin)} input tokens")
         return stats
 
     print(f"  {chapter_id}: Processing {len(events)} events "
           f"(~{prompt_tokens:,} tokens)...", end="", flush=True)
 
-    # Call API
-    t0 = time.time()
-    result = call_haiku(api_key, SYSTEM_PROMPT, prompt)
-    elapsed = time.time() - t0
+    req_hash = request_hash(API_MODEL, SYSTEM_PROMPT, prompt)
+    stats["request_hash"] = req_hash
+    cached = cached_response(req_hash) if run else None
+
+    # Call API (or re-use the response paid for by an interrupted run)
+    if cached is not None:
+        print(" [cached response]", end="", flush=True)
+        result = {"text": cached, "usage": {}, "error": None, "cost": 0.0,
+                  "elapsed": 0.0, "retries": 0}
+    else:
+        if run:
+            mark(run, chapter_id, "in_flight", request_hash=req_hash)
+        result = call_haiku(api_key, SYSTEM_PROMPT, prompt, tool=TOOL_NAME,
+                            chapter=chapter_id, timeout=120, backoff_cap=16)
+    elapsed = result["elapsed"]
 
     if result["error"]:
         stats["status"] = "error"
@@ -1007,8 +1137,7 @@ def process_chapter(chapter_id: str, api_key: str, alias_index: dict,
     usage = result.get("usage", {})
     stats["input_tokens"] = usage.get("input_tokens", 0)
     stats["output_tokens"] = usage.get("output_tokens", 0)
-    stats["cost"] = (stats["input_tokens"] * 0.80 / 1_000_000 +
-                     stats["output_tokens"] * 4.00 / 1_000_000)
+    stats["cost"] = result["cost"]
 
     # Parse response
     api_data = parse_api_response(result["text"])
@@ -1018,11 +1147,21 @@ def process_chapter(chapter_id: str, api_key: str, alias_index: dict,
         debug_path = TOOLS_DIR / f"debug_response_{chapter_id}.txt"
         debug_path.write_text(result["text"])
         print(f"    Raw response saved to {debug_path}")
+        # Never resume from a response that cannot be parsed
+        if cached is not None:
+            discard_response(req_hash)
         return stats
+    if run and cached is None:
+        cache_response(req_hash, result["text"])
 
     # --- Post-processing validation ---
     all_warnings = []
 
+    # 0. Partial parse — record what the JSON repair dropped
+    repairs = api_data.pop("_repairs", [])
+    if repairs:
+        all_warnings.extend(f"  JSON repair: {r}" for r in repairs)
+
     # 1. Validate and fix rolls
     if api_data.get("rolls"):
         fixed_rolls, roll_warnings = validate_and_fix_rolls(api_data["rolls"], chapter_id)
@@ -1076,10 +1215,14 @@ def process_chapter(chapter_id: str, api_key: str, alias_index: dict,
         "output_tokens": stats["output_tokens"],
         "cost_usd": stats["cost"],
         "elapsed_seconds": round(elapsed, 1),
+        "retries": result["retries"],
         "validation_warnings": len(all_warnings),
+        "json_repairs": repairs,
+        "roster_tokens_saved": stats["roster_tokens_saved"],
     }
 
     save_json(extraction_path, enriched)
+    stats["output_path"] = extraction_path
 
     # Count results
     n_updates = len(api_data.get("character_updates", []))
@@ -1151,6 +1294,24 @@ def get_all_needing_enrichment() -> list:
     return chapters
 
 
+# ---------------------------------------------------------------------------
+# Run checkpointing
+# ---------------------------------------------------------------------------
+
+def record_run_result(run: dict, chapter_id: str, stats: dict) -> None:
+    """Checkpoint a finished chapter in the run manifest."""
+    status = stats["status"]
+    if status == "success":
+        mark(run, chapter_id, "done", request_hash=stats["request_hash"],
+             output_hash=file_hash(stats["output_path"]))
+    elif status in ("error", "parse_error"):
+        mark(run, chapter_id, "failed", reason=status,
+             request_hash=stats["request_hash"])
+    else:
+        # Nothing to call the API for (already enriched, missing, no events)
+        mark(run, chapter_id, "done", reason=status)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -1170,6 +1331,8 @@ def main():
                         help="Overwrite existing non-stub extractions")
     parser.add_argument("--review-only", action="store_true",
                         help="Only collect review flags")
+    parser.add_argument("--resume", type=str, metavar="RUN_ID",
+                        help="Resume an interrupted run (done chapters are skipped)")
     args = parser.parse_args()
 
     if args.review_only:
@@ -1177,7 +1340,13 @@ def main():
         return
 
     # Determine chapters to process
-    if args.chapter:
+    run = None
+    if args.resume:
+        run = load_run(args.resume, TOOL_NAME)
+        args.force = run["options"].get("force", False)
+        args.dry_run = False
+        chapters = remaining_chapters(run)
+    elif args.chapter:
         chapters = [args.chapter]
     elif args.from_ch and args.to_ch:
         chapters = get_chapter_range(args.from_ch, args.to_ch)
@@ -1203,24 +1372,42 @@ def main():
     alias_index = build_alias_index(aliases, characters_db)
     known_faction_ids = {f["faction_id"] for f in factions_db}
 
+    roster = RosterSelector(characters_db, factions_db, aliases, alias_index)
+
     print(f"  {len(alias_index)} alias mappings, {len(known_faction_ids)} factions, "
           f"{len(characters_db)} characters\n")
 
     # Get API key (skip for dry run)
     api_key = "" if args.dry_run else get_api_key()
 
+    if run:
+        print(f"Resuming run {run['run_id']}\n")
+    elif not args.dry_run:
+        run = new_run(TOOL_NAME, chapters, {"force": args.force})
+        print(f"Run ID: {run['run_id']}\n")
+
     total_stats = {
         "processed": 0, "skipped": 0, "errors": 0,
         "input_tokens": 0, "output_tokens": 0, "cost": 0.0,
-        "review_flags": 0, "validation_warnings": 0,
+        "review_flags": 0, "validation_warnings": 0, "roster_tokens_saved": 0,
     }
     failed_chapters = []       # Track which chapters failed and why
     consecutive_errors = 0     # Abort if API seems persistently down
     MAX_CONSECUTIVE_ERRORS = 3
 
     for ch in chapters:
-        stats = process_chapter(ch, api_key, alias_index, known_faction_ids,
-                                dry_run=args.dry_run, force=args.force)
+        try:
+            stats = process_chapter(ch, api_key, alias_index, known_faction_ids,
+                                    dry_run=args.dry_run, force=args.force, run=run,
+                                    roster=roster)
+        except KeyboardInterrupt:
+            print("\n\n  Interrupted.")
+            if run:
+                print_resume_hint(run, "extract_from_exchanges_v2.py")
+            sys.exit(130)
+
+        if run:
+            record_run_result(run, ch, stats)
 
         if stats["status"] == "success":
             total_stats["processed"] += 1
@@ -1230,7 +1417,7 @@ def main():
             failed_chapters.append({"chapter": ch, "reason": stats["status"]})
             consecutive_errors += 1
             if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
-                remaining = [c for c in chapters if c > ch]
+                remaining = chapters[chapters.index(ch) + 1:]
                 if remaining:
                     print(f"\n  ABORT: {MAX_CONSECUTIVE_ERRORS} consecutive errors — "
                           f"API appears down. Skipping {len(remaining)} remaining "
@@ -1248,6 +1435,7 @@ def main():
         total_stats["cost"] += stats["cost"]
         total_stats["review_flags"] += stats["review_flags"]
         total_stats["validation_warnings"] += stats.get("validation_warnings", 0)
+        total_stats["roster_tokens_saved"] += stats.get("roster_tokens_saved", 0)
 
     # --- Summary ---
     print(f"\n{'='*60}")
@@ -1259,18 +1447,15 @@ def main():
     print(f"  Total cost:    ${total_stats['cost']:.3f}")
     print(f"  Review flags:  {total_stats['review_flags']}")
     print(f"  Validation fixes: {total_stats['validation_warnings']}")
+    print(f"  Roster pruning saved: ~{total_stats['roster_tokens_saved']:,} input tokens vs. the listed-only roster")
 
     # --- Failed chapters report ---
     if failed_chapters:
         print(f"\n  FAILED CHAPTERS ({len(failed_chapters)}):")
         for fc in failed_chapters:
             print(f"    - chapter {fc['chapter']}: {fc['reason']}")
-        print(f"\n  To retry failed chapters, run:")
-        failed_ids = [fc["chapter"] for fc in failed_chapters]
-        if len(failed_ids) == 1:
-            print(f"    python3 tools/extract_from_exchanges_v2.py --chapter {failed_ids[0]}")
-        else:
-            print(f"    python3 tools/extract_from_exchanges_v2.py --from {failed_ids[0]} --to {failed_ids[-1]}")
+        if run:
+            print_resume_hint(run, "extract_from_exchanges_v2.py")
     else:
         print(f"\n  All chapters processed successfully!")
 
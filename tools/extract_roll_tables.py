@@ -2,8 +2,19 @@
 """
 Extract Roll Tables — AI-assisted extraction of d100 roll tables from source material.
 
-Reads chapter source JSON files from resources/source_material/ and sends them
-to Claude Haiku to extract structured roll table data with full outcome ranges.
+Reads chapter source JSON files from resources/source_material/ and extracts
+structured roll table data with full outcome ranges. Tables in the GM's usual
+format are parsed locally first (range_table_parser.py); only the message
+windows the parser cannot read confidently are sent to Claude Haiku, and
+chapters without such windows need no API call at all. Tables the parser
+already read are listed in the window's prompt as already extracted, and an
+LLM table that repeats one anyway is dropped: either its ranges match the
+parsed table's, or it has the same source message and rolled value.
+
+Per-chapter extraction files use the table schema of SYSTEM_PROMPT. Every
+table carries "confidence" and "source": {"message"} (1-based). Parsed tables
+also carry source.roll_message and source.narration_message. merge keeps
+neither field in roll_tables.json.
 
 Book 1 chapters 1-10 used a d6 system with no fixed ranges — these are skipped.
 All other chapters (Book 1 ch 11+, all of Book 2) use d100 tables.
@@ -29,6 +40,12 @@ Usage:
   # Force re-extraction of already-extracted chapters
   python3 tools/extract_roll_tables.py extract --chapter 2.1 --force
 
+  # Send whole chapters to the LLM (skip the local parser)
+  python3 tools/extract_roll_tables.py extract --chapter 2.1 --force --llm-only
+
+  # Resume an interrupted run (run ID is printed at start and on abort)
+  python3 tools/extract_roll_tables.py extract --resume extract_roll_tables_20260301_120000
+
   # Merge all extractions into roll_tables.json
   python3 tools/extract_roll_tables.py merge
 
@@ -37,6 +54,8 @@ Usage:
 
   # Set API key (or use ANTHROPIC_API_KEY env var or .api_key file)
   ANTHROPIC_API_KEY=sk-ant-... python3 tools/extract_roll_tables.py extract --all
+
+Every API call is recorded in tools/logs/llm_usage.jsonl (see llm_client.py).
 """
 
 import json
@@ -45,11 +64,10 @@ import re
 import sys
 import time
 import argparse
+import functools
 from pathlib import Path
 from datetime import datetime
 
-import requests
-
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -63,10 +81,20 @@ ROLL_TABLES_FILE = DATA_DIR / "roll_tables.json"
 ROLL_HISTORY_FILE = DATA_DIR / "roll_history.json"
 OUTPUT_DIR = TOOLS_DIR / "extractions" / "roll_tables"
 
-API_URL = "https://api.anthropic.com/v1/messages"
-API_MODEL = "claude-haiku-4-5-20251001"
-API_VERSION = "2023-06-01"
-MAX_TOKENS = 16384
+# Shared API client (retries, cost, usage ledger)
+sys.path.insert(0, str(TOOLS_DIR))
+from llm_client import API_MODEL, call_haiku
+from json_repair import tolerant_loads
+from token_estimator import count_tokens_bounded, error_bound, margin_text
+from roll_intervals import (IntervalTable, parse_range, export_for_engine,
+                            EXPORT_FILE as INTERVALS_FILE)
+from run_manifest import (request_hash, cache_response, cached_response, discard_response,
+                          file_hash, new_run, load_run, mark, remaining_chapters, print_resume_hint)
+from range_table_parser import parse_chapter
+from corpus_store import open_corpus, corpus_exists, corpus_glob, stored_path
+
+TOOL_NAME = "extract_roll_tables"
+PARSER_MODEL = "range_table_parser"
 
 # Book 1 chapters 1-10 used d6 — no fixed range tables
 D6_LAST_CHAPTER = 10
@@ -76,6 +104,7 @@ D6_LAST_CHAPTER = 10
 # API helpers
 # ---------------------------------------------------------------------------
 
+@functools.cache
 def get_api_key() -> str:
     key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not key:
@@ -98,56 +127,6 @@ def get_api_key() -> str:
     return key
 
 
-def call_haiku(api_key: str, system_prompt: str, user_message: str,
-               max_retries: int = 3) -> dict:
-    """Call Claude Haiku with retry logic."""
-    headers = {
-        "x-api-key": api_key,
-        "anthropic-version": API_VERSION,
-        "content-type": "application/json",
-    }
-    payload = {
-        "model": API_MODEL,
-        "max_tokens": MAX_TOKENS,
-        "system": system_prompt,
-        "messages": [{"role": "user", "content": user_message}],
-    }
-
-    for attempt in range(max_retries):
-        try:
-            resp = requests.post(API_URL, headers=headers, json=payload, timeout=300)
-
-            if resp.status_code == 200:
-                data = resp.json()
-                text = data.get("content", [{}])[0].get("text", "")
-                usage = data.get("usage", {})
-                return {"text": text, "usage": usage, "error": None}
-
-            if resp.status_code == 429:
-                wait = 2 ** (attempt + 1)
-                print(f"    Rate limited, waiting {wait}s...")
-                time.sleep(wait)
-                continue
-
-            if resp.status_code >= 500:
-                wait = 2 ** (attempt + 1)
-                print(f"    Server error {resp.status_code}, waiting {wait}s...")
-                time.sleep(wait)
-                continue
-
-            return {"text": "", "usage": {},
-                    "error": f"HTTP {resp.status_code}: {resp.text[:200]}"}
-
-        except requests.exceptions.Timeout:
-            wait = 2 ** (attempt + 1)
-            print(f"    Timeout, waiting {wait}s...")
-            time.sleep(wait)
-        except requests.exceptions.RequestException as e:
-            return {"text": "", "usage": {}, "error": str(e)}
-
-    return {"text": "", "usage": {}, "error": "Max retries exceeded"}
-
-
 # ---------------------------------------------------------------------------
 # Source file discovery
 # ---------------------------------------------------------------------------
@@ -170,7 +149,7 @@ def find_source_file(chapter_id: str) -> Path | None:
     else:
         return None
 
-    return path if path.exists() else None
+    return path if corpus_exists(path) else None
 
 
 def discover_all_chapters() -> list[str]:
@@ -178,14 +157,14 @@ def discover_all_chapters() -> list[str]:
     chapters = []
 
     if SOURCE_BOOK1.exists():
-        for f in SOURCE_BOOK1.glob("Claude-Chapter *.json"):
+        for f in corpus_glob(SOURCE_BOOK1, "Claude-Chapter *.json"):
             m = re.match(r"Claude-Chapter (\d+)\.json", f.name)
             if m:
                 num = int(m.group(1))
                 chapters.append(f"1.{num}")
 
     if SOURCE_BOOK2.exists():
-        for f in SOURCE_BOOK2.glob("Claude-Chapter 2.*.json"):
+        for f in corpus_glob(SOURCE_BOOK2, "Claude-Chapter 2.*.json"):
             m = re.match(r"Claude-Chapter 2\.(\d+)\.json", f.name)
             if m:
                 num = int(m.group(1))
@@ -215,17 +194,22 @@ def is_d100_chapter(chapter_id: str) -> bool:
 
 def load_source_chapter(path: Path) -> list[dict]:
     """Load a source chapter JSON and return messages."""
-    with open(path, "r", encoding="utf-8") as f:
+    with open_corpus(path) as f:
         data = json.load(f)
     return data.get("messages", [])
 
 
-def format_messages_for_prompt(messages: list[dict], max_chars: int = 500000) -> str:
-    """Format chapter messages into a readable transcript for the AI."""
+def format_messages_for_prompt(messages: list[dict], max_chars: int = 500000,
+                               first: int = 0) -> str:
+    """Format chapter messages into a readable transcript for the AI.
+
+    first: chapter index of messages[0], so excerpts keep the chapter's
+    message numbers.
+    """
     lines = []
     total_chars = 0
 
-    for i, msg in enumerate(messages):
+    for i, msg in enumerate(messages, start=first):
         role = msg.get("role", "Unknown")
         text = msg.get("say", "")
 
@@ -240,7 +224,7 @@ def format_messages_for_prompt(messages: list[dict], max_chars: int = 500000) ->
         entry = f"[Message {i+1} — {role_label}]\n{text}\n"
 
         if total_chars + len(entry) > max_chars:
-            lines.append(f"\n[... TRUNCATED at message {i+1} of {len(messages)} ...]")
+            lines.append(f"\n[... TRUNCATED at message {i+1} of {first + len(messages)} ...]")
             break
 
         lines.append(entry)
@@ -276,6 +260,7 @@ CRITICAL RULES:
 7. If a table is presented but the player hasn't rolled against it yet (or the roll is in a later chapter), set rolled to null
 8. For the summary in each range: capture the key outcome in 1-2 sentences, preserving specific numbers and details
 9. Some rolls may appear WITHOUT a formal table (GM just states a result). Skip these — only extract rolls that have explicit numbered ranges.
+10. "source.message" is the number of the message (from its "[Message N — GM]" header) in which the GM presents the table
 
 RESPOND WITH VALID JSON ONLY. No markdown fences, no commentary outside the JSON object.
 
@@ -294,7 +279,8 @@ Output schema:
         {"range": "1-5", "label": "Short Label", "summary": "1-2 sentence description of this outcome"},
         {"range": "6-15", "label": "...", "summary": "..."}
       ],
-      "confidence": "high|medium|low"
+      "confidence": "high|medium|low",
+      "source": {"message": 12}
     }
   ],
   "notes": "Any observations about edge cases, uncertain extractions, or tables that were hard to parse"
@@ -304,18 +290,33 @@ If the chapter contains NO d100 roll tables with explicit ranges, return:
 {"tables": [], "notes": "No d100 roll tables found in this chapter"}"""
 
 
-def build_user_prompt(chapter_id: str, transcript: str) -> str:
-    """Build the user message for a chapter extraction."""
+def build_user_prompt(chapter_id: str, transcript: str, excerpt: str = "",
+                      known: list | None = None) -> str:
+    """Build the user message for a chapter extraction (excerpt: "messages 12-14").
+
+    known: tables already extracted from these messages, listed so the model
+    skips them.
+    """
+    scope = f"Read the excerpt below ({excerpt} of the chapter)." if excerpt else \
+        "Read the full transcript below."
+    captured = ""
+    if known:
+        lines = [f"- Message {t['source']['message']}: {t['title'] or 'untitled'} "
+                 f"(ranges {', '.join(r['range'] for r in t['ranges'])}"
+                 + (f"; rolled {t['rolled']}" if t["rolled"] is not None else "") + ")"
+                 for t in known]
+        captured = ("\n## Already extracted — do NOT extract these again\n\n"
+                    + "\n".join(lines) + "\n")
     return f"""# Chapter {chapter_id} — Extract all d100 roll tables
 
-Read the full transcript below. Find every d100 roll table (numbered ranges from 1-100) and extract the complete table data.
+{scope} Find every d100 roll table (numbered ranges from 1-100) and extract the complete table data.
 
 Remember:
 - Only extract rolls with EXPLICIT numbered range tables (not rolls where the GM just announces a result)
 - Include every range in each table
 - The rolled value is what the PLAYER reported, not the range
 - Use in-game dates (1430s), not real-world dates
-
+{captured}
 ## Transcript
 
 {transcript}"""
@@ -325,8 +326,12 @@ Remember:
 # Processing
 # ---------------------------------------------------------------------------
 
-def extract_json_from_response(text: str) -> dict | None:
-    """Parse JSON from the API response, handling common formatting issues."""
+def extract_json_from_response(text: str) -> tuple[dict | None, list[str]]:
+    """Parse JSON from the API response, handling common formatting issues.
+
+    Returns (data, repairs). Truncated or malformed output is recovered with
+    json_repair.tolerant_loads; repairs lists what had to be dropped.
+    """
     text = text.strip()
 
     # Remove markdown fences if present
@@ -335,16 +340,12 @@ def extract_json_from_response(text: str) -> dict | None:
         text = re.sub(r"\n?```\s*$", "", text)
 
     try:
-        return json.loads(text)
+        return json.loads(text), []
     except json.JSONDecodeError:
-        # Try to find JSON object in the text
-        match = re.search(r"\{[\s\S]*\}", text)
-        if match:
-            try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
-                pass
-    return None
+        data, repairs = tolerant_loads(text)
+        if isinstance(data, dict) and data:
+            return data, repairs
+    return None, []
 
 
 def validate_table(table: dict) -> list[str]:
@@ -356,47 +357,113 @@ def validate_table(table: dict) -> list[str]:
         if field not in table:
             warnings.append(f"Missing field: {field}")
 
-    # Check ranges cover 1-100
-    ranges = table.get("ranges", [])
-    if not ranges:
-        warnings.append("Empty ranges array")
+    # Check ranges cover 1-100 (gaps, overlaps, endpoints)
+    compiled = IntervalTable.from_ranges(table.get("ranges", []))
+    warnings.extend(compiled.problems())
+
+    # Check rolled value falls in outcome_range and in the table
+    rolled = table.get("rolled")
+    if isinstance(rolled, int):
+        outcome_range = parse_range(table.get("outcome_range", ""))
+        if outcome_range and not (outcome_range[0] <= rolled <= outcome_range[1]):
+            warnings.append(f"Rolled {rolled} not in outcome_range {table['outcome_range']}")
+        if len(compiled) and compiled.outcome_for(rolled) is None:
+            warnings.append(f"Rolled {rolled} not covered by any range")
+
+    return warnings
+
+
+def call_extraction(chapter_id: str, api_key: str, prompt: str,
+                    run: dict | None = None) -> dict:
+    """One Haiku extraction call (or its cached response); returns the parsed result.
+
+    With a run manifest, a raw response that parses is cached by request
+    hash so a resumed run never pays twice for the same prompt.
+    """
+    req_hash = request_hash(API_MODEL, SYSTEM_PROMPT, prompt)
+    cached = cached_response(req_hash) if run else None
+
+    # Call API (or re-use the response paid for by an interrupted run)
+    if cached is not None:
+        print(f"    Using cached response {req_hash}")
+        result = {"text": cached, "usage": {}, "error": None, "cost": 0.0,
+                  "elapsed": 0.0, "retries": 0}
     else:
-        # Parse range strings to check coverage
-        covered = set()
-        for r in ranges:
-            range_str = r.get("range", "")
-            m = re.match(r"(\d+)(?:-(\d+))?", range_str)
-            if m:
-                low = int(m.group(1))
-                high = int(m.group(2)) if m.group(2) else low
-                covered.update(range(low, high + 1))
+        if run:
+            mark(run, chapter_id, "in_flight", request_hash=req_hash)
+        print(f"    Calling Haiku...")
+        result = call_haiku(api_key, SYSTEM_PROMPT, prompt, tool=TOOL_NAME,
+                            chapter=chapter_id, timeout=300)
 
-        if 1 not in covered:
-            warnings.append("Ranges don't start at 1")
-        if 100 not in covered:
-            warnings.append("Ranges don't reach 100")
+    if result["error"]:
+        print(f"    ERROR: {result['error']}")
+        return {"status": "error", "error": result["error"], "request_hash": req_hash}
 
-        missing = set(range(1, 101)) - covered
-        if missing:
-            warnings.append(f"Gaps in ranges: {len(missing)} values uncovered")
+    usage = result["usage"]
+    input_tokens = usage.get("input_tokens", 0)
+    output_tokens = usage.get("output_tokens", 0)
+    print(f"    {result['elapsed']:.1f}s — {input_tokens:,} in / {output_tokens:,} out — "
+          f"${result['cost']:.4f}")
 
-    # Check rolled value falls in outcome_range
-    rolled = table.get("rolled")
-    outcome_range = table.get("outcome_range", "")
-    if rolled is not None and outcome_range:
-        m = re.match(r"(\d+)(?:-(\d+))?", outcome_range)
-        if m:
-            low = int(m.group(1))
-            high = int(m.group(2)) if m.group(2) else low
-            if not (low <= rolled <= high):
-                warnings.append(f"Rolled {rolled} not in outcome_range {outcome_range}")
+    # Parse response
+    parsed, repairs = extract_json_from_response(result["text"])
+    if not parsed:
+        print(f"    ERROR: Failed to parse JSON response")
+        # Save raw response for debugging
+        error_path = OUTPUT_DIR / f"chapter_{chapter_id}_error.txt"
+        error_path.parent.mkdir(parents=True, exist_ok=True)
+        error_path.write_text(result["text"], encoding="utf-8")
+        # Never resume from a response that cannot be parsed
+        if cached is not None:
+            discard_response(req_hash)
+        return {"status": "parse_error", "request_hash": req_hash}
+    if run and cached is None:
+        cache_response(req_hash, result["text"])
+
+    tables = parsed.get("tables", [])
+    if repairs:
+        print(f"    Repaired malformed JSON — kept {len(tables)} table(s):")
+        for r in repairs[:5]:
+            print(f"      {r}")
+    return {"status": "ok", "tables": tables, "notes": parsed.get("notes", ""),
+            "repairs": repairs, "request_hash": req_hash, "cost": result["cost"],
+            "input_tokens": input_tokens, "output_tokens": output_tokens}
+
+
+def tables_in_window(tables: list, lo: int, hi: int) -> list:
+    """Parsed tables presented or rolled in messages lo..hi (0-based, inclusive)."""
+    return [t for t in tables
+            if any(lo + 1 <= (t["source"].get(k) or 0) <= hi + 1
+                   for k in ("message", "roll_message"))]
+
+
+def range_set(table: dict) -> tuple:
+    return tuple(sorted(filter(None, (parse_range(r.get("range")) for r in table.get("ranges") or []))))
 
-    return warnings
+
+def is_duplicate(table: dict, known: list) -> bool:
+    """An LLM table that repeats a parsed one: same ranges, or the same
+    message and rolled value."""
+    ranges = range_set(table)
+    message = (table.get("source") or {}).get("message")
+    for t in known:
+        if ranges and ranges == range_set(t):
+            return True
+        if (message == t["source"]["message"] and table.get("rolled") is not None
+                and table.get("rolled") == t["rolled"]):
+            return True
+    return False
 
 
 def process_chapter(chapter_id: str, api_key: str, dry_run: bool = False,
-                    force: bool = False) -> dict:
-    """Process a single chapter and extract roll tables."""
+                    force: bool = False, run: dict | None = None,
+                    llm_only: bool = False) -> dict:
+    """Process a single chapter and extract roll tables.
+
+    Tables the local parser reads confidently are kept as parsed; each
+    doubtful message window goes to Haiku as a transcript excerpt (the
+    whole chapter with llm_only).
+    """
     output_path = OUTPUT_DIR / f"chapter_{chapter_id}.json"
 
     # Check if already extracted
@@ -410,48 +477,66 @@ def process_chapter(chapter_id: str, api_key: str, dry_run: bool = False,
         print(f"  ERROR {chapter_id} — source file not found")
         return {"status": "error", "tables": 0, "error": "Source not found"}
 
-    # Load and format
+    # Parse locally, then build one prompt per window the parser left over
     messages = load_source_chapter(source_path)
-    transcript = format_messages_for_prompt(messages)
-    prompt = build_user_prompt(chapter_id, transcript)
-
-    file_size_kb = source_path.stat().st_size / 1024
-    est_tokens = len(transcript) // 4
-    print(f"  {chapter_id}: {len(messages)} messages, {file_size_kb:.0f}KB, ~{est_tokens:,} tokens")
+    if llm_only:
+        local = {"tables": [], "doubtful": [], "notes": []}
+        prompts = [(0, len(messages) - 1,
+                    build_user_prompt(chapter_id, format_messages_for_prompt(messages)))]
+    else:
+        local = parse_chapter(messages)
+        prompts = [(lo, hi, build_user_prompt(
+                        chapter_id, format_messages_for_prompt(messages[lo:hi + 1], first=lo),
+                        excerpt=f"messages {lo + 1}-{hi + 1}",
+                        known=tables_in_window(local["tables"], lo, hi)))
+                   for lo, hi in local["doubtful"]]
+
+    file_size_kb = stored_path(source_path)[0].stat().st_size / 1024
+    est_tokens, margin = 0, None if error_bound() is None else 0
+    for _, _, prompt in prompts:
+        tokens, err = count_tokens_bounded(SYSTEM_PROMPT + "\n\n" + prompt)
+        est_tokens += tokens
+        if margin is not None:
+            margin += err
+    print(f"  {chapter_id}: {len(messages)} messages, {file_size_kb:.0f}KB — "
+          f"{len(local['tables'])} table(s) parsed locally, {len(prompts)} LLM call(s), "
+          f"~{est_tokens:,}{margin_text(margin)} tokens")
 
     if dry_run:
-        return {"status": "dry_run", "tables": 0, "est_tokens": est_tokens}
-
-    # Call API
-    print(f"    Calling Haiku...")
-    start = time.time()
-    result = call_haiku(api_key, SYSTEM_PROMPT, prompt)
-    elapsed = time.time() - start
-
-    if result["error"]:
-        print(f"    ERROR: {result['error']}")
-        return {"status": "error", "tables": 0, "error": result["error"]}
-
-    usage = result["usage"]
-    input_tokens = usage.get("input_tokens", 0)
-    output_tokens = usage.get("output_tokens", 0)
-    cost_input = input_tokens * 0.80 / 1_000_000
-    cost_output = output_tokens * 4.00 / 1_000_000
-    cost_total = cost_input + cost_output
-    print(f"    {elapsed:.1f}s — {input_tokens:,} in / {output_tokens:,} out — ${cost_total:.4f}")
+        return {"status": "dry_run", "tables": len(local["tables"]), "est_tokens": est_tokens}
+
+    tables = [(t["source"]["message"], t) for t in local["tables"]]
+    notes = list(local["notes"])
+    repairs, hashes = [], []
+    duplicates = 0
+    usage = {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0}
+    for first, last, prompt in prompts:
+        called = call_extraction(chapter_id, api_key or get_api_key(), prompt, run)
+        hashes.append(called["request_hash"])
+        if called["status"] != "ok":
+            return {"status": called["status"], "tables": 0, "error": called.get("error"),
+                    "request_hash": ",".join(hashes)}
+        usage["input_tokens"] += called["input_tokens"]
+        usage["output_tokens"] += called["output_tokens"]
+        usage["cost_usd"] += called["cost"]
+        known = tables_in_window(local["tables"], first, last)
+        for t in called["tables"]:
+            if is_duplicate(t, known):
+                duplicates += 1
+                continue
+            message = (t.get("source") or {}).get("message")
+            t["source"] = {"message": message if isinstance(message, int) else first + 1}
+            tables.append((t["source"]["message"], t))
+        if called["notes"]:
+            notes.append(called["notes"])
+        repairs.extend(called["repairs"])
 
-    # Parse response
-    parsed = extract_json_from_response(result["text"])
-    if not parsed:
-        print(f"    ERROR: Failed to parse JSON response")
-        # Save raw response for debugging
-        error_path = OUTPUT_DIR / f"chapter_{chapter_id}_error.txt"
-        error_path.parent.mkdir(parents=True, exist_ok=True)
-        error_path.write_text(result["text"], encoding="utf-8")
-        return {"status": "parse_error", "tables": 0}
+    if duplicates:
+        notes.append(f"{duplicates} LLM table(s) dropped as duplicates of parsed tables")
+        print(f"    Dropped {duplicates} LLM table(s) already parsed locally")
 
-    tables = parsed.get("tables", [])
-    notes = parsed.get("notes", "")
+    # Message order (stable: LLM tables of a window keep their own order)
+    tables = [t for _, t in sorted(tables, key=lambda pair: pair[0])]
 
     # Validate tables
     for i, table in enumerate(tables):
@@ -460,24 +545,30 @@ def process_chapter(chapter_id: str, api_key: str, dry_run: bool = False,
             print(f"    Table {i+1} warnings: {'; '.join(warnings)}")
 
     # Save extraction
+    usage["cost_usd"] = round(usage["cost_usd"], 4)
     output = {
         "chapter": chapter_id,
         "book": int(chapter_id.split(".")[0]),
         "extraction_date": datetime.now().isoformat(),
-        "model": API_MODEL,
-        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens,
-                  "cost_usd": round(cost_total, 4)},
+        "model": API_MODEL if prompts else PARSER_MODEL,
+        "usage": usage,
         "table_count": len(tables),
         "tables": tables,
-        "notes": notes,
+        "notes": "; ".join(notes),
     }
+    if not llm_only:
+        output["parser"] = {"tables": len(local["tables"]),
+                            "llm_windows": [[lo + 1, hi + 1] for lo, hi in local["doubtful"]]}
+    if repairs:
+        output["json_repairs"] = repairs
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(output, f, indent=2, ensure_ascii=False)
     print(f"    Saved {len(tables)} table(s) → {output_path.name}")
 
-    return {"status": "ok", "tables": len(tables), "cost": cost_total}
+    return {"status": "ok", "tables": len(tables), "cost": usage["cost_usd"],
+            "request_hash": ",".join(hashes) or "local", "output_path": output_path}
 
 
 # ---------------------------------------------------------------------------
@@ -559,6 +650,12 @@ def cmd_merge(args):
     print(f"\nMerged {len(all_tables)} tables from {total_files} chapters")
     print(f"Written to {ROLL_TABLES_FILE} ({size_kb:.1f}KB)")
 
+    # Keep the game's compiled copy in sync
+    compiled = export_for_engine(all_tables)
+    with open(INTERVALS_FILE, "w", encoding="utf-8") as f:
+        json.dump(compiled, f, indent=2, ensure_ascii=False)
+    print(f"Compiled {len(compiled['tables'])} tables → {INTERVALS_FILE}")
+
 
 # ---------------------------------------------------------------------------
 # Status command
@@ -625,13 +722,33 @@ def resolve_chapter_range(from_ch: str, to_ch: str, available: list[str]) -> lis
     return [ch for ch in available if from_key <= _chapter_sort_key(ch) <= to_key]
 
 
+def record_run_result(run: dict, chapter_id: str, result: dict) -> None:
+    """Checkpoint a finished chapter in the run manifest."""
+    status = result.get("status", "error")
+    if status == "ok":
+        mark(run, chapter_id, "done", request_hash=result["request_hash"],
+             output_hash=file_hash(result["output_path"]))
+    elif status == "skipped":
+        mark(run, chapter_id, "done", reason="already_extracted")
+    else:
+        mark(run, chapter_id, "failed", reason=result.get("error", status),
+             request_hash=result.get("request_hash"))
+
+
 def cmd_extract(args):
     """Extract roll tables from source chapters."""
     all_chapters = discover_all_chapters()
     d100_chapters = [ch for ch in all_chapters if is_d100_chapter(ch)]
 
     # Determine which chapters to process
-    if args.chapter:
+    run = None
+    if args.resume:
+        run = load_run(args.resume, TOOL_NAME)
+        args.force = run["options"].get("force", False)
+        args.llm_only = run["options"].get("llm_only", False)
+        args.dry_run = False
+        targets = remaining_chapters(run)
+    elif args.chapter:
         targets = [args.chapter]
     elif args.from_ch and args.to_ch:
         targets = resolve_chapter_range(args.from_ch, args.to_ch, d100_chapters)
@@ -659,14 +776,31 @@ def cmd_extract(args):
     if args.dry_run:
         print("(DRY RUN — no API calls)\n")
 
-    api_key = "" if args.dry_run else get_api_key()
+    # Asked for on the first LLM call; fully parsed chapters need none
+    api_key = get_api_key() if args.llm_only and not args.dry_run else ""
+
+    if run:
+        print(f"Resuming run {run['run_id']}")
+    elif not args.dry_run:
+        run = new_run(TOOL_NAME, final_targets, {"force": args.force, "llm_only": args.llm_only})
+        print(f"Run ID: {run['run_id']}")
 
     stats = {"ok": 0, "skipped": 0, "error": 0, "total_tables": 0, "total_cost": 0.0}
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     for i, ch in enumerate(final_targets):
         print(f"\n[{i+1}/{len(final_targets)}] Chapter {ch}")
-        result = process_chapter(ch, api_key, dry_run=args.dry_run, force=args.force)
+        try:
+            result = process_chapter(ch, api_key, dry_run=args.dry_run,
+                                     force=args.force, run=run, llm_only=args.llm_only)
+        except KeyboardInterrupt:
+            print("\n\nInterrupted.")
+            if run:
+                print_resume_hint(run, "extract_roll_tables.py extract")
+            sys.exit(130)
+
+        if run:
+            record_run_result(run, ch, result)
 
         status = result.get("status", "error")
         stats[status] = stats.get(status, 0) + 1
@@ -680,6 +814,8 @@ def cmd_extract(args):
     print(f"\n{'='*50}")
     print(f"Done. {stats['ok']} extracted, {stats['skipped']} skipped, {stats.get('error', 0) + stats.get('parse_error', 0)} errors")
     print(f"Total: {stats['total_tables']} tables, ${stats['total_cost']:.2f}")
+    if run:
+        print_resume_hint(run, "extract_roll_tables.py extract")
 
 
 # ---------------------------------------------------------------------------
@@ -698,6 +834,10 @@ def main():
     p_extract.add_argument("--all", action="store_true", help="Process all d100 chapters")
     p_extract.add_argument("--dry-run", action="store_true", help="Show what would be processed")
     p_extract.add_argument("--force", action="store_true", help="Re-extract already-extracted chapters")
+    p_extract.add_argument("--llm-only", action="store_true",
+                           help="Send whole chapters to the LLM (skip the local parser)")
+    p_extract.add_argument("--resume", type=str, metavar="RUN_ID",
+                           help="Resume an interrupted run (done chapters are skipped)")
 
     # Merge command
     p_merge = subparsers.add_parser("merge", help="Merge extractions into roll_tables.json")
@@ -2,30 +2,30 @@
 """
 Comprehensive data quality fix script for History-sim.
 Fixes factions, characters, locations, laws, and cross-references.
+
+The phases are registered fixers (fix_registry.py): they share one in-memory
+copy of the data and everything is saved once at the end.
 """
-import json
 import os
+import sys
 import shutil
-import glob as globmod
 
-DATA_DIR = "resources/data"
-EVENTS_DIR = os.path.join(DATA_DIR, "events")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fix_registry import DataStore, fixer, run_fixers
+from corpus_store import open_corpus, corpus_exists
 
-def load_json(path):
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+DATA_DIR = "resources/data"
 
-def save_json(path, data):
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"  Saved {path}")
+FIXERS = ["fix_factions", "fix_characters", "fix_locations", "fix_laws", "fix_cross_references"]
 
 # ============================================================================
 # PHASE 1: Fix factions.json
 # ============================================================================
-def fix_factions():
+@fixer(group="fix_all_data")
+def fix_factions(store):
+    """Merge duplicate factions, fill descriptions and leaders."""
     print("\n=== PHASE 1: Fixing factions.json ===")
-    data = load_json(os.path.join(DATA_DIR, "factions.json"))
+    data = store.load("factions.json")
     factions_list = data["factions"]
     factions = {f["faction_id"]: f for f in factions_list}
 
@@ -205,16 +205,17 @@ def fix_factions():
 
     data["factions"] = factions_list
     data["meta"]["total_factions"] = len(factions_list)
-    save_json(os.path.join(DATA_DIR, "factions.json"), data)
     print(f"  Total factions: {len(factions_list)}")
 
 
 # ============================================================================
 # PHASE 2: Fix characters.json
 # ============================================================================
-def fix_characters():
+@fixer(group="fix_all_data")
+def fix_characters(store):
+    """Correct character dates, titles, factions and duplicates."""
     print("\n=== PHASE 2: Fixing characters.json ===")
-    data = load_json(os.path.join(DATA_DIR, "characters.json"))
+    data = store.load("characters.json")
     chars = {c["id"]: c for c in data["characters"]}
 
     # 2a. Fix Capranica birth year (1369 -> 1400)
@@ -453,16 +454,17 @@ def fix_characters():
     print(f"  Removed {count_phantom} phantom event references")
 
     data["meta"]["total_characters"] = len(data["characters"])
-    save_json(os.path.join(DATA_DIR, "characters.json"), data)
     print(f"  Total characters: {len(data['characters'])}")
 
 
 # ============================================================================
 # PHASE 3: Fix locations.json
 # ============================================================================
-def fix_locations():
+@fixer(group="fix_all_data")
+def fix_locations(store):
+    """Merge duplicate locations, fill descriptions and regions."""
     print("\n=== PHASE 3: Fixing locations.json ===")
-    data = load_json(os.path.join(DATA_DIR, "locations.json"))
+    data = store.load("locations.json")
     locs = {loc["location_id"]: loc for loc in data["locations"]}
 
     # 3a. Merge granada_city into granada (keep granada as primary)
@@ -641,16 +643,17 @@ def fix_locations():
     print(f"  Filled descriptions/regions for {count_locs} locations")
 
     data["meta"]["total_locations"] = len(data["locations"])
-    save_json(os.path.join(DATA_DIR, "locations.json"), data)
     print(f"  Total locations: {len(data['locations'])}")
 
 
 # ============================================================================
 # PHASE 4: Fix laws.json
 # ============================================================================
-def fix_laws():
+@fixer(group="fix_all_data")
+def fix_laws(store):
+    """Complete law stubs with full text, scope and tags."""
     print("\n=== PHASE 4: Fixing laws.json ===")
-    data = load_json(os.path.join(DATA_DIR, "laws.json"))
+    data = store.load("laws.json")
     laws = {law["law_id"]: law for law in data["laws"]}
 
     law_completions = {
@@ -692,20 +695,22 @@ def fix_laws():
                 laws[lid][key] = val
     print(f"  Completed {len(law_completions)} law stubs")
 
-    save_json(os.path.join(DATA_DIR, "laws.json"), data)
 
 
 # ============================================================================
 # PHASE 5: Fix character <-> event cross-references
 # ============================================================================
-def fix_cross_references():
+@fixer(after=("fix_characters", "add_new_characters", "fix_luis_de_guzman_in_chapter_134",
+               "merge_jean_de_rochetaillee"), group="fix_all_data")
+def fix_cross_references(store):
+    """Sync character event_refs with the chapter event files."""
     print("\n=== PHASE 5: Fixing character <-> event cross-references ===")
 
     # Build event -> characters map from all chapter files
     event_chars = {}
-    chapter_files = sorted(globmod.glob(os.path.join(EVENTS_DIR, "chapter_*.json")))
+    chapter_files = store.chapter_names()
     for cf in chapter_files:
-        chapter_data = load_json(cf)
+        chapter_data = store.load(cf)
         events = chapter_data if isinstance(chapter_data, list) else chapter_data.get("events", [])
         for evt in events:
             eid = evt.get("event_id", "")
@@ -716,7 +721,7 @@ def fix_cross_references():
     print(f"  Loaded {len(event_chars)} events from {len(chapter_files)} chapter files")
 
     # Load characters
-    char_data = load_json(os.path.join(DATA_DIR, "characters.json"))
+    char_data = store.load("characters.json")
     chars = {c["id"]: c for c in char_data["characters"]}
 
     # Build character -> events map from events (source of truth)
@@ -748,8 +753,6 @@ def fix_cross_references():
 
     print(f"  Added {added} missing event refs, removed {removed} invalid refs")
 
-    save_json(os.path.join(DATA_DIR, "characters.json"), char_data)
-
 
 # ============================================================================
 # PHASE 6: Copy roll_tables.json from archive
@@ -758,8 +761,9 @@ def copy_roll_tables():
     print("\n=== PHASE 6: Copying roll_tables.json ===")
     src = "archive/v1_data/roll_tables.json"
     dst = os.path.join(DATA_DIR, "roll_tables.json")
-    if os.path.exists(src) and not os.path.exists(dst):
-        shutil.copy2(src, dst)
+    if corpus_exists(src) and not os.path.exists(dst):
+        with open_corpus(src, "rb") as f_in, open(dst, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
         print(f"  Copied {src} -> {dst}")
     elif os.path.exists(dst):
         print(f"  {dst} already exists, skipping")
@@ -775,11 +779,10 @@ def main():
     print("COMPREHENSIVE DATA QUALITY FIX")
     print("=" * 60)
 
-    fix_factions()
-    fix_characters()
-    fix_locations()
-    fix_laws()
-    fix_cross_references()
+    store, _ = run_fixers(FIXERS, DataStore())
+    print("\n=== Saving ===")
+    for name in store.commit("fix_all_data.py"):
+        print(f"  Saved {name}")
     copy_roll_tables()
 
     print("\n" + "=" * 60)
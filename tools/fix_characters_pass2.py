@@ -9,24 +9,15 @@ Fixes three issues:
 
 Also adds an "independent" faction entry to factions.json for characters
 genuinely unaffiliated with any defined faction.
+
+Registered as the fix_characters_pass2 fixer (fix_registry.py).
 """
 
-import json
 import os
 import sys
 
-DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "resources", "data")
-
-
-def load_json(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fix_registry import DataStore, fixer, run_fixers
 
 
 # ============================================================
@@ -346,13 +337,12 @@ INDEPENDENT_FACTION = {
 }
 
 
-def run():
-    # Load data
-    char_path = os.path.join(DATA_DIR, "characters.json")
-    fac_path = os.path.join(DATA_DIR, "factions.json")
-
-    char_data = load_json(char_path)
-    fac_data = load_json(fac_path)
+@fixer(after=("fix_factions", "fix_characters", "merge_jean_de_rochetaillee"),
+       group="fix_characters_pass2")
+def fix_characters_pass2(store):
+    """Faction assignments, DOB estimation, title backfill, independent faction."""
+    char_data = store.load("characters.json")
+    fac_data = store.load("factions.json")
 
     chars = {c["id"]: c for c in char_data["characters"]}
 
@@ -478,17 +468,19 @@ def run():
                     members.append(cid)
                     print(f"  Added {cid} to {fid}.member_ids")
 
-    # ---- Save ----
-    print("\n=== Saving ===")
-
     # Update meta
     char_data["meta"]["total_characters"] = len(char_data["characters"])
 
-    save_json(char_path, char_data)
-    print(f"  Saved {char_path}")
+    return stats
 
-    save_json(fac_path, fac_data)
-    print(f"  Saved {fac_path}")
+
+def run():
+    store, [(_, stats)] = run_fixers(["fix_characters_pass2"], DataStore())
+
+    # ---- Save ----
+    print("\n=== Saving ===")
+    for name in store.commit("fix_characters_pass2.py"):
+        print(f"  Saved {name}")
 
     # ---- Summary ----
     print("\n=== Summary ===")
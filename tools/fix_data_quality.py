@@ -18,17 +18,24 @@ Fixes applied:
 4. factions.json: Update jean_de_rochetaillee references to cardinal_rochetaillee
 
 5. roll_history.json: Renumber duplicate roll_ids (roll_090-117 Book 2 duplicates)
+
+Each fix is a registered fixer (fix_registry.py); --dry-run prints the
+combined diff instead of saving.
 """
 
-import json
 import os
 import sys
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "data")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fix_registry import DataStore, fixer, run_fixers
+from db_diff import print_summary
 
 
-def fix_faction_member_ids(factions_data):
+@fixer(group="fix_data_quality")
+def fix_faction_member_ids(store):
     """Fix orphaned member_ids in factions.json."""
+    factions_data = store.load("factions.json")
+    print("\n--- Fix 1: Faction member_id mismatches ---")
     replacements = {
         "eugenius_iv": "pope_eugenius_iv",
         "giordano_orsini": "cardinal_orsini",
@@ -58,8 +65,11 @@ def fix_faction_member_ids(factions_data):
     return fixed_count
 
 
-def add_giordano_orsini_alias(characters_data):
+@fixer(group="fix_data_quality")
+def add_giordano_orsini_alias(store):
     """Add 'giordano_orsini' as an alias to cardinal_orsini."""
+    characters_data = store.load("characters.json")
+    print("\n--- Fix 2: Add giordano_orsini alias to cardinal_orsini ---")
     for char in characters_data["characters"]:
         if char["id"] == "cardinal_orsini":
             if "giordano_orsini" not in char.get("aliases", []):
@@ -73,8 +83,11 @@ def add_giordano_orsini_alias(characters_data):
     return 0
 
 
-def merge_jean_de_rochetaillee(characters_data):
+@fixer(after=("add_new_characters",), group="fix_data_quality")
+def merge_jean_de_rochetaillee(store):
     """Merge jean_de_rochetaillee into cardinal_rochetaillee."""
+    characters_data = store.load("characters.json")
+    print("\n--- Fix 3: Merge jean_de_rochetaillee into cardinal_rochetaillee ---")
     cardinal = None
     jean = None
     jean_idx = None
@@ -123,8 +136,11 @@ def merge_jean_de_rochetaillee(characters_data):
     return 1
 
 
-def fix_roll_ids(roll_data):
+@fixer(group="fix_data_quality")
+def fix_roll_ids(store):
     """Renumber duplicate roll_ids in roll_history.json."""
+    roll_data = store.load("roll_history.json")
+    print("\n--- Fix 4: Renumber duplicate roll_ids ---")
     seen_ids = {}
     duplicates = []
 
@@ -167,58 +183,25 @@ def fix_roll_ids(roll_data):
     return fixed_count
 
 
-def load_json(filename):
-    path = os.path.join(DATA_DIR, filename)
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_json(filename, data):
-    path = os.path.join(DATA_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    print(f"  Saved {path}")
-
-
 def main():
     dry_run = "--dry-run" in sys.argv
 
     if dry_run:
         print("=== DRY RUN MODE (no files will be modified) ===\n")
 
-    # Load data
-    print("Loading data files...")
-    factions = load_json("factions.json")
-    characters = load_json("characters.json")
-    roll_history = load_json("roll_history.json")
-
-    # Fix 1: Faction member_ids
-    print("\n--- Fix 1: Faction member_id mismatches ---")
-    f1 = fix_faction_member_ids(factions)
-    print(f"  Total: {f1} references fixed")
-
-    # Fix 2: Add giordano_orsini alias
-    print("\n--- Fix 2: Add giordano_orsini alias to cardinal_orsini ---")
-    f2 = add_giordano_orsini_alias(characters)
-
-    # Fix 3: Merge jean_de_rochetaillee
-    print("\n--- Fix 3: Merge jean_de_rochetaillee into cardinal_rochetaillee ---")
-    f3 = merge_jean_de_rochetaillee(characters)
-
-    # Fix 4: Duplicate roll_ids
-    print("\n--- Fix 4: Renumber duplicate roll_ids ---")
-    f4 = fix_roll_ids(roll_history)
-    print(f"  Total: {f4} roll_ids renumbered")
+    store, results = run_fixers(["fix_faction_member_ids", "add_giordano_orsini_alias",
+                                 "merge_jean_de_rochetaillee", "fix_roll_ids"], DataStore())
+    f1, f2, f3, f4 = (summary for _, summary in results)
 
     # Save
     if not dry_run:
         print("\n--- Saving files ---")
-        save_json("factions.json", factions)
-        save_json("characters.json", characters)
-        save_json("roll_history.json", roll_history)
+        for name in store.commit("fix_data_quality.py"):
+            print(f"  Saved {name}")
         print("\nAll fixes applied successfully.")
     else:
+        print()
+        print_summary(store.diff(), limit=0)
         print("\nDry run complete. No files modified.")
 
     print(f"\nSummary: {f1} faction refs fixed, {f2} aliases added, {f3} characters merged, {f4} rolls renumbered")
@@ -21,6 +21,9 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "resources" / "data"
 
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from roll_intervals import infer_range_from_rolled
+
 NUMERIC_RANGE_RE = re.compile(r"^\d{1,3}-\d{1,3}$")
 
 # Label → standard numeric range mapping
@@ -59,27 +62,6 @@ def save_json(path, data):
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
-def infer_range_from_rolled(rolled):
-    """Given a rolled value, return the standard range it falls in."""
-    if rolled is None:
-        return None
-    v = int(rolled)
-    if v <= 10:
-        return "01-10"
-    elif v <= 25:
-        return "11-25"
-    elif v <= 40:
-        return "26-40"
-    elif v <= 60:
-        return "41-60"
-    elif v <= 80:
-        return "61-80"
-    elif v <= 93:
-        return "81-93"
-    else:
-        return "94-100"
-
-
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--apply", action="store_true")
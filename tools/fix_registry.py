@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Fix Registry — Runs data fixers over one shared in-memory copy of the databases.
+
+Each fix pass (fix_all_data.py, fix_automated.py, fix_characters_pass2.py,
+fix_data_quality.py, apply_review_fixes.py) is a function over a DataStore,
+registered with @fixer:
+
+  @fixer(after=("fix_characters",), group="fix_all_data")
+  def fix_cross_references(store: DataStore) -> dict:
+      chars = store.load("characters.json")
+      for name in store.chapter_names(): ...
+
+DataStore parses each file (resources/data/…) the first time a fixer asks
+for it and hands every later fixer the same object, so a chain of passes
+costs one parse per file. Nothing is written until commit(), which writes
+every changed file to a temp file first and then renames them all into
+place, and appends the combined record changes to the data journal
+(data_journal.py) as one entry. diff() gives the combined changes as a
+db_diff.py result for dry runs.
+
+Fixers run in registration order, except that a fixer always runs after
+the fixers named in its after= that are also selected.
+
+Usage:
+  python3 tools/fix_registry.py --list                      # Registered fixers
+  python3 tools/fix_registry.py                             # Dry run: all fixers, combined diff
+  python3 tools/fix_registry.py --group fix_all_data --apply
+  python3 tools/fix_registry.py fix_rolls fix_event_types --apply
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import argparse
+import importlib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+TOOLS_DIR = PROJECT_ROOT / "tools"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from db_diff import database_of, print_summary
+from data_journal import journal_ops, append_entry
+
+# The fix modules import this module by name; when it runs as a script they
+# must register into this instance, not a second copy
+if __name__ == "__main__":
+    sys.modules.setdefault("fix_registry", sys.modules[__name__])
+
+# Modules whose fixers register on import, in historical run order
+FIX_MODULES = ("fix_all_data", "apply_review_fixes", "fix_data_quality",
+               "fix_characters_pass2", "fix_automated")
+
+# name → {"fn", "after", "group", "doc"}
+FIXERS = {}
+
+
+def fixer(name: str | None = None, after: tuple = (), group: str | None = None):
+    """Register a fix function fn(store) -> summary under name (default: fn name)."""
+    def register(fn):
+        key = name or fn.__name__
+        if key in FIXERS and FIXERS[key]["fn"] is not fn:
+            raise ValueError(f"fixer {key!r} registered twice")
+        FIXERS[key] = {
+            "fn": fn,
+            "after": tuple(after),
+            "group": group or fn.__module__,
+            "doc": (fn.__doc__ or "").strip().split("\n")[0],
+        }
+        return fn
+    return register
+
+
+def load_fixers() -> dict:
+    for module in FIX_MODULES:
+        importlib.import_module(module)
+    return FIXERS
+
+
+def resolve_order(names: list) -> list:
+    """Selected fixers in registration order, moved after their dependencies."""
+    unknown = [n for n in names if n not in FIXERS]
+    if unknown:
+        raise KeyError(f"unknown fixer(s): {', '.join(unknown)}")
+    selected = [n for n in FIXERS if n in set(names)]
+    done, ordered = set(), []
+    while len(ordered) < len(selected):
+        ready = [n for n in selected if n not in done
+                 and all(d in done or d not in selected for d in FIXERS[n]["after"])]
+        if not ready:
+            cycle = [n for n in selected if n not in done]
+            raise ValueError(f"dependency cycle among: {', '.join(cycle)}")
+        done.add(ready[0])
+        ordered.append(ready[0])
+    return ordered
+
+
+# ---------------------------------------------------------------------------
+# Shared data
+# ---------------------------------------------------------------------------
+
+class DataStore:
+    """Lazily loaded data files, keyed by path relative to the data dir."""
+
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self.data = {}
+        self.original = {}
+        self.newline = {}
+
+    def path(self, name: str) -> Path:
+        return self.data_dir / name
+
+    def exists(self, name: str) -> bool:
+        return name in self.data or self.path(name).exists()
+
+    def load(self, name: str):
+        """Parsed file (the same object for every caller until commit)."""
+        if name not in self.data:
+            with open(self.path(name), "r", encoding="utf-8") as f:
+                text = f.read()
+            self.data[name] = json.loads(text)
+            self.original[name] = copy.deepcopy(self.data[name])
+            self.newline[name] = text.endswith("\n")
+        return self.data[name]
+
+    def create(self, name: str, data) -> None:
+        """Add a file that does not exist yet (written on commit)."""
+        self.data[name] = data
+        self.original[name] = None
+        self.newline[name] = False
+
+    def chapter_names(self) -> list:
+        """events/chapter_*.json names, sorted."""
+        return sorted(f"events/{p.name}" for p in (self.data_dir / "events").glob("chapter_*.json"))
+
+    def events(self) -> list:
+        """All events: events.json if it has been built, else the chapter files."""
+        if self.exists("events.json"):
+            return self.load("events.json").get("events", [])
+        return [e for name in self.chapter_names() for e in self.load(name).get("events", [])]
+
+    def changed(self) -> list:
+        return [name for name, data in self.data.items() if data != self.original[name]]
+
+    def render(self, name: str) -> str:
+        text = json.dumps(self.data[name], indent=2, ensure_ascii=False)
+        return text + "\n" if self.newline[name] else text
+
+    # -----------------------------------------------------------------------
+
+    def ops(self) -> list:
+        """Journal ops for every changed database file."""
+        ops = []
+        for name in self.changed():
+            db = database_of(Path(name))
+            if db is not None:
+                ops.extend(journal_ops(db, self.original[name], self.data[name]))
+        return ops
+
+    def diff(self) -> dict:
+        """Combined changes as a db_diff result (plus the changed file names)."""
+        result = {"from": str(self.data_dir), "to": "fixed (in memory)",
+                  "databases": {}, "ops": [], "files": self.changed()}
+        keys = {}
+        for op in self.ops():
+            info = result["databases"].setdefault(
+                op["db"], {"counts": {}, "fields": {}, "duplicate_keys": 0})
+            kind = {"upsert": "added", "remove": "removed"}.get(op["op"], "changed")
+            if kind == "changed":
+                field = op["field"].split(".")[0]
+                info["fields"][field] = info["fields"].get(field, 0) + 1
+                if op["key"] in keys.setdefault(op["db"], set()):
+                    result["ops"].append(op)
+                    continue
+                keys[op["db"]].add(op["key"])
+            info["counts"][kind] = info["counts"].get(kind, 0) + 1
+            result["ops"].append(op)
+        return result
+
+    def commit(self, source: str) -> list:
+        """Write all changed files at once and journal them; returns their names."""
+        names = self.changed()
+        if not names:
+            return []
+        ops = self.ops()
+        tmps = []
+        try:
+            for name in names:
+                tmp = self.path(name).with_suffix(".json.tmp")
+                tmp.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(self.render(name))
+                tmps.append((tmp, self.path(name)))
+        except BaseException:
+            for tmp, _ in tmps:
+                tmp.unlink(missing_ok=True)
+            raise
+        for tmp, path in tmps:
+            os.replace(tmp, path)
+        append_entry(source, ops)
+        for name in names:
+            self.original[name] = copy.deepcopy(self.data[name])
+        return names
+
+
+def run_fixers(names: list, store: DataStore | None = None) -> tuple:
+    """Run the named fixers (dependency order) on one store; nothing is saved.
+
+    Returns (store, [(name, summary), ...]).
+    """
+    store = store or DataStore()
+    results = []
+    for name in resolve_order(names):
+        results.append((name, FIXERS[name]["fn"](store)))
+    return store, results
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Run registered data fixers in one load/save cycle")
+    parser.add_argument("fixers", nargs="*", help="Fixer names (default: all, or --group)")
+    parser.add_argument("--group", action="append", help="All fixers of this group (repeatable)")
+    parser.add_argument("--list", action="store_true", help="List registered fixers")
+    parser.add_argument("--apply", action="store_true", help="Write the changes (default: dry run)")
+    parser.add_argument("--limit", type=int, default=25, help="Ops to list in the dry-run diff")
+    parser.add_argument("--json", action="store_true", help="Print the combined diff as JSON")
+    args = parser.parse_args()
+
+    load_fixers()
+    if args.list:
+        for name in resolve_order(list(FIXERS)):
+            info = FIXERS[name]
+            after = f" (after {', '.join(info['after'])})" if info["after"] else ""
+            print(f"  {info['group']:<22} {name:<36} {info['doc']}{after}")
+        return
+
+    names = list(args.fixers)
+    if args.group:
+        names += [n for n, info in FIXERS.items() if info["group"] in args.group]
+    names = names or list(FIXERS)
+
+    t0 = time.time()
+    try:
+        store, results = run_fixers(names)
+    except (KeyError, ValueError) as e:
+        print(f"ERROR: {e.args[0]}")
+        sys.exit(1)
+    elapsed = time.time() - t0
+
+    diff = store.diff()
+    if args.json:
+        print(json.dumps(diff, indent=2, ensure_ascii=False))
+    else:
+        print(f"\nRan {len(results)} fixer(s) in {elapsed:.2f}s: "
+              f"{len(store.data)} file(s) loaded, {len(diff['files'])} changed\n")
+        print_summary(diff, args.limit)
+
+    if args.apply:
+        written = store.commit("fix_registry.py " + " ".join(n for n, _ in results))
+        print(f"\nWrote {len(written)} file(s): {', '.join(written)}")
+    elif not args.json:
+        print("\nNo files modified. Use --apply to write changes.")
+
+
+if __name__ == "__main__":
+    main()
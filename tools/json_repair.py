@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+JSON Repair — Tolerant single-pass parser for malformed LLM JSON output.
+
+A Haiku response that fails json.loads() is usually *almost* right: wrapped
+in prose or markdown fences, cut off at max_tokens mid-array, or sprinkled
+with trailing commas and unescaped quotes. Re-calling the API for those
+wastes a paid call, so the extractors fall back to tolerant_loads(), which
+walks the text once (linear time) and returns the longest valid structure
+it can recover plus a list describing everything it dropped or repaired.
+
+Handles:
+  - Leading/trailing prose and ``` fences (skipped, reported)
+  - Trailing and doubled commas, missing commas between members
+  - Missing closing braces/brackets (truncated output)
+  - Unclosed strings at end of input (the incomplete member is dropped)
+  - Raw control characters and unescaped interior quotes inside strings
+  - // and /* */ comments, Python literals (True/False/None)
+  - Junk tokens inside containers (skipped up to the next separator)
+  - Nesting deeper than MAX_DEPTH (treated as truncation, not a crash)
+
+Successor to the repair_json_text() strategy in
+archive/v1_tools/chapter_converter.py.
+
+Usage:
+  python3 tools/json_repair.py debug_response_2.25.txt   # Show what is recoverable
+"""
+
+import re
+import sys
+import json
+from pathlib import Path
+
+_WS = " \t\r\n"
+_STRING_CHUNK_RE = re.compile(r'[^"\\]+')
+_NUMBER_RE = re.compile(r"-?(?:\d+)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_LITERALS = {
+    "true": True, "false": False, "null": None,
+    "True": True, "False": False, "None": None,
+}
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f",
+            "n": "\n", "r": "\r", "t": "\t"}
+
+# Containers nested deeper than this end the parse (recursion limit headroom)
+MAX_DEPTH = 200
+
+# Sentinels for "no value here": EOF reached, or a token that isn't JSON
+_MISSING = object()
+_INVALID = object()
+
+
+class _TolerantParser:
+    """Recursive-descent parser that never raises on malformed input.
+
+    Every parse_* method returns (value, complete). complete is False when the
+    input ended inside the value; callers keep truncated containers (pruned
+    recursively) but drop truncated scalars and the member that held them.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.n = len(text)
+        self.pos = 0
+        self.depth = 0
+        self.dropped = []
+
+    # -- lexing helpers -----------------------------------------------------
+
+    def skip_ws(self) -> None:
+        text, n = self.text, self.n
+        while self.pos < n:
+            ch = text[self.pos]
+            if ch in _WS:
+                self.pos += 1
+            elif text.startswith("//", self.pos):
+                end = text.find("\n", self.pos)
+                self.pos = n if end == -1 else end + 1
+            elif text.startswith("/*", self.pos):
+                end = text.find("*/", self.pos + 2)
+                self.pos = n if end == -1 else end + 2
+            else:
+                break
+
+    def skip_junk(self, path: str, stops: str) -> None:
+        """Skip an unparseable token up to the next separator in *stops*."""
+        start = self.pos
+        while self.pos < self.n and self.text[self.pos] not in stops:
+            self.pos += 1
+        snippet = self.text[start:self.pos].strip()[:40]
+        self.dropped.append(f"{path}: skipped unparseable text {snippet!r}")
+
+    def closes_string(self, quote_pos: int) -> bool:
+        """Is the quote at quote_pos the real end of the string?
+
+        A closing quote must be followed by , } ] : or end of input. A quote
+        followed by a newline and another quote is a closing quote with a
+        missing comma. Anything else is an unescaped interior quote.
+        """
+        k = quote_pos + 1
+        saw_newline = False
+        while k < self.n and self.text[k] in _WS:
+            saw_newline = saw_newline or self.text[k] == "\n"
+            k += 1
+        if k >= self.n:
+            return True
+        nxt = self.text[k]
+        return nxt in ",}]:" or (nxt == '"' and saw_newline)
+
+    # -- values -------------------------------------------------------------
+
+    def parse_value(self, path: str):
+        self.skip_ws()
+        if self.pos >= self.n:
+            return _MISSING, False
+        ch = self.text[self.pos]
+        if ch in "{[":
+            if self.depth >= MAX_DEPTH:
+                # Treated as the end of input: the enclosing containers are
+                # kept as truncated
+                self.dropped.append(f"{path}: nesting deeper than {MAX_DEPTH} levels, "
+                                    f"rest of input ({self.n - self.pos} chars) dropped")
+                self.pos = self.n
+                return _MISSING, False
+            self.depth += 1
+            try:
+                return self.parse_object(path) if ch == "{" else self.parse_array(path)
+            finally:
+                self.depth -= 1
+        if ch == '"':
+            return self.parse_string()
+        if ch == "-" or ch.isdigit():
+            return self.parse_number()
+        if ch.isalpha():
+            return self.parse_literal()
+        return _INVALID, True
+
+    def parse_string(self):
+        text, n = self.text, self.n
+        self.pos += 1  # opening quote
+        buf = []
+        while True:
+            m = _STRING_CHUNK_RE.match(text, self.pos)
+            if m:
+                buf.append(m.group())
+                self.pos = m.end()
+            if self.pos >= n:
+                return "".join(buf), False
+            ch = text[self.pos]
+            if ch == "\\":
+                if self.pos + 1 >= n:
+                    self.pos = n
+                    return "".join(buf), False
+                esc = text[self.pos + 1]
+                if esc == "u":
+                    hex_digits = text[self.pos + 2:self.pos + 6]
+                    if len(hex_digits) < 4:
+                        self.pos = n
+                        return "".join(buf), False
+                    try:
+                        buf.append(chr(int(hex_digits, 16)))
+                        self.pos += 6
+                    except ValueError:
+                        buf.append(esc)
+                        self.pos += 2
+                else:
+                    buf.append(_ESCAPES.get(esc, esc))
+                    self.pos += 2
+            else:  # quote
+                if self.closes_string(self.pos):
+                    self.pos += 1
+                    return "".join(buf), True
+                buf.append('"')
+                self.pos += 1
+
+    def parse_number(self):
+        m = _NUMBER_RE.match(self.text, self.pos)
+        if not m:
+            return _INVALID, True
+        self.pos = m.end()
+        raw = m.group()
+        value = float(raw) if any(c in raw for c in ".eE") else int(raw)
+        # A number running into end of input may have been cut off
+        return value, self.pos < self.n
+
+    def parse_literal(self):
+        start = self.pos
+        while self.pos < self.n and self.text[self.pos].isalpha():
+            self.pos += 1
+        word = self.text[start:self.pos]
+        if word in _LITERALS:
+            return _LITERALS[word], True
+        if self.pos >= self.n and any(lit.startswith(word) for lit in _LITERALS):
+            return _MISSING, False
+        self.pos = start
+        return _INVALID, True
+
+    # -- containers ---------------------------------------------------------
+
+    def parse_object(self, path: str):
+        self.pos += 1  # {
+        obj = {}
+        while True:
+            self.skip_ws()
+            if self.pos >= self.n:
+                self.dropped.append(f"{path}: unclosed object (closed after {len(obj)} keys)")
+                return obj, False
+            ch = self.text[self.pos]
+            if ch == "}":
+                self.pos += 1
+                return obj, True
+            if ch == ",":
+                self.pos += 1
+                continue
+            if ch == "]":
+                # Mismatched bracket — treat as the end of this object
+                self.dropped.append(f"{path}: stray ']' closed object")
+                self.pos += 1
+                return obj, True
+            if ch != '"':
+                self.skip_junk(path, ",}")
+                continue
+
+            key, complete = self.parse_string()
+            member_path = f"{path}.{key}"
+            if not complete:
+                self.dropped.append(f"{member_path}: truncated key dropped")
+                return obj, False
+            self.skip_ws()
+            if self.pos < self.n and self.text[self.pos] == ":":
+                self.pos += 1
+            elif self.pos >= self.n:
+                self.dropped.append(f"{member_path}: key without value dropped")
+                return obj, False
+            else:
+                self.dropped.append(f"{member_path}: missing ':' repaired")
+
+            value, complete = self.parse_value(member_path)
+            if value is _MISSING:
+                self.dropped.append(f"{member_path}: key without value dropped")
+                return obj, False
+            if value is _INVALID:
+                self.skip_junk(member_path, ",}")
+                continue
+            if not complete:
+                if isinstance(value, (dict, list)) and value:
+                    obj[key] = value
+                else:
+                    self.dropped.append(f"{member_path}: truncated value dropped")
+                return obj, False
+            obj[key] = value
+
+    def parse_array(self, path: str):
+        self.pos += 1  # [
+        arr = []
+        while True:
+            self.skip_ws()
+            if self.pos >= self.n:
+                self.dropped.append(f"{path}: unclosed array (closed after {len(arr)} items)")
+                return arr, False
+            ch = self.text[self.pos]
+            if ch == "]":
+                self.pos += 1
+                return arr, True
+            if ch == ",":
+                self.pos += 1
+                continue
+            if ch == "}":
+                self.dropped.append(f"{path}: stray '}}' closed array")
+                self.pos += 1
+                return arr, True
+
+            item_path = f"{path}[{len(arr)}]"
+            value, complete = self.parse_value(item_path)
+            if value is _MISSING:
+                return arr, False
+            if value is _INVALID:
+                self.skip_junk(item_path, ",]")
+                continue
+            if not complete:
+                if isinstance(value, (dict, list)) and value:
+                    arr.append(value)
+                    self.dropped.append(f"{item_path}: truncated item kept partially")
+                else:
+                    self.dropped.append(f"{item_path}: truncated item dropped")
+                return arr, False
+            arr.append(value)
+
+    # -- entry point --------------------------------------------------------
+
+    def parse(self):
+        starts = [i for i in (self.text.find("{"), self.text.find("[")) if i != -1]
+        if not starts:
+            self.dropped.append("no JSON object or array found")
+            return None
+        self.pos = min(starts)
+        leading = self.text[:self.pos].strip()
+        if leading and not re.fullmatch(r"```(?:json)?", leading):
+            self.dropped.append(f"$: ignored leading text ({len(leading)} chars)")
+
+        value, _ = self.parse_value("$")
+
+        trailing = self.text[self.pos:].strip()
+        if trailing and trailing != "```":
+            self.dropped.append(f"$: ignored trailing text ({len(trailing)} chars)")
+        return value
+
+
+def tolerant_loads(text: str) -> tuple:
+    """Parse *text* as JSON, repairing what can be repaired.
+
+    Returns (data, dropped): data is the longest valid dict/list recoverable
+    (None if the text contains no JSON structure at all), dropped is a list
+    of human-readable notes on everything skipped or repaired. Well-formed
+    JSON returns (json.loads(text), []).
+    """
+    try:
+        return json.loads(text), []
+    except (json.JSONDecodeError, RecursionError):
+        pass
+    parser = _TolerantParser(text)
+    data = parser.parse()
+    return data, parser.dropped
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    text = Path(sys.argv[1]).read_text(encoding="utf-8")
+    data, dropped = tolerant_loads(text)
+    if isinstance(data, dict):
+        print("Recovered keys: " + ", ".join(
+            f"{k} ({len(v)})" if isinstance(v, list) else k for k, v in data.items()))
+    elif isinstance(data, list):
+        print(f"Recovered array of {len(data)} items")
+    else:
+        print("Nothing recoverable")
+    for note in dropped:
+        print(f"  - {note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Law Linker — Ranked law → event linkage with date windows and BM25.
+
+Finds, for each law in laws.json, the event that enacted it (origin) and the
+events that concern it (related), with scores and the reasons behind them.
+Built once over the event corpus:
+
+  - Date index: events sorted by calendar day; bisect gives every event
+    within ±N real days of a date (no full scans).
+  - Character postings: character ID → events, for enacted_by/proposed_by.
+  - BM25 index over event summaries, types, tags and locations. The law's
+    title, summary and the most distinctive terms of its full_text form the
+    weighted query.
+
+Origin candidates are events within ORIGIN_WINDOW_DAYS of date_enacted plus
+the enacting/proposing characters' events within CHARACTER_WINDOW_DAYS.
+Related events are the best BM25 matches across the whole corpus (laws are
+cited for years after enactment).
+
+Used by fix_automated.py (fix_laws) to fill origin_event_id and
+related_events.
+
+Usage:
+  python3 tools/law_linker.py law_012             # Ranked candidates for one law
+  python3 tools/law_linker.py --all               # Best origin for every law + timing
+  python3 tools/law_linker.py law_012 --json      # Machine-readable
+"""
+
+import sys
+import json
+import math
+import time
+import bisect
+import argparse
+from pathlib import Path
+from datetime import date
+from collections import Counter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+TOOLS_DIR = PROJECT_ROOT / "tools"
+EVENTS_DIR = DATA_DIR / "events"
+EVENTS_FILE = DATA_DIR / "events.json"
+LAWS_FILE = DATA_DIR / "laws.json"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from character_mentions import fold_text
+
+# Date windows (calendar days either side of date_enacted)
+ORIGIN_WINDOW_DAYS = 7
+CHARACTER_WINDOW_DAYS = 30
+
+# Origin score components (same scale as the old fix_laws scorer)
+DATE_MATCH_SCORE = 50          # same day; decays linearly to 0 at the window edge
+ENACTED_BY_SCORE = 20
+PROPOSED_BY_SCORE = 15
+TAG_SCORE = 5
+TYPE_SCORE = 10
+TEXT_SCORE = 30                # best BM25 hit among candidates gets the full amount
+ORIGIN_MIN_SCORE = 30
+
+LEGAL_EVENT_TYPES = {"legal", "decision", "council", "diplomacy", "ceremony"}
+
+# Related events: BM25 score relative to the law's best match
+RELATED_MIN_RATIO = 0.35
+RELATED_LIMIT = 25
+
+# Query construction
+TITLE_WEIGHT = 3.0
+SUMMARY_WEIGHT = 2.0
+FULL_TEXT_TERMS = 40           # most distinctive full_text terms added to the query
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOP_WORDS = {
+    "the", "and", "for", "that", "with", "from", "this", "shall", "must", "will",
+    "are", "was", "were", "his", "her", "its", "their", "who", "which", "all",
+    "any", "not", "but", "has", "have", "had", "been", "into", "upon", "such",
+    "our", "who", "whom", "por", "del", "los", "las", "con", "que", "una",
+    "year", "lord", "being", "other", "each", "these", "those", "them", "they",
+}
+
+
+def tokenize(text: str) -> list:
+    return [t for t in fold_text(text).split()
+            if len(t) >= 3 and t not in STOP_WORDS and not t.isdigit()]
+
+
+def day_number(iso_date: str) -> int | None:
+    """Calendar day ordinal for YYYY-MM-DD (a 00 month/day counts as the 1st)."""
+    try:
+        y, m, d = (int(p) for p in iso_date[:10].split("-"))
+        return date(y, max(m, 1), max(d, 1)).toordinal()
+    except (ValueError, AttributeError):
+        return None
+
+
+def load_events() -> list:
+    """All events: events.json if it has been built, else the chapter files."""
+    if EVENTS_FILE.exists():
+        with open(EVENTS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("events", [])
+    events = []
+    for path in sorted(EVENTS_DIR.glob("chapter_*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            events.extend(json.load(f).get("events", []))
+    return events
+
+
+class LawLinker:
+    """Indexes an event corpus once; link() ranks candidates for one law."""
+
+    def __init__(self, events: list):
+        self.events = events
+
+        # Date index
+        dated = sorted((d, i) for i, e in enumerate(events)
+                       if (d := day_number(e.get("date", ""))) is not None)
+        self.days = [d for d, _ in dated]
+        self.day_order = [i for _, i in dated]
+
+        # Character postings
+        self.by_char = {}
+        for i, e in enumerate(events):
+            for cid in e.get("characters", []):
+                self.by_char.setdefault(cid, []).append(i)
+
+        # BM25 postings
+        self.postings = {}
+        self.doc_len = []
+        for i, e in enumerate(events):
+            terms = tokenize(" ".join([e.get("summary", ""), e.get("type", ""),
+                                       e.get("location", "") or "",
+                                       " ".join(e.get("tags", []))]))
+            self.doc_len.append(len(terms))
+            for term, tf in Counter(terms).items():
+                self.postings.setdefault(term, []).append((i, tf))
+        n = len(events)
+        self.avg_len = (sum(self.doc_len) / n) if n else 1.0
+        self.idf = {t: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5))
+                    for t, p in self.postings.items()}
+
+    # -- indexes ------------------------------------------------------------
+
+    def window(self, day: int, days: int) -> list:
+        """Event indices dated within ±days of day."""
+        lo = bisect.bisect_left(self.days, day - days)
+        hi = bisect.bisect_right(self.days, day + days)
+        return self.day_order[lo:hi]
+
+    def query_terms(self, law: dict) -> dict:
+        """Weighted query: title and summary terms, plus full_text's rarest."""
+        weights = Counter()
+        for t in tokenize(law.get("title", "")):
+            weights[t] += TITLE_WEIGHT
+        for t in tokenize(law.get("summary", "")):
+            weights[t] += SUMMARY_WEIGHT
+        body = Counter(tokenize(law.get("full_text", "")))
+        ranked = sorted((t for t in body if t in self.idf),
+                        key=lambda t: body[t] * self.idf[t], reverse=True)
+        for t in ranked[:FULL_TEXT_TERMS]:
+            weights[t] += 1.0
+        return {t: w for t, w in weights.items() if t in self.postings}
+
+    def bm25(self, query: dict) -> Counter:
+        """BM25 score for every event sharing a term with the query."""
+        scores = Counter()
+        for term, qw in query.items():
+            idf = self.idf[term]
+            for i, tf in self.postings[term]:
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[i] / self.avg_len)
+                scores[i] += qw * idf * tf * (BM25_K1 + 1) / norm
+        return scores
+
+    # -- linking ------------------------------------------------------------
+
+    def link(self, law: dict) -> dict:
+        """Rank origin and related-event candidates for a law.
+
+        Returns {"origin": [{event_id, score, date, reasons}], "related":
+        [{event_id, score}]}, both best first.
+        """
+        text_scores = self.bm25(self.query_terms(law))
+        enacted_by = law.get("enacted_by", "")
+        proposed_by = law.get("proposed_by", "")
+        law_tags = set(law.get("tags", []))
+        law_day = day_number(law.get("date_enacted", ""))
+
+        candidates = set()
+        if law_day is not None:
+            candidates.update(self.window(law_day, ORIGIN_WINDOW_DAYS))
+            near = set(self.window(law_day, CHARACTER_WINDOW_DAYS))
+            for cid in (enacted_by, proposed_by):
+                candidates.update(i for i in self.by_char.get(cid, []) if i in near)
+        elif enacted_by:
+            # Undated law: fall back to the enactor's best-matching events
+            candidates.update(sorted(self.by_char.get(enacted_by, []),
+                                     key=lambda i: text_scores[i], reverse=True)[:20])
+
+        best_text = max((text_scores[i] for i in candidates), default=0.0) or 1.0
+        origin = []
+        for i in candidates:
+            evt = self.events[i]
+            score = 0.0
+            reasons = []
+            evt_day = day_number(evt.get("date", ""))
+            if law_day is not None and evt_day is not None:
+                gap = abs(evt_day - law_day)
+                if gap <= ORIGIN_WINDOW_DAYS:
+                    score += DATE_MATCH_SCORE * (1 - gap / (ORIGIN_WINDOW_DAYS + 1))
+                    reasons.append(f"{gap}d")
+            chars = evt.get("characters", [])
+            if enacted_by and enacted_by in chars:
+                score += ENACTED_BY_SCORE
+                reasons.append("enacted_by")
+            if proposed_by and proposed_by != enacted_by and proposed_by in chars:
+                score += PROPOSED_BY_SCORE
+                reasons.append("proposed_by")
+            shared_tags = law_tags & set(evt.get("tags", []))
+            if shared_tags:
+                score += TAG_SCORE * len(shared_tags)
+                reasons.append("tags")
+            if evt.get("type") in LEGAL_EVENT_TYPES:
+                score += TYPE_SCORE
+                reasons.append(evt["type"])
+            if text_scores[i]:
+                score += TEXT_SCORE * text_scores[i] / best_text
+                reasons.append(f"text={text_scores[i]:.1f}")
+            origin.append({"event_id": evt["event_id"], "score": round(score, 1),
+                           "date": evt.get("date", ""), "reasons": reasons})
+        origin.sort(key=lambda c: c["score"], reverse=True)
+
+        related = []
+        if text_scores:
+            top = text_scores.most_common(1)[0][1]
+            for i, s in text_scores.most_common(RELATED_LIMIT):
+                if s < RELATED_MIN_RATIO * top:
+                    break
+                related.append({"event_id": self.events[i]["event_id"], "score": round(s, 2)})
+
+        return {"origin": origin, "related": related}
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank law → event links")
+    parser.add_argument("law_id", nargs="?", help="Law to show (e.g. law_012)")
+    parser.add_argument("--all", action="store_true", help="Best origin for every law")
+    parser.add_argument("--top", type=int, default=5, help="Candidates to show")
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+    args = parser.parse_args()
+
+    if not args.law_id and not args.all:
+        parser.print_help()
+        return
+
+    t0 = time.time()
+    linker = LawLinker(load_events())
+    with open(LAWS_FILE, "r", encoding="utf-8") as f:
+        laws = json.load(f).get("laws", [])
+    t_index = time.time() - t0
+
+    if args.all:
+        t0 = time.time()
+        results = {law["law_id"]: linker.link(law) for law in laws}
+        t_link = time.time() - t0
+        if args.json:
+            print(json.dumps(results, indent=2))
+            return
+        for law in laws:
+            res = results[law["law_id"]]
+            best = res["origin"][0] if res["origin"] else None
+            current = law.get("origin_event_id", "")
+            if best:
+                mark = "=" if best["event_id"] == current else "≠"
+                print(f"  {law['law_id']:<9} {best['event_id']:<16} {best['score']:>6.1f} "
+                      f"{mark} {current or '-':<16} {law.get('title', '')[:45]}")
+            else:
+                print(f"  {law['law_id']:<9} {'(none)':<16} {'':>6} "
+                      f"  {current or '-':<16} {law.get('title', '')[:45]}")
+        print(f"\n  Indexed {len(linker.events)} events in {t_index * 1000:.0f} ms; "
+              f"linked {len(laws)} laws in {t_link * 1000:.0f} ms "
+              f"({t_link * 1000 / max(len(laws), 1):.1f} ms/law)")
+        return
+
+    law = next((l for l in laws if l["law_id"] == args.law_id), None)
+    if not law:
+        print(f"ERROR: {args.law_id} not in laws.json")
+        sys.exit(1)
+    res = linker.link(law)
+    if args.json:
+        print(json.dumps(res, indent=2))
+        return
+    print(f"{law['law_id']}: {law.get('title', '')} ({law.get('date_enacted', '?')})")
+    print(f"  Origin candidates (current: {law.get('origin_event_id') or '-'}):")
+    for c in res["origin"][:args.top]:
+        print(f"    {c['event_id']:<16} {c['score']:>6.1f}  {c['date']}  {', '.join(c['reasons'])}")
+    print(f"  Related events ({len(res['related'])}):")
+    for c in res["related"][:args.top]:
+        print(f"    {c['event_id']:<16} {c['score']:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
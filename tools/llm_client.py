@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+LLM Client — Shared Anthropic API wrapper with an append-only usage ledger.
+
+Every tool that calls the Messages API goes through call_haiku() here instead
+of rolling its own requests/retry loop. Each call (success or failure) appends
+exactly one row to tools/logs/llm_usage.jsonl:
+
+  {"ts": "...", "tool": "extract_from_exchanges_v2", "chapter": "2.25",
+   "model": "claude-haiku-4-5-20251001", "input_tokens": 41234,
+   "output_tokens": 5120, "cache_creation_input_tokens": 0,
+   "cache_read_input_tokens": 0, "latency_s": 38.2, "attempts": 1,
+   "retries": 0, "timeouts": 0, "http_status": 200, "error": null,
+   "cost_usd": 0.06683}
+
+Prices live in MODEL_PRICES (USD per million tokens) so every tool reports
+the same cost for the same usage. Use tools/llm_usage_report.py to analyze
+the ledger.
+
+Successful calls also log a token-count sample for the prompt and the
+response (tools/logs/token_samples.jsonl), which token_estimator.py fits
+its weights against.
+
+This module is imported by the extraction tools; it has no CLI of its own.
+"""
+
+import json
+import time
+from pathlib import Path
+from datetime import datetime
+
+from token_estimator import append_sample
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+LEDGER_FILE = TOOLS_DIR / "logs" / "llm_usage.jsonl"
+
+API_URL = "https://api.anthropic.com/v1/messages"
+API_MODEL = "claude-haiku-4-5-20251001"
+API_VERSION = "2023-06-01"
+MAX_TOKENS = 16384
+
+# USD per million tokens: (input, output, cache write, cache read)
+MODEL_PRICES = {
+    "claude-haiku-4-5-20251001": (1.00, 5.00, 1.25, 0.10),
+    "claude-3-5-haiku-20241022": (0.80, 4.00, 1.00, 0.08),
+    "claude-sonnet-4-20250514": (3.00, 15.00, 3.75, 0.30),
+}
+
+# ---------------------------------------------------------------------------
+# Cost
+# ---------------------------------------------------------------------------
+
+def compute_cost(model: str, usage: dict) -> float:
+    """Return the USD cost of one API response's usage block.
+
+    Unknown models are priced as Haiku 4.5 so the ledger never records
+    a silent zero.
+    """
+    price_in, price_out, price_cw, price_cr = MODEL_PRICES.get(
+        model, MODEL_PRICES[API_MODEL])
+    return (usage.get("input_tokens", 0) * price_in
+            + usage.get("output_tokens", 0) * price_out
+            + usage.get("cache_creation_input_tokens", 0) * price_cw
+            + usage.get("cache_read_input_tokens", 0) * price_cr) / 1_000_000
+
+
+# ---------------------------------------------------------------------------
+# Ledger
+# ---------------------------------------------------------------------------
+
+def append_ledger(row: dict, path: Path = LEDGER_FILE) -> None:
+    """Append one row to the JSONL ledger (one line, flushed immediately)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def read_ledger(path: Path = LEDGER_FILE) -> list:
+    """Read all ledger rows. Malformed lines (e.g. a torn last write) are skipped."""
+    if not path.exists():
+        return []
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+def call_haiku(api_key: str, system_prompt: str, user_message: str,
+               tool: str, chapter: str = "", model: str = API_MODEL,
+               max_tokens: int = MAX_TOKENS, max_retries: int = 3,
+               timeout: int = 120, backoff_cap: int | None = None) -> dict:
+    """Call the Messages API with retry logic and record the call in the ledger.
+
+    Returns {"text", "usage", "error", "cost", "elapsed", "retries"}. The first
+    three keys match what the per-tool call_haiku() functions used to return.
+    Backoff is 2, 4, 8... seconds, optionally capped at backoff_cap.
+    """
+    import requests
+
+    headers = {
+        "x-api-key": api_key,
+        "anthropic-version": API_VERSION,
+        "content-type": "application/json",
+    }
+    payload = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": user_message}],
+    }
+
+    def backoff(attempt):
+        wait = 2 ** (attempt + 1)
+        return min(wait, backoff_cap) if backoff_cap else wait
+
+    text = ""
+    usage = {}
+    error = "Max retries exceeded"
+    http_status = None
+    timeouts = 0
+    attempts = 0
+    t0 = time.time()
+
+    for attempt in range(max_retries):
+        attempts = attempt + 1
+        try:
+            resp = requests.post(API_URL, headers=headers, json=payload, timeout=timeout)
+            http_status = resp.status_code
+
+            if resp.status_code == 200:
+                data = resp.json()
+                text = data.get("content", [{}])[0].get("text", "")
+                usage = data.get("usage", {})
+                error = None
+                break
+
+            if resp.status_code == 429:
+                wait = backoff(attempt)
+                print(f"    Rate limited (attempt {attempts}/{max_retries}), waiting {wait}s...")
+                time.sleep(wait)
+                continue
+
+            if resp.status_code >= 500:
+                wait = backoff(attempt)
+                print(f"    Server error {resp.status_code} (attempt {attempts}/{max_retries}), "
+                      f"waiting {wait}s...")
+                time.sleep(wait)
+                continue
+
+            error = f"HTTP {resp.status_code}: {resp.text[:200]}"
+            break
+
+        except requests.exceptions.Timeout:
+            timeouts += 1
+            wait = backoff(attempt)
+            print(f"    Timeout (attempt {attempts}/{max_retries}), waiting {wait}s...")
+            time.sleep(wait)
+        except requests.exceptions.RequestException as e:
+            error = str(e)
+            break
+
+    elapsed = time.time() - t0
+    cost = compute_cost(model, usage)
+
+    if error is None:
+        append_sample("input", model, system_prompt + "\n\n" + user_message,
+                      usage.get("input_tokens", 0))
+        append_sample("output", model, text, usage.get("output_tokens", 0))
+
+    append_ledger({
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "tool": tool,
+        "chapter": chapter,
+        "model": model,
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
+        "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
+        "latency_s": round(elapsed, 2),
+        "attempts": attempts,
+        "retries": max(0, attempts - 1),
+        "timeouts": timeouts,
+        "http_status": http_status,
+        "error": error,
+        "cost_usd": round(cost, 6),
+    })
+
+    return {"text": text, "usage": usage, "error": error, "cost": cost,
+            "elapsed": elapsed, "retries": max(0, attempts - 1)}
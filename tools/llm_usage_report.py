@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+LLM Usage Report — Cost and latency analytics over the API usage ledger.
+
+Reads tools/logs/llm_usage.jsonl (written by llm_client.call_haiku) and
+summarizes where extraction time and money go.
+
+Commands:
+  summary   — Per tool/model: calls, tokens, cost, p50/p95 latency,
+              retry/timeout/error rates (default)
+  chapters  — Cost, tokens and latency per chapter
+  timeline  — Calls, cost, latency and retry/timeout rates per day (or week)
+
+Usage:
+  python3 tools/llm_usage_report.py
+  python3 tools/llm_usage_report.py summary --tool extract_roll_tables
+  python3 tools/llm_usage_report.py chapters --since 2026-03-01
+  python3 tools/llm_usage_report.py timeline --bucket week
+  python3 tools/llm_usage_report.py chapters --json
+"""
+
+import sys
+import json
+import math
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from llm_client import LEDGER_FILE, read_ledger
+
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list (0.0 for empty input)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def aggregate(rows: list) -> dict:
+    """Summarize a group of ledger rows."""
+    latencies = [r.get("latency_s", 0.0) for r in rows]
+    calls = len(rows)
+    retried = sum(1 for r in rows if r.get("retries", 0) > 0)
+    timed_out = sum(1 for r in rows if r.get("timeouts", 0) > 0)
+    errors = sum(1 for r in rows if r.get("error"))
+    return {
+        "calls": calls,
+        "input_tokens": sum(r.get("input_tokens", 0) for r in rows),
+        "output_tokens": sum(r.get("output_tokens", 0) for r in rows),
+        "cache_tokens": sum(r.get("cache_creation_input_tokens", 0)
+                            + r.get("cache_read_input_tokens", 0) for r in rows),
+        "cost_usd": round(sum(r.get("cost_usd", 0.0) for r in rows), 4),
+        "latency_p50": round(percentile(latencies, 50), 1),
+        "latency_p95": round(percentile(latencies, 95), 1),
+        "latency_total": round(sum(latencies), 1),
+        "retry_rate": round(retried / calls, 3) if calls else 0.0,
+        "timeout_rate": round(timed_out / calls, 3) if calls else 0.0,
+        "error_rate": round(errors / calls, 3) if calls else 0.0,
+    }
+
+
+def group_by(rows: list, key_fn) -> dict:
+    groups = {}
+    for r in rows:
+        groups.setdefault(key_fn(r), []).append(r)
+    return groups
+
+
+def _chapter_sort_key(ch: str):
+    try:
+        book, num = ch.split(".")
+        return (int(book), int(num))
+    except ValueError:
+        return (999, 999)
+
+
+def _bucket(ts: str, bucket: str) -> str:
+    if bucket == "week":
+        year, week, _ = datetime.fromisoformat(ts).isocalendar()
+        return f"{year}-W{week:02d}"
+    return ts[:10]
+
+
+def filter_rows(rows: list, tool: str | None, since: str | None) -> list:
+    if tool:
+        rows = [r for r in rows if r.get("tool") == tool]
+    if since:
+        rows = [r for r in rows if r.get("ts", "") >= since]
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+def cmd_summary(rows: list, as_json: bool) -> None:
+    groups = group_by(rows, lambda r: (r.get("tool", "?"), r.get("model", "?")))
+    report = [{"tool": t, "model": m, **aggregate(g)}
+              for (t, m), g in sorted(groups.items())]
+    total = aggregate(rows)
+
+    if as_json:
+        print(json.dumps({"groups": report, "total": total}, indent=2))
+        return
+
+    print(f"{'tool':<28} {'model':<28} {'calls':>6} {'in tok':>11} {'out tok':>9} "
+          f"{'cost':>9} {'p50 s':>7} {'p95 s':>7} {'retry':>6} {'tmout':>6} {'err':>6}")
+    for g in report + [{"tool": "TOTAL", "model": "", **total}]:
+        print(f"{g['tool']:<28} {g['model']:<28} {g['calls']:>6} "
+              f"{g['input_tokens']:>11,} {g['output_tokens']:>9,} "
+              f"${g['cost_usd']:>8.3f} {g['latency_p50']:>7.1f} {g['latency_p95']:>7.1f} "
+              f"{g['retry_rate']:>6.1%} {g['timeout_rate']:>6.1%} {g['error_rate']:>6.1%}")
+
+
+def cmd_chapters(rows: list, as_json: bool) -> None:
+    groups = group_by(rows, lambda r: r.get("chapter") or "?")
+    report = [{"chapter": ch, **aggregate(groups[ch])}
+              for ch in sorted(groups, key=_chapter_sort_key)]
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'chapter':<8} {'calls':>6} {'in tok':>11} {'out tok':>9} {'cost':>9} "
+          f"{'time s':>8} {'p95 s':>7} {'err':>6}")
+    for g in report:
+        print(f"{g['chapter']:<8} {g['calls']:>6} {g['input_tokens']:>11,} "
+              f"{g['output_tokens']:>9,} ${g['cost_usd']:>8.3f} {g['latency_total']:>8.1f} "
+              f"{g['latency_p95']:>7.1f} {g['error_rate']:>6.1%}")
+
+
+def cmd_timeline(rows: list, bucket: str, as_json: bool) -> None:
+    groups = group_by(rows, lambda r: _bucket(r.get("ts", "0000-00-00"), bucket))
+    report = [{"period": p, **aggregate(groups[p])} for p in sorted(groups)]
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'period':<11} {'calls':>6} {'cost':>9} {'p50 s':>7} {'p95 s':>7} "
+          f"{'retry':>6} {'tmout':>6} {'err':>6}")
+    for g in report:
+        print(f"{g['period']:<11} {g['calls']:>6} ${g['cost_usd']:>8.3f} "
+              f"{g['latency_p50']:>7.1f} {g['latency_p95']:>7.1f} "
+              f"{g['retry_rate']:>6.1%} {g['timeout_rate']:>6.1%} {g['error_rate']:>6.1%}")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze the LLM usage ledger")
+    parser.add_argument("command", nargs="?", default="summary",
+                        choices=["summary", "chapters", "timeline"])
+    parser.add_argument("--ledger", type=Path, default=LEDGER_FILE,
+                        help=f"Ledger path (default: {LEDGER_FILE.relative_to(PROJECT_ROOT)})")
+    parser.add_argument("--tool", type=str, help="Only rows from this tool")
+    parser.add_argument("--since", type=str, help="Only rows on/after this date (YYYY-MM-DD)")
+    parser.add_argument("--bucket", choices=["day", "week"], default="day",
+                        help="Timeline bucket size")
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+    args = parser.parse_args()
+
+    rows = filter_rows(read_ledger(args.ledger), args.tool, args.since)
+    if not rows:
+        print(f"No ledger rows found in {args.ledger}")
+        return
+
+    if args.command == "summary":
+        cmd_summary(rows, args.json)
+    elif args.command == "chapters":
+        cmd_chapters(rows, args.json)
+    elif args.command == "timeline":
+        cmd_timeline(rows, args.bucket, args.json)
+
+
+if __name__ == "__main__":
+    main()
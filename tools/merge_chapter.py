@@ -9,13 +9,15 @@ roll_history.json, factions.json, and laws.json.
 Operations:
   1. Load current database state + build_state.json
   2. Read extraction JSON for the specified chapter
-  3. Assign event IDs (evt_{year}_{seq}) using global sequence counter
+  3. Assign event IDs (evt_{year}_{seq}) from a block reserved on the global
+     sequence counter (event_sequence.py, locked)
   4. Create/update characters (alias resolution via known_aliases.json)
   5. Create/update locations (add event_refs)
   6. Create/update factions (add members, event_refs)
   7. Append rolls with sequential IDs
   8. Update laws (link events, add effectiveness modifiers)
-  9. Save all databases + update build_state.json
+  9. Save all databases (record changes appended to the data journal,
+     data_journal.py) + update build_state.json
 
 Usage:
   python3 tools/merge_chapter.py 1.01              # Merge single chapter
@@ -52,6 +54,11 @@ LAWS_FILE = DATA_DIR / "laws.json"
 BUILD_STATE_FILE = TOOLS_DIR / "build_state.json"
 ALIASES_FILE = TOOLS_DIR / "known_aliases.json"
 
+sys.path.insert(0, str(TOOLS_DIR))
+from event_sequence import (EVENT_COUNTER, ROLL_COUNTER, peek, reserve, event_year,
+                            make_event_id, save_build_state)
+from data_journal import journaled_save_all
+
 
 # ---------------------------------------------------------------------------
 # Database Loading / Saving
@@ -86,8 +93,8 @@ def load_all_databases() -> dict:
     }
 
 
-def save_all_databases(db: dict) -> None:
-    """Save all 6 databases + build state."""
+def save_all_databases(db: dict, source: str = "merge_chapter.py") -> None:
+    """Save all 6 databases + build state, journaling record changes."""
     # Update meta counts before saving
     db["events"].setdefault("meta", {})["total_events"] = len(db["events"].get("events", []))
     db["characters"].setdefault("meta", {})["total_characters"] = len(db["characters"].get("characters", []))
@@ -95,13 +102,17 @@ def save_all_databases(db: dict) -> None:
     db["roll_history"].setdefault("meta", {})["total_rolls"] = len(db["roll_history"].get("rolls", []))
     db["factions"].setdefault("meta", {})["total_factions"] = len(db["factions"].get("factions", []))
 
-    save_json(EVENTS_FILE, db["events"])
-    save_json(CHARACTERS_FILE, db["characters"])
-    save_json(LOCATIONS_FILE, db["locations"])
-    save_json(ROLL_HISTORY_FILE, db["roll_history"])
-    save_json(FACTIONS_FILE, db["factions"])
-    save_json(LAWS_FILE, db["laws"])
-    save_json(BUILD_STATE_FILE, db["build_state"])
+    # One journal entry for the whole merge
+    journaled_save_all([
+        (EVENTS_FILE, db["events"]),
+        (CHARACTERS_FILE, db["characters"]),
+        (LOCATIONS_FILE, db["locations"]),
+        (ROLL_HISTORY_FILE, db["roll_history"]),
+        (FACTIONS_FILE, db["factions"]),
+        (LAWS_FILE, db["laws"]),
+    ], source, save_json)
+    # Locked merge: never rolls back counters advanced by a concurrent run
+    save_build_state(db["build_state"])
 
 
 # ---------------------------------------------------------------------------
@@ -140,11 +151,6 @@ def resolve_character_id(raw_id: str, alias_index: dict) -> str:
 # Event Merging
 # ---------------------------------------------------------------------------
 
-def make_event_id(year: int, seq: int) -> str:
-    """Generate event ID: evt_{year}_{5digit}."""
-    return f"evt_{year}_{seq:05d}"
-
-
 def lookup_existing_event_ids(db: dict, extraction: dict) -> dict:
     """Build event_id_map from already-existing events in events.json.
 
@@ -178,31 +184,41 @@ def lookup_existing_event_ids(db: dict, extraction: dict) -> dict:
     return id_map
 
 
-def merge_events(db: dict, extraction: dict) -> dict:
+def reserve_block(db: dict, count: int, chapter_id: str, counter: str, dry_run: bool) -> range:
+    """Sequence numbers for a chapter's events or rolls.
+
+    Reserved from the shared counter (keyed merge:{chapter}, so a retried
+    merge gets the same IDs but never assign-ids' block); a dry run only peeks.
+    """
+    build_state = db["build_state"]
+    if dry_run:
+        start = max(build_state.get(counter, 1), peek(counter))
+        block = range(start, start + count)
+    else:
+        block = reserve(count, key=f"merge:{chapter_id}", counter=counter)
+    build_state[counter] = max(build_state.get(counter, 1), block.stop)
+    return block
+
+
+def merge_events(db: dict, extraction: dict, dry_run: bool = False) -> dict:
     """Merge extracted events into the events database.
 
     Returns a mapping of extraction event indices to assigned event IDs.
     """
     events_db = db["events"]
     events_db.setdefault("events", [])
-    build_state = db["build_state"]
 
     chapter_id = extraction["chapter"]
     book = extraction.get("book", int(chapter_id.split(".")[0]))
     alias_index = build_alias_index(db["aliases"], db["characters"].get("characters", []))
 
-    seq = build_state.get("next_event_seq", 1)
+    new_events = extraction.get("events", [])
+    block = reserve_block(db, len(new_events), chapter_id, EVENT_COUNTER, dry_run)
     id_map = {}  # index → event_id
 
-    for i, evt in enumerate(extraction.get("events", [])):
-        # Extract year from date
+    for i, (evt, seq) in enumerate(zip(new_events, block)):
         date_str = evt.get("date", "")
-        try:
-            year = int(date_str[:4]) if date_str and len(date_str) >= 4 else 1430
-        except ValueError:
-            year = 1430
-
-        event_id = make_event_id(year, seq)
+        event_id = make_event_id(event_year(date_str), seq)
         id_map[i] = event_id
 
         # Resolve character IDs through alias index
@@ -233,9 +249,6 @@ def merge_events(db: dict, extraction: dict) -> dict:
         }
 
         events_db["events"].append(event_entry)
-        seq += 1
-
-    build_state["next_event_seq"] = seq
 
     # Update date range in meta
     if events_db["events"]:
@@ -509,17 +522,17 @@ def merge_locations(db: dict, extraction: dict, event_id_map: dict) -> None:
 # Roll Merging
 # ---------------------------------------------------------------------------
 
-def merge_rolls(db: dict, extraction: dict, event_id_map: dict) -> None:
+def merge_rolls(db: dict, extraction: dict, event_id_map: dict, dry_run: bool = False) -> None:
     """Merge roll data into roll_history.json."""
     rolls_db = db["roll_history"]
     rolls_db.setdefault("rolls", [])
-    build_state = db["build_state"]
 
-    roll_seq = build_state.get("next_roll_seq", 1)
     chapter_id = extraction["chapter"]
     book = extraction.get("book", int(chapter_id.split(".")[0]))
+    new_rolls = extraction.get("rolls", [])
+    block = reserve_block(db, len(new_rolls), chapter_id, ROLL_COUNTER, dry_run)
 
-    for roll in extraction.get("rolls", []):
+    for roll, roll_seq in zip(new_rolls, block):
         roll_id = f"roll_{roll_seq:03d}"
 
         # Resolve event_id reference
@@ -547,9 +560,6 @@ def merge_rolls(db: dict, extraction: dict, event_id_map: dict) -> None:
         }
 
         rolls_db["rolls"].append(roll_entry)
-        roll_seq += 1
-
-    build_state["next_roll_seq"] = roll_seq
 
 
 # ---------------------------------------------------------------------------
@@ -732,12 +742,12 @@ def merge_chapter(chapter_id: str, dry_run: bool = False,
             print(f"  WARNING: No existing events found for chapter {chapter_id} "
                   f"in events.json. Enrichment will proceed without event linkage.")
     else:
-        event_id_map = merge_events(db, extraction)
+        event_id_map = merge_events(db, extraction, dry_run=dry_run)
 
     # Merge enrichment data
     merge_characters(db, extraction, event_id_map)
     merge_locations(db, extraction, event_id_map)
-    merge_rolls(db, extraction, event_id_map)
+    merge_rolls(db, extraction, event_id_map, dry_run=dry_run)
     merge_factions(db, extraction, event_id_map)
     merge_laws(db, extraction, event_id_map)
 
@@ -763,7 +773,7 @@ def merge_chapter(chapter_id: str, dry_run: bool = False,
     db["build_state"].setdefault("chapters_processed", {})[chapter_id] = stats
 
     if not dry_run:
-        save_all_databases(db)
+        save_all_databases(db, f"merge_chapter.py {chapter_id}")
 
     return stats
 
@@ -958,7 +968,7 @@ def main():
         print(f"\nEnriching characters from event data...")
         try:
             from enrich_characters import run_enrichment
-            enrichment_stats = run_enrichment()
+            enrichment_stats = run_enrichment(source="merge_chapter.py enrichment")
             enriched_fields = [f"{v} {k}" for k, v in enrichment_stats.items() if v > 0]
             if enriched_fields:
                 print(f"  Updated: {', '.join(enriched_fields)}")
@@ -30,6 +30,9 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "resources" / "data"
 EXTRACTIONS_DIR = PROJECT_ROOT / "tools" / "extractions"
 
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from data_journal import journaled_save_all
+
 
 def load_json(path):
     with open(path, encoding="utf-8") as f:
@@ -456,11 +459,13 @@ def main():
 
     if args.apply:
         print("\nWriting databases...")
-        save_json(DATA_DIR / "characters.json", characters_db)
-        save_json(DATA_DIR / "locations.json", locations_db)
-        save_json(DATA_DIR / "roll_history.json", rolls_db)
-        save_json(DATA_DIR / "factions.json", factions_db)
-        save_json(DATA_DIR / "laws.json", laws_db)
+        journaled_save_all([
+            (DATA_DIR / "characters.json", characters_db),
+            (DATA_DIR / "locations.json", locations_db),
+            (DATA_DIR / "roll_history.json", rolls_db),
+            (DATA_DIR / "factions.json", factions_db),
+            (DATA_DIR / "laws.json", laws_db),
+        ], "merge_extractions.py", save_json)
         print("\nDone! All databases updated.")
     else:
         print("\nDry run complete. Use --apply to write changes.")
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Message Search — Ranked full-text search over preprocessed chapter messages.
+
+Finds where something happened ("the Malaga ambush") across every chapter in
+tools/preprocessed/, for planning the msgs: [start, end] boundaries in
+tools/event_defs/. Hits are (chapter, message index, role, snippet), best
+match first (BM25).
+
+The index is a SQLite FTS5 table in tools/preprocessed/search_index.sqlite
+(unicode61 tokenizer with diacritics folded, so "malaga" finds "Málaga").
+Before every search the preprocessed files are stat'ed and any chapter that
+is new or whose file changed since it was indexed is re-indexed; chapters
+whose file disappeared are dropped. Running preprocess_chapter.py and then
+searching is all it takes to keep the index current.
+
+Query syntax: plain words must all appear (any order); "quoted phrases"
+match exactly; a trailing * matches a prefix (ambush*). --raw passes the
+query to FTS5 unchanged (OR, NEAR(), column filters).
+
+Usage:
+  python3 tools/message_search.py malaga ambush
+  python3 tools/message_search.py '"hamza bey"' --role gm --chapters 2.20-2.30
+  python3 tools/message_search.py 'cortes NEAR(toledo, 10)' --raw --limit 50
+  python3 tools/message_search.py --status           # Index inventory
+  python3 tools/message_search.py --rebuild          # Drop and rebuild the index
+"""
+
+import re
+import sys
+import json
+import time
+import sqlite3
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PREPROCESSED_DIR = PROJECT_ROOT / "tools" / "preprocessed"
+INDEX_FILE = PREPROCESSED_DIR / "search_index.sqlite"
+
+SNIPPET_TOKENS = 16
+DEFAULT_LIMIT = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chapters (
+    chapter   TEXT PRIMARY KEY,
+    sort_key  INTEGER NOT NULL,
+    mtime_ns  INTEGER NOT NULL,
+    size      INTEGER NOT NULL,
+    messages  INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages USING fts5(
+    text,
+    chapter UNINDEXED,
+    sort_key UNINDEXED,
+    msg_index UNINDEXED,
+    role UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def chapter_sort_key(chapter_id: str) -> int:
+    """1.07 → 1007, 2.31 → 2031 (orders and range-filters chapters)."""
+    book, _, num = chapter_id.partition(".")
+    return int(book) * 1000 + int(num)
+
+
+def chapter_of(path: Path) -> str:
+    return path.name[len("chapter_"):-len("_preprocessed.json")]
+
+
+# ---------------------------------------------------------------------------
+# Index maintenance
+# ---------------------------------------------------------------------------
+
+def open_index(rebuild: bool = False) -> sqlite3.Connection:
+    if rebuild and INDEX_FILE.exists():
+        INDEX_FILE.unlink()
+    conn = sqlite3.connect(INDEX_FILE)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def refresh_index(conn: sqlite3.Connection) -> dict:
+    """Re-index new/changed chapter files and drop deleted ones.
+
+    Returns {"added": [...], "updated": [...], "removed": [...]}.
+    """
+    indexed = {row[0]: (row[1], row[2]) for row in
+               conn.execute("SELECT chapter, mtime_ns, size FROM chapters")}
+    on_disk = {}
+    for path in PREPROCESSED_DIR.glob("chapter_*_preprocessed.json"):
+        st = path.stat()
+        on_disk[chapter_of(path)] = (path, st.st_mtime_ns, st.st_size)
+
+    changes = {"added": [], "updated": [], "removed": sorted(set(indexed) - set(on_disk))}
+    with conn:
+        for chapter in changes["removed"]:
+            conn.execute("DELETE FROM messages WHERE chapter = ?", (chapter,))
+            conn.execute("DELETE FROM chapters WHERE chapter = ?", (chapter,))
+
+        for chapter, (path, mtime_ns, size) in sorted(on_disk.items()):
+            if indexed.get(chapter) == (mtime_ns, size):
+                continue
+            changes["updated" if chapter in indexed else "added"].append(chapter)
+            with open(path, "r", encoding="utf-8") as f:
+                messages = json.load(f).get("messages", [])
+            key = chapter_sort_key(chapter)
+            conn.execute("DELETE FROM messages WHERE chapter = ?", (chapter,))
+            conn.executemany(
+                "INSERT INTO messages (text, chapter, sort_key, msg_index, role) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(m.get("text", ""), chapter, key, int(m["index"]), m.get("role", ""))
+                 for m in messages])
+            conn.execute("INSERT OR REPLACE INTO chapters VALUES (?, ?, ?, ?, ?)",
+                         (chapter, key, mtime_ns, size, len(messages)))
+    return changes
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+def build_match(query: str) -> str:
+    """Plain query → FTS5 expression: phrases kept, words quoted, * kept."""
+    parts = []
+    for phrase, word in re.findall(r'"([^"]+)"|(\S+)', query):
+        if phrase:
+            parts.append('"' + phrase.replace('"', "") + '"')
+            continue
+        prefix = word.endswith("*")
+        for token in re.findall(r"\w+", word):
+            parts.append(f'"{token}"')
+        if prefix and parts:
+            parts[-1] += "*"
+    return " ".join(parts)
+
+
+def parse_chapter_range(spec: str) -> tuple:
+    """"1.20-1.30" → (1020, 1030); "2.05" → (2005, 2005); "2" → whole book."""
+    lo, _, hi = spec.partition("-")
+    hi = hi or lo
+
+    def bound(c: str, upper: bool) -> int:
+        if "." in c:
+            return chapter_sort_key(c)
+        return int(c) * 1000 + (999 if upper else 0)
+
+    return bound(lo, False), bound(hi, True)
+
+
+def search(conn: sqlite3.Connection, match: str, role: str | None = None,
+           chapters: tuple | None = None, limit: int = DEFAULT_LIMIT) -> list:
+    """Best-first hits: [{chapter, index, role, snippet, score}]."""
+    sql = ("SELECT chapter, msg_index, role, "
+           f"snippet(messages, 0, '[', ']', '…', {SNIPPET_TOKENS}), bm25(messages) "
+           "FROM messages WHERE messages MATCH ?")
+    params = [match]
+    if role:
+        sql += " AND role = ?"
+        params.append(role)
+    if chapters:
+        sql += " AND sort_key BETWEEN ? AND ?"
+        params.extend(chapters)
+    sql += " ORDER BY bm25(messages) LIMIT ?"
+    params.append(limit)
+    return [{"chapter": ch, "index": idx, "role": r,
+             "snippet": " ".join(snip.split()), "score": round(-score, 2)}
+            for ch, idx, r, snip, score in conn.execute(sql, params)]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def print_status(conn: sqlite3.Connection) -> None:
+    rows = conn.execute("SELECT chapter, messages FROM chapters ORDER BY sort_key").fetchall()
+    total = sum(n for _, n in rows)
+    size = INDEX_FILE.stat().st_size if INDEX_FILE.exists() else 0
+    print(f"Index: {INDEX_FILE.relative_to(PROJECT_ROOT)} ({size / 1e6:.1f} MB)")
+    print(f"  {len(rows)} chapters, {total:,} messages")
+    if rows:
+        print(f"  {rows[0][0]} … {rows[-1][0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search preprocessed chapter messages")
+    parser.add_argument("query", nargs="*", help="Words, \"phrases\" or prefix*")
+    parser.add_argument("--role", choices=["player", "gm"], help="Only this speaker")
+    parser.add_argument("--chapters", help="Chapter or range: 1.23, 1.20-1.30, 2")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    parser.add_argument("--raw", action="store_true", help="Pass query to FTS5 as-is")
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+    parser.add_argument("--status", action="store_true", help="Show index inventory")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from scratch")
+    args = parser.parse_args()
+
+    t0 = time.time()
+    conn = open_index(rebuild=args.rebuild)
+    changes = refresh_index(conn)
+    t_refresh = time.time() - t0
+    reindexed = len(changes["added"]) + len(changes["updated"])
+    if (reindexed or changes["removed"]) and not args.json:
+        print(f"Indexed {reindexed} chapter(s), removed {len(changes['removed'])} "
+              f"in {t_refresh:.1f}s", file=sys.stderr)
+
+    if args.status or not args.query:
+        print_status(conn)
+        return
+
+    query = " ".join(args.query)
+    match = query if args.raw else build_match(query)
+    try:
+        chapters = parse_chapter_range(args.chapters) if args.chapters else None
+    except ValueError:
+        print(f"ERROR: bad --chapters value: {args.chapters}")
+        sys.exit(1)
+
+    t0 = time.time()
+    try:
+        hits = search(conn, match, args.role, chapters, args.limit)
+    except sqlite3.OperationalError as e:
+        print(f"ERROR: bad query {match!r}: {e}")
+        sys.exit(1)
+    elapsed = time.time() - t0
+
+    if args.json:
+        print(json.dumps(hits, indent=2, ensure_ascii=False))
+        return
+    for h in hits:
+        print(f"  {h['chapter']:>5} [{h['index']:3d}] {h['role']:6s} {h['snippet']}")
+    print(f"\n{len(hits)} hit(s) for {match} in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
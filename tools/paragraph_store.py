@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Paragraph Store — Content-addressed paragraphs and cached paragraph classifications.
+
+The raw exports repeat whole paragraphs — "Tool: Searching project",
+"Thought process" headers, web-search dumps, GM recaps pasted into several
+messages — and the strippers (preprocess_chapter.py, strip_gm_thinking.py)
+classify every paragraph they meet, several times per run. Both
+classifiers look at one paragraph at a time and only at its stripped text, so
+a classification is a pure function of the paragraph's content and can be
+kept by content hash:
+
+  paragraph_key(text)   blake2b-128 digest of the stripped paragraph
+  classify(fn, text)    fn(stripped) computed once per distinct paragraph, ever
+
+Classifications are stored per classifier id — module.function plus a hash of
+the source of the module that defines it — so editing a classifier, or any
+helper, word list or regex it reads from its module, starts a fresh cache
+rather than serving stale answers.
+
+Messages can be stored as the list of their paragraph hashes (plus the blank
+line runs between them when those are not the usual single blank line), so a
+repeated block is stored once however many messages contain it; message()
+reassembles the exact text.
+
+Everything lives in tools/preprocessed/paragraphs.sqlite. New paragraphs and
+classifications are held in memory until flush().
+
+Usage:
+  python3 tools/paragraph_store.py                 # Store statistics and label counts
+  python3 tools/paragraph_store.py --clear         # Drop the store
+"""
+
+import re
+import sys
+import json
+import inspect
+import hashlib
+import sqlite3
+import argparse
+from pathlib import Path
+from collections import Counter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STORE_FILE = PROJECT_ROOT / "tools" / "preprocessed" / "paragraphs.sqlite"
+
+PARAGRAPH_SPLIT_RE = re.compile(r"(\n\n+)")
+DEFAULT_SEPARATOR = "\n\n"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS paragraphs (
+    hash   BLOB PRIMARY KEY,
+    text   TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS labels (
+    classifier  TEXT NOT NULL,
+    hash        BLOB NOT NULL,
+    value       TEXT NOT NULL,
+    PRIMARY KEY (classifier, hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS messages (
+    source      TEXT NOT NULL,
+    msg_index   INTEGER NOT NULL,
+    paragraphs  BLOB NOT NULL,
+    separators  TEXT,
+    PRIMARY KEY (source, msg_index)
+) WITHOUT ROWID;
+"""
+
+
+HASH_SIZE = 16
+
+
+def paragraph_key(text: str) -> bytes:
+    return hashlib.blake2b(text.strip().encode("utf-8"), digest_size=HASH_SIZE).digest()
+
+
+def classifier_id(fn) -> str:
+    """module.function:hash-of-module-source — changes whenever the function,
+    or anything else in its module it may depend on, does."""
+    try:
+        source = inspect.getsource(inspect.getmodule(fn))
+    except (OSError, TypeError):
+        try:
+            source = inspect.getsource(fn)
+        except (OSError, TypeError):
+            source = fn.__qualname__
+    digest = hashlib.blake2b(source.encode("utf-8"), digest_size=6).hexdigest()
+    return f"{fn.__module__}.{fn.__qualname__}:{digest}"
+
+
+def unpack_hashes(blob: bytes) -> list:
+    return [blob[i:i + HASH_SIZE] for i in range(0, len(blob), HASH_SIZE)]
+
+
+def split_paragraphs(text: str) -> tuple:
+    """(paragraphs, separators) such that they interleave back into text exactly."""
+    parts = PARAGRAPH_SPLIT_RE.split(text)
+    return parts[0::2], parts[1::2]
+
+
+class ParagraphStore:
+    """Paragraph texts, classifications and messages keyed by content hash."""
+
+    def __init__(self, path: Path | None = STORE_FILE):
+        self.path = path
+        self.conn = None
+        self.labels = {}          # classifier id → {hash: value}
+        self.new_labels = {}      # classifier id → {hash: value} not yet flushed
+        self.new_paragraphs = {}
+        self.new_messages = {}
+        self.known = None         # paragraph hashes already in the database
+        self.ids = {}
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def _db(self) -> sqlite3.Connection | None:
+        if self.conn is None and self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.path)
+            self.conn.executescript(SCHEMA)
+        return self.conn
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # -----------------------------------------------------------------------
+    # Classification cache
+    # -----------------------------------------------------------------------
+
+    def _table(self, fn) -> tuple:
+        cid = self.ids.get(fn)
+        if cid is None:
+            cid = self.ids[fn] = classifier_id(fn)
+        table = self.labels.get(cid)
+        if table is None:
+            table = self.labels[cid] = {}
+            db = self._db()
+            if db is not None:
+                for h, value in db.execute("SELECT hash, value FROM labels WHERE classifier = ?", (cid,)):
+                    table[h] = json.loads(value)
+        return cid, table
+
+    def classify(self, fn, text: str):
+        """fn(stripped text), cached by paragraph content. fn's result must be JSON-able."""
+        cid, table = self._table(fn)
+        stripped = text.strip()
+        key = hashlib.blake2b(stripped.encode("utf-8"), digest_size=HASH_SIZE).digest()
+        value = table.get(key, table)
+        if value is not table:
+            self.hits[cid] += 1
+            return value
+        self.misses[cid] += 1
+        value = fn(stripped)
+        if isinstance(value, (tuple, list, dict)):
+            # Stored through JSON, so tuples come back as lists; normalize now
+            # so cold and warm runs hand callers the same type
+            value = json.loads(json.dumps(value))
+        table[key] = value
+        self.new_labels.setdefault(cid, {})[key] = value
+        return value
+
+    # -----------------------------------------------------------------------
+    # Paragraphs and messages
+    # -----------------------------------------------------------------------
+
+    def put(self, text: str) -> bytes:
+        """Store a paragraph (stripped) and return its hash."""
+        key = paragraph_key(text)
+        if key not in self.new_paragraphs:
+            if self.known is None:
+                db = self._db()
+                self.known = {h for (h,) in db.execute("SELECT hash FROM paragraphs")} if db else set()
+            if key not in self.known:
+                self.new_paragraphs[key] = text.strip()
+        return key
+
+    def paragraph(self, key: bytes) -> str | None:
+        if key in self.new_paragraphs:
+            return self.new_paragraphs[key]
+        db = self._db()
+        row = db.execute("SELECT text FROM paragraphs WHERE hash = ?", (key,)).fetchone() if db else None
+        return row[0] if row else None
+
+    def add_message(self, source: str, index: int, text: str) -> list:
+        """Store a message as paragraph hashes; returns the hashes.
+
+        Leading/trailing whitespace of each paragraph is kept with the
+        separators so that message() reproduces text exactly.
+        """
+        paragraphs, separators = split_paragraphs(text)
+        hashes, seps = [], []
+        for n, para in enumerate(paragraphs):
+            hashes.append(self.put(para))
+            lead = para[:len(para) - len(para.lstrip())]
+            trail = para[len(para.rstrip()):]
+            seps.append([lead, trail, separators[n] if n < len(separators) else ""])
+        plain = all(lead == "" and trail == "" and sep in (DEFAULT_SEPARATOR, "")
+                    for lead, trail, sep in seps) and seps[-1][2] == ""
+        self.new_messages[(source, index)] = (hashes, None if plain else seps)
+        return hashes
+
+    def message(self, source: str, index: int) -> str | None:
+        entry = self.new_messages.get((source, index))
+        if entry is None:
+            db = self._db()
+            row = db.execute("SELECT paragraphs, separators FROM messages WHERE source = ? AND "
+                             "msg_index = ?", (source, index)).fetchone() if db else None
+            if row is None:
+                return None
+            entry = (unpack_hashes(row[0]), json.loads(row[1]) if row[1] else None)
+        hashes, seps = entry
+        texts = [self.paragraph(h) for h in hashes]
+        if seps is None:
+            return DEFAULT_SEPARATOR.join(texts)
+        return "".join(lead + t + trail + sep for t, (lead, trail, sep) in zip(texts, seps))
+
+    # -----------------------------------------------------------------------
+
+    def flush(self) -> dict:
+        """Write new paragraphs, messages and classifications; returns counts."""
+        counts = {"paragraphs": len(self.new_paragraphs), "messages": len(self.new_messages),
+                  "labels": sum(len(t) for t in self.new_labels.values())}
+        db = self._db()
+        if db is None:
+            return counts
+        with db:
+            db.executemany("INSERT OR IGNORE INTO paragraphs VALUES (?, ?)", self.new_paragraphs.items())
+            db.executemany("INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?)",
+                           [(src, idx, b"".join(h), json.dumps(s) if s else None)
+                            for (src, idx), (h, s) in self.new_messages.items()])
+            db.executemany("INSERT OR REPLACE INTO labels VALUES (?, ?, ?)",
+                           [(cid, h, json.dumps(v)) for cid, table in self.new_labels.items()
+                            for h, v in table.items()])
+        if self.known is not None:
+            self.known.update(self.new_paragraphs)
+        self.new_paragraphs, self.new_messages, self.new_labels = {}, {}, {}
+        return counts
+
+    def cache_report(self) -> str:
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        total = hits + misses
+        rate = f"{hits * 100 / total:.0f}%" if total else "-"
+        return f"paragraph cache: {hits} hits, {misses} misses ({rate})"
+
+
+_default = None
+
+
+def default_store() -> ParagraphStore:
+    """The process-wide store at STORE_FILE (opened on first use)."""
+    global _default
+    if _default is None:
+        _default = ParagraphStore()
+    return _default
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def print_stats(store: ParagraphStore) -> None:
+    db = store._db()
+    n_para, para_bytes = db.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(text)), 0) FROM paragraphs").fetchone()
+    print(f"\n{STORE_FILE.relative_to(PROJECT_ROOT)}")
+    print(f"  {n_para:,} distinct paragraphs ({para_bytes:,} chars)")
+
+    uses = Counter()
+    n_msg = 0
+    for (hashes,) in db.execute("SELECT paragraphs FROM messages"):
+        n_msg += 1
+        uses.update(unpack_hashes(hashes))
+    if n_msg:
+        lengths = dict(db.execute("SELECT hash, LENGTH(text) FROM paragraphs"))
+        total_chars = sum(lengths.get(h, 0) * n for h, n in uses.items())
+        print(f"  {n_msg:,} messages, {sum(uses.values()):,} paragraph uses "
+              f"({total_chars:,} chars before deduplication)")
+        print("  Most repeated:")
+        for h, n in uses.most_common(5):
+            print(f"    {n:>5}x  {store.paragraph(h)[:60]!r}")
+
+    print("  Cached classifications:")
+    for cid, count in db.execute("SELECT classifier, COUNT(*) FROM labels GROUP BY classifier"):
+        print(f"    {count:>8,}  {cid}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed paragraph store")
+    parser.add_argument("--clear", action="store_true", help="Delete the store")
+    args = parser.parse_args()
+
+    if args.clear:
+        STORE_FILE.unlink(missing_ok=True)
+        print(f"Removed {STORE_FILE.relative_to(PROJECT_ROOT)}")
+        return
+    if not STORE_FILE.exists():
+        print("No paragraph store yet (run preprocess_chapter.py or strip_gm_thinking.py).")
+        sys.exit(1)
+    print_stats(ParagraphStore())
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,10 @@ Operations:
   4. Filter meta-discussions (greetings, file loading, rule clarifications)
   5. Output clean JSON to tools/preprocessed/chapter_{id}.json
 
+Each raw message is also recorded in the paragraph store (paragraph_store.py)
+as a list of paragraph hashes, and the per-paragraph tests of step 2-3 are
+cached there by content, so repeated blocks are classified once.
+
 Usage:
   python3 tools/preprocess_chapter.py 1.01              # Single chapter
   python3 tools/preprocess_chapter.py 1.01 1.02 1.03    # Multiple chapters
@@ -37,6 +41,10 @@ SOURCE_BOOK1 = PROJECT_ROOT / "resources" / "source_material" / "book1"
 SOURCE_BOOK2 = PROJECT_ROOT / "resources" / "source_material" / "book2"
 OUTPUT_DIR = PROJECT_ROOT / "tools" / "preprocessed"
 
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from corpus_store import open_corpus, corpus_exists, corpus_glob
+from paragraph_store import default_store
+
 # Patterns that indicate meta-discussion (not game content)
 META_PATTERNS = [
     # Session setup / file loading
@@ -86,14 +94,14 @@ def discover_all_chapters(book_filter: int = None) -> list[str]:
     chapters = []
 
     if book_filter is None or book_filter == 1:
-        for f in sorted(SOURCE_BOOK1.glob("Claude-Chapter *.json")):
+        for f in corpus_glob(SOURCE_BOOK1, "Claude-Chapter *.json"):
             match = re.search(r"Claude-Chapter (\d+)\.json", f.name)
             if match:
                 num = int(match.group(1))
                 chapters.append(f"1.{num:02d}")
 
     if book_filter is None or book_filter == 2:
-        for f in sorted(SOURCE_BOOK2.glob("Claude-Chapter 2.*.json")):
+        for f in corpus_glob(SOURCE_BOOK2, "Claude-Chapter 2.*.json"):
             match = re.search(r"Claude-Chapter 2\.(\d+)\.json", f.name)
             if match:
                 num = int(match.group(1))
@@ -108,6 +116,40 @@ def discover_all_chapters(book_filter: int = None) -> list[str]:
 # Text Cleaning
 # ---------------------------------------------------------------------------
 
+THINKING_CONTINUATIONS = [
+    r"^(I should|I need to|Let me|So |The user|This is a|Looking at)",
+    r"^(From |Based on|However,? (the|I|it|this)|Key |Now I|Now let me)",
+    r"^(Good,|Excellent|The key|I'm |So the|From Chapter|From the)",
+    r"^(The player|According|I can see|I have|So actually|I'll)",
+    r"^(This gives|The seal|However, Juan|Making|Tracking|I can)",
+    r"^(The timeline|Juan is currently|The chronology|The precise)",
+    r"^(I'm focusing|I'm tracking|Padilla appears)",
+    r"^(The upload|The allowed|Let me check|The user said)",
+    r"^(This is helpful|Now I have a complete|Let me also)",
+]
+
+
+def starts_with_thinking_marker(stripped: str) -> bool:
+    """Paragraph opens with a Thought process:/Tool:/View: marker."""
+    return stripped.startswith(tuple(THINKING_MARKERS))
+
+
+def is_thinking_continuation(stripped: str) -> bool:
+    """Paragraph reads like more of the thinking block it follows."""
+    for pattern in THINKING_CONTINUATIONS:
+        if re.match(pattern, stripped):
+            return True
+    # Short numbered lists in thinking
+    if re.match(r"^\d+\.\s", stripped) and len(stripped) < 200:
+        return True
+    # Short lines that are clearly meta (under 60 chars, no narrative markers)
+    if len(stripped) < 60 and re.match(r"^[A-Z]", stripped):
+        # Could be a header or transition — keep if it looks like narrative
+        if not re.match(r"^(The |A |An |You |Your |In |On |At |By |For |With |When )", stripped):
+            return True
+    return False
+
+
 def strip_thinking_and_tools(text: str) -> str:
     """Remove Thought process:, Tool:, View:, Bash Tool: sections from GM text.
 
@@ -126,42 +168,12 @@ def strip_thinking_and_tools(text: str) -> str:
             continue
 
         # Check if this paragraph starts with a thinking/tool marker
-        is_meta = False
-        for marker in THINKING_MARKERS:
-            if stripped.startswith(marker):
-                is_meta = True
-                break
+        is_meta = starts_with_thinking_marker(stripped)
 
         # Also catch continuation lines that are clearly part of thinking
         # (numbered lists in thinking, "I should:", "Let me:", etc.)
         if not is_meta and skip_until_next:
-            # Check if this looks like continuation of thinking/analysis
-            thinking_continuations = [
-                r"^(I should|I need to|Let me|So |The user|This is a|Looking at)",
-                r"^(From |Based on|However,? (the|I|it|this)|Key |Now I|Now let me)",
-                r"^(Good,|Excellent|The key|I'm |So the|From Chapter|From the)",
-                r"^(The player|According|I can see|I have|So actually|I'll)",
-                r"^(This gives|The seal|However, Juan|Making|Tracking|I can)",
-                r"^(The timeline|Juan is currently|The chronology|The precise)",
-                r"^(I'm focusing|I'm tracking|Padilla appears)",
-                r"^(The upload|The allowed|Let me check|The user said)",
-                r"^(This is helpful|Now I have a complete|Let me also)",
-            ]
-            is_continuation = False
-            for pattern in thinking_continuations:
-                if re.match(pattern, stripped):
-                    is_continuation = True
-                    break
-            # Short numbered lists in thinking
-            if not is_continuation and re.match(r"^\d+\.\s", stripped) and len(stripped) < 200:
-                is_continuation = True
-            # Short lines that are clearly meta (under 60 chars, no narrative markers)
-            if not is_continuation and len(stripped) < 60 and re.match(r"^[A-Z]", stripped):
-                # Could be a header or transition — keep if it looks like narrative
-                if not re.match(r"^(The |A |An |You |Your |In |On |At |By |For |With |When )", stripped):
-                    is_continuation = True
-
-            if is_continuation:
+            if default_store().classify(is_thinking_continuation, stripped):
                 is_meta = True
             else:
                 skip_until_next = False
@@ -265,10 +277,10 @@ def preprocess_chapter(chapter_id: str) -> dict:
     """Preprocess a single chapter, returning clean message list."""
     filepath = chapter_id_to_path(chapter_id)
 
-    if not filepath.exists():
+    if not corpus_exists(filepath):
         raise FileNotFoundError(f"Chapter file not found: {filepath}")
 
-    with open(filepath, "r", encoding="utf-8") as f:
+    with open_corpus(filepath) as f:
         raw = json.load(f)
 
     metadata = raw.get("metadata", {})
@@ -278,10 +290,12 @@ def preprocess_chapter(chapter_id: str) -> dict:
     skipped_count = 0
     msg_index = 0
 
-    for msg in messages:
+    store = default_store()
+    for raw_index, msg in enumerate(messages):
         role = msg.get("role", "")
         text = msg.get("say", "")
         time_str = msg.get("time", "")
+        store.add_message(chapter_id, raw_index, text)
 
         # Skip entirely meta messages
         if is_meta_discussion(text, role):
@@ -394,6 +408,8 @@ def main():
             print(f"  {chapter_id}: ERROR - {type(e).__name__}: {e}")
 
     print(f"\nTotal: {total_raw} raw → {total_clean} clean ({total_skipped} skipped)")
+    print(default_store().cache_report())
+    default_store().flush()
 
 
 if __name__ == "__main__":
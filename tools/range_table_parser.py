@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Range Table Parser — Local, deterministic extraction of d100 roll tables.
+
+The GM presents d100 tables in a fixed shape: numbered ranges from 1 to
+100, each with a label and an outcome ("01-15: Label — outcome", or the
+range on its own line followed by label/outcome lines, or a markdown table
+row); the player answers "rolled 74"; the next GM message narrates the
+result. This module reads a chapter's source messages once, line by line,
+with a small state machine:
+
+  outside ──range starting at 0/1──▶ in table ──range low = previous high + 1──▶ in table
+                                        │
+                                        └─ outcome of the 100 range read, or
+                                           too many non-range lines ──▶ outside
+
+Each table is validated with roll_intervals (coverage of 1-100, no gaps or
+overlaps), paired with the next roll the player reports (several tables in
+one GM message take the rolls in order) and with the GM narration after
+it, and emitted in extract_roll_tables.py's table schema.
+
+Whatever cannot be parsed confidently is returned as message windows:
+range lines that do not form a valid table, and player rolls that no
+parsed table claims. extract_roll_tables.py sends only those windows to
+the LLM, and skips the API call for chapters that have none.
+
+Usage:
+  python3 tools/range_table_parser.py 2.12            # Parse one chapter, print tables
+  python3 tools/range_table_parser.py --all --stats   # Parsed vs. doubtful, every d100 chapter
+  python3 tools/range_table_parser.py 2.12 --json
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from roll_intervals import IntervalTable, parse_range, format_range, D100_MAX
+
+GM_ROLE = "Response"
+PLAYER_ROLE = "Prompt"
+
+# A line that starts with a range: "01-15", "**16–35**:", "- 91-100 —", "| 36-55 |".
+# Not "20-30%", "3-5,000", "1/2", "- 40 miles": text after the range needs a separator.
+RANGE_LINE_RE = re.compile(
+    r"^[\s*#>•·|-]*\(?(\d{1,3}(?:\s*[-–—]\s*\d{1,3})?)\)?(?![\d%,/.])\**\s*(?:[:|.)—–-]\s*(.*))?$")
+# "Label — outcome", "Label: outcome"
+LABEL_SPLIT_RE = re.compile(r"\s+[—–]\s+|:\s+|\s+-\s+")
+# Player roll reports: "rolled 88", "I roll 18", "Roll: 74", "d100 result: 51", "48 rolled",
+# a bare number, or "52: Modest Success" as the first line
+ROLL_REPORT_RE = re.compile(
+    r"(?i)\b(?:roll(?:ed|s)?(?:\s+(?:an?|of))?\s*:?|d100(?:\s+result)?\s*:?)\s*(\d{1,3})\b"
+    r"|\b(\d{1,3})\s+rolled\b")
+BARE_ROLL_RE = re.compile(r"^\s*(\d{1,3})\s*[.!]?\s*$")
+LEADING_ROLL_RE = re.compile(r"^\s*(\d{1,3})\s*:\s+\S")
+# "D100 Roll: Does Alfonso attend?", "Roll — Siege of Antequera"
+TITLE_RE = re.compile(r"(?i)^[\s*#]*(?:d100\s+)?(?:roll|table)(?:\s+table)?\s*[:—–-]\s*(.+?)[\s*]*$")
+TITLE_SUFFIX_RE = re.compile(r"(?i)[\s:—–-]*\b(?:d100\s+)?(?:roll\s+)?table$")
+GENERIC_HEADINGS = {"d100 table", "roll", "outcome", "outcomes", "roll table", "d100 roll",
+                    "range", "result", "possible outcomes", "the roll", "d100"}
+
+MONTHS = ("january", "february", "march", "april", "may", "june", "july",
+          "august", "september", "october", "november", "december")
+DATE_LINE_RE = re.compile(r"(?im)^[\s*]*(?:in-game\s+)?date\s*:(.*)$")
+DATE_RE = re.compile(
+    r"(?i)\b(?:(\d{1,2})\s+)?(" + "|".join(MONTHS) + r")(?:\s+(\d{1,2})(?:st|nd|rd|th)?)?,?\s+(14\d\d)\b")
+
+# roll_type → words that suggest it (first best count wins; ties keep this order)
+ROLL_TYPE_KEYWORDS = {
+    "military": ("siege", "battle", "army", "troops", "assault", "campaign", "fleet", "garrison"),
+    "diplomacy": ("envoy", "embassy", "treaty", "alliance", "ambassador", "negotiat", "king"),
+    "persuasion": ("convince", "persuade", "accept", "agree", "reaction", "respond"),
+    "espionage": ("spy", "spies", "informant", "secret", "discover", "intelligence"),
+    "religion": ("pope", "papal", "bishop", "church", "council", "archbishop", "religious"),
+    "economy": ("trade", "revenue", "tax", "merchant", "harvest", "ducats", "maravedís", "cost"),
+    "travel": ("journey", "voyage", "travel", "arrival", "crossing", "road", "sail"),
+    "intrigue": ("plot", "conspiracy", "faction", "rival", "court", "betray"),
+    "personal": ("health", "birth", "marriage", "illness", "child", "queen", "heir"),
+}
+DEFAULT_ROLL_TYPE = "chaos"
+
+# Non-range lines tolerated inside an unfinished table before it is abandoned
+MAX_GAP_LINES = 40
+# Fewer range lines than this are prose, not a table
+MIN_RANGES = 3
+LABEL_MAX_CHARS = 80
+SHORT_LABEL_WORDS = 4
+
+
+# ---------------------------------------------------------------------------
+# Line-level helpers
+# ---------------------------------------------------------------------------
+
+def clean(text: str) -> str:
+    return re.sub(r"\*\*|__", "", text).strip(" \t*|-—–:")
+
+
+def match_range_line(line: str) -> tuple | None:
+    """(low, high, rest) if the line starts with a d100 range."""
+    m = RANGE_LINE_RE.match(line)
+    if not m:
+        return None
+    parsed = parse_range(m.group(1).replace("–", "-").replace("—", "-"))
+    if not parsed or parsed[1] > D100_MAX:
+        return None
+    return parsed[0], parsed[1], (m.group(2) or "").strip()
+
+
+def split_label(text: str) -> tuple:
+    """"Label — outcome" → (label, outcome); a short line alone is a label."""
+    if "|" in text:
+        cells = [clean(c) for c in text.split("|") if clean(c)]
+        if len(cells) >= 2:
+            return cells[0], " ".join(cells[1:])
+        text = cells[0] if cells else ""
+    text = clean(text)
+    # "Outright Refusal. Something has gone wrong — …"
+    head, dot, tail = text.partition(". ")
+    if dot and len(head.split()) <= SHORT_LABEL_WORDS and tail:
+        return clean(head), clean(tail)
+    m = LABEL_SPLIT_RE.search(text)
+    if m and m.start() <= LABEL_MAX_CHARS:
+        return clean(text[:m.start()]), clean(text[m.end():])
+    if len(text) <= LABEL_MAX_CHARS and not text.endswith("."):
+        return text, ""
+    return "", text
+
+
+def trim_label(label: str) -> str:
+    """Drop an unclosed parenthesis: "Good progress (raiders harass" → "Good progress"."""
+    if label.count("(") > label.count(")"):
+        label = label[:label.rfind("(")].strip()
+    return label
+
+
+def derive_label(summary: str) -> str:
+    """First clause of an outcome, for ranges without their own label."""
+    clause = re.split(r"[.;:—–]|,\s", summary, maxsplit=1)[0].strip()
+    words = clause.split()
+    return " ".join(words[:8]) + ("…" if len(words) > 8 else "")
+
+
+def first_sentences(text: str, n: int = 2) -> str:
+    parts = re.split(r"(?<=[.!?])\s+", text.strip())
+    return " ".join(parts[:n])
+
+
+def roll_reports(text: str) -> list:
+    """Roll values a player message reports, in order."""
+    values = [int(a or b) for a, b in ROLL_REPORT_RE.findall(text)]
+    if not values:
+        values = [int(m.group(1)) for line in text.splitlines()
+                  if (m := BARE_ROLL_RE.match(line))]
+    if not values and (m := LEADING_ROLL_RE.match(text)):
+        values = [int(m.group(1))]
+    return [v for v in values if 1 <= v <= D100_MAX]
+
+
+def find_date(text: str) -> str:
+    """In-game date in text as YYYY-MM-DD (day 01 when only month/year).
+
+    A "Date:" line wins; otherwise the last date mentioned.
+    """
+    labelled = DATE_LINE_RE.findall(text)
+    if labelled and DATE_RE.search(labelled[-1]):
+        text = labelled[-1]
+    found = ""
+    for day1, month, day2, year in DATE_RE.findall(text):
+        day = int(day1 or day2 or 1)
+        if 1 <= day <= 31:
+            found = f"{year}-{MONTHS.index(month.lower()) + 1:02d}-{day:02d}"
+    return found
+
+
+def classify(text: str) -> str:
+    low = text.lower()
+    scores = {t: sum(low.count(w) for w in words) for t, words in ROLL_TYPE_KEYWORDS.items()}
+    best = max(scores, key=scores.get)
+    return best if scores[best] else DEFAULT_ROLL_TYPE
+
+
+# ---------------------------------------------------------------------------
+# State machine
+# ---------------------------------------------------------------------------
+
+class TableReader:
+    """Reads one GM message line by line and collects the range tables in it.
+
+    A range inside the previous band ("1-15: MINOR FRICTION" then 1-5,
+    6-10, 11-15) is a sub-range of it; bands whose sub-ranges tile them
+    are emitted as the sub-ranges, under the band's label.
+    """
+
+    def __init__(self, text: str):
+        self.lines = [line for line in text.splitlines() if line.strip()]
+        self.tables = []            # {"first_line", "ranges": [band]}
+        self.stray = 0              # range-like lines outside any table
+        self.current = None
+        self.gap = 0
+
+    def close(self) -> None:
+        if self.current:
+            self.tables.append(self.current)
+        self.current = None
+        self.gap = 0
+
+    def last_entry(self) -> dict:
+        band = self.current["ranges"][-1]
+        return band["sub"][-1] if band["sub"] else band
+
+    def read(self) -> "TableReader":
+        for n, line in enumerate(self.lines):
+            parsed = match_range_line(line)
+            if parsed:
+                low, high, rest = parsed
+                label, summary = split_label(rest) if rest else ("", "")
+                entry = {"low": low, "high": high, "label": label, "summary": summary, "sub": []}
+                band = self.current["ranges"][-1] if self.current else None
+                if band and band["low"] <= low and high <= band["high"] \
+                        and (low, high) != (band["low"], band["high"]):
+                    band["sub"].append(entry)
+                elif low <= 1 and (band is None or band["high"] > 1):
+                    self.close()
+                    self.current = {"first_line": n, "ranges": [entry]}
+                elif band is None:
+                    self.stray += 1
+                    continue
+                else:
+                    self.current["ranges"].append(entry)
+                self.gap = 0
+                continue
+
+            if self.current is None:
+                continue
+            band = self.current["ranges"][-1]
+            entry = self.last_entry()
+            done = band["high"] >= D100_MAX and (not band["sub"] or entry["high"] == band["high"])
+            if not entry["summary"]:
+                label, summary = split_label(line)
+                if not entry["label"] and label and not summary:
+                    entry["label"] = label
+                else:
+                    entry["summary"] = summary or label
+                    if done:
+                        self.close()
+                continue
+            self.gap += 1
+            if done or self.gap > MAX_GAP_LINES:
+                self.close()
+        self.close()
+        return self
+
+    @staticmethod
+    def flatten(bands: list) -> list:
+        """[(low, high, label, summary)], bands replaced by sub-ranges that tile them."""
+        ranges = []
+        for band in bands:
+            subs = sorted(band["sub"], key=lambda e: e["low"])
+            tiled = subs and subs[0]["low"] == band["low"] and subs[-1]["high"] == band["high"] \
+                and all(a["high"] + 1 == b["low"] for a, b in zip(subs, subs[1:]))
+            label = band["label"] or derive_label(band["summary"])
+            if tiled:
+                ranges.extend((e["low"], e["high"], label, e["summary"] or e["label"]) for e in subs)
+            else:
+                ranges.append((band["low"], band["high"], label, band["summary"]))
+        return ranges
+
+    def heading_before(self, line_no: int) -> tuple:
+        """(title, context) from the lines above a table."""
+        above = self.lines[max(0, line_no - 40):line_no]
+        title = ""
+        for line in reversed(above):
+            m = TITLE_RE.match(line)
+            if m and clean(m.group(1)).lower() not in GENERIC_HEADINGS:
+                title = clean(m.group(1))
+                break
+        if not title:
+            for line in reversed(above):
+                text = clean(line)
+                if (text and len(text) <= LABEL_MAX_CHARS and not text.endswith(".")
+                        and not line.rstrip(" *").endswith(":")
+                        and text.lower() not in GENERIC_HEADINGS and not match_range_line(line)):
+                    title = text
+                    break
+        context = ""
+        for line in above:
+            text = clean(line)
+            if len(text) > LABEL_MAX_CHARS and text.endswith((".", "?", "!")):
+                context = first_sentences(text)
+                break
+        return TITLE_SUFFIX_RE.sub("", title) or title, context
+
+
+# ---------------------------------------------------------------------------
+# Chapter
+# ---------------------------------------------------------------------------
+
+def build_table(reader: TableReader, raw: dict, message_index: int, prior_text: str) -> dict:
+    ranges = [{"range": format_range(lo, hi), "label": trim_label(label),
+               "summary": first_sentences(summary)}
+              for lo, hi, label, summary in reader.flatten(raw["ranges"])]
+    title, context = reader.heading_before(raw["first_line"])
+    roll_type = classify(f"{title} {context}")
+    text_above = "\n".join(reader.lines[:raw["first_line"]])
+    return {
+        "title": title,
+        "context": f"{roll_type.capitalize()} — {context}" if context else roll_type.capitalize(),
+        "roll_type": roll_type,
+        "date": find_date(title) or find_date(text_above) or find_date(prior_text),
+        "rolled": None,
+        "outcome_range": "",
+        "outcome_label": "",
+        "ranges": ranges,
+        "confidence": "medium",
+        "source": {"message": message_index + 1},
+    }
+
+
+def parse_chapter(messages: list) -> dict:
+    """Parse a chapter's source messages.
+
+    Returns {"tables": [...], "doubtful": [(first, last) message indexes],
+    "notes": [str]}. Tables are in message order; each carries
+    source.message (1-based, as in the LLM transcript) and, once paired,
+    source.roll_message and source.narration_message.
+    """
+    tables, doubtful, pending = [], [], []
+    recent = ""                    # recent GM text, for dates stated before the table message
+    notes = []
+
+    for i, msg in enumerate(messages):
+        text = msg.get("say", "") or ""
+        role = msg.get("role")
+        if role == GM_ROLE:
+            for table in pending:
+                if table["source"].get("roll_message"):
+                    table["source"].setdefault("narration_message", i + 1)
+            reader = TableReader(text).read()
+            valid, flagged = [], False
+            for n, raw in enumerate(reader.tables):
+                if n + 1 < len(reader.tables) and is_draft(raw, reader.tables[n + 1]):
+                    continue
+                if len(raw["ranges"]) < MIN_RANGES:
+                    # "1-10: maybe confusion in the advance" in the GM's planning
+                    reader.stray += len(raw["ranges"])
+                    continue
+                table = build_table(reader, raw, i, recent)
+                problems = IntervalTable.from_ranges(table["ranges"]).problems()
+                if problems:
+                    doubtful.append((i, min(i + 2, len(messages) - 1)))
+                    notes.append(f"message {i + 1}: {', '.join(problems)}")
+                    flagged = True
+                else:
+                    valid.append(table)
+            if reader.stray >= MIN_RANGES and not valid and not flagged:
+                doubtful.append((i, min(i + 2, len(messages) - 1)))
+                notes.append(f"message {i + 1}: {reader.stray} range lines outside a table")
+            if valid:
+                # A new table replaces drafts the player never rolled against
+                if pending and all(t["rolled"] is None for t in pending):
+                    tables = [t for t in tables if t not in pending]
+                    notes.append(f"message {i + 1}: replaces unrolled table(s) in message "
+                                 f"{pending[0]['source']['message']}")
+                pending = valid
+                tables.extend(valid)
+            elif pending and pending[0]["source"].get("roll_message"):
+                pending = []
+            recent = (recent + "\n" + text)[-20000:]
+        elif role == PLAYER_ROLE:
+            values = roll_reports(text)
+            if not values:
+                continue
+            open_tables = [t for t in pending if t["rolled"] is None]
+            if not open_tables:
+                doubtful.append((max(0, i - 1), min(i + 1, len(messages) - 1)))
+                notes.append(f"message {i + 1}: roll {values[0]} with no parsed table")
+                continue
+            for table, value in zip(open_tables, values):
+                outcome = IntervalTable.from_ranges(table["ranges"]).outcome_for(value)
+                table["rolled"] = value
+                table["outcome_range"] = outcome["range"]
+                table["outcome_label"] = outcome["label"]
+                table["confidence"] = "high"
+                table["source"]["roll_message"] = i + 1
+
+    return {"tables": tables, "doubtful": merge_windows(doubtful), "notes": notes}
+
+
+def is_draft(raw: dict, following: dict) -> bool:
+    """A sketch the GM reworks right after ("1-10: Catastrophic" … "01-08: Catastrophic Journey")."""
+    if len(raw["ranges"]) != len(following["ranges"]):
+        return False
+    def head(band):
+        return (band["label"] or band["summary"]).lower().split()[:1]
+    same = sum(head(a) == head(b) for a, b in zip(raw["ranges"], following["ranges"]))
+    return same * 2 >= len(raw["ranges"])
+
+
+def merge_windows(windows: list) -> list:
+    merged = []
+    for lo, hi in sorted(windows):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    from extract_roll_tables import (find_source_file, load_source_chapter,
+                                     discover_all_chapters, is_d100_chapter)
+
+    parser = argparse.ArgumentParser(description="Parse d100 range tables without the LLM")
+    parser.add_argument("chapters", nargs="*", help="Chapter IDs (e.g. 2.12)")
+    parser.add_argument("--all", action="store_true", help="Every d100 chapter")
+    parser.add_argument("--stats", action="store_true", help="One line per chapter")
+    parser.add_argument("--json", action="store_true", help="Print the parse result as JSON")
+    args = parser.parse_args()
+
+    chapters = args.chapters
+    if args.all:
+        chapters = [ch for ch in discover_all_chapters() if is_d100_chapter(ch)]
+    if not chapters:
+        parser.error("give chapter IDs or --all")
+
+    totals = {"tables": 0, "local": 0, "windows": 0}
+    for ch in chapters:
+        path = find_source_file(ch)
+        if path is None:
+            print(f"  {ch}: source file not found")
+            continue
+        messages = load_source_chapter(path)
+        result = parse_chapter(messages)
+        totals["tables"] += len(result["tables"])
+        totals["windows"] += len(result["doubtful"])
+        totals["local"] += not result["doubtful"]
+        if args.json:
+            print(json.dumps({"chapter": ch, **result}, indent=2, ensure_ascii=False))
+        elif args.stats:
+            print(f"  {ch:<6} {len(messages):>4} msgs  {len(result['tables']):>3} table(s)  "
+                  f"{len(result['doubtful'])} doubtful window(s)")
+        else:
+            print(f"\nChapter {ch}: {len(result['tables'])} table(s)")
+            for t in result["tables"]:
+                print(f"  [msg {t['source']['message']}] {t['title'] or '(untitled)'}  "
+                      f"{t['date'] or '????-??-??'}  rolled {t['rolled']} → "
+                      f"{t['outcome_range']} {t['outcome_label']}")
+                for r in t["ranges"]:
+                    print(f"      {r['range']:<7} {r['label']}")
+            for lo, hi in result["doubtful"]:
+                print(f"  doubtful: messages {lo + 1}-{hi + 1}")
+            for note in result["notes"]:
+                print(f"  note: {note}")
+
+    if len(chapters) > 1 and not args.json:
+        print(f"\n{totals['tables']} table(s); {totals['local']}/{len(chapters)} chapter(s) "
+              f"fully parsed; {totals['windows']} window(s) left for the LLM")
+
+
+if __name__ == "__main__":
+    main()
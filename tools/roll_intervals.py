@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Roll Intervals — Compiled d100 interval tables and batch coverage validation.
+
+A roll table's "ranges" (["1-5", "6-15", ...]) are parsed once into sorted
+breakpoint arrays (lows, highs, labels). outcome_for(rolled) is then a
+bisect — O(log k) — instead of re-parsing range strings per lookup. Where
+ranges overlap (nested sub-bands), the latest-starting interval that
+contains the value wins; validation still reports the overlap.
+
+STANDARD_BANDS is the 7-band table the GM uses when no explicit table is
+shown (01-10 … 94-100); infer_range_from_rolled() is a lookup into it and
+replaces the hardcoded if/elif chains in extract_from_exchanges_v2.py and
+fix_merged_rolls.py.
+
+validate_records() checks every table of roll_tables.json and every roll of
+roll_history.json in one vectorized NumPy pass: all intervals are
+concatenated, offset by table index so that one sort and one running
+maximum cover every table at once, and gaps, overlaps, missing 1/100
+endpoints and rolled-vs-outcome mismatches fall out as array comparisons.
+
+The compiled form is exported to resources/data/roll_intervals.json for
+the game's RollEngine (scripts/roll_engine.gd).
+
+Usage:
+  python3 tools/roll_intervals.py validate            # Validate roll_tables.json + roll_history.json
+  python3 tools/roll_intervals.py lookup roll_ch1_14_001 37
+  python3 tools/roll_intervals.py export              # Write roll_intervals.json for the game
+"""
+
+import re
+import sys
+import json
+import bisect
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+ROLL_TABLES_FILE = DATA_DIR / "roll_tables.json"
+ROLL_HISTORY_FILE = DATA_DIR / "roll_history.json"
+EXPORT_FILE = DATA_DIR / "roll_intervals.json"
+
+RANGE_RE = re.compile(r"^\s*(\d{1,3})\s*(?:[-–—]\s*(\d{1,3}))?\s*$")
+
+D100_MIN = 1
+D100_MAX = 100
+
+# Per-table offset for the batch pass (any parsed bound is < 1000)
+_TABLE_OFFSET = 1000
+
+
+def parse_range(range_str) -> tuple | None:
+    """"11-25" → (11, 25); "7" → (7, 7); anything else → None."""
+    m = RANGE_RE.match(str(range_str or ""))
+    if not m:
+        return None
+    low = int(m.group(1))
+    high = int(m.group(2)) if m.group(2) else low
+    return (low, high) if low <= high else None
+
+
+def format_range(low: int, high: int) -> str:
+    return f"{low:02d}-{high:02d}"
+
+
+# ---------------------------------------------------------------------------
+# Compiled table
+# ---------------------------------------------------------------------------
+
+class IntervalTable:
+    """Sorted, parsed intervals of one d100 table."""
+
+    def __init__(self, intervals: list):
+        intervals = sorted(intervals)
+        self.lows = [lo for lo, _, _ in intervals]
+        self.highs = [hi for _, hi, _ in intervals]
+        self.labels = [label for _, _, label in intervals]
+
+    @classmethod
+    def from_ranges(cls, ranges: list) -> "IntervalTable":
+        """Compile a table's "ranges" list (unparseable entries are skipped)."""
+        intervals = []
+        for r in ranges:
+            parsed = parse_range(r.get("range"))
+            if parsed:
+                intervals.append((parsed[0], parsed[1], r.get("label", "")))
+        return cls(intervals)
+
+    def __len__(self) -> int:
+        return len(self.lows)
+
+    def index_for(self, rolled: int) -> int | None:
+        """Interval containing rolled; with overlapping (nested) ranges, the
+        one starting latest — the most specific band."""
+        i = bisect.bisect_right(self.lows, rolled) - 1
+        while i >= 0 and rolled > self.highs[i]:
+            i -= 1
+        return i if i >= 0 else None
+
+    def outcome_for(self, rolled: int) -> dict | None:
+        """{"range", "label"} of the interval containing rolled, or None."""
+        i = self.index_for(rolled)
+        if i is None:
+            return None
+        return {"range": format_range(self.lows[i], self.highs[i]), "label": self.labels[i]}
+
+    def problems(self) -> list:
+        """Coverage warnings: endpoints, gaps and overlaps across 1-100."""
+        if not self.lows:
+            return ["Empty ranges array"]
+        warnings = []
+        if self.lows[0] > D100_MIN:
+            warnings.append("Ranges don't start at 1")
+        if max(self.highs) < D100_MAX:
+            warnings.append("Ranges don't reach 100")
+        uncovered = max(0, self.lows[0] - D100_MIN)
+        overlaps = 0
+        reach = self.highs[0]
+        for lo, hi in zip(self.lows[1:], self.highs[1:]):
+            if lo <= reach:
+                overlaps += 1
+            else:
+                uncovered += lo - reach - 1
+            reach = max(reach, hi)
+        uncovered += max(0, D100_MAX - reach)
+        if uncovered:
+            warnings.append(f"Gaps in ranges: {uncovered} values uncovered")
+        if overlaps:
+            warnings.append(f"Overlapping ranges: {overlaps}")
+        return warnings
+
+    def to_dict(self) -> dict:
+        return {"lows": self.lows, "highs": self.highs, "labels": self.labels}
+
+
+STANDARD_BANDS = IntervalTable([
+    (1, 10, "Critical Failure"),
+    (11, 25, "Failure"),
+    (26, 40, "Mixed Negative"),
+    (41, 60, "Status Quo"),
+    (61, 80, "Success"),
+    (81, 93, "Strong Success"),
+    (94, 100, "Critical Success"),
+])
+
+
+def infer_range_from_rolled(rolled) -> str | None:
+    """Given a rolled value, return the standard numeric range it falls in."""
+    if rolled is None:
+        return None
+    outcome = STANDARD_BANDS.outcome_for(min(max(int(rolled), D100_MIN), D100_MAX))
+    return outcome["range"]
+
+
+# ---------------------------------------------------------------------------
+# Batch validation (NumPy)
+# ---------------------------------------------------------------------------
+
+def interval_arrays(records: list) -> dict:
+    """Flatten every record's ranges into sorted NumPy arrays.
+
+    Returns {"t", "lo", "hi", "key", "labels", "unparseable"}: t is the
+    record index of each interval, intervals are sorted by (t, lo), and
+    key = t * OFFSET + lo puts every table in one searchable key space
+    (table i occupies [i*OFFSET, (i+1)*OFFSET)). unparseable lists
+    (record index, range string) pairs that were skipped.
+    """
+    import numpy as np
+
+    # The only per-item Python pass
+    t_idx, lows, highs, labels, unparseable = [], [], [], [], []
+    for ti, rec in enumerate(records):
+        for r in rec.get("ranges") or []:
+            parsed = parse_range(r.get("range"))
+            if parsed is None:
+                unparseable.append((ti, r.get("range")))
+                continue
+            t_idx.append(ti)
+            lows.append(min(parsed[0], _TABLE_OFFSET - 1))
+            highs.append(min(parsed[1], _TABLE_OFFSET - 1))
+            labels.append(r.get("label", ""))
+
+    t = np.asarray(t_idx, dtype=np.int64)
+    lo = np.asarray(lows, dtype=np.int64)
+    hi = np.asarray(highs, dtype=np.int64)
+    order = np.lexsort((lo, t))
+    t, lo, hi = t[order], lo[order], hi[order]
+    return {"t": t, "lo": lo, "hi": hi, "key": t * _TABLE_OFFSET + lo,
+            "labels": [labels[i] for i in order], "unparseable": unparseable}
+
+
+def locate(arrays: dict, rolled):
+    """Interval index holding each record's rolled value (vectorized).
+
+    rolled has one entry per record. Returns (pos, hit): pos indexes the
+    interval arrays, hit is False where the value falls in no interval of
+    its own record. searchsorted finds the last interval starting at or
+    below the value; when ranges overlap that one may end too early, so
+    misses step back to the latest-starting interval that does contain it
+    (as IntervalTable.index_for does).
+    """
+    import numpy as np
+
+    t, lo, hi = arrays["t"], arrays["lo"], arrays["hi"]
+    n = len(rolled)
+    if not len(t):
+        return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=bool)
+    rec_idx = np.arange(n)
+    query = rec_idx * _TABLE_OFFSET + np.clip(rolled, 0, _TABLE_OFFSET - 1)
+    pos = np.maximum(np.searchsorted(arrays["key"], query, side="right") - 1, 0)
+    hit = (t[pos] == rec_idx) & (lo[pos] <= rolled) & (hi[pos] >= rolled)
+    for i in np.flatnonzero(~hit & (t[pos] == rec_idx) & (lo[pos] <= rolled)):
+        j = pos[i] - 1
+        while j >= 0 and t[j] == i and hi[j] < rolled[i]:
+            j -= 1
+        if j >= 0 and t[j] == i:
+            pos[i], hit[i] = j, True
+    return pos, hit
+
+
+def validate_records(records: list) -> list:
+    """Validate many tables/rolls at once. Returns one warning list per record.
+
+    A record is a roll_tables.json table or a roll_history.json roll:
+    optional "ranges", "rolled", "outcome_range", "outcome_label".
+    """
+    import numpy as np
+
+    warnings = [[] for _ in records]
+
+    arrays = interval_arrays(records)
+    for ti, range_str in arrays["unparseable"]:
+        warnings[ti].append(f"Unparseable range '{range_str}'")
+    n = len(records)
+    t, lo, hi, labels = arrays["t"], arrays["lo"], arrays["hi"], arrays["labels"]
+
+    base = t * _TABLE_OFFSET
+    key_lo = arrays["key"]
+    reach = np.maximum.accumulate(base + hi) if len(t) else key_lo
+    prev_reach = np.empty_like(reach)
+    if len(t):
+        prev_reach[1:] = reach[:-1]
+        starts = np.ones(len(t), dtype=bool)
+        starts[1:] = t[1:] != t[:-1]
+        prev_reach[starts] = base[starts]  # nothing covered yet: "up to 0"
+    else:
+        starts = np.zeros(0, dtype=bool)
+
+    overlap = (key_lo <= prev_reach) & ~starts
+    gap = np.maximum(key_lo - prev_reach - 1, 0)
+    gap[overlap] = 0
+
+    has_ranges = np.bincount(t, minlength=n) > 0
+    first_lo = np.full(n, D100_MIN, dtype=np.int64)
+    first_lo[t[starts]] = lo[starts]
+    max_hi = np.zeros(n, dtype=np.int64)
+    np.maximum.at(max_hi, t, hi)
+    uncovered = (np.bincount(t, weights=gap, minlength=n).astype(np.int64)
+                 + np.maximum(D100_MAX - max_hi, 0))
+    overlaps = np.bincount(t, weights=overlap, minlength=n).astype(np.int64)
+
+    # Rolled values
+    rolled = np.full(n, -1, dtype=np.int64)
+    o_lo = np.full(n, -1, dtype=np.int64)
+    o_hi = np.full(n, -1, dtype=np.int64)
+    for i, rec in enumerate(records):
+        if isinstance(rec.get("rolled"), int):
+            rolled[i] = rec["rolled"]
+        parsed = parse_range(rec.get("outcome_range"))
+        if parsed:
+            o_lo[i], o_hi[i] = parsed
+    has_roll = rolled >= 0
+    out_of_d100 = has_roll & ((rolled < D100_MIN) | (rolled > D100_MAX))
+    outside_outcome = has_roll & (o_lo >= 0) & ((rolled < o_lo) | (rolled > o_hi))
+
+    # Locate every rolled value in its own table with one searchsorted
+    pos, hit = locate(arrays, rolled)
+    hit &= has_roll
+    uncovered_roll = has_roll & has_ranges & ~hit & ~out_of_d100
+
+    for i in np.flatnonzero(has_ranges):
+        if first_lo[i] > D100_MIN:
+            warnings[i].append("Ranges don't start at 1")
+        if max_hi[i] < D100_MAX:
+            warnings[i].append("Ranges don't reach 100")
+        if uncovered[i]:
+            warnings[i].append(f"Gaps in ranges: {uncovered[i]} values uncovered")
+        if overlaps[i]:
+            warnings[i].append(f"Overlapping ranges: {overlaps[i]}")
+    for i in np.flatnonzero(out_of_d100):
+        warnings[i].append(f"Rolled {rolled[i]} outside 1-100")
+    for i in np.flatnonzero(outside_outcome):
+        warnings[i].append(f"Rolled {rolled[i]} not in outcome_range {records[i].get('outcome_range')}")
+    for i in np.flatnonzero(uncovered_roll):
+        warnings[i].append(f"Rolled {rolled[i]} not covered by any range")
+    for i in np.flatnonzero(hit):
+        expected = labels[pos[i]]
+        actual = records[i].get("outcome_label") or ""
+        # A label extended with detail ("Alarm - Firmly explains...") still matches
+        if expected and actual and not (actual.casefold().startswith(expected.casefold())
+                                        or expected.casefold().startswith(actual.casefold())):
+            warnings[i].append(f"Rolled {rolled[i]} falls in '{expected}', "
+                               f"outcome_label is '{actual}'")
+    return warnings
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+def compile_tables(tables: list) -> dict:
+    """table id → IntervalTable for every table with parseable ranges."""
+    compiled = {}
+    for table in tables:
+        it = IntervalTable.from_ranges(table.get("ranges") or [])
+        if len(it):
+            compiled[table["id"]] = it
+    return compiled
+
+
+def export_for_engine(tables: list) -> dict:
+    return {
+        "meta": {
+            "description": "Compiled d100 roll tables (sorted breakpoints) for RollEngine. "
+                           "Generated by tools/roll_intervals.py export — do not edit.",
+            "generated": datetime.now().isoformat(timespec="seconds"),
+        },
+        "standard": STANDARD_BANDS.to_dict(),
+        "tables": {tid: it.to_dict() for tid, it in compile_tables(tables).items()},
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cmd_validate(args) -> None:
+    tables = load_json(ROLL_TABLES_FILE).get("tables", [])
+    rolls = load_json(ROLL_HISTORY_FILE).get("rolls", [])
+    records = tables + rolls
+    results = validate_records(records)
+
+    flagged = [(rec.get("id") or rec.get("roll_id", "?"), w)
+               for rec, w in zip(records, results) if w]
+    for rid, w in flagged[:args.limit] if args.limit else flagged:
+        print(f"  {rid}: {'; '.join(w)}")
+    if args.limit and len(flagged) > args.limit:
+        print(f"  ... and {len(flagged) - args.limit} more")
+    print(f"\n{len(tables)} tables + {len(rolls)} rolls checked, {len(flagged)} with warnings")
+
+
+def cmd_lookup(args) -> None:
+    tables = load_json(ROLL_TABLES_FILE).get("tables", [])
+    table = next((t for t in tables if t["id"] == args.table_id), None)
+    if table is None:
+        print(f"ERROR: {args.table_id} not in roll_tables.json")
+        sys.exit(1)
+    outcome = IntervalTable.from_ranges(table.get("ranges") or []).outcome_for(args.rolled)
+    if outcome:
+        print(f"  {args.rolled} → {outcome['range']}: {outcome['label']}")
+    else:
+        print(f"  {args.rolled} → not covered")
+
+
+def cmd_export(args) -> None:
+    tables = load_json(ROLL_TABLES_FILE).get("tables", [])
+    data = export_for_engine(tables)
+    with open(EXPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"Exported {len(data['tables'])} compiled tables → {EXPORT_FILE.relative_to(PROJECT_ROOT)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiled d100 roll tables")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("validate", help="Validate roll_tables.json and roll_history.json")
+    p.add_argument("--limit", type=int, default=0, help="Show at most N flagged records")
+    p = sub.add_parser("lookup", help="Outcome of a rolled value in one table")
+    p.add_argument("table_id")
+    p.add_argument("rolled", type=int)
+    sub.add_parser("export", help="Write roll_intervals.json for the game")
+
+    args = parser.parse_args()
+    if args.command == "validate":
+        cmd_validate(args)
+    elif args.command == "lookup":
+        cmd_lookup(args)
+    elif args.command == "export":
+        cmd_export(args)
+
+
+if __name__ == "__main__":
+    main()
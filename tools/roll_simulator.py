@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Roll Simulator — Monte Carlo odds for d100 tables and chained rolls.
+
+GM tables (resources/gm_prompts/layer2_*.txt) move their breakpoints from
+roll to roll, and many scenes chain rolls: the chapter 1.23 ambush (roll 18,
+"Bad Complications") is followed by a rally roll whose table only comes into
+play because of the first result. This tool shows designers the odds of
+such sequences.
+
+A chain is a list of stages, each a table from roll_tables.json or an ad hoc
+spec, optionally conditioned on the previous stage's result:
+
+  roll_ch1_23_001                      table by ID
+  "1-5=Disaster,6-30=Trouble,31-100=Fine"   ad hoc spec
+  roll_ch1_23_002@1-30                 only rolled if the previous stage's outcome
+                                       lies in 1-30 (the condition is bound to those
+                                       outcomes, so it follows them when breakpoints shift)
+
+All trials are drawn at once as a (stages × trials) NumPy array; outcomes
+are found with searchsorted, chain paths are encoded as mixed-radix integers
+and counted with bincount. Sensitivity re-uses the same draws (common random
+numbers) with each internal breakpoint shifted ±N, so differences reflect
+the shift rather than sampling noise.
+
+Reports:
+  - per stage: probability it is rolled and of each outcome (conditional)
+  - chained paths: the most likely outcome sequences
+  - expected final rank: outcome of the last stage rolled, worst 0 → best 1
+  - sensitivity: change in final rank and path odds per breakpoint shift
+
+Usage:
+  python3 tools/roll_simulator.py roll_ch1_23_001
+  python3 tools/roll_simulator.py "1-20=Ambush,21-100=Quiet" "1-40=Rout,41-100=Rally@1-20"
+  python3 tools/roll_simulator.py roll_ch1_23_001 roll_ch1_23_002@1-30 --trials 2000000 --shift 5
+  python3 tools/roll_simulator.py roll_ch1_23_001 --json
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from roll_intervals import IntervalTable, ROLL_TABLES_FILE, parse_range, load_json
+
+DEFAULT_TRIALS = 1_000_000
+DEFAULT_SHIFT = 5
+UNCOVERED = "(uncovered)"
+NOT_ROLLED = "—"
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+class Stage:
+    """One roll in a chain: sorted breakpoints + optional condition."""
+
+    def __init__(self, name: str, table: IntervalTable, condition: tuple | None):
+        if not len(table):
+            raise ValueError(f"{name}: no parseable ranges")
+        self.name = name
+        self.lows = np.asarray(table.lows, dtype=np.int64)
+        self.highs = np.asarray(table.highs, dtype=np.int64)
+        self.labels = list(table.labels)
+        self.condition = condition
+        self.when = None  # previous-stage outcome indices that trigger this stage
+
+    def bind_condition(self, previous: "Stage") -> None:
+        """Resolve @lo-hi to the previous stage's outcomes inside that range."""
+        if self.condition is None:
+            return
+        lo, hi = self.condition
+        inside = (previous.lows >= lo) & (previous.highs <= hi)
+        if not inside.any():
+            raise ValueError(f"{self.name}: no outcome of {previous.name} lies in {lo}-{hi}")
+        self.when = np.flatnonzero(inside)
+
+    def shifted(self, boundary: int, delta: int) -> "Stage | None":
+        """Copy with the boundary between outcome i and i+1 moved by delta."""
+        lows, highs = self.lows.copy(), self.highs.copy()
+        new_low = lows[boundary + 1] + delta
+        if not (lows[boundary] < new_low <= highs[boundary + 1]):
+            return None
+        lows[boundary + 1] = new_low
+        highs[boundary] = new_low - 1
+        stage = Stage.__new__(Stage)
+        stage.name, stage.labels, stage.condition = self.name, self.labels, self.condition
+        stage.when, stage.lows, stage.highs = self.when, lows, highs
+        return stage
+
+    def outcomes(self, draws: np.ndarray) -> np.ndarray:
+        """Outcome index per draw; len(labels) marks an uncovered value."""
+        idx = np.searchsorted(self.lows, draws, side="right") - 1
+        safe = np.maximum(idx, 0)
+        covered = (idx >= 0) & (draws <= self.highs[safe])
+        return np.where(covered, idx, len(self.labels))
+
+
+def parse_stage(arg: str, tables_by_id: dict) -> Stage:
+    """Table ID or "lo-hi=Label,..." spec, optionally suffixed with @lo-hi."""
+    spec, _, cond = arg.rpartition("@") if "@" in arg else (arg, "", "")
+    condition = None
+    if cond:
+        condition = parse_range(cond)
+        if condition is None:
+            raise ValueError(f"Bad condition '@{cond}' (expected @lo-hi)")
+
+    if spec in tables_by_id:
+        table = IntervalTable.from_ranges(tables_by_id[spec].get("ranges") or [])
+        return Stage(spec, table, condition)
+
+    intervals = []
+    for part in spec.split(","):
+        rng, _, label = part.partition("=")
+        parsed = parse_range(rng)
+        if parsed is None:
+            raise ValueError(f"'{spec}' is neither a table ID nor a range spec")
+        intervals.append((parsed[0], parsed[1], label.strip() or rng.strip()))
+    return Stage(spec if len(spec) <= 40 else spec[:37] + "...", IntervalTable(intervals), condition)
+
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+def run_chain(stages: list, draws: np.ndarray) -> tuple:
+    """Per-trial results of a chain over pre-drawn d100 values (stages × trials).
+
+    Returns (path, final_rank, per_stage): path is each trial's mixed-radix
+    outcome sequence, final_rank the rank of the last stage rolled (NaN if
+    none), per_stage a list of (active, outcome) arrays.
+    """
+    trials = draws.shape[1]
+    active = np.ones(trials, dtype=bool)
+    path = np.zeros(trials, dtype=np.int64)
+    final_rank = np.full(trials, np.nan)
+    per_stage = []
+    out = None
+
+    for s, stage in enumerate(stages):
+        if s and stage.when is not None:
+            active = active & np.isin(out, stage.when)
+        k = len(stage.labels)
+        out = stage.outcomes(draws[s])
+        # Radix k+2: outcomes, uncovered (k), not rolled (k+1)
+        path = path * (k + 2) + np.where(active, out, k + 1)
+        final_rank = np.where(active & (out < k), out / max(k - 1, 1), final_rank)
+        per_stage.append((active, out))
+    return path, final_rank, per_stage
+
+
+def simulate(stages: list, draws: np.ndarray) -> dict:
+    """Outcome probabilities, path counts and final rank for a chain."""
+    trials = draws.shape[1]
+    path, final_rank, per_stage = run_chain(stages, draws)
+
+    stage_results = []
+    for stage, (active, out) in zip(stages, per_stage):
+        k = len(stage.labels)
+        counts = np.bincount(out[active], minlength=k + 1)
+        n_active = int(active.sum())
+        stage_results.append({
+            "stage": stage.name,
+            "p_rolled": n_active / trials,
+            "outcomes": [{"label": label, "range": f"{lo}-{hi}",
+                          "p": counts[i] / n_active if n_active else 0.0}
+                         for i, (label, lo, hi) in enumerate(zip(stage.labels, stage.lows.tolist(),
+                                                                 stage.highs.tolist()))],
+            "p_uncovered": counts[k] / n_active if n_active else 0.0,
+        })
+
+    rolled = ~np.isnan(final_rank)
+    return {"stages": stage_results, "trials": trials,
+            "path": path, "path_counts": np.bincount(path),
+            "rank_sum": float(final_rank[rolled].sum()), "rank_n": int(rolled.sum()),
+            "final_rank": float(final_rank[rolled].mean()) if rolled.any() else None}
+
+
+def decode_path(code: int, stages: list) -> list:
+    labels = []
+    for stage in reversed(stages):
+        k = len(stage.labels)
+        digit = code % (k + 2)
+        code //= k + 2
+        labels.append(stage.labels[digit] if digit < k else (UNCOVERED if digit == k else NOT_ROLLED))
+    return labels[::-1]
+
+
+def path_table(result: dict) -> dict:
+    """Path code → probability for every path that occurred."""
+    counts = result["path_counts"]
+    return {int(c): counts[c] / result["trials"] for c in np.flatnonzero(counts)}
+
+
+def sensitivity(stages: list, draws: np.ndarray, base: dict, shift: int) -> list:
+    """Re-run with each internal breakpoint moved ±shift (same draws).
+
+    Moving a boundary only changes trials whose draw at that stage falls
+    between the old and new breakpoint, so only those are re-simulated and
+    their contribution swapped into the base counts.
+    """
+    base_counts = base["path_counts"]
+    trials = base["trials"]
+    rows = []
+    for s, stage in enumerate(stages):
+        for b in range(len(stage.labels) - 1):
+            for delta in (-shift, shift):
+                moved = stage.shifted(b, delta)
+                if moved is None:
+                    continue
+                edge = stage.lows[b + 1]
+                lo, hi = min(edge, edge + delta), max(edge, edge + delta)
+                sub = np.flatnonzero((draws[s] >= lo) & (draws[s] < hi))
+                variant = stages[:s] + [moved] + stages[s + 1:]
+                sub_path, sub_rank, _ = run_chain(variant, draws[:, sub])
+                _, old_rank, _ = run_chain(stages, draws[:, sub])
+
+                size = len(base_counts)
+                diff = (np.bincount(sub_path, minlength=size)[:size]
+                        - np.bincount(base["path"][sub], minlength=size)[:size])
+                code = int(np.argmax(np.abs(diff)))
+
+                new_rolled, old_rolled = ~np.isnan(sub_rank), ~np.isnan(old_rank)
+                rank_sum = base["rank_sum"] + sub_rank[new_rolled].sum() - old_rank[old_rolled].sum()
+                rank_n = base["rank_n"] + int(new_rolled.sum()) - int(old_rolled.sum())
+                new_final = rank_sum / rank_n if rank_n else 0.0
+
+                rows.append({
+                    "stage": stage.name,
+                    "boundary": f"{stage.highs[b]}|{stage.lows[b + 1]}",
+                    "shift": delta,
+                    "d_final_rank": new_final - (base["final_rank"] or 0),
+                    "top_path": " → ".join(decode_path(code, stages)),
+                    "d_top_path": diff[code] / trials,
+                })
+    rows.sort(key=lambda r: abs(r["d_final_rank"]), reverse=True)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo odds for d100 roll chains")
+    parser.add_argument("stages", nargs="+",
+                        help="Table IDs or 'lo-hi=Label,...' specs, optionally @lo-hi")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--shift", type=int, default=DEFAULT_SHIFT,
+                        help="Breakpoint shift for sensitivity (0 to skip)")
+    parser.add_argument("--paths", type=int, default=10, help="Chained paths to show")
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+    args = parser.parse_args()
+
+    tables_by_id = {}
+    if ROLL_TABLES_FILE.exists():
+        tables_by_id = {t["id"]: t for t in load_json(ROLL_TABLES_FILE).get("tables", [])}
+    try:
+        stages = [parse_stage(a, tables_by_id) for a in args.stages]
+        for prev, stage in zip(stages, stages[1:]):
+            stage.bind_condition(prev)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    t0 = time.time()
+    rng = np.random.default_rng(args.seed)
+    draws = rng.integers(1, 101, size=(len(stages), args.trials), dtype=np.int64)
+    result = simulate(stages, draws)
+    sens = sensitivity(stages, draws, result, args.shift) if args.shift else []
+    elapsed = time.time() - t0
+
+    paths = sorted(path_table(result).items(), key=lambda kv: kv[1], reverse=True)
+    if args.json:
+        print(json.dumps({
+            "trials": args.trials,
+            "stages": result["stages"],
+            "final_rank": result["final_rank"],
+            "paths": [{"path": decode_path(c, stages), "p": p} for c, p in paths],
+            "sensitivity": sens,
+            "elapsed_s": round(elapsed, 3),
+        }, indent=2))
+        return
+
+    for i, st in enumerate(result["stages"]):
+        cond = f" (if previous roll {stages[i].condition[0]}-{stages[i].condition[1]})" \
+            if i and stages[i].condition else ""
+        print(f"Stage {i + 1}: {st['stage']}{cond} — rolled in {st['p_rolled']:.1%} of trials")
+        for o in st["outcomes"]:
+            print(f"    {o['range']:>7}  {o['p']:>6.1%}  {o['label']}")
+        if st["p_uncovered"]:
+            print(f"    {'':>7}  {st['p_uncovered']:>6.1%}  {UNCOVERED}")
+
+    if len(stages) > 1:
+        print(f"\nChained paths (top {min(args.paths, len(paths))} of {len(paths)}):")
+        for code, p in paths[:args.paths]:
+            print(f"    {p:>6.2%}  {' → '.join(decode_path(code, stages))}")
+
+    if result["final_rank"] is not None:
+        print(f"\nExpected final outcome rank (0 worst → 1 best): {result['final_rank']:.3f}")
+
+    if sens:
+        print(f"\nSensitivity to ±{args.shift} breakpoint shifts (largest first):")
+        for row in sens[:10]:
+            print(f"    {row['stage'][:24]:<24} {row['boundary']:>7} {row['shift']:+d}: "
+                  f"rank {row['d_final_rank']:+.3f}, "
+                  f"{row['d_top_path']:+.2%} {row['top_path'][:60]}")
+
+    print(f"\n{args.trials:,} trials in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Roll Stats — Distribution, fairness and outcome analytics for d100 rolls.
+
+Loads roll_history.json and roll_tables.json into NumPy arrays and reports:
+
+  - Distribution: decile histogram, mean/std against a fair d100, and a
+    chi-square uniformity test (with p-value) over the rolled values
+  - Outcome bands: how often rolls land in each standard band
+    (01-10 … 94-100), expected vs observed
+  - Table bias: for GM-designed tables in roll_tables.json, each outcome's
+    rank from worst (0) to best (1) weighted by its width gives the expected
+    outcome of a fair roll; < 0.5 means the table gives more of the die to
+    bad outcomes. Compared against the realized outcome rank.
+  - Per roll_type and per chapter: counts, mean roll, success (61+) and
+    failure (≤25) rates
+
+Every statistic is computed with array operations (bincount, searchsorted)
+so the report stays instant as the campaign grows.
+
+Usage:
+  python3 tools/roll_stats.py                       # Full report (roll_history.json)
+  python3 tools/roll_stats.py --source tables       # Rolls recorded in roll_tables.json
+  python3 tools/roll_stats.py --by chapter          # Group by chapter instead of roll_type
+  python3 tools/roll_stats.py --json                # Machine-readable
+"""
+
+import sys
+import json
+import math
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from roll_intervals import (ROLL_TABLES_FILE, ROLL_HISTORY_FILE, STANDARD_BANDS,
+                            interval_arrays, locate, load_json)
+
+# Standard-band thresholds used for success/failure rates
+SUCCESS_MIN = 61
+FAILURE_MAX = 25
+
+# Tables whose expected outcome rank is below this are flagged as failure-biased
+BIAS_THRESHOLD = 0.45
+
+
+# ---------------------------------------------------------------------------
+# Statistics helpers
+# ---------------------------------------------------------------------------
+
+def chi2_sf(x: float, dof: int) -> float:
+    """Survival function of the chi-square distribution (upper-tail p-value).
+
+    Regularized upper incomplete gamma Q(dof/2, x/2): series expansion below
+    a+1, continued fraction above (Numerical Recipes gammq).
+    """
+    if x <= 0:
+        return 1.0
+    a, x = dof / 2.0, x / 2.0
+    gln = math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(500):
+            ap += 1
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * 1e-12:
+                break
+        return max(0.0, 1.0 - total * math.exp(-x + a * math.log(x) - gln))
+    b = x + 1 - a
+    c = 1 / 1e-300
+    d = 1 / b
+    h = d
+    for i in range(1, 500):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = 1e-300 if abs(d) < 1e-300 else d
+        c = b + an / c
+        c = 1e-300 if abs(c) < 1e-300 else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-12:
+            break
+    return math.exp(-x + a * math.log(x) - gln) * h
+
+
+def uniformity(rolled: np.ndarray, bins: int = 10) -> dict:
+    """Decile histogram and chi-square test against a fair d100."""
+    counts = np.bincount((rolled - 1) * bins // 100, minlength=bins)
+    expected = len(rolled) / bins
+    chi2 = float(((counts - expected) ** 2 / expected).sum()) if len(rolled) else 0.0
+    return {
+        "n": int(len(rolled)),
+        "mean": round(float(rolled.mean()), 2) if len(rolled) else None,
+        "std": round(float(rolled.std()), 2) if len(rolled) else None,
+        "fair_mean": 50.5,
+        "fair_std": round(math.sqrt((100 ** 2 - 1) / 12), 2),
+        "histogram": counts.tolist(),
+        "chi2": round(chi2, 2),
+        "dof": bins - 1,
+        "p_value": round(chi2_sf(chi2, bins - 1), 4),
+    }
+
+
+def band_distribution(rolled: np.ndarray) -> list:
+    """Observed vs expected share of rolls in each standard band."""
+    lows = np.asarray(STANDARD_BANDS.lows)
+    highs = np.asarray(STANDARD_BANDS.highs)
+    idx = np.searchsorted(lows, rolled, side="right") - 1
+    counts = np.bincount(idx, minlength=len(lows))
+    n = max(len(rolled), 1)
+    return [{"range": f"{lo:02d}-{hi:02d}", "label": label,
+             "expected": round((hi - lo + 1) / 100, 3),
+             "observed": round(int(c) / n, 3), "count": int(c)}
+            for lo, hi, label, c in zip(lows.tolist(), highs.tolist(),
+                                        STANDARD_BANDS.labels, counts)]
+
+
+def group_rates(rolled: np.ndarray, keys: list) -> list:
+    """Count, mean roll, success and failure rate per group key."""
+    names, inverse = np.unique(np.asarray(keys, dtype=object).astype(str), return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(names))
+    sums = np.bincount(inverse, weights=rolled, minlength=len(names))
+    success = np.bincount(inverse, weights=rolled >= SUCCESS_MIN, minlength=len(names))
+    failure = np.bincount(inverse, weights=rolled <= FAILURE_MAX, minlength=len(names))
+    rows = [{"group": str(name), "count": int(c), "mean": round(s / c, 1),
+             "success_rate": round(ok / c, 3), "failure_rate": round(bad / c, 3)}
+            for name, c, s, ok, bad in zip(names, counts, sums, success, failure)]
+    rows.sort(key=lambda r: r["count"], reverse=True)
+    return rows
+
+
+def table_bias(tables: list) -> dict:
+    """Expected vs realized outcome rank for tables with explicit ranges."""
+    arrays = interval_arrays(tables)
+    t, lo, hi = arrays["t"], arrays["lo"], arrays["hi"]
+    n = len(tables)
+    if not len(t):
+        return {"tables": 0, "rows": []}
+
+    k = np.bincount(t, minlength=n)
+    has = k >= 2
+    if not has.any():
+        # Only single-range tables: no outcome ranks to compare
+        return {"tables": 0, "rows": []}
+    first = np.concatenate(([0], np.cumsum(k)[:-1]))
+    position = np.arange(len(t)) - first[t]
+    rank = position / np.maximum(k[t] - 1, 1)          # 0 = worst outcome, 1 = best
+    width = np.clip(np.minimum(hi, 100) - np.maximum(lo, 1) + 1, 0, None)
+    total_width = np.bincount(t, weights=width, minlength=n)
+    expected = np.bincount(t, weights=width * rank, minlength=n) / np.maximum(total_width, 1)
+
+    rolled = np.array([tb["rolled"] if isinstance(tb.get("rolled"), int) else -1
+                       for tb in tables], dtype=np.int64)
+    pos, hit = locate(arrays, rolled)
+    hit &= (rolled >= 1) & (k >= 2)
+    realized = np.where(hit, rank[pos], np.nan)
+
+    rows = [{"id": tables[i].get("id") or tables[i].get("roll_id", "?"),
+             "outcomes": int(k[i]),
+             "expected_rank": round(float(expected[i]), 3),
+             "realized_rank": None if math.isnan(realized[i]) else round(float(realized[i]), 3)}
+            for i in np.flatnonzero(has)]
+    valid = has & hit
+    return {
+        "tables": int(has.sum()),
+        "mean_expected_rank": round(float(expected[has].mean()), 3),
+        "mean_realized_rank": round(float(realized[valid].mean()), 3) if valid.any() else None,
+        "failure_biased": int((expected[has] < BIAS_THRESHOLD).sum()),
+        "rows": rows,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def load_records(source: str) -> list:
+    records = []
+    if source in ("history", "all"):
+        records += load_json(ROLL_HISTORY_FILE).get("rolls", [])
+    if source in ("tables", "all"):
+        records += load_json(ROLL_TABLES_FILE).get("tables", [])
+    return records
+
+
+def build_report(records: list, tables: list, by: str) -> dict:
+    valid = [r for r in records if isinstance(r.get("rolled"), int) and 1 <= r["rolled"] <= 100]
+    rolled = np.array([r["rolled"] for r in valid], dtype=np.int64)
+    if by == "chapter":
+        keys = [r.get("chapter", "?") for r in valid]
+    else:
+        keys = [r.get("roll_type") or "(untyped)" for r in valid]
+    return {
+        "records": len(records),
+        "valid_rolls": len(valid),
+        "distribution": uniformity(rolled),
+        "bands": band_distribution(rolled),
+        "groups": {"by": by, "rows": group_rates(rolled, keys)},
+        "table_bias": table_bias([t for t in tables if t.get("ranges")]),
+    }
+
+
+def print_report(report: dict, top: int) -> None:
+    d = report["distribution"]
+    print(f"Rolls: {report['valid_rolls']} valid of {report['records']}")
+    print(f"\n  Distribution: mean {d['mean']} (fair {d['fair_mean']}), "
+          f"std {d['std']} (fair {d['fair_std']})")
+    peak = max(d["histogram"]) or 1
+    for i, c in enumerate(d["histogram"]):
+        print(f"    {i * 10 + 1:>3}-{i * 10 + 10:<3} {c:>5}  {'#' * round(30 * c / peak)}")
+    verdict = "consistent with a fair die" if d["p_value"] >= 0.05 else "NOT uniform (p < 0.05)"
+    print(f"    chi² = {d['chi2']} (dof {d['dof']}), p = {d['p_value']} — {verdict}")
+
+    print("\n  Standard bands (expected → observed):")
+    for b in report["bands"]:
+        print(f"    {b['range']:<7} {b['label']:<17} {b['expected']:>6.1%} → "
+              f"{b['observed']:>6.1%}  ({b['count']})")
+
+    g = report["groups"]
+    print(f"\n  By {g['by']}: {'count':>6} {'mean':>6} {'success':>8} {'failure':>8}")
+    for row in g["rows"][:top]:
+        print(f"    {row['group']:<20} {row['count']:>5} {row['mean']:>6.1f} "
+              f"{row['success_rate']:>8.1%} {row['failure_rate']:>8.1%}")
+
+    b = report["table_bias"]
+    if b["tables"]:
+        print(f"\n  GM-designed tables: {b['tables']}")
+        print(f"    Mean expected outcome rank (fair roll): {b['mean_expected_rank']}")
+        print(f"    Mean realized outcome rank:             {b['mean_realized_rank']}")
+        print(f"    Failure-biased tables (expected < {BIAS_THRESHOLD}): {b['failure_biased']}")
+        worst = sorted(b["rows"], key=lambda r: r["expected_rank"])[:min(top, 5)]
+        for row in worst:
+            print(f"      {row['id']:<20} {row['outcomes']:>2} outcomes, "
+                  f"expected rank {row['expected_rank']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze d100 roll history")
+    parser.add_argument("--source", choices=["history", "tables", "all"], default="history",
+                        help="Rolls to analyze: roll_history.json (default), "
+                             "roll_tables.json, or both")
+    parser.add_argument("--by", choices=["type", "chapter"], default="type",
+                        help="Grouping for success rates")
+    parser.add_argument("--top", type=int, default=15, help="Groups to show")
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+    args = parser.parse_args()
+
+    tables = load_json(ROLL_TABLES_FILE).get("tables", [])
+    report = build_report(load_records(args.source), tables, args.by)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Run Manifest — Checkpointed, resumable state for multi-chapter API runs.
+
+Each extraction run writes tools/progress/{run_id}.json recording every
+chapter's state:
+
+  pending    — not started yet
+  in_flight  — API call issued, output not yet saved
+  done       — output saved (output_hash = sha256 of the written file)
+  failed     — error / parse error (reason recorded)
+
+plus the request_hash of the prompt sent for it. Raw API responses are cached
+under tools/progress/responses/{request_hash}.txt once they parse, so
+resuming a chapter whose output was never written re-uses the paid response
+instead of calling the API again. A response that fails to parse is not
+kept, so the resumed chapter gets a fresh call.
+
+The manifest is rewritten atomically after every state change, so a Ctrl-C
+or a MAX_CONSECUTIVE_ERRORS abort leaves an exact checkpoint behind.
+
+Used by extract_from_exchanges_v2.py and extract_roll_tables.py (--resume).
+
+Usage:
+  python3 tools/run_manifest.py                 # List runs
+  python3 tools/run_manifest.py <run_id>        # Show one run's chapter states
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+PROGRESS_DIR = TOOLS_DIR / "progress"
+RESPONSES_DIR = PROGRESS_DIR / "responses"
+
+STATES = ("pending", "in_flight", "done", "failed")
+
+
+# ---------------------------------------------------------------------------
+# Hashing
+# ---------------------------------------------------------------------------
+
+def request_hash(model: str, system_prompt: str, user_message: str) -> str:
+    """Stable hash of everything that determines an API response."""
+    h = hashlib.sha256()
+    for part in (model, system_prompt, user_message):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def file_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+def cache_response(req_hash: str, text: str) -> None:
+    RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
+    (RESPONSES_DIR / f"{req_hash}.txt").write_text(text, encoding="utf-8")
+
+
+def cached_response(req_hash: str) -> str | None:
+    path = RESPONSES_DIR / f"{req_hash}.txt"
+    return path.read_text(encoding="utf-8") if path.exists() else None
+
+
+def discard_response(req_hash: str) -> None:
+    (RESPONSES_DIR / f"{req_hash}.txt").unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def manifest_path(run_id: str) -> Path:
+    return PROGRESS_DIR / f"{run_id}.json"
+
+
+def save_manifest(manifest: dict) -> None:
+    """Write the manifest atomically (temp file + rename)."""
+    PROGRESS_DIR.mkdir(parents=True, exist_ok=True)
+    path = manifest_path(manifest["run_id"])
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def new_run(tool: str, chapters: list, options: dict) -> dict:
+    """Create and persist a manifest for a fresh run."""
+    run_id = f"{tool}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    manifest = {
+        "run_id": run_id,
+        "tool": tool,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "options": options,
+        "order": list(chapters),
+        "chapters": {ch: {"state": "pending"} for ch in chapters},
+    }
+    save_manifest(manifest)
+    return manifest
+
+
+def load_run(run_id: str, tool: str) -> dict:
+    """Load a manifest for --resume. Exits with a message if it can't be used."""
+    path = manifest_path(run_id)
+    if not path.exists():
+        print(f"ERROR: No run manifest {path}")
+        sys.exit(1)
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("tool") != tool:
+        print(f"ERROR: Run {run_id} belongs to {manifest.get('tool')}, not {tool}")
+        sys.exit(1)
+    return manifest
+
+
+def mark(manifest: dict, chapter: str, state: str, **fields) -> None:
+    """Set a chapter's state (plus any extra fields) and checkpoint."""
+    assert state in STATES, state
+    entry = manifest["chapters"].setdefault(chapter, {})
+    entry.update(fields)
+    entry["state"] = state
+    entry["updated"] = datetime.now().isoformat(timespec="seconds")
+    if state == "done":
+        entry.pop("reason", None)
+    save_manifest(manifest)
+
+
+def remaining_chapters(manifest: dict) -> list:
+    """Chapters still to do, in original order (everything not done)."""
+    return [ch for ch in manifest["order"]
+            if manifest["chapters"].get(ch, {}).get("state") != "done"]
+
+
+def state_counts(manifest: dict) -> dict:
+    counts = {s: 0 for s in STATES}
+    for entry in manifest["chapters"].values():
+        counts[entry.get("state", "pending")] += 1
+    return counts
+
+
+def print_resume_hint(manifest: dict, script: str) -> None:
+    left = remaining_chapters(manifest)
+    if left:
+        print(f"\n  {len(left)} chapter(s) not done. To resume this run:")
+        print(f"    python3 tools/{script} --resume {manifest['run_id']}")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect extraction run manifests")
+    parser.add_argument("run_id", nargs="?", help="Run to show (omit to list all runs)")
+    args = parser.parse_args()
+
+    if not args.run_id:
+        paths = sorted(PROGRESS_DIR.glob("*.json")) if PROGRESS_DIR.exists() else []
+        if not paths:
+            print("No runs recorded.")
+            return
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                m = json.load(f)
+            c = state_counts(m)
+            print(f"  {m['run_id']:<48} done={c['done']:<3} failed={c['failed']:<3} "
+                  f"in_flight={c['in_flight']:<3} pending={c['pending']}")
+        return
+
+    path = manifest_path(args.run_id)
+    if not path.exists():
+        print(f"No run manifest {path}")
+        sys.exit(1)
+    with open(path, "r", encoding="utf-8") as f:
+        m = json.load(f)
+    print(f"Run {m['run_id']} ({m['tool']}, created {m['created']})")
+    for ch in m["order"]:
+        e = m["chapters"].get(ch, {})
+        extra = f" — {e['reason']}" if e.get("reason") else ""
+        print(f"  {ch:<6} {e.get('state', 'pending'):<10} "
+              f"req={e.get('request_hash', '-'):<16} out={e.get('output_hash', '-')}{extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,22 @@
 """
 Scan all chapter event files for GM thinking/commentary text that should have been stripped.
 Searches only "gm" role exchanges in chapter JSON files.
+
+PATTERNS is the corpus_scan.py pattern set "gm_thinking"; the scan runs on
+that engine (one prefiltered pass per exchange, chapter files in parallel).
+
+Usage:
+  python3 tools/scan_gm_thinking.py                # Report grouped by category
+  python3 tools/scan_gm_thinking.py --jsonl        # One JSON hit per line
 """
 
-import json
 import os
-import re
-import glob
+import sys
+import json
+import argparse
 
-EVENTS_DIR = "/home/user/History-sim/resources/data/events"
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from corpus_scan import chapter_files, from_categories, scan_corpus
 
 # Patterns to search for, grouped by category
 PATTERNS = {
@@ -94,67 +102,21 @@ PATTERNS = {
     ],
 }
 
-# Patterns to exclude from "I'll" / "I will" because they're valid in-character speech
-# (Characters in the narrative saying "I'll" or "I will" is fine)
-# We need to be smart about this - only flag if it appears to be GM meta-text, not dialogue
-
-def get_context(text, match, context_chars=100):
-    """Get surrounding context for a match."""
-    start = max(0, match.start() - 20)
-    end = min(len(text), match.start() + context_chars)
-    snippet = text[start:end].replace('\n', '\\n')
-    if start > 0:
-        snippet = "..." + snippet
-    if end < len(text):
-        snippet = snippet + "..."
-    return snippet
-
-def scan_file(filepath):
-    """Scan a single chapter file for problematic patterns."""
-    findings = []
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    chapter = data.get("chapter", "unknown")
-
-    for event in data.get("events", []):
-        event_id = event.get("event_id", "unknown")
-
-        for ex_idx, exchange in enumerate(event.get("exchanges", [])):
-            if exchange.get("role") != "gm":
-                continue
-
-            text = exchange.get("text", "")
-            if not text:
-                continue
-
-            for category, patterns in PATTERNS.items():
-                for pattern, description in patterns:
-                    for match in re.finditer(pattern, text):
-                        context = get_context(text, match)
-                        findings.append({
-                            "file": os.path.basename(filepath),
-                            "chapter": chapter,
-                            "event_id": event_id,
-                            "exchange_idx": ex_idx,
-                            "category": category,
-                            "pattern": description,
-                            "context": context,
-                            "match_text": match.group(0),
-                        })
-
-    return findings
-
 def main():
-    chapter_files = sorted(glob.glob(os.path.join(EVENTS_DIR, "chapter_*.json")))
-
-    print(f"Scanning {len(chapter_files)} chapter files...\n")
-
-    all_findings = []
-    for filepath in chapter_files:
-        findings = scan_file(filepath)
-        all_findings.extend(findings)
+    parser = argparse.ArgumentParser(description="Scan GM exchanges for leftover thinking/meta text")
+    parser.add_argument("--jsonl", action="store_true", help="Print hits as JSONL")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    files = chapter_files()
+    if not args.jsonl:
+        print(f"Scanning {len(files)} chapter files...\n")
+    all_findings = list(scan_corpus(from_categories(PATTERNS), files, workers=args.workers))
+
+    if args.jsonl:
+        for f in all_findings:
+            print(json.dumps(f, ensure_ascii=False))
+        return
 
     if not all_findings:
         print("NO ISSUES FOUND - all chapter files are clean.")
@@ -180,9 +142,9 @@ def main():
 
         for f in findings:
             print(f"\n  File: {f['file']}")
-            print(f"  Event: {f['event_id']}, Exchange idx: {f['exchange_idx']}")
+            print(f"  Event: {f['event_id']}, Exchange idx: {f['exchange']}")
             print(f"  Pattern: {f['pattern']}")
-            print(f"  Match: '{f['match_text']}'")
+            print(f"  Match: '{f['match']}'")
             print(f"  Context: {f['context']}")
             print(f"  {'-' * 80}")
 
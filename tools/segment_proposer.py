@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Segment Proposer — Drafts event definitions for a preprocessed chapter.
+
+Scans tools/preprocessed/chapter_{id}_preprocessed.json once and proposes
+event boundaries with date, location and characters pre-filled, in the
+format assemble_chapter.py --defs consumes. The author reviews and edits the
+proposal (summary, type, tags, factions) instead of reading the chapter cold.
+
+Per message it extracts:
+  - explicit dates ("September 17, 1431", "17 October 1431", "October 18",
+    ISO dates); years are carried over from the running date
+  - locations: names and IDs from locations.json (accent-folded), and the
+    destination of travel ("we ride to Málaga", "arrive in Ostia")
+  - characters: the surface forms of character_mentions.py, resolved to
+    canonical IDs through the merge_chapter alias index; a form shared by
+    several characters goes to the one the chapter names most unambiguously
+  - scene cues: time skips ("the next morning", "days later"), travel
+    ("we ride to", "arrive at"), sleep/rest
+
+Events start on player messages. Each candidate boundary is scored from the
+cues, a travel destination, a new date in the reply's opening lines and the
+shift in character roster between the messages before and after it; peaks
+above BOUNDARY_THRESHOLD become boundaries, subject to MIN_EVENT_MSGS and
+MAX_EVENT_MSGS. Date and location start where the previous chapter ended and
+only move on evidence (see segment_date; location changes only on travel).
+
+--evaluate compares the proposal with a hand-written defs file (boundary
+precision/recall within ±BOUNDARY_TOLERANCE messages, date and location
+agreement) to keep the heuristics honest.
+
+Usage:
+  python3 tools/segment_proposer.py 2.61                  # Print proposal
+  python3 tools/segment_proposer.py 2.61 --write          # → tools/event_defs/chapter_2.61_defs.json
+  python3 tools/segment_proposer.py 2.61 --json > defs.json
+  python3 tools/segment_proposer.py 1.24 --evaluate       # Compare with existing defs
+  python3 tools/segment_proposer.py --evaluate-all        # Over every defs file
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from datetime import date, timedelta
+from collections import Counter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+TOOLS_DIR = PROJECT_ROOT / "tools"
+PREPROCESSED_DIR = TOOLS_DIR / "preprocessed"
+DEFS_DIR = TOOLS_DIR / "event_defs"
+EVENTS_DIR = DATA_DIR / "events"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from character_mentions import fold_text, MentionScanner
+from merge_chapter import load_json, build_alias_index, ALIASES_FILE, CHARACTERS_FILE
+
+PROTAGONIST = "juan_ii"
+DEFAULT_LOCATION = "Toledo"
+
+# Segmentation
+MIN_EVENT_MSGS = 2
+MAX_EVENT_MSGS = 30
+BOUNDARY_THRESHOLD = 2.5
+ROSTER_WINDOW = 4              # messages either side compared for roster shift
+DESTINATION_SPAN = 60          # chars after a travel cue searched for the place
+SCENE_HEADER_CHARS = 300       # opening of a message treated as a scene header
+MAX_DATE_JUMP_DAYS = 31        # later dates beyond this must be in a scene header
+CHARACTER_MIN_MENTIONS = 3     # mentions within an event to list a character
+
+# Boundary score weights
+TIME_CUE_WEIGHT = 2.0
+TRAVEL_CUE_WEIGHT = 1.5
+NEW_DATE_WEIGHT = 1.5
+LOCATION_CHANGE_WEIGHT = 1.5
+ROSTER_SHIFT_WEIGHT = 2.0
+
+# Evaluation
+BOUNDARY_TOLERANCE = 2
+
+MONTHS = ["january", "february", "march", "april", "may", "june", "july",
+          "august", "september", "october", "november", "december"]
+_MONTH = "(" + "|".join(MONTHS) + ")"
+DATE_PATTERNS = [
+    # September 17, 1431 / September 17
+    (re.compile(_MONTH + r" (\d{1,2})(?:st|nd|rd|th)?(?: (1[3-5]\d\d))?\b"), ("m", "d", "y")),
+    # 17 September 1431 / 17th of September
+    (re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)? (?:of )?" + _MONTH + r"(?: (1[3-5]\d\d))?\b"),
+     ("d", "m", "y")),
+    # 1431 09 17 (ISO after folding)
+    (re.compile(r"\b(1[3-5]\d\d) (\d\d) (\d\d)\b"), ("y", "m", "d")),
+]
+
+TIME_CUES = re.compile(
+    r"\b(?:next (?:morning|day|week|month)|the following (?:morning|day|week)|"
+    r"tomorrow|(?:days|weeks|months) later|a (?:few|couple of) (?:days|weeks)|"
+    r"we sleep|i sleep|go to (?:bed|sleep)|you wake|wake up|at dawn|that evening|"
+    r"later that (?:day|night|evening)|time skip|skip ahead|fast forward|meanwhile)\b")
+# Subset of TIME_CUES that moves the calendar on by a day
+NEXT_DAY_CUES = re.compile(
+    r"\b(?:next (?:morning|day)|the following (?:morning|day)|tomorrow|you wake|"
+    r"wake up|at dawn|we sleep|i sleep|go to (?:bed|sleep))\b")
+TRAVEL_CUES = re.compile(
+    r"\b(?:we (?:ride|travel|sail|march|leave|depart|set out|head)|"
+    r"i (?:ride|travel|sail|march|leave|depart|set out|head)|"
+    r"arrive (?:at|in)|arriving (?:at|in)|journey to|on the road to)\b")
+
+
+# ---------------------------------------------------------------------------
+# Per-message features
+# ---------------------------------------------------------------------------
+
+def find_dates(folded: str, year_hint: int) -> list:
+    """Explicit dates in folded text as ISO strings (year from hint if absent)."""
+    found = []
+    for pattern, order in DATE_PATTERNS:
+        for m in pattern.finditer(folded):
+            parts = dict(zip(order, m.groups()))
+            month = parts["m"]
+            month = MONTHS.index(month) + 1 if not month.isdigit() else int(month)
+            year = int(parts["y"]) if parts.get("y") else year_hint
+            try:
+                found.append((m.start(), date(year, month, int(parts["d"])).isoformat()))
+            except (ValueError, TypeError):
+                continue
+    return [d for _, d in sorted(found)]
+
+
+class LocationMatcher:
+    """Accent-folded alternation over location names and IDs."""
+
+    def __init__(self, locations: list):
+        self.form_to_name = {}
+        for loc in locations:
+            for form in (loc.get("name", ""), loc.get("location_id", "").replace("_", " ")):
+                folded = fold_text(form).strip()
+                if len(folded) >= 4:
+                    self.form_to_name.setdefault(folded, loc["name"])
+        forms = sorted(self.form_to_name, key=len, reverse=True)
+        self.pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(f) for f in forms) + r")\b") if forms else None
+
+    def scan(self, folded: str) -> Counter:
+        if not self.pattern:
+            return Counter()
+        return Counter(self.form_to_name[m.group()] for m in self.pattern.finditer(folded))
+
+    def destination(self, folded: str) -> str | None:
+        """First location named within DESTINATION_SPAN chars after a travel cue."""
+        if not self.pattern:
+            return None
+        for cue in TRAVEL_CUES.finditer(folded):
+            m = self.pattern.search(folded, cue.end(), cue.end() + DESTINATION_SPAN)
+            if m:
+                return self.form_to_name[m.group()]
+        return None
+
+
+class SegmentProposer:
+    """Loads the location and character indexes once; propose() per chapter."""
+
+    def __init__(self):
+        characters = load_json(CHARACTERS_FILE).get("characters", [])
+        aliases = load_json(ALIASES_FILE)
+        self.scanner = MentionScanner(characters, aliases)
+        self.canonical = build_alias_index(aliases, characters)
+        self.locator = LocationMatcher(load_json(DATA_DIR / "locations.json").get("locations", []))
+
+    def match_forms(self, folded: str) -> Counter:
+        """Surface-form counts in folded text (the scanner's leftmost-longest matches)."""
+        return Counter(form for _, form in self.scanner.matches(folded))
+
+    # -- features -----------------------------------------------------------
+
+    def message_features(self, messages: list, year_hint: int) -> list:
+        feats = []
+        year = year_hint
+        for m in messages:
+            text = m.get("text", "")
+            folded = fold_text(text)
+            header_dates = find_dates(folded[:SCENE_HEADER_CHARS], year)
+            dates = find_dates(folded, year)
+            if dates:
+                year = int(dates[-1][:4])
+            forms = self.match_forms(folded)
+            feats.append({
+                "index": int(m["index"]),
+                "role": m.get("role", ""),
+                "dates": dates,
+                "header_dates": header_dates,
+                "forms": forms,
+                "destination": self.locator.destination(folded),
+                "locations": self.locator.scan(folded),
+                "time_cue": bool(TIME_CUES.search(folded)),
+                "next_day": bool(NEXT_DAY_CUES.search(folded)),
+                "travel_cue": bool(TRAVEL_CUES.search(folded)),
+                "preview": " ".join(text.split())[:200],
+            })
+        self.resolve_characters(feats)
+        return feats
+
+    def resolve_characters(self, feats: list) -> None:
+        """Per-message character counts, with shared forms ("isabel") given to
+        the candidate the chapter mentions most by unambiguous forms."""
+        ids_of = {form: {self.canonical.get(c, c) for c in cids}
+                  for form, cids in self.scanner.form_to_ids.items()}
+        certain = Counter()
+        for f in feats:
+            for form, n in f["forms"].items():
+                if len(ids_of[form]) == 1:
+                    certain[next(iter(ids_of[form]))] += n
+        for f in feats:
+            chars = Counter()
+            for form, n in f["forms"].items():
+                candidates = ids_of[form]
+                best = max(candidates, key=lambda c: certain[c])
+                if len(candidates) == 1 or certain[best] > 0:
+                    chars[best] += n
+            f["characters"] = chars
+
+    # -- proposal -----------------------------------------------------------
+
+    def propose(self, chapter_id: str) -> dict:
+        """Proposed defs ({"events": [...]}) for one preprocessed chapter."""
+        data = load_json(PREPROCESSED_DIR / f"chapter_{chapter_id}_preprocessed.json")
+        messages = data.get("messages", [])
+        if not messages:
+            return {"events": []}
+
+        current_date, current_location = previous_chapter_state(chapter_id)
+        year_hint = int(current_date[:4]) if current_date else first_year(messages)
+        feats = self.message_features(messages, year_hint)
+        starts = pick_boundaries(boundary_scores(feats))
+
+        if not current_location:
+            current_location = _dominant_location(feats) or DEFAULT_LOCATION
+
+        events = []
+        for start, end in zip(starts, starts[1:] + [len(feats)]):
+            seg = feats[start:end]
+            current_date = segment_date(seg, current_date, first=not events)
+
+            # Location is sticky: it only moves when someone travels somewhere
+            opening = next((f["destination"] for f in seg[:2] if f["destination"]), None)
+            location = opening or current_location
+            current_location = next((f["destination"] for f in reversed(seg) if f["destination"]),
+                                    location)
+
+            mentions = Counter()
+            for f in seg:
+                mentions.update(f["characters"])
+            characters = [PROTAGONIST] + [c for c, n in mentions.most_common()
+                                          if n >= CHARACTER_MIN_MENTIONS and c != PROTAGONIST]
+
+            events.append({
+                "msgs": [seg[0]["index"], seg[-1]["index"]],
+                "date": current_date or "",
+                "end_date": None,
+                "type": "",
+                "summary": seg[0]["preview"],
+                "characters": characters,
+                "factions_affected": [],
+                "location": location,
+                "tags": [],
+            })
+        return {"events": events}
+
+
+# ---------------------------------------------------------------------------
+# Segmentation
+# ---------------------------------------------------------------------------
+
+def _roster(feats: list) -> set:
+    roster = Counter()
+    for f in feats:
+        roster.update(f["characters"])
+    return {c for c, n in roster.items() if c != PROTAGONIST}
+
+
+def _dominant_location(feats: list) -> str | None:
+    counts = Counter()
+    for f in feats:
+        # Narration places the scene; weight it over the player's references
+        for name, n in f["locations"].items():
+            counts[name] += n * (2 if f["role"] == "gm" else 1)
+    return counts.most_common(1)[0][0] if counts else None
+
+
+def boundary_scores(feats: list) -> list:
+    """Score for starting a new event at each position (0 for non-player)."""
+    scores = [0.0] * len(feats)
+    for i in range(1, len(feats)):
+        if feats[i]["role"] != "player":
+            continue
+        reply = feats[i + 1] if i + 1 < len(feats) else None
+        score = 0.0
+        if feats[i]["time_cue"] or (reply and reply["time_cue"]):
+            score += TIME_CUE_WEIGHT
+        if feats[i]["travel_cue"]:
+            score += TRAVEL_CUE_WEIGHT
+        if feats[i]["destination"] or (reply and reply["destination"]):
+            score += LOCATION_CHANGE_WEIGHT
+
+        before = feats[max(0, i - ROSTER_WINDOW):i]
+        after = feats[i:i + ROSTER_WINDOW]
+        b_roster, a_roster = _roster(before), _roster(after)
+        if b_roster or a_roster:
+            overlap = len(b_roster & a_roster) / len(b_roster | a_roster)
+            score += ROSTER_SHIFT_WEIGHT * (1 - overlap)
+        prev_dates = {d for f in before for d in f["dates"]}
+        if reply and reply["header_dates"] and not set(reply["header_dates"]) <= prev_dates:
+            score += NEW_DATE_WEIGHT
+        scores[i] = score
+    return scores
+
+
+def pick_boundaries(scores: list) -> list:
+    """Greedy peak picking: strongest boundaries first, min/max length enforced."""
+    n = len(scores)
+    chosen = {0}
+    for i in sorted(range(1, n), key=lambda i: scores[i], reverse=True):
+        if scores[i] < BOUNDARY_THRESHOLD:
+            break
+        if all(abs(i - b) >= MIN_EVENT_MSGS for b in chosen) and n - i >= MIN_EVENT_MSGS:
+            chosen.add(i)
+
+    # Split overlong segments at their best-scoring player message
+    bounds = sorted(chosen)
+    result = []
+    for start, end in zip(bounds, bounds[1:] + [n]):
+        result.append(start)
+        while end - start > MAX_EVENT_MSGS:
+            window = range(start + MIN_EVENT_MSGS,
+                           min(start + MAX_EVENT_MSGS, end - MIN_EVENT_MSGS) + 1)
+            if not window:
+                break
+            cut = max(window, key=lambda i: scores[i])
+            result.append(cut)
+            start = cut
+    return result
+
+
+def segment_date(seg: list, current: str | None, first: bool) -> str | None:
+    """Date of a segment given the running date.
+
+    Narration cites older dates (letters, backstory), so only dates on or
+    after the running date count: one in a scene header is taken as is, any
+    other only if it is within MAX_DATE_JUMP_DAYS. Failing that, a next-day
+    cue at the start of the segment moves the date on a day.
+    """
+    narration = [f for f in seg if f["role"] == "gm"]
+    if current is None:
+        found = [d for f in narration for d in f["header_dates"] + f["dates"]]
+        return found[0] if found else None
+
+    header = [d for f in narration for d in f["header_dates"] if d >= current]
+    if header:
+        return header[0]
+    limit = (date.fromisoformat(current) + timedelta(days=MAX_DATE_JUMP_DAYS)).isoformat()
+    near = [d for f in narration for d in f["dates"] if current <= d <= limit]
+    if near:
+        return near[0]
+    if not first and any(f["next_day"] for f in seg[:2]):
+        return (date.fromisoformat(current) + timedelta(days=1)).isoformat()
+    return current
+
+
+def first_year(messages: list) -> int:
+    """Most common explicit year in a chapter (for chapters with no history)."""
+    years = Counter(re.findall(r"\b(1[34]\d\d)\b", " ".join(m.get("text", "") for m in messages)))
+    return int(years.most_common(1)[0][0]) if years else 1430
+
+
+def previous_chapter_state(chapter_id: str) -> tuple:
+    """(date, location) where the previous chapter ended: its assembled
+    events, else its defs file."""
+    book, num = chapter_id.split(".")
+    prev = f"{book}.{int(num) - 1:02d}"
+    for path in (EVENTS_DIR / f"chapter_{prev}.json", DEFS_DIR / f"chapter_{prev}_defs.json"):
+        events = load_json(path).get("events", [])
+        if events:
+            last = events[-1]
+            return last.get("end_date") or last.get("date") or None, last.get("location") or None
+    return None, None
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+def evaluate(proposal: dict, reference: dict) -> dict:
+    """Boundary precision/recall and date/location agreement vs hand defs."""
+    ref = reference.get("events", [])
+    got = proposal.get("events", [])
+    ref_starts = [e["msgs"][0] for e in ref][1:]
+    got_starts = [e["msgs"][0] for e in got][1:]
+    hits_p = sum(any(abs(s - r) <= BOUNDARY_TOLERANCE for r in ref_starts) for s in got_starts)
+    hits_r = sum(any(abs(s - r) <= BOUNDARY_TOLERANCE for s in got_starts) for r in ref_starts)
+
+    # Field agreement: each reference event vs the proposed event covering its start
+    date_ok = loc_ok = 0
+    char_hit = char_got = char_ref = 0
+    for e in ref:
+        covering = next((g for g in got if g["msgs"][0] <= e["msgs"][0] <= g["msgs"][1]), None)
+        if not covering:
+            continue
+        date_ok += covering["date"] == e.get("date")
+        # "Alcazar of Toledo" / "Casa de las Palomas, Toledo" agree with "Toledo"
+        loc_ok += fold_text(covering["location"]).strip() in fold_text(e.get("location", ""))
+        got_chars, ref_chars = set(covering["characters"]), set(e.get("characters", []))
+        char_hit += len(got_chars & ref_chars)
+        char_got += len(got_chars)
+        char_ref += len(ref_chars)
+    return {
+        "reference_events": len(ref), "proposed_events": len(got),
+        "boundary_precision": hits_p / len(got_starts) if got_starts else 1.0,
+        "boundary_recall": hits_r / len(ref_starts) if ref_starts else 1.0,
+        "date_agreement": date_ok / len(ref) if ref else 0.0,
+        "location_agreement": loc_ok / len(ref) if ref else 0.0,
+        "character_precision": char_hit / char_got if char_got else 0.0,
+        "character_recall": char_hit / char_ref if char_ref else 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def print_proposal(chapter_id: str, proposal: dict) -> None:
+    events = proposal["events"]
+    print(f"Chapter {chapter_id}: {len(events)} proposed events\n")
+    for i, e in enumerate(events, 1):
+        print(f"  {i:>2}. msgs {e['msgs'][0]:>3}-{e['msgs'][1]:<3} {e['date'] or '????-??-??'}  "
+              f"{e['location']}")
+        print(f"      {', '.join(e['characters'][:8])}")
+        print(f"      {e['summary'][:110]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Propose event defs for a preprocessed chapter")
+    parser.add_argument("chapter", nargs="?", help="Chapter ID (e.g., 2.61)")
+    parser.add_argument("--write", action="store_true", help="Write tools/event_defs/chapter_{id}_defs.json")
+    parser.add_argument("--force", action="store_true", help="Overwrite an existing defs file")
+    parser.add_argument("--json", action="store_true", help="Print the defs JSON")
+    parser.add_argument("--evaluate", action="store_true", help="Compare with the existing defs file")
+    parser.add_argument("--evaluate-all", action="store_true", help="Evaluate every chapter with defs")
+    args = parser.parse_args()
+
+    if args.evaluate_all:
+        proposer = SegmentProposer()
+        totals = Counter()
+        chapters = sorted(p.name[len("chapter_"):-len("_defs.json")] for p in DEFS_DIR.glob("chapter_*_defs.json"))
+        for ch in chapters:
+            if not (PREPROCESSED_DIR / f"chapter_{ch}_preprocessed.json").exists():
+                continue
+            r = evaluate(proposer.propose(ch), load_json(DEFS_DIR / f"chapter_{ch}_defs.json"))
+            totals["chapters"] += 1
+            for k, v in r.items():
+                totals[k] += v
+            print(f"  {ch:>5}  {r['reference_events']:>3} ref {r['proposed_events']:>3} prop  "
+                  f"P {r['boundary_precision']:.2f} R {r['boundary_recall']:.2f}  "
+                  f"date {r['date_agreement']:.2f} loc {r['location_agreement']:.2f}  "
+                  f"chars P {r['character_precision']:.2f} R {r['character_recall']:.2f}")
+        n = max(totals["chapters"], 1)
+        print(f"\n  Mean over {totals['chapters']} chapters: "
+              f"P {totals['boundary_precision'] / n:.2f} R {totals['boundary_recall'] / n:.2f}  "
+              f"date {totals['date_agreement'] / n:.2f} loc {totals['location_agreement'] / n:.2f}  "
+              f"chars P {totals['character_precision'] / n:.2f} R {totals['character_recall'] / n:.2f}")
+        return
+
+    if not args.chapter:
+        parser.print_help()
+        return
+    if not (PREPROCESSED_DIR / f"chapter_{args.chapter}_preprocessed.json").exists():
+        print(f"ERROR: chapter {args.chapter} has not been preprocessed")
+        sys.exit(1)
+
+    proposal = SegmentProposer().propose(args.chapter)
+    defs_path = DEFS_DIR / f"chapter_{args.chapter}_defs.json"
+
+    if args.evaluate:
+        if not defs_path.exists():
+            print(f"ERROR: no defs to compare against: {defs_path}")
+            sys.exit(1)
+        print(json.dumps(evaluate(proposal, load_json(defs_path)), indent=2))
+        return
+    if args.json:
+        print(json.dumps(proposal, indent=2, ensure_ascii=False))
+        return
+
+    print_proposal(args.chapter, proposal)
+    if args.write:
+        if defs_path.exists() and not args.force:
+            print(f"\nERROR: {defs_path.name} exists (use --force to overwrite)")
+            sys.exit(1)
+        with open(defs_path, "w", encoding="utf-8") as f:
+            json.dump(proposal, f, indent=2, ensure_ascii=False)
+        print(f"\nWrote {defs_path.relative_to(PROJECT_ROOT)} — review summary/type/tags, then:")
+        print(f"  python3 tools/assemble_chapter.py {args.chapter} --defs {defs_path.relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,11 @@ first-person analysis, web search results, meta-commentary on the player's
 actions — before the actual narrative begins. This script identifies and removes
 those prefixes, leaving only the narrative text.
 
+The per-paragraph tests (thinking, narrative, web search) are cached by
+paragraph content in the paragraph store (paragraph_store.py), so a
+paragraph seen in an earlier run, or earlier in this one, is not classified
+again.
+
 Usage:
     python3 tools/strip_gm_thinking.py stats      # Summary statistics
     python3 tools/strip_gm_thinking.py report      # Show what would be changed
@@ -20,6 +25,9 @@ from pathlib import Path
 
 EVENTS_DIR = Path(__file__).parent.parent / "resources" / "data" / "events"
 
+sys.path.insert(0, str(Path(__file__).parent))
+from paragraph_store import default_store
+
 # ---------------------------------------------------------------------------
 # Physical/dynamic action verbs — strong narrative markers
 # (Linking / stative verbs like is/has/was/seems are excluded because they
@@ -313,6 +321,46 @@ def has_soft_narrative_markers(para):
     return False
 
 
+def is_web_search_block(para):
+    """Return True if a paragraph is a pasted web search query or result list."""
+    lines = para.split("\n")
+
+    # Starts with "Web Search:"
+    if any(line.strip().startswith("Web Search:") for line in lines):
+        return True
+
+    # Block of URL-like search results (title + domain pattern)
+    url_lines = sum(
+        1 for line in lines
+        if re.search(r"\b\w+\.(?:org|com|net|edu|info)\s*$", line.strip())
+    )
+    return url_lines >= 2 and url_lines >= len(lines) * 0.4
+
+
+def paragraph_is_thinking(para):
+    return is_clearly_thinking(para.split("\n")[0].strip(), para)
+
+
+def paragraph_is_narrative(para):
+    return is_clearly_narrative(para.split("\n")[0].strip(), para)
+
+
+def cached(test, para):
+    """test(para.strip()), answered from the paragraph store when seen before."""
+    return default_store().classify(test, para)
+
+
+def paragraph_label(para):
+    """web / thinking / narrative / ambiguous, for reports."""
+    if cached(is_web_search_block, para):
+        return "web"
+    if cached(paragraph_is_thinking, para):
+        return "thinking"
+    if cached(paragraph_is_narrative, para):
+        return "narrative"
+    return "ambiguous"
+
+
 # ---------------------------------------------------------------------------
 # Main stripping logic
 # ---------------------------------------------------------------------------
@@ -333,9 +381,7 @@ def _strip_thinking_once(text):
             first_para = p.strip()
             break
 
-    first_line = first_para.split("\n")[0].strip() if first_para else ""
-
-    if not is_clearly_thinking(first_line, first_para):
+    if not cached(paragraph_is_thinking, first_para):
         return text, "", False
 
     # Walk forward through paragraphs to find the narrative start
@@ -346,15 +392,13 @@ def _strip_thinking_once(text):
         if not stripped_para:
             continue
 
-        para_first_line = stripped_para.split("\n")[0].strip()
-
         # Clearly narrative → this is our start
-        if is_clearly_narrative(para_first_line, stripped_para):
+        if cached(paragraph_is_narrative, stripped_para):
             narrative_idx = i
             break
 
         # Clearly thinking → keep scanning
-        if is_clearly_thinking(para_first_line, stripped_para):
+        if cached(paragraph_is_thinking, stripped_para):
             continue
 
         # Ambiguous paragraph
@@ -378,8 +422,7 @@ def _strip_thinking_once(text):
                 jp = paragraphs[j].strip()
                 if not jp:
                     continue
-                jfl = jp.split("\n")[0].strip()
-                if is_clearly_thinking(jfl, jp):
+                if cached(paragraph_is_thinking, jp):
                     think_ahead += 1
                 else:
                     break  # stop at first non-thinking
@@ -442,25 +485,7 @@ def strip_web_search_blocks(text):
             cleaned_paragraphs.append(para)
             continue
 
-        lines = stripped_para.split("\n")
-
-        # Check if this is a web search block
-        is_web = False
-
-        # Starts with "Web Search:"
-        if any(line.strip().startswith("Web Search:") for line in lines):
-            is_web = True
-
-        # Block of URL-like search results (title + domain pattern)
-        if not is_web:
-            url_lines = sum(
-                1 for line in lines
-                if re.search(r"\b\w+\.(?:org|com|net|edu|info)\s*$", line.strip())
-            )
-            if url_lines >= 2 and url_lines >= len(lines) * 0.4:
-                is_web = True
-
-        if is_web:
+        if cached(is_web_search_block, stripped_para):
             stripped_count += 1
         else:
             cleaned_paragraphs.append(para)
@@ -512,7 +537,7 @@ def strip_midtext_thinking(text):
         para_first_line = stripped_para.split("\n")[0].strip()
 
         # Check if this paragraph is narrative
-        if is_clearly_narrative(para_first_line, stripped_para):
+        if cached(paragraph_is_narrative, stripped_para):
             seen_narrative = True
             keep.append(para)
             continue
@@ -544,7 +569,7 @@ def strip_midtext_thinking(text):
                     next_p = paragraphs[i + 1].strip()
                     if next_p:
                         nfl = next_p.split("\n")[0].strip()
-                        if is_clearly_thinking(nfl, next_p) or _STRONG_MIDTEXT.match(nfl):
+                        if cached(paragraph_is_thinking, next_p) or _STRONG_MIDTEXT.match(nfl):
                             removed += 1
                             continue
             keep.append(para)
@@ -646,6 +671,8 @@ def process_files(mode="stats"):
     print(f"Web search blocks:     {total_web_blocks}")
     print(f"Characters removed:    {total_chars_removed:,}")
     print(f"Files modified:        {files_modified}")
+    print(f"{default_store().cache_report().capitalize()}")
+    default_store().flush()
 
     if mode == "stats":
         print(f"\nRun with 'report' to see details, or 'apply' to make changes.")
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Token Estimator — Calibrated local token counts with an error bound.
+
+len(text) // 4 is badly off for this corpus: Spanish and Latin names,
+accented characters and dense JSON all tokenize far worse than English
+prose. count_tokens() instead uses a linear model over character classes:
+
+  tokens ≈ Σ weight[class] × count[class] + bias
+
+Classes: ASCII letters, ASCII word starts, digits, spaces, newlines, ASCII
+punctuation and non-ASCII characters. The weights are fitted by least
+squares (minimizing relative error) against real API token counts:
+llm_client.call_haiku() logs the feature vector of every prompt and
+response next to the input/output token counts the API reported
+(tools/logs/token_samples.jsonl — features only, no text).
+
+The fitted model is written to resources/data/token_calibration.json, which
+is also read by the game (scripts/token_estimator.gd), so the Python tools
+and the runtime budgets share one calibration. Without a calibration file
+the built-in DEFAULT_WEIGHTS are used and the error bound is unknown: the
+defaults were never measured, so no margin is claimed for them.
+
+API:
+  count_tokens(text)        -> int                 (point estimate)
+  count_tokens_bounded(text)-> (tokens, margin)    (estimate ± margin, p95;
+                                                    margin None if uncalibrated)
+  error_bound()             -> float | None        (relative p95 error)
+  margin_text(margin)       -> str                 (" ±N" or an uncalibrated note)
+
+Usage:
+  python3 tools/token_estimator.py calibrate          # Fit weights from the samples
+  python3 tools/token_estimator.py show               # Current weights and error bound
+  python3 tools/token_estimator.py count FILE [...]   # Estimate tokens in files
+"""
+
+import re
+import json
+import math
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+SAMPLES_FILE = TOOLS_DIR / "logs" / "token_samples.jsonl"
+CALIBRATION_FILE = PROJECT_ROOT / "resources" / "data" / "token_calibration.json"
+
+FEATURES = ("letters", "words", "digits", "spaces", "newlines", "punct",
+            "non_ascii", "bias")
+
+# Uncalibrated starting point (~4.3 chars/token on English prose, more
+# tokens for digits, punctuation and accented text)
+DEFAULT_WEIGHTS = {
+    "letters": 0.18, "words": 0.25, "digits": 0.5, "spaces": 0.0,
+    "newlines": 0.5, "punct": 0.6, "non_ascii": 1.0, "bias": 4.0,
+}
+
+# Minimum samples per feature before a fit is trusted
+MIN_SAMPLES_PER_FEATURE = 3
+
+_WORD_RE = re.compile(r"[A-Za-z]+")
+_DIGIT_RE = re.compile(r"[0-9]")
+
+_model = None
+
+
+# ---------------------------------------------------------------------------
+# Features
+# ---------------------------------------------------------------------------
+
+def features(text: str) -> list:
+    """Character-class counts for *text*, in FEATURES order."""
+    words = _WORD_RE.findall(text)
+    letters = sum(len(w) for w in words)
+    digits = len(_DIGIT_RE.findall(text))
+    spaces = text.count(" ") + text.count("\t")
+    newlines = text.count("\n")
+    non_ascii = len(text) - len(text.encode("ascii", "ignore"))
+    punct = len(text) - letters - digits - spaces - newlines - non_ascii
+    return [letters, len(words), digits, spaces, newlines, punct, non_ascii, 1]
+
+
+# ---------------------------------------------------------------------------
+# Model
+# ---------------------------------------------------------------------------
+
+def load_model() -> dict:
+    """Calibrated model if present, else the defaults. Cached per process."""
+    global _model
+    if _model is None:
+        model = {"weights": dict(DEFAULT_WEIGHTS), "error_bound": None, "samples": 0}
+        if CALIBRATION_FILE.exists():
+            with open(CALIBRATION_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            model["weights"].update(data.get("weights", {}))
+            model["error_bound"] = data.get("error_bound")
+            model["samples"] = data.get("samples", 0)
+        _model = model
+    return _model
+
+
+def predict(feats: list, weights: dict) -> float:
+    return sum(w * x for w, x in zip((weights[k] for k in FEATURES), feats))
+
+
+def count_tokens(text: str) -> int:
+    """Estimated token count of *text*."""
+    if not text:
+        return 0
+    return max(1, round(predict(features(text), load_model()["weights"])))
+
+
+def error_bound() -> float | None:
+    """Relative error of count_tokens() at the 95th percentile (None until a
+    calibration has measured it)."""
+    return load_model()["error_bound"]
+
+
+def count_tokens_bounded(text: str) -> tuple:
+    """(tokens, margin): the true count is within tokens ± margin ~95% of the
+    time. margin is None while uncalibrated."""
+    tokens = count_tokens(text)
+    bound = error_bound()
+    return tokens, None if bound is None else math.ceil(tokens * bound)
+
+
+def margin_text(margin: int | None) -> str:
+    """' ±N' for a known margin, else a note that the bound is unmeasured."""
+    return f" ±{margin:,}" if margin is not None else " (±? uncalibrated)"
+
+
+# ---------------------------------------------------------------------------
+# Calibration
+# ---------------------------------------------------------------------------
+
+def append_sample(kind: str, model: str, text: str, tokens: int,
+                  path: Path = SAMPLES_FILE) -> None:
+    """Record one (features, actual tokens) pair. Called by llm_client."""
+    if not text or tokens <= 0:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    row = {"ts": datetime.now().isoformat(timespec="seconds"), "kind": kind,
+           "model": model, "features": features(text), "tokens": tokens}
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(row) + "\n")
+
+
+def read_samples(path: Path = SAMPLES_FILE) -> list:
+    if not path.exists():
+        return []
+    samples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if len(row.get("features", [])) == len(FEATURES) and row.get("tokens", 0) > 0:
+                samples.append(row)
+    return samples
+
+
+def _solve(a: list, b: list) -> list:
+    """Solve a·x = b (small dense system) by Gaussian elimination."""
+    n = len(b)
+    m = [row[:] + [b[i]] for i, row in enumerate(a)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        m[col], m[pivot] = m[pivot], m[col]
+        if abs(m[col][col]) < 1e-12:
+            continue
+        for r in range(n):
+            if r != col:
+                factor = m[r][col] / m[col][col]
+                for c in range(col, n + 1):
+                    m[r][c] -= factor * m[col][c]
+    return [m[i][n] / m[i][i] if abs(m[i][i]) > 1e-12 else 0.0 for i in range(n)]
+
+
+def fit_weights(samples: list) -> dict:
+    """Non-negative least squares on relative error.
+
+    Each row is scaled by 1/tokens so a 60k-token prompt and a 2k-token
+    response count equally. Features whose weight goes negative are pinned
+    to zero and the rest refitted.
+    """
+    active = list(range(len(FEATURES)))
+    while True:
+        k = len(active)
+        ata = [[0.0] * k for _ in range(k)]
+        atb = [0.0] * k
+        for s in samples:
+            y = s["tokens"]
+            x = [s["features"][i] / y for i in active]
+            for i in range(k):
+                atb[i] += x[i]
+                for j in range(k):
+                    ata[i][j] += x[i] * x[j]
+        for i in range(k):
+            ata[i][i] += 1e-9  # ridge for features absent from every sample
+        coef = _solve(ata, atb)
+        negative = [active[i] for i in range(k) if coef[i] < 0]
+        if not negative:
+            break
+        active = [i for i in active if i not in negative]
+    weights = {name: 0.0 for name in FEATURES}
+    for i, c in zip(active, coef):
+        weights[FEATURES[i]] = round(c, 6)
+    return weights
+
+
+def relative_errors(samples: list, weights: dict) -> list:
+    return sorted(abs(predict(s["features"], weights) - s["tokens"]) / s["tokens"]
+                  for s in samples)
+
+
+def _p95(errors: list) -> float:
+    return errors[max(0, math.ceil(0.95 * len(errors)) - 1)] if errors else 0.0
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_calibrate(args) -> None:
+    samples = read_samples(args.samples)
+    needed = MIN_SAMPLES_PER_FEATURE * len(FEATURES)
+    if len(samples) < needed:
+        print(f"Only {len(samples)} samples in {args.samples} (need {needed}). "
+              f"Run some extractions first.")
+        return
+
+    before = relative_errors(samples, load_model()["weights"])
+    weights = fit_weights(samples)
+    after = relative_errors(samples, weights)
+    # Character count = every class except word starts and bias
+    naive = sorted(abs((s["features"][0] + sum(s["features"][2:7])) / 4 - s["tokens"])
+                   / s["tokens"] for s in samples)
+
+    print(f"Fitted on {len(samples)} samples")
+    print(f"  {'feature':<10} {'weight':>9}")
+    for name in FEATURES:
+        print(f"  {name:<10} {weights[name]:>9.4f}")
+    print(f"\n  p95 relative error: len//4 {_p95(naive):.1%}, "
+          f"current {_p95(before):.1%}, fitted {_p95(after):.1%}")
+
+    if args.dry_run:
+        return
+    calibration = {
+        "fitted": datetime.now().isoformat(timespec="seconds"),
+        "samples": len(samples),
+        "features": list(FEATURES),
+        "weights": weights,
+        "error_bound": round(_p95(after), 4),
+        "mean_error": round(sum(after) / len(after), 4),
+    }
+    with open(CALIBRATION_FILE, "w", encoding="utf-8") as f:
+        json.dump(calibration, f, indent=2)
+        f.write("\n")
+    print(f"  Saved {CALIBRATION_FILE.relative_to(PROJECT_ROOT)}")
+
+
+def cmd_show(args) -> None:
+    model = load_model()
+    source = (f"{CALIBRATION_FILE.relative_to(PROJECT_ROOT)} ({model['samples']} samples)"
+              if CALIBRATION_FILE.exists() else "built-in defaults (uncalibrated)")
+    print(f"Token model: {source}")
+    for name in FEATURES:
+        print(f"  {name:<10} {model['weights'][name]:>9.4f}")
+    bound = model["error_bound"]
+    print("  error bound (p95): " + (f"±{bound:.1%}" if bound is not None else "unknown (uncalibrated)"))
+
+
+def cmd_count(args) -> None:
+    for path in args.files:
+        text = Path(path).read_text(encoding="utf-8")
+        tokens, margin = count_tokens_bounded(text)
+        print(f"  {path}: ~{tokens:,}{margin_text(margin)} tokens "
+              f"({len(text):,} chars, len//4 = {len(text) // 4:,})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrated local token estimator")
+    sub = parser.add_subparsers(dest="command")
+
+    p = sub.add_parser("calibrate", help="Fit weights from logged API samples")
+    p.add_argument("--samples", type=Path, default=SAMPLES_FILE)
+    p.add_argument("--dry-run", action="store_true", help="Report the fit without saving")
+    sub.add_parser("show", help="Show the current model")
+    p = sub.add_parser("count", help="Estimate tokens in files")
+    p.add_argument("files", nargs="+")
+
+    args = parser.parse_args()
+    if args.command == "calibrate":
+        cmd_calibrate(args)
+    elif args.command == "count":
+        cmd_count(args)
+    else:
+        cmd_show(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Travel Check — Flags impossible travel speeds in character location timelines.
+
+Every event places its listed characters at its location on its date. Each
+character's events, in date order, form a (date, location) sequence; two
+consecutive placements imply a journey, and the journey implies a speed:
+
+  distance  great-circle (haversine) distance between the two locations'
+            coordinates in locations.json, in km
+  days      calendar days from the first event's end (date or end_date) to
+            the second event's date, plus one — a same-day pair may use the
+            whole day, so the speed is a lower bound
+  speed     distance / days, in km per day
+
+The journey's mode is "sea" when both ends are ports (or a port-flagged
+location without coordinates — at_sea, tyrrhenian_sea, … — lies between
+them) and "land" otherwise; a journey is flagged when its speed exceeds
+MODE_SPEEDS for its mode. Locations without coordinates (regions, roads,
+seas) are skipped, so the journey is measured between the placed points on
+either side of them.
+
+All sequences of all characters are concatenated into flat NumPy arrays and
+sorted once by (character, date, corpus order); distances, day counts and
+speeds for every transition in the corpus then come out of a single
+vectorized pass.
+
+Usage:
+  python3 tools/travel_check.py                       # Flagged journeys, fastest first
+  python3 tools/travel_check.py --id juan_ii          # One character's journeys
+  python3 tools/travel_check.py --all --id juan_ii    # Including plausible ones
+  python3 tools/travel_check.py --json
+"""
+
+import re
+import json
+import argparse
+import unicodedata
+from pathlib import Path
+from datetime import date
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "resources" / "data"
+EVENTS_FILE = DATA_DIR / "events.json"
+EVENTS_DIR = DATA_DIR / "events"
+LOCATIONS_FILE = DATA_DIR / "locations.json"
+
+EARTH_RADIUS_KM = 6371.0
+
+# Sustained km/day a 15th-century traveller can beat only exceptionally:
+# a mounted party with remounts on land, a galley with fair wind at sea
+MODE_SPEEDS = {
+    "land": 80.0,
+    "sea": 250.0,
+}
+
+# Nearby places (a palace and its city) are never a journey
+MIN_DISTANCE_KM = 15.0
+
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_events() -> list:
+    """All events: events.json if it has been built, else the chapter files."""
+    if EVENTS_FILE.exists():
+        return load_json(EVENTS_FILE).get("events", [])
+    return [e for path in sorted(EVENTS_DIR.glob("chapter_*.json"))
+            for e in load_json(path).get("events", [])]
+
+
+def fold(text: str) -> str:
+    nfkd = unicodedata.normalize("NFKD", text)
+    ascii_only = nfkd.encode("ASCII", "ignore").decode("ASCII")
+    return re.sub(r"[^a-z0-9]+", " ", ascii_only.lower()).strip()
+
+
+def parse_day(value: str) -> int | None:
+    """'1430-05-03' → proleptic ordinal day; anything else → None."""
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Locations
+# ---------------------------------------------------------------------------
+
+class LocationIndex:
+    """Event location strings → location_id, plus coordinate arrays by location."""
+
+    def __init__(self, locations: list):
+        self.ids = [loc["location_id"] for loc in locations]
+        self.forms = {}
+        for n, loc in enumerate(locations):
+            for form in (loc["location_id"].replace("_", " "), loc.get("name", "")):
+                self.forms.setdefault(fold(form), n)
+        for n, loc in enumerate(locations):
+            for sub in loc.get("sub_locations", []):
+                self.forms.setdefault(fold(sub), n)
+
+        coords = [loc.get("coordinates") or {} for loc in locations]
+        self.lat = np.radians([c.get("lat", np.nan) for c in coords])
+        self.lon = np.radians([c.get("lon", np.nan) for c in coords])
+        self.placed = ~np.isnan(self.lat)
+        self.port = np.array([bool(loc.get("port")) for loc in locations])
+        self.cache = {}
+
+    def resolve(self, text: str) -> int | None:
+        """Index of the location an event's location string names.
+
+        'Seville, Alcázar' → seville; 'Vatican, Rome' → vatican; 'Candia, Crete'
+        → candia: the whole string first, then each comma part in order.
+        """
+        if text not in self.cache:
+            parts = [fold(text)] + [fold(p) for p in str(text).split(",")]
+            self.cache[text] = next((self.forms[p] for p in parts if p in self.forms), None)
+        return self.cache[text]
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance; all arguments in radians, any broadcastable shape."""
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+# ---------------------------------------------------------------------------
+# Timelines
+# ---------------------------------------------------------------------------
+
+def build_placements(events: list, index: LocationIndex) -> dict:
+    """Flat (character, day, end day, location, event) arrays for every listing.
+
+    Listings whose date or location cannot be read are counted, not kept.
+    """
+    chars, char_ids = {}, []
+    rows = {"char": [], "day": [], "end": [], "loc": [], "event": []}
+    skipped = {"no_date": 0, "unresolved": {}}
+    for n, evt in enumerate(events):
+        day = parse_day(evt.get("date", ""))
+        if day is None:
+            skipped["no_date"] += len(evt.get("characters", []))
+            continue
+        end = parse_day(evt.get("end_date") or "") or day
+        loc_text = evt.get("location") or ""
+        loc = index.resolve(loc_text)
+        if loc is None:
+            skipped["unresolved"][loc_text] = skipped["unresolved"].get(loc_text, 0) + 1
+            continue
+        for cid in evt.get("characters", []):
+            if cid not in chars:
+                chars[cid] = len(char_ids)
+                char_ids.append(cid)
+            rows["char"].append(chars[cid])
+            rows["day"].append(day)
+            rows["end"].append(max(day, end))
+            rows["loc"].append(loc)
+            rows["event"].append(n)
+
+    arrays = {k: np.array(v, dtype=np.int64) for k, v in rows.items()}
+    order = np.lexsort((arrays["event"], arrays["day"], arrays["char"]))
+    return {"characters": char_ids,
+            **{k: v[order] for k, v in arrays.items()},
+            "skipped": skipped}
+
+
+def transitions(placements: dict, index: LocationIndex) -> dict:
+    """Every consecutive pair of placed points per character, with speed and mode."""
+    loc = placements["loc"]
+    placed = index.placed[loc]
+    char = placements["char"]
+
+    # A port-flagged point without coordinates (at sea) marks the journey
+    # from the previous placed point to the next one as a sea voyage
+    sea_gap = ~placed & index.port[loc]
+    gaps_seen = np.cumsum(sea_gap)
+
+    keep = np.flatnonzero(placed)
+    c, d, e = char[keep], placements["day"][keep], placements["end"][keep]
+    l, ev = loc[keep], placements["event"][keep]
+    same = c[1:] == c[:-1]
+    a, b = np.flatnonzero(same), np.flatnonzero(same) + 1
+
+    distance = haversine_km(index.lat[l[a]], index.lon[l[a]], index.lat[l[b]], index.lon[l[b]])
+    days = np.maximum(d[b] - e[a], 0) + 1
+    speed = distance / days
+    via_sea = gaps_seen[keep[b]] > gaps_seen[keep[a]]
+    sea = (index.port[l[a]] & index.port[l[b]]) | via_sea
+    limit = np.where(sea, MODE_SPEEDS["sea"], MODE_SPEEDS["land"])
+    flagged = (speed > limit) & (distance >= MIN_DISTANCE_KM)
+
+    return {
+        "char": c[a], "from_loc": l[a], "to_loc": l[b],
+        "from_event": ev[a], "to_event": ev[b],
+        "from_day": e[a], "to_day": d[b],
+        "distance": distance, "days": days, "speed": speed,
+        "sea": sea, "ratio": speed / limit, "flagged": flagged,
+    }
+
+
+def journey_rows(t: dict, mask: np.ndarray, placements: dict, index: LocationIndex,
+                 events: list) -> list:
+    """Selected transitions as dicts, fastest relative to their limit first."""
+    rows = []
+    for i in np.flatnonzero(mask)[np.argsort(-t["ratio"][mask], kind="stable")]:
+        rows.append({
+            "character": placements["characters"][t["char"][i]],
+            "from_event": events[t["from_event"][i]]["event_id"],
+            "to_event": events[t["to_event"][i]]["event_id"],
+            "from": index.ids[t["from_loc"][i]],
+            "to": index.ids[t["to_loc"][i]],
+            "from_date": date.fromordinal(int(t["from_day"][i])).isoformat(),
+            "to_date": date.fromordinal(int(t["to_day"][i])).isoformat(),
+            "distance_km": round(float(t["distance"][i]), 1),
+            "days": int(t["days"][i]),
+            "km_per_day": round(float(t["speed"][i]), 1),
+            "mode": "sea" if t["sea"][i] else "land",
+        })
+    return rows
+
+
+def check_travel(events: list, locations: list, character: str | None = None,
+                 include_all: bool = False) -> dict:
+    """Journeys (flagged ones, or all with include_all) plus what could not be placed."""
+    index = LocationIndex(locations)
+    placements = build_placements(events, index)
+    t = transitions(placements, index)
+    mask = np.ones(len(t["speed"]), dtype=bool) if include_all else t["flagged"].copy()
+    if character is not None:
+        cid = placements["characters"].index(character) if character in placements["characters"] else -1
+        mask &= t["char"] == cid
+    unplaced = sorted({index.ids[n] for n in np.unique(placements["loc"]) if not index.placed[n]})
+    return {
+        "journeys": journey_rows(t, mask, placements, index, events),
+        "transitions": int(len(t["speed"])),
+        "flagged": int(t["flagged"].sum()),
+        "unplaced_locations": unplaced,
+        "unresolved": placements["skipped"]["unresolved"],
+        "undated": placements["skipped"]["no_date"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag impossible travel speeds between events")
+    parser.add_argument("--id", type=str, help="Only this character's journeys")
+    parser.add_argument("--all", action="store_true", help="List every journey, not just flagged ones")
+    parser.add_argument("--limit", type=int, default=40, help="Journeys to list (0 = all)")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    events = load_events()
+    locations = load_json(LOCATIONS_FILE).get("locations", [])
+    result = check_travel(events, locations, args.id, args.all)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    journeys = result["journeys"]
+    shown = journeys[:args.limit] if args.limit else journeys
+    for j in shown:
+        print(f"  {j['character']:<28} {j['from']:>22} → {j['to']:<22} "
+              f"{j['distance_km']:>7.0f} km / {j['days']:>3} d = {j['km_per_day']:>6.0f} km/d "
+              f"({j['mode']})  {j['from_event']} → {j['to_event']}")
+    if len(journeys) > len(shown):
+        print(f"  ... and {len(journeys) - len(shown)} more")
+
+    print(f"\n{result['transitions']} journeys checked, {result['flagged']} faster than "
+          f"{MODE_SPEEDS['land']:.0f} km/day by land or {MODE_SPEEDS['sea']:.0f} km/day by sea")
+    if result["unplaced_locations"]:
+        print(f"No coordinates (skipped): {', '.join(result['unplaced_locations'])}")
+    if result["unresolved"]:
+        names = ", ".join(f"{k!r} ({v})" for k, v in sorted(result["unresolved"].items()))
+        print(f"Unresolved event locations: {names}")
+    if result["undated"]:
+        print(f"Undated listings: {result['undated']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,8 @@ Checks:
                roll linkage, summary quality
   Cross-chapter: alias consistency, chronological order, faction membership,
                  law linkage
-  Comparison: new data vs archived v1 data (for Book 2 chapters 1-28)
+  Comparison: new data vs archived v1 data (for Book 2 chapters 1-28); event
+              counts only, see db_diff.py for record- and field-level changes
   Review mode: shows raw chapter content alongside extracted events
 
 Usage:
@@ -33,6 +34,7 @@ PREPROCESSED_DIR = TOOLS_DIR / "preprocessed"
 
 # Import normalize_location_id from merge_chapter
 sys.path.insert(0, str(TOOLS_DIR))
+from corpus_store import open_corpus, corpus_exists
 try:
     from merge_chapter import normalize_location_id
 except ImportError:
@@ -45,9 +47,9 @@ except ImportError:
 
 
 def load_json(path: Path) -> dict:
-    if not path.exists():
+    if not corpus_exists(path):
         return {}
-    with open(path, "r", encoding="utf-8") as f:
+    with open_corpus(path) as f:
         return json.load(f)
 
 
@@ -184,7 +186,7 @@ def compare_with_v1() -> list[str]:
     notes = []
 
     v1_events_path = ARCHIVE_DIR / "starter_events.json"
-    if not v1_events_path.exists():
+    if not corpus_exists(v1_events_path):
         notes.append("No v1 starter_events.json found for comparison")
         return notes
 
@@ -230,7 +232,7 @@ def compare_with_v1() -> list[str]:
 
     # Character comparison
     v1_chars_path = ARCHIVE_DIR / "characters.json"
-    if v1_chars_path.exists():
+    if corpus_exists(v1_chars_path):
         v1_chars = load_json(v1_chars_path).get("characters", [])
         new_chars = load_json(DATA_DIR / "characters.json").get("characters", [])
         v1_ids = {c["id"] for c in v1_chars}